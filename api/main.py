@@ -1,24 +1,33 @@
 """
 FastAPI web service wrapper for TRAPI validator and Biolink Model compliance testing
 """
-from typing import Optional, Dict, Annotated
+from typing import Optional, Dict, Annotated, Iterator
+from contextlib import asynccontextmanager
 from sys import stderr
+from os import getenv
 from os.path import abspath, dirname
 from pydantic import BaseModel
 
-from fastapi import FastAPI, HTTPException, Body
+from fastapi import FastAPI, HTTPException, Body, Request
 from fastapi.openapi.models import Example
 from fastapi.openapi.docs import get_swagger_ui_html
 from fastapi.staticfiles import StaticFiles
+from fastapi.responses import Response, StreamingResponse
 
 import uvicorn
 
 from bmt import Toolkit
 
 from api import SAMPLE_TRAPI_RESPONSE
+from reasoner_validator import codec
+from reasoner_validator.cache import ResponseValidationCache
+from reasoner_validator.message import MessageType
+from reasoner_validator.rendering import PAGE_UNITS
+from reasoner_validator.report import ReportingPolicy
 from reasoner_validator.trapi import TRAPISchemaValidator
 from reasoner_validator.versioning import get_latest_version
-from reasoner_validator.validator import TRAPIResponseValidator
+from reasoner_validator.validator import TRAPIResponseValidator, ResultsWorkerPool
+from reasoner_validator.streaming import ijson, AsyncByteStream, StreamingTRAPIResponseValidator
 
 API_DIRECTORY = abspath(dirname(__file__))
 print(f"API App Directory: {API_DIRECTORY}", file=stderr)
@@ -31,7 +40,30 @@ SERVICE_NAME = "reasoner-validator"
 default_toolkit: Toolkit = Toolkit()
 DEFAULT_BIOLINK_MODEL_VERSION = default_toolkit.get_model_version()
 
-app = FastAPI(title=SERVICE_NAME, docs_url=None)
+# Validation reports of identical TRAPI Responses (validated with identical parameters)
+# are cached, in memory (RESPONSE_CACHE_SIZE == 0 disables the cache) and, optionally,
+# on disk, in the RESPONSE_CACHE_DIRECTORY, if the environment variable is set,
+# up to a total of RESPONSE_CACHE_MAX_BYTES bytes of (least recently used) reports.
+RESPONSE_CACHE_SIZE: int = int(getenv("RESPONSE_CACHE_SIZE", ResponseValidationCache.DEFAULT_MAX_SIZE))
+RESPONSE_CACHE: Optional[ResponseValidationCache] = ResponseValidationCache(
+    max_size=RESPONSE_CACHE_SIZE,
+    directory=getenv("RESPONSE_CACHE_DIRECTORY"),
+    max_bytes=int(getenv("RESPONSE_CACHE_MAX_BYTES", ResponseValidationCache.DEFAULT_MAX_BYTES))
+) if RESPONSE_CACHE_SIZE > 0 else None
+
+# The worker processes validating the results of TRAPI Responses in parallel (see the 'result_workers' of a Query)
+# are shared by the validators of all requests, thus only started once (per TRAPI version and number of workers),
+# then shut down with the service.
+RESULTS_POOL: ResultsWorkerPool = ResultsWorkerPool()
+
+
+@asynccontextmanager
+async def lifespan(application: FastAPI):
+    yield
+    RESULTS_POOL.shutdown()
+
+
+app = FastAPI(title=SERVICE_NAME, docs_url=None, lifespan=lifespan)
 
 app.mount("/img", StaticFiles(directory=f"{API_DIRECTORY}/img"), name="img")
 
@@ -67,6 +99,26 @@ class TargetProvenance(BaseModel):
     kp_source_type: Optional[str] = None
 
 
+# Bounds on the number of validation messages recorded in the validation report (see ReportingPolicy),
+# e.g. for very large knowledge graphs, with messages beyond these bounds only counted (as 'unrecorded')
+# Example: ReportingLimits(max_identifiers=100, max_messages=10, deduplicate=True, min_severity="warning")
+class ReportingLimits(BaseModel):
+    max_identifiers: int = 0
+    max_messages: int = 0
+    deduplicate: bool = False
+    min_severity: Optional[str] = None
+
+    def to_policy(self) -> ReportingPolicy:
+        if self.min_severity and self.min_severity not in MessageType.__members__:
+            raise HTTPException(status_code=400, detail=f"Unknown message type '{self.min_severity}'")
+        return ReportingPolicy(
+            max_identifiers=self.max_identifiers,
+            max_messages=self.max_messages,
+            deduplicate=self.deduplicate,
+            min_severity=MessageType[self.min_severity] if self.min_severity else None
+        )
+
+
 class Query(BaseModel):
 
     trapi_version: Optional[str] = get_latest_version(TRAPISchemaValidator.DEFAULT_TRAPI_VERSION)
@@ -93,6 +145,22 @@ class Query(BaseModel):
     # returned from edges for each test query (default: 0 means 'validate all results')
     max_results: int = 0
 
+    # If given, knowledge graph edges and results are sampled (as limited by 'max_kg_edges' and 'max_results')
+    # by reproducible random sampling seeded by this value, stratified by edge predicate, primary knowledge source
+    # and subject/object categories (default: None means 'validate the first max_kg_edges edges and max_results')
+    sampling_seed: Optional[int] = None
+
+    # If greater than 1, the results of the TRAPI Response are validated in parallel,
+    # by a pool of 'result_workers' processes (default: 0 means 'validate the results serially')
+    result_workers: int = 0
+
+    # If True, validation messages are recorded in a (much more compact) columnar message store,
+    # e.g. for very large knowledge graphs with millions of warnings (default: False)
+    compact_messages: bool = False
+
+    # See ReportingLimits above (default: None means 'record all validation messages')
+    reporting_limits: Optional[ReportingLimits] = None
+
     #
     # We don't instantiate the full TRAPI models here but just use an open-ended dictionary which should have
     # query_graph, knowledge_graph and results JSON tag-values.  A full Query.Response is (now) expected here,
@@ -143,12 +211,30 @@ async def validate(
     max_results: int = query.max_results
     print(f"Specified 'results_sample_size' == {max_results}", file=stderr)
 
+    sampling_seed: Optional[int] = query.sampling_seed
+    print(f"Specified 'sampling_seed' == {sampling_seed}", file=stderr)
+
+    result_workers: int = query.result_workers
+    print(f"Specified 'result_workers' == {result_workers}", file=stderr)
+
+    compact_messages: bool = query.compact_messages
+    print(f"Specified 'compact_messages' == {compact_messages}", file=stderr)
+
+    reporting_limits: Optional[ReportingLimits] = query.reporting_limits
+    print(f"Specified 'reporting_limits' == {reporting_limits}", file=stderr)
+
     validator: TRAPIResponseValidator = TRAPIResponseValidator(
         trapi_version=trapi_version,
         biolink_version=biolink_version,
         target_provenance=target_provenance.model_dump() if target_provenance is not None else None,
         strict_validation=strict_validation,
-        suppress_empty_data_warnings=suppress_empty_data_warnings
+        suppress_empty_data_warnings=suppress_empty_data_warnings,
+        sampling_seed=sampling_seed,
+        response_cache=RESPONSE_CACHE,
+        result_workers=result_workers,
+        results_pool=RESULTS_POOL,
+        compact_messages=compact_messages,
+        reporting_policy=reporting_limits.to_policy() if reporting_limits is not None else None
     )
     validator.check_compliance_of_trapi_response(
         response=query.response,
@@ -159,7 +245,149 @@ async def validate(
     if not validator.has_messages():
         validator.report(code="info.compliant")
 
-    return validator.to_dict()
+    # the validation report is serialized (as bytes) by the (fast) codec of the reasoner-validator
+    return Response(content=codec.dumps_bytes(validator.to_dict()), media_type="application/json")
+
+
+# Paging through the (human-readable) text validation report of a TRAPI Response (see ValidationReporter.dump()):
+# the TRAPI Response is validated (or its validation report retrieved from the RESPONSE_CACHE) for each page,
+# of which 'page_size' targets, tests, codes or identifiers ('page_by') are rendered, from the 'cursor'
+# returned with the previous page (default: None, the first page; a 'page_size' of 0 renders the whole report)
+class TextReportQuery(Query):
+    id_rows: int = 0
+    msg_rows: int = 0
+    page_by: Optional[str] = None
+    page_size: int = 0
+    cursor: Optional[str] = None
+
+
+@app.post("/validate_text")
+async def validate_text(query: TextReportQuery):
+    """
+    Validation of a TRAPI Response (with the same parameters as the /validate endpoint) returning one page
+    of the text validation report, as the 'report', with the 'cursor' of the next page (None after the last page).
+    """
+    if not query.response:
+        raise HTTPException(status_code=400, detail="Empty input message?")
+    if query.page_by is not None and query.page_by not in PAGE_UNITS:
+        raise HTTPException(status_code=400, detail=f"Unknown unit of pagination '{query.page_by}'")
+
+    validator: TRAPIResponseValidator = TRAPIResponseValidator(
+        trapi_version=query.trapi_version,
+        biolink_version=query.biolink_version,
+        target_provenance=query.target_provenance.model_dump() if query.target_provenance is not None else None,
+        strict_validation=query.strict_validation,
+        suppress_empty_data_warnings=bool(query.suppress_empty_data_warnings),
+        sampling_seed=query.sampling_seed,
+        response_cache=RESPONSE_CACHE,
+        result_workers=query.result_workers,
+        results_pool=RESULTS_POOL,
+        compact_messages=query.compact_messages,
+        reporting_policy=query.reporting_limits.to_policy() if query.reporting_limits is not None else None
+    )
+    validator.check_compliance_of_trapi_response(
+        response=query.response,
+        max_kg_edges=query.max_kg_edges,
+        max_results=query.max_results
+    )
+
+    try:
+        report, cursor = validator.dumps_page(
+            id_rows=max(query.id_rows, 0),
+            msg_rows=max(query.msg_rows, 0),
+            cursor=query.cursor,
+            page_by=query.page_by,
+            page_size=max(query.page_size, 0)
+        )
+    except ValueError as error:
+        raise HTTPException(status_code=400, detail=str(error))
+
+    return {"report": report, "cursor": cursor}
+
+
+@app.post("/validate_messages")
+async def validate_messages(query: Query):
+    """
+    Validation of a TRAPI Response (with the same parameters as the /validate endpoint) returning the validation
+    messages as they are reported, as a (streamed) JSON Lines response, one message record per line
+    (see reasoner_validator.sinks), e.g. for rendering partial results of long validations.
+    """
+    if not query.response:
+        raise HTTPException(status_code=400, detail="Empty input message?")
+
+    validator: TRAPIResponseValidator = TRAPIResponseValidator(
+        trapi_version=query.trapi_version,
+        biolink_version=query.biolink_version,
+        target_provenance=query.target_provenance.model_dump() if query.target_provenance is not None else None,
+        strict_validation=query.strict_validation,
+        suppress_empty_data_warnings=bool(query.suppress_empty_data_warnings),
+        sampling_seed=query.sampling_seed,
+        result_workers=query.result_workers,
+        results_pool=RESULTS_POOL,
+        retain_messages=False
+    )
+
+    def records() -> Iterator[str]:
+        for record in validator.iter_validate(
+            query.response,
+            max_kg_edges=query.max_kg_edges,
+            max_results=query.max_results
+        ):
+            yield codec.dumps(record) + "\n"
+
+    return StreamingResponse(records(), media_type="application/x-ndjson")
+
+
+@app.post("/validate_stream")
+async def validate_stream(
+    request: Request,
+    trapi_version: Optional[str] = get_latest_version(TRAPISchemaValidator.DEFAULT_TRAPI_VERSION),
+    biolink_version: Optional[str] = DEFAULT_BIOLINK_MODEL_VERSION,
+    ara_source: Optional[str] = None,
+    kp_source: Optional[str] = None,
+    kp_source_type: Optional[str] = None,
+    strict_validation: bool = False,
+    suppress_empty_data_warnings: bool = False,
+    max_kg_edges: int = 0,
+    max_results: int = 0,
+    compact_messages: bool = False
+):
+    """
+    Streaming validation of a (possibly huge) TRAPI Response, posted as the (raw JSON) request body,
+    which is parsed and validated incrementally, as it is received, rather than being loaded as a whole.
+    The validation parameters (as for the /validate endpoint) are given as query parameters.
+    """
+    if ijson is None:
+        raise HTTPException(status_code=501, detail="Streaming validation is not available (needs 'ijson')")
+
+    target_provenance: Optional[Dict[str, str]] = None
+    if ara_source or kp_source or kp_source_type:
+        target_provenance = TargetProvenance(
+            ara_source=ara_source, kp_source=kp_source, kp_source_type=kp_source_type
+        ).model_dump()
+
+    validator: StreamingTRAPIResponseValidator = StreamingTRAPIResponseValidator(
+        trapi_version=trapi_version,
+        biolink_version=biolink_version,
+        target_provenance=target_provenance,
+        strict_validation=strict_validation,
+        suppress_empty_data_warnings=suppress_empty_data_warnings,
+        compact_messages=compact_messages
+    )
+    try:
+        await validator.check_compliance_of_trapi_response_async_stream(
+            AsyncByteStream(request.stream()),
+            max_kg_edges=max_kg_edges,
+            max_results=max_results
+        )
+    except ijson.JSONError as error:
+        raise HTTPException(status_code=400, detail=f"Invalid JSON input: {str(error)}")
+
+    if not validator.has_messages():
+        validator.report(code="info.compliant")
+
+    # the validation report is serialized (as bytes) by the (fast) codec of the reasoner-validator
+    return Response(content=codec.dumps_bytes(validator.to_dict()), media_type="application/json")
 
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=80)
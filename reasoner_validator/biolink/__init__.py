@@ -17,7 +17,8 @@ from linkml_runtime.linkml_model import ClassDefinition, Element
 from reasoner_validator.versioning import SemVer, SemVerError
 from reasoner_validator.message import MESSAGES_BY_TARGET
 from reasoner_validator.trapi import TRAPISchemaValidator
-from reasoner_validator.report import TRAPIGraphType
+from reasoner_validator.report import TRAPIGraphType, ReportingPolicy
+from reasoner_validator.sinks import MessageSink
 
 import logging
 logger = logging.getLogger(__name__)
@@ -201,7 +202,12 @@ class BiolinkValidator(TRAPISchemaValidator, BMTWrapper):
         trapi_version: Optional[str] = None,
         biolink_version: Optional[str] = None,
         target_provenance: Optional[Dict[str, str]] = None,
-        strict_validation: Optional[bool] = None
+        strict_validation: Optional[bool] = None,
+        compact_messages: bool = False,
+        reporting_policy: Optional[ReportingPolicy] = None,
+        message_sink: Optional[MessageSink] = None,
+        retain_messages: bool = True,
+        index_messages: bool = False
     ):
         """
         Biolink Validator constructor.
@@ -215,6 +221,15 @@ class BiolinkValidator(TRAPISchemaValidator, BMTWrapper):
         :param target_provenance: Optional[Dict[str, str]], Dictionary of context ARA and KP for provenance validation
         :param strict_validation: Optional[bool] = None, if True, some tests validate as 'error';  False, simply issues
                                   'info' message; A value of 'None' uses the default value for specific graph contexts.
+        :param compact_messages: bool = False, if True, messages are recorded in a (much more compact) columnar
+                                 message store (see ValidationReporter)
+        :param reporting_policy: Optional[ReportingPolicy] = None, if given, policies bounding the number
+                                 of messages recorded (see ValidationReporter)
+        :param message_sink: Optional[MessageSink] = None, if given, sink to which each message is
+                             emitted as soon as it is reported (see ValidationReporter)
+        :param retain_messages: bool = True, if False, messages are only emitted to the 'message_sink'
+        :param index_messages: bool = False, if True, messages are indexed by identifier and selected parameter
+                               values, e.g. to find the messages of a given edge (see ValidationReporter)
 
         """
         BMTWrapper.__init__(self, biolink_version=biolink_version)
@@ -223,7 +238,12 @@ class BiolinkValidator(TRAPISchemaValidator, BMTWrapper):
             default_test=default_test,
             default_target=default_target if default_target else f"Biolink Validation",
             trapi_version=trapi_version,
-            strict_validation=strict_validation
+            strict_validation=strict_validation,
+            compact_messages=compact_messages,
+            reporting_policy=reporting_policy,
+            message_sink=message_sink,
+            retain_messages=retain_messages,
+            index_messages=index_messages
         )
         self.target_provenance: Optional[Dict] = target_provenance
 
@@ -1506,7 +1526,7 @@ class BiolinkValidator(TRAPISchemaValidator, BMTWrapper):
                 identifier=edge_id
             )
 
-        elif subject_id not in self.get_node_identifiers():
+        elif subject_id not in self.nodes:
             self.report(
                 code=f"error.{context}.edge.subject.missing_from_nodes",
                 identifier=subject_id,
@@ -1565,7 +1585,7 @@ class BiolinkValidator(TRAPISchemaValidator, BMTWrapper):
                 code=f"error.{context}.edge.object.missing",
                 identifier=edge_id
             )
-        elif object_id not in self.get_node_identifiers():
+        elif object_id not in self.nodes:
             self.report(
                 code=f"error.{context}.edge.object.missing_from_nodes",
                 identifier=object_id,
@@ -1715,13 +1735,21 @@ class BiolinkValidator(TRAPISchemaValidator, BMTWrapper):
             category_name=object_category_curie
         )
 
-    def check_biolink_model_compliance(self, graph: Dict, graph_type: TRAPIGraphType):
+    def check_biolink_model_compliance(
+            self,
+            graph: Dict,
+            graph_type: TRAPIGraphType,
+            check_dangling_nodes: bool = True
+    ):
         """
         Validate a TRAPI-schema compliant Message graph-like data structure
         against the currently active Biolink Model Toolkit model version.
 
         :param graph: Dict, knowledge graph to be validated
         :param graph_type: TRAPIGraphType, component type of TRAPI graph to be validated
+        :param check_dangling_nodes: bool, if False, don't report dangling nodes, for example, when the graph is
+                                     a sample of a knowledge graph whose node usage is checked elsewhere
+                                     (see MappingValidator) (Default: True)
         """
         if not graph:
             self.report(code="warning.graph.empty", identifier=graph_type.value)
@@ -1772,7 +1800,7 @@ class BiolinkValidator(TRAPISchemaValidator, BMTWrapper):
             # TODO: some notion of dangling nodes also applies
             #       to QPaths, but this is not yet coded here
             pass
-        else:
+        elif check_dangling_nodes:
             # Dangling edges are discovered during validate_graph_edge() but
             # Dangling_nodes can only be detected after all edges are processed.
             # This is now deemed not a serious error but will be treated as 'info'
@@ -1786,30 +1814,44 @@ class BiolinkValidator(TRAPISchemaValidator, BMTWrapper):
                     identifier='|'.join(dangling_nodes)
                 )
 
-    def merge(self, reporter):
+    def merge(self, reporter, move: bool = False):
         """
         Merge all messages and metadata from a second BiolinkValidator,
         into the calling TRAPISchemaValidator instance.
 
         :param reporter: second BiolinkValidator
+        :param move: bool, if True, the messages of the second BiolinkValidator
+                     are moved, rather than copied (see ValidationReporter.merge())
         """
-        TRAPISchemaValidator.merge(self, reporter)
+        TRAPISchemaValidator.merge(self, reporter, move=move)
 
         # First come, first serve... We only overwrite
         # empty versions in the parent reporter
         if isinstance(reporter, BiolinkValidator) and not self.get_biolink_version():
             self.reset_biolink_version(reporter.get_biolink_version())
 
-    def to_dict(self) -> Dict:
+    def to_dict(self, copy: bool = False) -> Dict:
         """
         Export BiolinkValidator contents as a Python dictionary
         (including Biolink version and parent class dictionary content).
+        :param copy: bool, if True, the messages are an independent (deep) copy
+                     (Default: False, the messages are shared with the validator, thus are not to be modified)
         :return: Dict
         """
-        dictionary = TRAPISchemaValidator.to_dict(self)
+        dictionary = TRAPISchemaValidator.to_dict(self, copy=copy)
         dictionary["biolink_version"] = self.get_biolink_version()
         return dictionary
 
+    @classmethod
+    def _constructor_arguments(cls, header: Dict) -> Dict:
+        """
+        :param header: Dict, metadata of a BiolinkValidator, as exported by to_bytes()
+        :return: Dict, constructor arguments of the class (including the Biolink Model version)
+        """
+        arguments: Dict = super()._constructor_arguments(header)
+        arguments["biolink_version"] = header["biolink_version"]
+        return arguments
+
     def report_header(self, title: Optional[str] = None, compact_format: bool = True) -> str:
         header: str = super().report_header(title, compact_format)
         header += " and Biolink Model version " \
@@ -1,27 +1,33 @@
 """
 Ontology KP interface
 """
-from typing import Optional, List
-from functools import lru_cache
+from typing import Optional, List, Dict, Iterable
 
 from reasoner_validator.biolink import get_biolink_model_toolkit
-from reasoner_validator import post_query, NODE_NORMALIZER_SERVER
+from reasoner_validator import post_query
+from reasoner_validator.cache import ValidationCache
+from reasoner_validator.nodenorm import NodeNormalizer, get_node_normalizer
+from reasoner_validator.biolink.ontology_index import OntologyIndex, get_ontology_index
+
+import logging
+logger = logging.getLogger(__name__)
 
 ONTOLOGY_KP_TRAPI_SERVER = "https://automat.renci.org/ubergraph/query"
 
 CACHE_SIZE = 1024
 
+# Maximum number of CURIEs in each (multi-id) Ontology KP subclass query
+ONTOLOGY_KP_CHUNK_SIZE = 500
+
 
-def convert_to_preferred(curie, allowed_list):
+def convert_to_preferred(curie, allowed_list, node_normalizer: Optional[NodeNormalizer] = None):
     """
     :param curie
     :param allowed_list
+    :param node_normalizer: Optional[NodeNormalizer], Node Normalizer client (Default: None, use the shared client)
     """
-    query = {'curies': [curie]}
-    result = post_query(url=NODE_NORMALIZER_SERVER, query=query, server="Node Normalizer")
-    if not (result and curie in result and result[curie] and 'equivalent_identifiers' in result[curie]):
-        return None
-    new_ids = [v['identifier'] for v in result[curie]['equivalent_identifiers']]
+    node_normalizer = node_normalizer if node_normalizer is not None else get_node_normalizer()
+    new_ids = NodeNormalizer.get_equivalent_identifiers(node_normalizer.get_clique(curie))
     for nid in new_ids:
         if nid.split(':')[0] in allowed_list:
             return nid
@@ -103,18 +109,172 @@ def get_ontology_parents(curie, category):
         return None
 
 
-@lru_cache(CACHE_SIZE)
-def get_parent_concepts(curie, category, biolink_version) -> Optional[List[str]]:
+def get_ontology_ancestors_of(
+        curies: List[str],
+        btype: str,
+        url: str = ONTOLOGY_KP_TRAPI_SERVER
+) -> Optional[Dict[str, List[str]]]:
     """
-    Given a CURIE of a concept and its category,
-    attempt to return the parent concept if available
-    within an ontology modeled by a specified Biolink Model release.
+    Batch version of get_ontology_ancestors(): a single multi-id subclass query of the Ontology KP.
 
-    :param curie: CURIE of a concept instance
-    :param category: Biolink Category of the concept instance
-    :param biolink_version: Biolink Model version to use in validation (SemVer string specification)
-    :return List of parent concept identifiers, if the input CURIE lies within an ontology (DAG) hierarchy
+    :param curies: List[str], CURIEs of the ontology terms whose ancestors are needed
+    :param btype: str, Biolink category of the ontology terms
+    :param url: str, URL of the Ontology KP (Default: ONTOLOGY_KP_TRAPI_SERVER)
+    :return: Optional[Dict[str, List[str]]], ancestors (in the namespace of the term) indexed by each term CURIE;
+             None if the Ontology KP could not be queried
+    """
+    query = {
+        "message": {
+            "query_graph": {
+                "nodes": {
+                    "a": {
+                        "ids": curies
+                    },
+                    "b": {
+                        "categories": [btype]
+                    }
+                },
+                "edges": {
+                    "ab": {
+                        "subject": "a",
+                        "object": "b",
+                        "predicates": ["biolink:subclass_of"]
+                    }
+                }
+            }
+        }
+    }
+    response = post_query(url=url, query=query, server="Ontology KP")
+    if not response:
+        logger.warning("get_ontology_ancestors_of(): no response from the Ontology server: it may be offline?")
+        return None
+
+    ancestors: Dict[str, List[str]] = {curie: list() for curie in curies}
+    message: Dict = response["message"] if "message" in response and response["message"] else dict()
+    for result in message["results"] if "results" in message and message["results"] else []:
+        binding: Dict = result['node_bindings']['a'][0]
+        curie: str = binding['query_id'] if 'query_id' in binding and binding['query_id'] else binding['id']
+        parent_id: str = result['node_bindings']['b'][0]['id']
+        if curie not in ancestors or parent_id == curie:
+            # everything is a subclass of itself
+            continue
+        if not parent_id.startswith(curie.split(':')[0]):
+            # Don't give me UPHENO:000001 if I asked for a parent of HP:000012312
+            continue
+        if parent_id not in ancestors[curie]:
+            ancestors[curie].append(parent_id)
+    return ancestors
+
+
+def resolve_parent_concepts(
+        curies: Iterable[str],
+        category: str,
+        preferred_prefixes: List[str],
+        url: str = ONTOLOGY_KP_TRAPI_SERVER,
+        node_normalizer: Optional[NodeNormalizer] = None
+) -> Optional[Dict[str, Optional[List[str]]]]:
+    """
+    Resolve the parent concepts of a batch of CURIEs (of a given category), with one (chunked) bulk normalization
+    of the CURIEs, one (chunked) multi-id Ontology KP subclass query and one bulk normalization of their ancestors.
+
+    :param curies: Iterable[str], CURIEs of concept instances
+    :param category: str, Biolink Category of the concept instances
+    :param preferred_prefixes: List[str], namespaces of ontologies of the category (i.e. its Biolink Model id_prefixes)
+    :param url: str, URL of the Ontology KP (Default: ONTOLOGY_KP_TRAPI_SERVER)
+    :param node_normalizer: Optional[NodeNormalizer], Node Normalizer client (Default: None, use the shared client)
+    :return: Optional[Dict[str, Optional[List[str]]]], parent concepts (None if not within an ontology
+             hierarchy) indexed by CURIE; None if the Ontology KP could not be queried
+    """
+    node_normalizer = node_normalizer if node_normalizer is not None else get_node_normalizer()
+    curies = list(dict.fromkeys(curies))
+
+    # Normalize the input curie identifiers to the preferred ontology namespaces, in bulk
+    node_normalizer.resolve([curie for curie in curies if curie.split(':')[0] not in preferred_prefixes])
+    query_entities: Dict[str, Optional[str]] = {
+        curie: curie if curie.split(':')[0] in preferred_prefixes
+        else convert_to_preferred(curie, preferred_prefixes, node_normalizer=node_normalizer)
+        for curie in curies
+    }
+
+    # A "query_entity" within a DAG ontology hierarchy
+    # may return a List of zero or more general ontology terms
+    entities: List[str] = list(dict.fromkeys(entity for entity in query_entities.values() if entity is not None))
+    ancestors: Dict[str, List[str]] = dict()
+    for i in range(0, len(entities), ONTOLOGY_KP_CHUNK_SIZE):
+        chunk_ancestors: Optional[Dict[str, List[str]]] = \
+            get_ontology_ancestors_of(entities[i:i + ONTOLOGY_KP_CHUNK_SIZE], category, url=url)
+        if chunk_ancestors is None:
+            return None
+        ancestors.update(chunk_ancestors)
+
+    # Sanity check for mixed ontology namespaces, return
+    # identifiers only from the preferred input namespace?
+    terms: Dict[str, List[str]] = {
+        curie: [
+            term for term in ancestors[query_entities[curie]]
+            if term.split(':')[0] == curie.split(':')[0]
+        ] if query_entities[curie] is not None else []
+        for curie in curies
+    }
+    node_normalizer.resolve([term for curie_terms in terms.values() for term in curie_terms])
+
+    parents: Dict[str, Optional[List[str]]] = dict()
+    for curie in curies:
+        if not terms[curie]:
+            parents[curie] = None
+            continue
+        # terms unknown to the Node Normalizer are
+        # already in the input namespace, so are kept
+        input_prefix: str = curie.split(':')[0]
+        parents[curie] = [
+            convert_to_preferred(term, [input_prefix], node_normalizer=node_normalizer) or term
+            for term in terms[curie]
+        ]
+    return parents
+
+
+# Parent concepts memoized by Biolink Model version, category and CURIE
+_parent_concepts: ValidationCache = ValidationCache(max_size=100 * CACHE_SIZE)
+
+
+def get_parent_concepts_of(
+        curies: Iterable[str],
+        category: str,
+        biolink_version: Optional[str],
+        url: str = ONTOLOGY_KP_TRAPI_SERVER,
+        node_normalizer: Optional[NodeNormalizer] = None
+) -> Dict[str, Optional[List[str]]]:
     """
+    Batch version of get_parent_concepts(): the offline ontology closure index (if available) is
+    consulted first; other parent concepts are memoized, per Biolink Model version, so only
+    previously unseen CURIEs are resolved (by the Ontology KP).
+
+    :param curies: Iterable[str], CURIEs of concept instances
+    :param category: str, Biolink Category of the concept instances
+    :param biolink_version: Optional[str], Biolink Model version to use in validation (SemVer string specification)
+    :param url: str, URL of the Ontology KP (Default: ONTOLOGY_KP_TRAPI_SERVER)
+    :param node_normalizer: Optional[NodeNormalizer], Node Normalizer client (Default: None, use the shared client)
+    :return: Dict[str, Optional[List[str]]], parent concept identifiers, indexed by CURIE; None for a
+             CURIE which doesn't lie within an ontology (DAG) hierarchy (or the Ontology KP is unavailable)
+    """
+    parents: Dict[str, Optional[List[str]]] = dict()
+    unresolved: List[str] = list()
+    index: Optional[OntologyIndex] = get_ontology_index()
+    for curie in curies:
+        if index is not None and curie in index:
+            # ancestors are only reported from the input namespace, as for the Ontology KP
+            prefix: str = curie.split(':')[0]
+            ancestors: List[str] = [term for term in index.get_ancestors(curie) if term.split(':')[0] == prefix]
+            parents[curie] = ancestors if ancestors else None
+            continue
+        cached: Optional[List] = _parent_concepts.get(f"{biolink_version}|{category}|{curie}")
+        if cached is not None:
+            parents[curie] = cached[0]
+        else:
+            unresolved.append(curie)
+    if not unresolved:
+        return parents
+
     tk = get_biolink_model_toolkit(biolink_version=biolink_version)
     if not tk.is_category(category):
         assert False, f"'{category}' is not a Biolink Model Category!"
@@ -125,27 +285,28 @@ def get_parent_concepts(curie, category, biolink_version) -> Optional[List[str]]
     # preferred_prefixes = {'CHEBI', 'HP', 'MONDO', 'UBERON', 'CL', 'EFO', 'NCIT'}
     preferred_prefixes = tk.get_element(category).id_prefixes
 
-    # Normalize the input curie identifier
-    input_prefix = curie.split(':')[0]
-    if input_prefix in preferred_prefixes:
-        query_entity = curie
-    else:
-        query_entity = convert_to_preferred(curie, preferred_prefixes)
-    if query_entity is None:
-        return None
+    resolved: Optional[Dict[str, Optional[List[str]]]] = resolve_parent_concepts(
+        unresolved, category, preferred_prefixes, url=url, node_normalizer=node_normalizer
+    )
+    for curie in unresolved:
+        if resolved is None:
+            # failures of the Ontology KP are not memoized
+            parents[curie] = None
+        else:
+            _parent_concepts.put(f"{biolink_version}|{category}|{curie}", [resolved[curie]])
+            parents[curie] = resolved[curie]
+    return parents
 
-    # A "query_entity" within a DAG ontology hierarchy
-    # may return a List of zero or more general ontology terms
-    ancestors: List[str] = get_ontology_ancestors(query_entity, category)
-    if not ancestors:
-        return None
 
-    # Sanity check for mixed ontology namespaces, return
-    # identifiers only from the preferred input namespace?
-    ancestors = [
-        convert_to_preferred(term, [input_prefix])
-        for term in ancestors
-        if term.split(':')[0] == input_prefix
-    ]
+def get_parent_concepts(curie, category, biolink_version) -> Optional[List[str]]:
+    """
+    Given a CURIE of a concept and its category,
+    attempt to return the parent concept if available
+    within an ontology modeled by a specified Biolink Model release.
 
-    return ancestors
+    :param curie: CURIE of a concept instance
+    :param category: Biolink Category of the concept instance
+    :param biolink_version: Biolink Model version to use in validation (SemVer string specification)
+    :return List of parent concept identifiers, if the input CURIE lies within an ontology (DAG) hierarchy
+    """
+    return get_parent_concepts_of([curie], category, biolink_version)[curie]
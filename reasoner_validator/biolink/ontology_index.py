@@ -0,0 +1,309 @@
+"""
+Offline ontology closure index, for (network free) ontology subclass ('is_a') matching.
+
+The index is built from local ontology files (OBO, or OBO Graphs JSON, e.g. of MONDO, HP, CHEBI or UBERON)
+into a transitive closure of the ontology term ancestors, stored as 'compressed sparse row' arrays:
+a sorted list of term identifiers, a (term indexed) array of offsets and a flat array of (sorted)
+ancestor term indices. The index is saved to a binary file which is memory-mapped when loaded.
+"""
+from typing import Optional, Dict, List, Set, Iterable, Sequence, Tuple
+from array import array
+from bisect import bisect_left
+from mmap import mmap, ACCESS_READ
+from os import getenv
+from struct import Struct
+from sys import byteorder
+import gzip
+
+from reasoner_validator import codec
+
+import logging
+logger = logging.getLogger(__name__)
+
+# Path of an (optional) offline ontology closure index file, built
+# by the scripts/build_ontology_index.py command, loaded at startup
+ONTOLOGY_INDEX_PATH: Optional[str] = getenv("ONTOLOGY_INDEX_PATH")
+
+
+def iri_to_curie(iri: str) -> str:
+    """
+    :param iri: str, OBO PURL (e.g. 'http://purl.obolibrary.org/obo/MONDO_0005148') or CURIE
+    :return: str, CURIE of the term (e.g. 'MONDO:0005148')
+    """
+    if "/" not in iri and "#" not in iri:
+        return iri
+    local_id: str = iri.replace("#", "/").rstrip("/").split("/")[-1]
+    return local_id if ":" in local_id else local_id.replace("_", ":", 1)
+
+
+def _open(path: str):
+    return gzip.open(path, "rt", encoding="utf-8") if path.endswith(".gz") else open(path, "r", encoding="utf-8")
+
+
+def parse_obo(path: str) -> Dict[str, Set[str]]:
+    """
+    :param path: str, path to an OBO format ontology file (optionally gzip compressed)
+    :return: Dict[str, Set[str]], direct 'is_a' parents of each (non-obsolete) ontology term
+    """
+    parents: Dict[str, Set[str]] = dict()
+    term_id: Optional[str] = None
+    term_parents: Set[str] = set()
+    obsolete: bool = False
+    in_term: bool = False
+
+    def flush():
+        if in_term and term_id and not obsolete:
+            parents.setdefault(term_id, set()).update(term_parents)
+
+    with _open(path) as obo_file:
+        for line in obo_file:
+            line = line.strip()
+            if line.startswith("["):
+                flush()
+                in_term = line == "[Term]"
+                term_id, term_parents, obsolete = None, set(), False
+            elif in_term and ":" in line:
+                tag, _, value = line.partition(":")
+                value = value.split("!")[0].strip()
+                if tag == "id":
+                    term_id = value
+                elif tag == "is_a" and value:
+                    # 'is_a' values may be followed by {qualifiers}
+                    term_parents.add(value.split()[0])
+                elif tag == "is_obsolete" and value == "true":
+                    obsolete = True
+        flush()
+    return parents
+
+
+def parse_obographs(path: str) -> Dict[str, Set[str]]:
+    """
+    :param path: str, path to an OBO Graphs JSON format ontology file (optionally gzip compressed)
+    :return: Dict[str, Set[str]], direct 'is_a' parents of each (non-deprecated) ontology term
+    """
+    with _open(path) as json_file:
+        document: Dict = codec.load(json_file)
+    parents: Dict[str, Set[str]] = dict()
+    for graph in document["graphs"] if "graphs" in document else []:
+        deprecated: Set[str] = set()
+        for node in graph["nodes"] if "nodes" in graph else []:
+            if "meta" in node and node["meta"] and "deprecated" in node["meta"] and node["meta"]["deprecated"]:
+                deprecated.add(node["id"])
+            elif "type" not in node or node["type"] == "CLASS":
+                parents.setdefault(iri_to_curie(node["id"]), set())
+        for edge in graph["edges"] if "edges" in graph else []:
+            if edge["pred"] == "is_a" and edge["sub"] not in deprecated:
+                parents.setdefault(iri_to_curie(edge["sub"]), set()).add(iri_to_curie(edge["obj"]))
+    return parents
+
+
+def parse_ontology(path: str) -> Dict[str, Set[str]]:
+    """
+    :param path: str, path to an ontology file, in OBO Graphs JSON ('.json') or otherwise, OBO format
+    :return: Dict[str, Set[str]], direct 'is_a' parents of each ontology term
+    """
+    if path.endswith(".json") or path.endswith(".json.gz"):
+        return parse_obographs(path)
+    return parse_obo(path)
+
+
+class OntologyIndex:
+    """
+    Transitive closure of ontology term ancestors, in array-backed ('compressed sparse row') form.
+    The ancestors of the i'th (sorted) term identifier are the term indices
+    ancestors[offsets[i]:offsets[i+1]], themselves sorted (for binary search).
+    """
+    MAGIC: bytes = b"RVONTIX1"
+
+    # number of terms, number of ancestor entries and byte length of the term identifiers
+    HEADER: Struct = Struct("<QQQ")
+
+    def __init__(self, ids: List[str], offsets: Sequence[int], ancestors: Sequence[int]):
+        """
+        :param ids: List[str], sorted term identifiers (CURIEs)
+        :param offsets: Sequence[int], 'len(ids) + 1' offsets into the 'ancestors' array
+        :param ancestors: Sequence[int], flat array of the (sorted) ancestor term indices of each term
+        """
+        self.ids: List[str] = ids
+        self.offsets: Sequence[int] = offsets
+        self.ancestors: Sequence[int] = ancestors
+        self.index: Dict[str, int] = {curie: i for i, curie in enumerate(ids)}
+        self._mmap: Optional[mmap] = None
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, curie: str) -> bool:
+        return curie in self.index
+
+    @classmethod
+    def from_hierarchy(cls, parents: Dict[str, Iterable[str]]):
+        """
+        Compute the transitive closure of an ontology hierarchy.
+
+        :param parents: Dict[str, Iterable[str]], direct parents of each ontology term
+        :return: OntologyIndex
+        """
+        terms: Set[str] = set(parents.keys())
+        for term_parents in parents.values():
+            terms.update(term_parents)
+        ids: List[str] = sorted(terms)
+        index: Dict[str, int] = {curie: i for i, curie in enumerate(ids)}
+        direct: List[List[int]] = [
+            sorted({index[parent] for parent in parents[curie] if parent != curie}) if curie in parents else []
+            for curie in ids
+        ]
+
+        # iterative (post-order) depth first computation of the
+        # ancestor closure of each term; 'is_a' cycles are ignored
+        closure: List[Optional[Set[int]]] = [None] * len(ids)
+        for root in range(len(ids)):
+            if closure[root] is not None:
+                continue
+            visiting: Set[int] = {root}
+            stack: List[Tuple[int, int]] = [(root, 0)]
+            while stack:
+                term, position = stack[-1]
+                if position < len(direct[term]):
+                    stack[-1] = (term, position + 1)
+                    parent: int = direct[term][position]
+                    if closure[parent] is None and parent not in visiting:
+                        visiting.add(parent)
+                        stack.append((parent, 0))
+                else:
+                    stack.pop()
+                    visiting.discard(term)
+                    term_closure: Set[int] = set(direct[term])
+                    for parent in direct[term]:
+                        if closure[parent] is not None:
+                            term_closure.update(closure[parent])
+                    term_closure.discard(term)
+                    closure[term] = term_closure
+
+        offsets: array = array("Q", [0])
+        ancestors: array = array("I")
+        for term_closure in closure:
+            ancestors.extend(sorted(term_closure))
+            offsets.append(len(ancestors))
+        return cls(ids, offsets, ancestors)
+
+    @classmethod
+    def build(cls, paths: Iterable[str]):
+        """
+        Build an index from local ontology files.
+
+        :param paths: Iterable[str], paths to OBO or OBO Graphs JSON ontology files (optionally gzip compressed)
+        :return: OntologyIndex
+        """
+        parents: Dict[str, Set[str]] = dict()
+        for path in paths:
+            logger.info(f"OntologyIndex.build(): parsing ontology file '{path}'")
+            for curie, term_parents in parse_ontology(path).items():
+                parents.setdefault(curie, set()).update(term_parents)
+        return cls.from_hierarchy(parents)
+
+    def save(self, path: str):
+        """
+        Persist the index to a binary file: the MAGIC string, HEADER, term identifiers
+        (newline delimited UTF-8), then the 8-byte aligned little-endian 'offsets' and 'ancestors' arrays.
+
+        :param path: str, path to the index file
+        """
+        ids: bytes = "\n".join(self.ids).encode("utf-8")
+        offsets: array = array("Q", self.offsets)
+        ancestors: array = array("I", self.ancestors)
+        if byteorder != "little":
+            offsets.byteswap()
+            ancestors.byteswap()
+        with open(path, "wb") as index_file:
+            index_file.write(self.MAGIC)
+            index_file.write(self.HEADER.pack(len(self.ids), len(ancestors), len(ids)))
+            index_file.write(ids)
+            index_file.write(b"\0" * (-len(ids) % 8))
+            index_file.write(offsets.tobytes())
+            index_file.write(ancestors.tobytes())
+
+    @classmethod
+    def load(cls, path: str):
+        """
+        Load an index file, memory-mapping its 'offsets' and 'ancestors' arrays.
+
+        :param path: str, path to the index file
+        :return: OntologyIndex
+        """
+        with open(path, "rb") as index_file:
+            mapped: mmap = mmap(index_file.fileno(), 0, access=ACCESS_READ)
+        assert mapped[:len(cls.MAGIC)] == cls.MAGIC, f"OntologyIndex.load(): '{path}' is not an ontology index file!"
+        start: int = len(cls.MAGIC)
+        number_of_terms, number_of_ancestors, ids_length = cls.HEADER.unpack_from(mapped, start)
+        start += cls.HEADER.size
+        ids: List[str] = mapped[start:start + ids_length].decode("utf-8").split("\n") if number_of_terms else []
+        start += ids_length + (-ids_length % 8)
+
+        view: memoryview = memoryview(mapped)
+        offsets_end: int = start + 8 * (number_of_terms + 1)
+        offsets: Sequence[int] = view[start:offsets_end].cast("Q")
+        ancestors: Sequence[int] = view[offsets_end:offsets_end + 4 * number_of_ancestors].cast("I")
+        if byteorder != "little":
+            # memory-mapping is only zero-copy on little-endian platforms
+            offsets, ancestors = array("Q", offsets), array("I", ancestors)
+            offsets.byteswap()
+            ancestors.byteswap()
+
+        index = cls(ids, offsets, ancestors)
+        index._mmap = mapped
+        return index
+
+    def get_ancestors(self, curie: str) -> Optional[List[str]]:
+        """
+        :param curie: str, ontology term identifier
+        :return: Optional[List[str]], all (transitive) ancestors of the term; None if the term is not indexed
+        """
+        if curie not in self.index:
+            return None
+        i: int = self.index[curie]
+        return [self.ids[ancestor] for ancestor in self.ancestors[self.offsets[i]:self.offsets[i + 1]]]
+
+    def is_subclass_of(self, curie: str, ancestor: str) -> bool:
+        """
+        :param curie: str, ontology term identifier
+        :param ancestor: str, candidate ancestor term identifier
+        :return: bool, True if 'ancestor' is a (transitive, proper) superclass of the term
+        """
+        if curie not in self.index or ancestor not in self.index:
+            return False
+        i: int = self.index[curie]
+        target: int = self.index[ancestor]
+        start: int = self.offsets[i]
+        end: int = self.offsets[i + 1]
+        position: int = bisect_left(self.ancestors, target, start, end)
+        return position < end and self.ancestors[position] == target
+
+
+_ontology_index: Optional[OntologyIndex] = None
+_ontology_index_loaded: bool = False
+
+
+def get_ontology_index() -> Optional[OntologyIndex]:
+    """
+    :return: Optional[OntologyIndex], offline ontology closure index, loaded (once) from
+             the file at ONTOLOGY_INDEX_PATH, if given (Default: None, no index available)
+    """
+    global _ontology_index, _ontology_index_loaded
+    if not _ontology_index_loaded:
+        _ontology_index_loaded = True
+        if ONTOLOGY_INDEX_PATH:
+            try:
+                _ontology_index = OntologyIndex.load(ONTOLOGY_INDEX_PATH)
+            except (OSError, ValueError, AssertionError) as error:
+                logger.error(f"Ontology index '{ONTOLOGY_INDEX_PATH}' could not be loaded: {str(error)}")
+    return _ontology_index
+
+
+def set_ontology_index(index: Optional[OntologyIndex]):
+    """
+    :param index: Optional[OntologyIndex], offline ontology closure index to use (None: disable the index)
+    """
+    global _ontology_index, _ontology_index_loaded
+    _ontology_index = index
+    _ontology_index_loaded = True
@@ -0,0 +1,250 @@
+"""
+Bounded caches of validation verdicts and reports, keyed by stable content hashes of the validated TRAPI data.
+"""
+from typing import Optional, Any, Dict, List
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from hashlib import sha256
+from tempfile import NamedTemporaryFile
+from os import replace, makedirs, remove, scandir, utime
+from os.path import exists, join, dirname, abspath
+
+from reasoner_validator import codec
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+def content_hash(content: Any) -> str:
+    """
+    Stable hash of JSON-like content: the hash is independent of the ordering of dictionary keys,
+    hence is the same for equivalent content of successive (separately parsed) TRAPI Responses.
+
+    :param content: Any, JSON-like data (e.g. a TRAPI knowledge graph node, edge or result)
+    :return: str, hexadecimal SHA-256 digest of the canonical JSON serialization of the content
+    """
+    return sha256(codec.dumps_bytes(content, sort_keys=True, default_function=str)).hexdigest()
+
+
+def write_atomically(path: str, data: bytes):
+    """
+    Write data to a file through a uniquely named temporary file (in the same directory) which is then
+    renamed, so that neither an interrupted write nor concurrent writers of the same file corrupt the file.
+
+    :param path: str, path of the file to be written
+    :param data: bytes, content of the file
+    """
+    temporary_file = NamedTemporaryFile(dir=dirname(abspath(path)), suffix=".tmp", delete=False)
+    try:
+        with temporary_file:
+            temporary_file.write(data)
+        replace(temporary_file.name, path)
+    except BaseException:
+        if exists(temporary_file.name):
+            remove(temporary_file.name)
+        raise
+
+
+class ValidationCache:
+    """
+    Thread-safe, bounded ('least recently used' evicting) cache of validation verdicts,
+    optionally expiring entries after a given 'time to live', which may be persisted
+    to (and reloaded from) a JSON file on disk.
+    """
+    DEFAULT_MAX_SIZE: int = 100000
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE, path: Optional[str] = None, ttl: Optional[float] = None):
+        """
+        :param max_size: int, maximum number (> 0) of cached entries (Default: 100000)
+        :param path: Optional[str], path to the JSON file in which the cache is persisted.
+                     The cache is initially loaded from the file, if it exists (Default: None, not persisted)
+        :param ttl: Optional[float], 'time to live', in seconds, of cached entries (Default: None, entries don't expire)
+        """
+        assert max_size > 0, "ValidationCache(): 'max_size' must be a positive integer!"
+        self.max_size: int = max_size
+        self.path: Optional[str] = path
+        self.ttl: Optional[float] = ttl
+        self._entries: OrderedDict = OrderedDict()
+        self._expiry: Dict[str, float] = dict()
+        self._lock: Lock = Lock()
+        if path and exists(path):
+            self.load(path)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._entries and not self._expired(key)
+
+    def _expired(self, key: str) -> bool:
+        if key in self._expiry and self._expiry[key] <= monotonic():
+            self._entries.pop(key)
+            self._expiry.pop(key)
+            return True
+        return False
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        :param key: str, cache key
+        :return: Optional[Any], cached value; None if the key is not cached (or its entry has expired)
+        """
+        with self._lock:
+            if key not in self._entries or self._expired(key):
+                return None
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def put(self, key: str, value: Any):
+        """
+        Cache a value, evicting the least recently used entries if the cache is full.
+
+        :param key: str, cache key
+        :param value: Any, (JSON serializable, if the cache is to be persisted) value to be cached
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if self.ttl is not None:
+                self._expiry[key] = monotonic() + self.ttl
+            while len(self._entries) > self.max_size:
+                evicted, _ = self._entries.popitem(last=False)
+                self._expiry.pop(evicted, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._expiry.clear()
+
+    def save(self, path: Optional[str] = None):
+        """
+        Persist the cache, as JSON, to disk.
+
+        :param path: Optional[str], path to the target JSON file (Default: None, use the path of the cache)
+        """
+        path = path if path else self.path
+        assert path, "ValidationCache.save(): no file path given to persist the cache!"
+        with self._lock:
+            entries: List[List] = [[key, value] for key, value in self._entries.items()]
+        write_atomically(path, codec.dumps_bytes({"max_size": self.max_size, "entries": entries}, default_function=str))
+
+    def load(self, path: Optional[str] = None):
+        """
+        Load (and merge) cache entries, persisted as JSON on disk, into the cache.
+
+        :param path: Optional[str], path to the source JSON file (Default: None, use the path of the cache)
+        """
+        path = path if path else self.path
+        assert path, "ValidationCache.load(): no file path given from which to load the cache!"
+        try:
+            with open(path, "rb") as cache_file:
+                cached: Dict = codec.load(cache_file)
+        except (OSError, ValueError) as error:
+            logger.error(f"ValidationCache.load(): cache file '{path}' could not be loaded: {str(error)}")
+            return
+        for key, value in cached["entries"] if "entries" in cached else []:
+            self.put(key, value)
+
+
+class ResponseValidationCache:
+    """
+    Cache of the validation reports of whole TRAPI Responses, with an in-memory ('least recently used' evicting)
+    tier, optionally backed by an on-disk tier, of one JSON file per report in a given directory, bounded by
+    a total size in bytes (beyond which the least recently used reports are deleted).
+    """
+    DEFAULT_MAX_SIZE: int = 128
+    DEFAULT_MAX_BYTES: int = 2**30
+
+    def __init__(
+            self,
+            max_size: int = DEFAULT_MAX_SIZE,
+            directory: Optional[str] = None,
+            max_bytes: int = DEFAULT_MAX_BYTES
+    ):
+        """
+        :param max_size: int, maximum number (> 0) of reports cached in memory (Default: 128)
+        :param directory: Optional[str], directory of the on-disk tier of the cache (Default: None, memory only)
+        :param max_bytes: int, maximum total size (> 0), in bytes, of the reports of the on-disk tier (Default: 1 GiB)
+        """
+        assert max_bytes > 0, "ResponseValidationCache(): 'max_bytes' must be a positive integer!"
+        self.memory: ValidationCache = ValidationCache(max_size=max_size)
+        self.directory: Optional[str] = directory
+        self.max_bytes: int = max_bytes
+        # sizes of the reports of the on-disk tier, in (least to most) recently used order
+        self._files: OrderedDict = OrderedDict()
+        self._lock: Lock = Lock()
+        if directory:
+            makedirs(directory, exist_ok=True)
+            reports: List = [
+                entry for entry in scandir(directory) if entry.is_file() and entry.name.endswith(".json")
+            ]
+            for entry in sorted(reports, key=lambda e: e.stat().st_mtime):
+                self._files[entry.name[:-len(".json")]] = entry.stat().st_size
+            self._evict()
+
+    @staticmethod
+    def key(response: Dict, parameters: List) -> str:
+        """
+        The response is hashed as is (not in canonical key order, which would cost about as much as
+        parsing the response in the first place): the same (JSON text of a) response, parsed again,
+        has the same key, whereas a response with reordered keys is just a cache miss.
+
+        :param response: Dict, TRAPI Response
+        :param parameters: List, (JSON serializable) validation parameters on which the validation report depends
+        :return: str, cache key of the validation report of the response
+        """
+        digest = sha256(content_hash(parameters).encode("utf-8"))
+        digest.update(codec.dumps_bytes(response, default_function=str))
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return join(self.directory, f"{key}.json")
+
+    def _evict(self):
+        # delete the least recently used reports, until the on-disk tier fits within 'max_bytes'
+        total: int = sum(self._files.values())
+        while total > self.max_bytes and self._files:
+            evicted, size = self._files.popitem(last=False)
+            total -= size
+            try:
+                remove(self._path(evicted))
+            except OSError:
+                # e.g. already deleted by another cache instance sharing the directory
+                pass
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        :param key: str, cache key
+        :return: Optional[Dict], cached validation report; None if the key is not cached
+        """
+        report: Optional[Dict] = self.memory.get(key)
+        if report is None and self.directory and exists(self._path(key)):
+            try:
+                with open(self._path(key), "rb") as report_file:
+                    report = codec.load(report_file)
+                # the modification time of a report records its last use, across cache instances
+                utime(self._path(key))
+            except (OSError, ValueError) as error:
+                logger.error(f"ResponseValidationCache.get(): cached report '{key}' could not be loaded: {str(error)}")
+                return None
+            with self._lock:
+                if key in self._files:
+                    self._files.move_to_end(key)
+            # promote the report to the in-memory tier
+            self.memory.put(key, report)
+        return report
+
+    def put(self, key: str, report: Dict):
+        """
+        :param key: str, cache key
+        :param report: Dict, validation report (i.e. 'to_dict()' of the validator) to be cached
+        """
+        self.memory.put(key, report)
+        if self.directory:
+            data: bytes = codec.dumps_bytes(report)
+            write_atomically(self._path(key), data)
+            with self._lock:
+                self._files[key] = len(data)
+                self._files.move_to_end(key)
+                self._evict()
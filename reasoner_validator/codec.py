@@ -0,0 +1,128 @@
+"""
+JSON codec of the reasoner-validator, through which TRAPI Responses are loaded and validation reports serialized.
+
+The (optional) 'orjson' package (i.e. the 'fast-json' extra of the package) is used if installed, which parses and serializes
+(large) TRAPI Responses and validation reports many times faster than the Python standard library 'json'
+module, to which the codec otherwise falls back. The messages of validation reports (e.g. as exported by
+to_dict()) are natively serialized by both libraries, their (set) parameter values being recorded as lists.
+Read-only message views, sets and other iterables (which neither library serializes) are otherwise serialized
+as JSON objects and (sorted, for sets) lists, respectively.
+
+Both libraries serialize compact, unescaped (UTF-8) JSON text, but the serialized text may still differ in details
+(e.g. of the formatting of floating point numbers) between installations with and without the 'orjson' package.
+"""
+from typing import Optional, Any, Callable, Union, IO
+from collections.abc import Mapping
+import json
+
+from reasoner_validator.message import MessagesView
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+def default(o: Any) -> Any:
+    """
+    Serialization of (validation report) objects not natively serialized by the JSON libraries.
+    :param o: Any, object to be serialized
+    :return: Any, JSON serializable (dictionary or list) equivalent of the object
+    :raises: TypeError, if the object is not serializable
+    """
+    if isinstance(o, MessagesView):
+        # the underlying message data is serialized as is, rather than view by (nested) view
+        return o.unwrap()
+    if isinstance(o, Mapping):
+        return dict(o)
+    if isinstance(o, (set, frozenset)):
+        return sorted(o, key=str)
+    try:
+        iterable = iter(o)
+    except TypeError:
+        pass
+    else:
+        return list(iterable)
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+def uses_orjson() -> bool:
+    """
+    :return: bool, True if the codec uses the (fast) 'orjson' library
+    """
+    return orjson is not None
+
+
+def loads(data: Union[str, bytes, bytearray, memoryview]) -> Any:
+    """
+    :param data: Union[str, bytes, bytearray, memoryview], JSON text (e.g. of a TRAPI Response)
+    :return: Any, parsed JSON content
+    :raises: json.JSONDecodeError, if the JSON text is invalid (which 'orjson' errors also are)
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load(file: IO) -> Any:
+    """
+    :param file: IO, (text or binary) file of JSON text (e.g. of a TRAPI Response)
+    :return: Any, parsed JSON content
+    :raises: json.JSONDecodeError, if the JSON text is invalid
+    """
+    return loads(file.read())
+
+
+def dumps_bytes(
+        content: Any,
+        indent: Optional[int] = None,
+        sort_keys: bool = False,
+        default_function: Optional[Callable[[Any], Any]] = default
+) -> bytes:
+    """
+    :param content: Any, JSON-like content (e.g. a validation report)
+    :param indent: Optional[int], indentation of the JSON text (Default: None, compact JSON text)
+    :param sort_keys: bool, if True, the keys of JSON objects are sorted (Default: False)
+    :param default_function: Optional[Callable[[Any], Any]], serialization of objects not natively
+                             serialized (Default: dictionaries of mappings and lists of iterables)
+    :return: bytes, (UTF-8 encoded) JSON text of the content, e.g. for a web service response
+    """
+    # 'orjson' only indents by two spaces (and only serializes 64-bit integers)
+    if orjson is not None and indent in [None, 2]:
+        option: int = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(content, default=default_function, option=option)
+        except orjson.JSONEncodeError as error:
+            logger.debug(f"dumps_bytes(): falling back to the 'json' library: {str(error)}")
+    return json.dumps(
+        content,
+        default=default_function,
+        indent=indent,
+        sort_keys=sort_keys,
+        separators=None if indent else (",", ":"),
+        ensure_ascii=False
+    ).encode("utf-8")
+
+
+def dumps(
+        content: Any,
+        indent: Optional[int] = None,
+        sort_keys: bool = False,
+        default_function: Optional[Callable[[Any], Any]] = default
+) -> str:
+    """
+    :param content: Any, JSON-like content (e.g. a validation report)
+    :param indent: Optional[int], indentation of the JSON text (Default: None, compact JSON text)
+    :param sort_keys: bool, if True, the keys of JSON objects are sorted (Default: False)
+    :param default_function: Optional[Callable[[Any], Any]], serialization of objects not natively
+                             serialized (Default: dictionaries of mappings and lists of iterables)
+    :return: str, JSON text of the content
+    """
+    return dumps_bytes(content, indent=indent, sort_keys=sort_keys, default_function=default_function).decode("utf-8")
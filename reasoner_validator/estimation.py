@@ -0,0 +1,202 @@
+"""
+Estimation of the prevalence of validation message codes across all the nodes, edges or results of a
+TRAPI Response Message, from the validation of a stratified random sample of those elements.
+
+Each validated element (the sampling 'unit') either exhibits a given validation code or not. The prevalence
+of the code over the whole population of elements is then estimated as the stratum size weighted mean of its
+per-stratum sample proportions, with a (finite population corrected) variance from which a Wilson score
+confidence interval is computed on the 'effective' sample size of the (stratified) design.
+"""
+from typing import Optional, Dict, List, Set, Tuple, Hashable
+from math import sqrt
+from statistics import NormalDist
+
+from reasoner_validator.sampling import StratifiedSampler
+
+import logging
+logger = logging.getLogger(__name__)
+
+# Prevalence estimate of a single validation code, with the tags:
+# "prevalence", "lower", "upper" (confidence interval) and "observed" (count of sampled units exhibiting the code)
+PREVALENCE_ESTIMATE = Dict[str, float]
+
+
+def wilson_interval(proportion: float, sample_size: float, z: float) -> Tuple[float, float]:
+    """
+    Wilson score confidence interval of a proportion (which, unlike the 'normal
+    approximation' interval, remains informative for proportions of, or near, zero or one).
+
+    :param proportion: float, (estimated) proportion
+    :param sample_size: float, (effective) sample size (> 0) of the estimate
+    :param z: float, standard normal quantile of the confidence level (e.g. 1.96 for 95% confidence)
+    :return: Tuple[float, float], lower and upper bounds of the confidence interval
+    """
+    z2: float = z * z
+    denominator: float = 1.0 + z2 / sample_size
+    centre: float = (proportion + z2 / (2.0 * sample_size)) / denominator
+    half_width: float = \
+        z * sqrt(proportion * (1.0 - proportion) / sample_size + z2 / (4.0 * sample_size * sample_size)) / denominator
+    return max(0.0, centre - half_width), min(1.0, centre + half_width)
+
+
+class PrevalenceEstimator:
+    """
+    Stratified estimator of the prevalence of validation codes in a population of TRAPI elements.
+    Samples are drawn incrementally: each call to 'extend()' returns only the newly drawn units,
+    which are to be validated by the caller, then their validation codes recorded with 'observe()'.
+    """
+    def __init__(
+            self,
+            strata: Dict[Hashable, List],
+            seed: Optional[int] = None,
+            confidence: float = 0.95
+    ):
+        """
+        :param strata: Dict[Hashable, List], members (units) of each stratum of the population
+        :param seed: Optional[int], seed of the pseudo-random number generator used to draw samples (default: None)
+        :param confidence: float, confidence level (0 < confidence < 1) of the estimated intervals (default: 0.95)
+        """
+        assert 0.0 < confidence < 1.0, "PrevalenceEstimator(): 'confidence' must be between zero and one!"
+        self.strata: Dict[Hashable, List] = strata
+        self.confidence: float = confidence
+        self.z: float = NormalDist().inv_cdf(0.5 + confidence / 2.0)
+        self.sampler: StratifiedSampler = StratifiedSampler(seed=seed)
+
+        # Each stratum is drawn in a fixed random order, so that
+        # successive (growing) samples are supersets of one another
+        self.order: Dict[Hashable, List] = {
+            stratum: self.sampler.rng.sample(members, len(members)) for stratum, members in strata.items()
+        }
+        self.quotas: Dict[Hashable, int] = {stratum: 0 for stratum in strata}
+
+        # sets of validation codes exhibited by each validated unit, indexed by stratum
+        self.observations: Dict[Hashable, List[Set[str]]] = {stratum: list() for stratum in strata}
+
+    @property
+    def population_size(self) -> int:
+        return sum(len(members) for members in self.strata.values())
+
+    @property
+    def sample_size(self) -> int:
+        return sum(len(observed) for observed in self.observations.values())
+
+    def is_exhaustive(self) -> bool:
+        """
+        :return: bool, True if every member of the population has been observed
+        """
+        return all(len(self.observations[stratum]) == len(members) for stratum, members in self.strata.items())
+
+    def extend(self, sample_size: int) -> List[Tuple[Hashable, object]]:
+        """
+        Grow the sample to (approximately) 'sample_size' units in total. The sample size is raised, if need
+        be, to the number of (non-empty) strata, since every stratum must be sampled for its weight to be
+        represented in the (otherwise biased) population estimates.
+
+        :param sample_size: int, target total sample size
+        :return: List[Tuple[Hashable, object]], (stratum, member) of the units newly drawn into the sample
+        """
+        strata: Dict[Hashable, List] = {stratum: members for stratum, members in self.strata.items() if members}
+        if sample_size < len(strata):
+            logger.debug(f"PrevalenceEstimator.extend(): sample size {sample_size} raised to {len(strata)} strata")
+            sample_size = len(strata)
+        drawn: List[Tuple[Hashable, object]] = list()
+        for stratum, quota in self.sampler.allocate(strata, sample_size).items():
+            if quota > self.quotas[stratum]:
+                drawn.extend((stratum, member) for member in self.order[stratum][self.quotas[stratum]:quota])
+                self.quotas[stratum] = quota
+        return drawn
+
+    def observe(self, stratum: Hashable, codes: Set[str]):
+        """
+        Record the (set of) validation codes exhibited by a validated unit.
+
+        :param stratum: Hashable, stratum of the unit
+        :param codes: Set[str], validation codes reported for the unit (empty if the unit is valid)
+        """
+        self.observations[stratum].append(set(codes))
+
+    def get_codes(self) -> Set[str]:
+        """
+        :return: Set[str], all validation codes observed in the sample
+        """
+        codes: Set[str] = set()
+        for observed in self.observations.values():
+            for unit_codes in observed:
+                codes.update(unit_codes)
+        return codes
+
+    def _weights(self) -> Dict[Hashable, float]:
+        # Population weights of the (non-empty) strata, all of which are
+        # sampled by 'extend()', hence never renormalized over a subset
+        total: int = self.population_size
+        return {stratum: len(members) / total for stratum, members in self.strata.items() if members}
+
+    def estimate(self, code: Optional[str]) -> PREVALENCE_ESTIMATE:
+        """
+        Estimate the prevalence of a validation code in the population.
+
+        :param code: Optional[str], validation code; None estimates the (upper bound of) the
+                     prevalence of any code which is absent from the current sample
+        :return: PREVALENCE_ESTIMATE, estimated prevalence with confidence interval
+        """
+        n: int = self.sample_size
+        if not n:
+            return {"prevalence": 0.0, "lower": 0.0, "upper": 1.0, "observed": 0}
+
+        prevalence: float = 0.0
+        variance: float = 0.0
+        observed: int = 0
+        for stratum, weight in self._weights().items():
+            units: List[Set[str]] = self.observations[stratum]
+            n_h: int = len(units)
+            k_h: int = sum(1 for unit_codes in units if code in unit_codes)
+            p_h: float = k_h / n_h
+            observed += k_h
+            prevalence += weight * p_h
+            if n_h > 1:
+                sampling_fraction: float = n_h / len(self.strata[stratum])
+                variance += weight * weight * (1.0 - sampling_fraction) * p_h * (1.0 - p_h) / (n_h - 1)
+
+        if self.is_exhaustive():
+            # a census has no sampling error
+            lower, upper = prevalence, prevalence
+        else:
+            effective_n: float = prevalence * (1.0 - prevalence) / variance if variance > 0.0 else n
+            lower, upper = wilson_interval(prevalence, effective_n, self.z)
+
+        return {"prevalence": prevalence, "lower": lower, "upper": upper, "observed": observed}
+
+    def estimates(self) -> Dict[str, PREVALENCE_ESTIMATE]:
+        """
+        :return: Dict[str, PREVALENCE_ESTIMATE], prevalence estimates of all the validation codes observed
+        """
+        return {code: self.estimate(code) for code in sorted(self.get_codes())}
+
+    def max_half_width(self) -> float:
+        """
+        :return: float, largest confidence interval half-width of all the observed validation
+                 codes (including that of the upper bound of any unobserved validation code)
+        """
+        unobserved: PREVALENCE_ESTIMATE = self.estimate(None)
+        return max(
+            [unobserved["upper"] / 2.0] +
+            [(entry["upper"] - entry["lower"]) / 2.0 for entry in self.estimates().values()]
+        )
+
+    def is_stable(self, tolerance: float) -> bool:
+        """
+        :param tolerance: float, maximum acceptable confidence interval half-width of the estimates
+        :return: bool, True if all estimates are within the given tolerance (or the population is exhausted)
+        """
+        return self.is_exhaustive() or self.max_half_width() <= tolerance
+
+    def to_dict(self) -> Dict:
+        """
+        :return: Dict, summary of the population, sample and prevalence estimates of the observed validation codes
+        """
+        return {
+            "population": self.population_size,
+            "sampled": self.sample_size,
+            "strata": len(self.strata),
+            "estimates": self.estimates()
+        }
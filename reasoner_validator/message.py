@@ -3,7 +3,8 @@ This module provides standalone global reasoner-validator validation Message typ
 to avoid load order conflicts for other modules using these data types.
 """
 from enum import Enum
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Any, Iterator
+from collections.abc import Mapping
 
 #
 # The MESSAGE_CATALOG data structure is something like the following:
@@ -97,3 +98,59 @@ MESSAGES_BY_TARGET = Dict[
     str,  # target identifier: endpoint URL, URI or CURIE
     MESSAGES_BY_TEST
 ]
+
+
+class MessagesView(Mapping):
+    """
+    Read-only (lazy) view of a nested validation message data structure, e.g. MESSAGES_BY_TARGET.
+    Nested dictionaries are likewise wrapped as read-only views, and lists as tuples, as they are accessed.
+    Since nothing is copied, the view reflects later messages reported to the underlying ValidationReporter.
+    """
+    __slots__ = ("_data",)
+
+    def __init__(self, data: Dict):
+        """
+        :param data: Dict, (nested) message data to be viewed
+        """
+        self._data: Dict = data
+
+    @staticmethod
+    def wrap(value: Any) -> Any:
+        """
+        :param value: Any, a value of the message data structure
+        :return: Any, a read-only version of the value (scalar values are returned as is)
+        """
+        if isinstance(value, Dict):
+            return MessagesView(value)
+        elif isinstance(value, List):
+            return tuple(MessagesView.wrap(item) for item in value)
+        else:
+            return value
+
+    def unwrap(self) -> Dict:
+        """
+        :return: Dict, the underlying (nested) message data, e.g. for its (read-only) serialization
+        """
+        return self._data
+
+    def __getitem__(self, key: str) -> Any:
+        return self.wrap(self._data[key])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key) -> bool:
+        return key in self._data
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, MessagesView):
+            return self._data == other._data
+        elif isinstance(other, Dict):
+            return self._data == other
+        return super().__eq__(other)
+
+    def __repr__(self) -> str:
+        return f"MessagesView({self._data!r})"
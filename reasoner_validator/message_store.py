@@ -0,0 +1,329 @@
+"""
+Compact (columnar) storage of the validation messages of a ValidationReporter, for very large validation reports
+(e.g. of knowledge graphs with millions of warnings). Rather than being recorded in the nested MESSAGES_BY_TARGET
+data structure, one dictionary of parameters per message, each message is recorded as one row of a set of
+array-backed columns of indices, into a table of interned symbols (targets, tests, message types with
+their codes, identifiers and tuples of parameter names), with the parameter values appended to a flat list.
+The nested MESSAGES_BY_TARGET data structure is only materialized on demand.
+"""
+from array import array
+from sys import byteorder
+from typing import Optional, Dict, List, Tuple, Any, Hashable
+
+from reasoner_validator.message import (
+    MessageType,
+    MESSAGE_CATALOG,
+    MESSAGE_PARAMETERS,
+    IDENTIFIED_MESSAGES,
+    MESSAGES_BY_TARGET,
+    MESSAGES_BY_TEST
+)
+
+
+class ColumnarMessageStore:
+    """
+    Columnar store of validation messages, indexed by target, test, message type and code,
+    as recorded by ValidationReporter.report() and ValidationReporter.add_messages().
+    """
+    # 'identifier' column values of messages without an identifier, recorded as either an empty dictionary
+    # (as by ValidationReporter.report()) or None (as by ValidationReporter.add_messages()) for their code
+    NO_IDENTIFIER: int = -1
+    NO_CONTENT: int = -2
+
+    # 'parameters' column value of messages without any parameters besides their identifier
+    NO_PARAMETERS: int = -1
+
+    def __init__(self):
+        # interned symbols: targets, tests, (message type, code) tuples, identifiers and tuples of parameter names
+        self._symbols: List[Hashable] = list()
+        self._symbol_index: Dict[Hashable, int] = dict()
+
+        # (target, test) symbol indices of the message contexts, in order of creation
+        self._contexts: List[Tuple[int, int]] = list()
+        self._context_index: Dict[Tuple[str, str], int] = dict()
+
+        # the columns of the messages, one row per message (in the order reported)
+        self._context_column: array = array('I')
+        self._code_column: array = array('I')
+        self._identifier_column: array = array('i')
+        self._parameters_column: array = array('i')
+
+        # the parameter values of all messages, in the order of the rows and their parameter names (the values,
+        # e.g. edge identifiers, are generally unique to each message, thus are simply referenced, not interned)
+        self._parameter_values: List[Any] = list()
+
+    def __len__(self) -> int:
+        return len(self._code_column)
+
+    def extent(self) -> Tuple[int, int]:
+        """
+        :return: Tuple[int, int], numbers of messages and of message contexts recorded, which only ever
+                 grow, thus identify the contents of the store (e.g. to cache their materialization)
+        """
+        return len(self._code_column), len(self._contexts)
+
+    def _intern(self, symbol: Hashable) -> int:
+        """
+        :param symbol: Hashable, string (or tuple of parameter names) to be interned
+        :return: int, index of the symbol in the symbol table
+        """
+        if symbol not in self._symbol_index:
+            self._symbol_index[symbol] = len(self._symbols)
+            self._symbols.append(symbol)
+        return self._symbol_index[symbol]
+
+    def add_context(self, target: str, test: str) -> int:
+        """
+        Register a (possibly still empty) message context.
+        :param target: str, target of the messages
+        :param test: str, test of the messages
+        :return: int, index of the message context
+        """
+        context: Tuple[str, str] = (target, test)
+        if context not in self._context_index:
+            self._context_index[context] = len(self._contexts)
+            self._contexts.append((self._intern(target), self._intern(test)))
+        return self._context_index[context]
+
+    def append(
+            self,
+            target: str,
+            test: str,
+            message_type: MessageType,
+            code: str,
+            identifier: Optional[Hashable] = None,
+            parameters: Optional[MESSAGE_PARAMETERS] = None,
+            content: bool = True
+    ):
+        """
+        Record one message.
+        :param target: str, target of the message
+        :param test: str, test of the message
+        :param message_type: MessageType, type of the message
+        :param code: str, validation code of the message
+        :param identifier: Optional[Hashable], message identifier (Default: None, message without an identifier)
+        :param parameters: Optional[MESSAGE_PARAMETERS], additional parameters of an identified message
+        :param content: bool, if False, a message without an identifier records its code with None content
+                        (Default: True, recording an empty dictionary of identified messages for its code)
+        """
+        self._context_column.append(self.add_context(target, test))
+        self._code_column.append(self._intern((message_type.name, code)))
+        if identifier is None:
+            self._identifier_column.append(self.NO_IDENTIFIER if content else self.NO_CONTENT)
+            self._parameters_column.append(self.NO_PARAMETERS)
+            return
+        self._identifier_column.append(self._intern(identifier))
+        if not parameters:
+            self._parameters_column.append(self.NO_PARAMETERS)
+            return
+        self._parameters_column.append(self._intern(tuple(parameters.keys())))
+        self._parameter_values.extend(parameters.values())
+
+    def add_messages(
+            self,
+            target: str,
+            test: str,
+            message_type: MessageType,
+            code: str,
+            content: Optional[IDENTIFIED_MESSAGES]
+    ):
+        """
+        Record a batch of messages of a given code, as added by ValidationReporter.add_messages().
+        :param target: str, target of the messages
+        :param test: str, test of the messages
+        :param message_type: MessageType, type of the messages
+        :param code: str, validation code of the messages
+        :param content: Optional[IDENTIFIED_MESSAGES], identified messages of the code
+        """
+        if not content:
+            self.append(target, test, message_type, code, content=False)
+            return
+        identifier: str
+        parameters_list: Optional[List[MESSAGE_PARAMETERS]]
+        for identifier, parameters_list in content.items():
+            if parameters_list:
+                for parameters in parameters_list:
+                    self.append(target, test, message_type, code, identifier=identifier, parameters=parameters)
+            else:
+                self.append(target, test, message_type, code, identifier=identifier)
+
+    def extend(self, other):
+        """
+        Record all the messages (and message contexts) of another message store, in their order,
+        without materializing them. The parameter values are shared with the other store.
+        :param other: ColumnarMessageStore, store of the messages to be recorded
+        """
+        assert other is not self, "ColumnarMessageStore.extend(): a message store cannot extend itself"
+        symbols: List[int] = [self._intern(symbol) for symbol in other._symbols]
+        contexts: List[int] = [
+            self.add_context(other._symbols[target_index], other._symbols[test_index])
+            for target_index, test_index in other._contexts
+        ]
+        self._context_column.extend(contexts[context] for context in other._context_column)
+        self._code_column.extend(symbols[code] for code in other._code_column)
+        # negative indices (of messages without an identifier or parameters) are not symbols
+        self._identifier_column.extend(
+            symbols[identifier] if identifier >= 0 else identifier for identifier in other._identifier_column
+        )
+        self._parameters_column.extend(
+            symbols[names] if names >= 0 else names for names in other._parameters_column
+        )
+        self._parameter_values.extend(other._parameter_values)
+
+    def materialize(self, target: Optional[str] = None, test: Optional[str] = None) -> MESSAGES_BY_TARGET:
+        """
+        Materialize the (nested) MESSAGES_BY_TARGET data structure of the messages, as
+        they would have been recorded by the ValidationReporter without a message store.
+
+        :param target: Optional[str], if given, only materialize the messages of the given target
+        :param test: Optional[str], if given, only materialize the messages of the given test
+        :return: MESSAGES_BY_TARGET, (new) messages indexed by target, test, message type and code
+        """
+        messages: MESSAGES_BY_TARGET = dict()
+        catalogs: Dict[int, MESSAGE_CATALOG] = dict()
+        context: int
+        for context, (target_index, test_index) in enumerate(self._contexts):
+            context_target: str = self._symbols[target_index]
+            context_test: str = self._symbols[test_index]
+            if (target is None or context_target == target) and (test is None or context_test == test):
+                messages_by_test: MESSAGES_BY_TEST = messages.setdefault(context_target, dict())
+                catalogs[context] = messages_by_test.setdefault(
+                    context_test, {name: dict() for name in MessageType.__members__}
+                )
+
+        position: int = 0
+        for row in range(len(self._code_column)):
+            parameters_index: int = self._parameters_column[row]
+            names: Tuple[str, ...] = self._symbols[parameters_index] \
+                if parameters_index != self.NO_PARAMETERS else tuple()
+            start: int = position
+            position += len(names)
+            context = self._context_column[row]
+            if context not in catalogs:
+                continue
+
+            message_type: str
+            code: str
+            message_type, code = self._symbols[self._code_column[row]]
+            partition: Dict = catalogs[context][message_type]
+
+            identifier_index: int = self._identifier_column[row]
+            if identifier_index < 0:
+                if code not in partition:
+                    partition[code] = dict() if identifier_index == self.NO_IDENTIFIER else None
+                continue
+            if code not in partition or partition[code] is None:
+                partition[code] = dict()
+            identified_messages: IDENTIFIED_MESSAGES = partition[code]
+            identifier: str = self._symbols[identifier_index]
+            if not names:
+                identified_messages[identifier] = None
+            else:
+                if identifier not in identified_messages or identified_messages[identifier] is None:
+                    identified_messages[identifier] = list()
+                identified_messages[identifier].append(dict(zip(names, self._parameter_values[start:position])))
+
+        return messages
+
+    @staticmethod
+    def _narrowed(column: array) -> array:
+        """
+        :param column: array, column of (signed or unsigned) indices
+        :return: array, column of the same indices, of the narrowest integer type spanning their range
+        """
+        if not column:
+            return column
+        low: int = min(column)
+        high: int = max(column)
+        for typecode in (["b", "h"] if column.typecode == "i" else ["B", "H"]):
+            bits: int = 8 * array(typecode).itemsize
+            if typecode.islower():
+                in_range: bool = -2**(bits - 1) <= low and high < 2**(bits - 1)
+            else:
+                in_range: bool = high < 2**bits
+            if in_range:
+                return array(typecode, column)
+        return column
+
+    def to_columns(self) -> Dict[str, Any]:
+        """
+        :return: Dict[str, Any], the (serializable) contents of the store: its symbol table, message contexts,
+                 columns (as the bytes of their arrays, narrowed to the integer type spanning the range of their
+                 indices, of the 'byteorder' of the platform) and parameter values
+        """
+        columns: Dict[str, Any] = {
+            "byteorder": byteorder,
+            "symbols": self._symbols,
+            "contexts": self._contexts,
+            "parameter_values": self._parameter_values
+        }
+        column: array
+        for column, name in [
+            (self._context_column, "context_column"),
+            (self._code_column, "code_column"),
+            (self._identifier_column, "identifier_column"),
+            (self._parameters_column, "parameters_column")
+        ]:
+            narrowed: array = self._narrowed(column)
+            columns[name] = [narrowed.typecode, narrowed.tobytes()]
+        return columns
+
+    @classmethod
+    def from_columns(cls, columns: Dict[str, Any]):
+        """
+        :param columns: Dict[str, Any], contents of a store, as returned by to_columns()
+                        (with tuples possibly deserialized as lists)
+        :return: ColumnarMessageStore, store of the given contents
+        """
+        store = cls()
+        store._symbols = [tuple(symbol) if isinstance(symbol, List) else symbol for symbol in columns["symbols"]]
+        store._symbol_index = {symbol: index for index, symbol in enumerate(store._symbols)}
+        store._contexts = [tuple(context) for context in columns["contexts"]]
+        store._context_index = {
+            (store._symbols[target_index], store._symbols[test_index]): index
+            for index, (target_index, test_index) in enumerate(store._contexts)
+        }
+        column: array
+        for column, name in [
+            (store._context_column, "context_column"),
+            (store._code_column, "code_column"),
+            (store._identifier_column, "identifier_column"),
+            (store._parameters_column, "parameters_column")
+        ]:
+            typecode, data = columns[name]
+            narrowed: array = array(typecode)
+            narrowed.frombytes(data)
+            if columns["byteorder"] != byteorder:
+                narrowed.byteswap()
+            if typecode == column.typecode:
+                column.extend(narrowed)
+            else:
+                column.fromlist(narrowed.tolist())
+        store._parameter_values = list(columns["parameter_values"])
+        return store
+
+    @classmethod
+    def from_messages(cls, messages: MESSAGES_BY_TARGET):
+        """
+        :param messages: MESSAGES_BY_TARGET, messages indexed by target, test, message type and code
+        :return: ColumnarMessageStore, store of the given messages (which it materializes as is)
+        """
+        store = cls()
+        target: str
+        messages_by_test: MESSAGES_BY_TEST
+        for target, messages_by_test in messages.items():
+            test: str
+            message_catalog: MESSAGE_CATALOG
+            for test, message_catalog in messages_by_test.items():
+                store.add_context(target, test)
+                for message_type in MessageType:
+                    if message_type.name not in message_catalog:
+                        continue
+                    code: str
+                    content: Optional[IDENTIFIED_MESSAGES]
+                    for code, content in message_catalog[message_type.name].items():
+                        if not content:
+                            store.append(target, test, message_type, code, content=content is not None)
+                        else:
+                            store.add_messages(target, test, message_type, code, content)
+        return store
@@ -0,0 +1,131 @@
+"""
+Batched, cached resolution of CURIE identifier cliques ('aliases') by the Translator Node Normalizer
+"""
+from typing import Optional, Dict, List, Iterable
+from concurrent.futures import ThreadPoolExecutor
+
+from reasoner_validator import post_query, NODE_NORMALIZER_SERVER
+from reasoner_validator.cache import ValidationCache
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+class NodeNormalizer:
+    """
+    Client of the Node Normalizer 'get_normalized_nodes' endpoint, which resolves batches of CURIEs with
+    (concurrent) multi-CURIE requests of a limited 'chunk size'. Resolved cliques are kept in a bounded cache,
+    with a 'time to live', shared by all users of the NodeNormalizer instance (e.g. all TRAPIResponseValidators).
+    """
+    DEFAULT_CHUNK_SIZE: int = 500
+    DEFAULT_MAX_WORKERS: int = 4
+    DEFAULT_CACHE_SIZE: int = 100000
+    DEFAULT_TTL: float = 86400.0  # one day, in seconds
+
+    def __init__(
+            self,
+            url: str = NODE_NORMALIZER_SERVER,
+            chunk_size: int = DEFAULT_CHUNK_SIZE,
+            max_workers: int = DEFAULT_MAX_WORKERS,
+            cache_size: int = DEFAULT_CACHE_SIZE,
+            ttl: Optional[float] = DEFAULT_TTL
+    ):
+        """
+        :param url: str, URL of the Node Normalizer 'get_normalized_nodes' endpoint (Default: NODE_NORMALIZER_SERVER)
+        :param chunk_size: int, maximum number (> 0) of CURIEs resolved by each Node Normalizer request
+        :param max_workers: int, maximum number (> 0) of concurrent Node Normalizer requests
+        :param cache_size: int, maximum number of cached CURIE cliques
+        :param ttl: Optional[float], 'time to live', in seconds, of cached CURIE cliques (None: cliques don't expire)
+        """
+        assert chunk_size > 0, "NodeNormalizer(): 'chunk_size' must be a positive integer!"
+        assert max_workers > 0, "NodeNormalizer(): 'max_workers' must be a positive integer!"
+        self.url: str = url
+        self.chunk_size: int = chunk_size
+        self.max_workers: int = max_workers
+        self.cache: ValidationCache = ValidationCache(max_size=cache_size, ttl=ttl)
+
+    def _post(self, curies: List[str]) -> Optional[Dict]:
+        result: Dict = post_query(url=self.url, query={'curies': curies}, server="Node Normalizer")
+        # an empty result signals failure of the request (logged by post_query)
+        return result if result else None
+
+    def resolve(self, curies: Iterable[str]) -> Dict[str, Optional[Dict]]:
+        """
+        Resolve the cliques of a batch of CURIEs: cached cliques are returned directly,
+        others are retrieved from the Node Normalizer by (concurrent) chunked requests.
+
+        :param curies: Iterable[str], CURIEs to be resolved
+        :return: Dict[str, Optional[Dict]], Node Normalizer cliques indexed by CURIE. A CURIE unknown to
+                 the Node Normalizer has a None clique; CURIEs which could not be resolved (i.e. due to
+                 Node Normalizer request failures) are missing from the dictionary (and are not cached).
+        """
+        resolved: Dict[str, Optional[Dict]] = dict()
+        unresolved: List[str] = list()
+        for curie in dict.fromkeys(curies):  # removes duplicates, preserving order
+            cached: Optional[List] = self.cache.get(curie)
+            if cached is not None:
+                # cliques are cached wrapped in a list, to distinguish cached 'None' cliques from cache misses
+                resolved[curie] = cached[0]
+            else:
+                unresolved.append(curie)
+
+        if unresolved:
+            chunks: List[List[str]] = [
+                unresolved[i:i + self.chunk_size] for i in range(0, len(unresolved), self.chunk_size)
+            ]
+            if len(chunks) == 1:
+                results: List[Optional[Dict]] = [self._post(chunks[0])]
+            else:
+                with ThreadPoolExecutor(max_workers=min(self.max_workers, len(chunks))) as executor:
+                    results = list(executor.map(self._post, chunks))
+
+            for chunk, result in zip(chunks, results):
+                if result is None:
+                    logger.warning(f"NodeNormalizer.resolve(): failed to resolve {len(chunk)} CURIEs")
+                    continue
+                for curie in chunk:
+                    clique: Optional[Dict] = result[curie] if curie in result and result[curie] else None
+                    self.cache.put(curie, [clique])
+                    resolved[curie] = clique
+
+        return resolved
+
+    def get_clique(self, curie: str) -> Optional[Dict]:
+        """
+        :param curie: str, CURIE to be resolved
+        :return: Optional[Dict], Node Normalizer clique of the CURIE; None if unknown or unresolved
+        """
+        resolved: Dict[str, Optional[Dict]] = self.resolve([curie])
+        return resolved[curie] if curie in resolved else None
+
+    @staticmethod
+    def get_equivalent_identifiers(clique: Optional[Dict]) -> List[str]:
+        """
+        :param clique: Optional[Dict], Node Normalizer clique
+        :return: List[str], equivalent identifiers of the clique (empty if not available)
+        """
+        if clique and "equivalent_identifiers" in clique:
+            return [entry["identifier"] for entry in clique["equivalent_identifiers"]]
+        return list()
+
+
+# Default NodeNormalizer shared by all validators
+_node_normalizer: NodeNormalizer = NodeNormalizer()
+
+
+def get_node_normalizer() -> NodeNormalizer:
+    """
+    :return: NodeNormalizer, default (shared) Node Normalizer client
+    """
+    return _node_normalizer
+
+
+def set_node_normalizer(node_normalizer: NodeNormalizer):
+    """
+    Reset the default (shared) Node Normalizer client, e.g. to use another
+    Node Normalizer instance or a local stand-in (for testing purposes).
+
+    :param node_normalizer: NodeNormalizer, new default Node Normalizer client
+    """
+    global _node_normalizer
+    _node_normalizer = node_normalizer
@@ -0,0 +1,337 @@
+"""
+Rendering of the (human-readable) text validation report of a ValidationReporter (see ValidationReporter.dump()
+and ValidationReporter.dumps()), written through a buffered writer, with the header of each validation code
+only generated once, and optionally paginated: each page renders a given number of targets, tests, codes
+or identifiers, returning a cursor from which the next page is rendered, such that (e.g. web service
+or command line) clients may page through very large validation reports without rendering them whole.
+"""
+from typing import Optional, Dict, List, Tuple, IO
+from collections import Counter
+from functools import lru_cache
+from itertools import islice
+
+from reasoner_validator.message import (
+    MESSAGE_CATALOG,
+    MESSAGE_PARTITION,
+    IDENTIFIED_MESSAGES,
+    MESSAGE_PARAMETERS,
+    MESSAGES_BY_TARGET,
+    MESSAGES_BY_TEST
+)
+from reasoner_validator.validation_codes import CodeDictionary
+
+# units by which a report may be paginated, and their level in the report (i.e. their position in a cursor)
+PAGE_UNITS: Dict[str, int] = {"target": 0, "test": 1, "code": 3, "identifier": 4}
+
+# positions of a cursor: target, test, message type, code and identifier
+_CURSOR_SIZE: int = 5
+
+# number of characters buffered by a BufferedWriter before being written to its file
+DEFAULT_BUFFER_SIZE: int = 1 << 16
+
+
+@lru_cache(maxsize=None)
+def code_header(code: str) -> Tuple[str, Optional[str]]:
+    """
+    :param code: str, validation code
+    :return: Tuple[str, Optional[str]], (cached) tag and message template of the validation code
+    """
+    return CodeDictionary.validation_code_tag(code), CodeDictionary.get_message_template(code)
+
+
+class BufferedWriter:
+    """
+    Writer of text fragments, buffered until 'buffer_size' characters are pending, then written to a file
+    as a single string. Without a file, all the text is buffered, to be returned by getvalue().
+    """
+    def __init__(self, file: Optional[IO] = None, buffer_size: int = DEFAULT_BUFFER_SIZE):
+        """
+        :param file: Optional[IO], (text) file to which the text is written (Default: None, the text is kept)
+        :param buffer_size: int, number of characters buffered before being written to the file
+        """
+        self.file: Optional[IO] = file
+        self.buffer_size: int = buffer_size
+        self._fragments: List[str] = list()
+        self._size: int = 0
+
+    def write(self, text: str):
+        self._fragments.append(text)
+        self._size += len(text)
+        if self.file is not None and self._size >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        """
+        Write the buffered text to the file (if any).
+        """
+        if self.file is not None and self._fragments:
+            self.file.write("".join(self._fragments))
+            self._fragments = list()
+            self._size = 0
+
+    def getvalue(self) -> str:
+        """
+        :return: str, all the (buffered) text written, if the writer has no file
+        """
+        return "".join(self._fragments)
+
+
+def parse_cursor(cursor: Optional[str]) -> List[int]:
+    """
+    :param cursor: Optional[str], cursor returned by ReportRenderer.render() (Default: None, start of the report)
+    :return: List[int], positions of the cursor (i.e. of the target, test, message type, code and identifier)
+    :raises: ValueError, if the cursor is invalid
+    """
+    if cursor is None:
+        return [0] * _CURSOR_SIZE
+    positions: List[str] = cursor.split(":")
+    if len(positions) != _CURSOR_SIZE or not all(position.isdigit() for position in positions):
+        raise ValueError(f"Invalid validation report cursor '{cursor}'")
+    return [int(position) for position in positions]
+
+
+class ReportRenderer:
+    """
+    Renderer of the text validation report of a ValidationReporter.
+    """
+    def __init__(self, reporter, id_rows: int = 0, msg_rows: int = 0, compact_format: bool = False):
+        """
+        :param reporter: ValidationReporter, of which the messages are rendered
+        :param id_rows: int >= 0, if set, maximum number of code-related identifiers to
+                             print per code (value of 0 means print all; default: 0)
+        :param msg_rows: int >= 0, if set, maximum number of parameterized code-related messages to
+                                  print per identifier row (value of 0 means print all; default: 0)
+        :param compact_format: bool, if True, omit blank lines inserted by default for human readability;
+                               also, suppress character escapes (i.e. underlining of titles) (default: False)
+        """
+        assert id_rows >= 0, "ReportRenderer(): 'id_rows' argument must be positive or equal to zero"
+        assert msg_rows >= 0, "ReportRenderer(): 'msg_rows' argument must be positive or equal to zero"
+        self.reporter = reporter
+        self.id_rows: int = id_rows
+        self.msg_rows: int = msg_rows
+        self.compact_format: bool = compact_format
+
+    def render(
+            self,
+            writer: BufferedWriter,
+            title: Optional[str] = "",
+            cursor: Optional[str] = None,
+            page_by: Optional[str] = None,
+            page_size: int = 0
+    ) -> Optional[str]:
+        """
+        Render (a page of) the validation report. The report header is only rendered on the first page,
+        whereas each page repeats the target, test, message type and code headers of its first messages.
+
+        :param writer: BufferedWriter, to which the report is written
+        :param title: Optional[str], report title (see ValidationReporter.report_header())
+        :param cursor: Optional[str], cursor of the page to be rendered, as returned by the rendering
+                       of the previous page (of the same, unchanged, report) (Default: None, first page)
+        :param page_by: Optional[str], unit of pagination, one of 'target', 'test', 'code' or 'identifier'
+                        (Default: None, the report is rendered whole)
+        :param page_size: int, number of units of pagination per page (Default: 0, the report is rendered whole)
+        :return: Optional[str], cursor of the next page, or None if the report has been fully rendered
+        :raises: ValueError, if the cursor is invalid
+        """
+        assert page_by is None or page_by in PAGE_UNITS, \
+            f"ReportRenderer.render(): 'page_by' should be one of {', '.join(PAGE_UNITS.keys())}"
+        assert page_size >= 0, "ReportRenderer.render(): 'page_size' argument must be positive or equal to zero"
+        start: List[int] = parse_cursor(cursor)
+        page_level: Optional[int] = PAGE_UNITS[page_by] if page_by is not None and page_size else None
+        units: int = 0
+        compact_format: bool = self.compact_format
+        blank: str = "" if compact_format else "\n"
+
+        if cursor is None:
+            writer.write(f"{self.reporter.report_header(title, compact_format)}.\n{blank}")
+            if not self.reporter.has_messages():
+                writer.write("Hurray! No validation messages reported!\n")
+                return None
+
+        # messages counted, but not recorded, as a consequence of the reporting policy, indexed by (target, test)
+        unrecorded_by_test: Dict[Tuple[str, str], Dict[str, Counter]] = dict()
+        context: Tuple[str, str, str]
+        counts: Counter
+        for context, counts in self.reporter._unrecorded.items():
+            unrecorded_by_test.setdefault((context[0], context[1]), dict())[context[2]] = counts
+
+        # (target, test and message type) headers are only written with the first message rendered below them
+        pending: List[str] = list()
+
+        def emit(text: str):
+            if pending:
+                writer.write("".join(pending))
+                pending.clear()
+            writer.write(text)
+
+        messages: MESSAGES_BY_TARGET = self.reporter.messages
+        target: str
+        target_messages: MESSAGES_BY_TEST
+        for ti, (target, target_messages) in enumerate(islice(messages.items(), start[0], None), start[0]):
+            if page_level == 0:
+                if units >= page_size:
+                    return f"{ti}:0:0:0:0"
+                units += 1
+            on_target: bool = ti == start[0]
+            target_mark: int = len(pending)
+            if not compact_format:
+                pending.append(f"\033[4mTarget: {target}\033[0m\n\n")
+            else:
+                # compact also ignores underlining
+                pending.append(f"\nTarget: {target}\n")
+
+            test: str
+            test_messages: MESSAGE_CATALOG
+            test_offset: int = start[1] if on_target else 0
+            for si, (test, test_messages) in enumerate(islice(target_messages.items(), test_offset, None), test_offset):
+                if page_level == 1:
+                    if units >= page_size:
+                        return f"{ti}:{si}:0:0:0"
+                    units += 1
+                on_test: bool = on_target and si == start[1]
+                test_mark: int = len(pending)
+                if not compact_format:
+                    pending.append(f"\t\033[4mTest: {test}\033[0m\n\n")
+                else:
+                    # compact also ignores underlining
+                    pending.append(f"\tTest: {test}\n")
+
+                unrecorded_codes: Dict[str, Counter] = \
+                    unrecorded_by_test[(target, test)] if (target, test) in unrecorded_by_test else dict()
+
+                message_type: str
+                coded_messages: MESSAGE_PARTITION
+                type_offset: int = start[2] if on_test else 0
+                for yi, (message_type, coded_messages) in \
+                        enumerate(islice(test_messages.items(), type_offset, None), type_offset):
+                    # print nothing if a given message_type has no messages
+                    if not coded_messages:
+                        continue
+                    on_type: bool = on_test and yi == start[2]
+                    type_mark: int = len(pending)
+                    if not compact_format:
+                        pending.append(f"\t\t\033[4m{message_type.capitalize()}\033[0m\n\n")
+                    else:
+                        # compact also ignores underlining
+                        pending.append(f"\n\t\t{message_type.capitalize()}:\n")
+
+                    code: str
+                    messages_by_code: Optional[IDENTIFIED_MESSAGES]
+                    code_offset: int = start[3] if on_type else 0
+                    for ci, (code, messages_by_code) in \
+                            enumerate(islice(coded_messages.items(), code_offset, None), code_offset):
+                        if page_level == 3:
+                            if units >= page_size:
+                                return f"{ti}:{si}:{yi}:{ci}:0"
+                            units += 1
+                        on_code: bool = on_type and ci == start[3]
+                        id_offset: int = start[4] if on_code else 0
+                        code_label: str
+                        template: Optional[str]
+                        code_label, template = code_header(code)
+                        code_text: str = f"\t\t* {code_label}:\n\t\t=> {template}\n{blank}"
+                        unrecorded: Counter = unrecorded_codes[code] if code in unrecorded_codes else Counter()
+                        if unrecorded[None] and not id_offset:
+                            code_text += f"\t\t\t{str(unrecorded[None])} more messages " + \
+                                         f"for code '{code_label}' (not recorded)...\n"
+                        code_mark: int = 0
+                        if not messages_by_code or page_level != 4:
+                            emit(code_text)
+                        else:
+                            # the code header is only written with the first identifier rendered below it
+                            code_mark = len(pending)
+                            pending.append(code_text)
+                        if messages_by_code is None:
+                            continue
+
+                        num_ids: int = len(messages_by_code)
+                        more_ids: int = num_ids - self.id_rows if num_ids > self.id_rows else 0
+                        ids_per_row: int = id_offset
+                        identifier: str
+                        parameters_list: Optional[List[MESSAGE_PARAMETERS]]
+                        for ii, (identifier, parameters_list) in \
+                                enumerate(islice(messages_by_code.items(), id_offset, None), id_offset):
+                            if page_level == 4:
+                                if units >= page_size:
+                                    return f"{ti}:{si}:{yi}:{ci}:{ii}"
+                                units += 1
+                            if parameters_list is None:
+                                # For codes whose context of validation is solely discerned
+                                # with their identifier, just print out the identifier
+                                emit(f"\t\t\t\t# {identifier}\n{blank}")
+                            else:
+                                self._render_identified_messages(
+                                    emit, target, test, code, identifier, parameters_list, unrecorded[identifier]
+                                )
+                            ids_per_row += 1
+                            if self.id_rows and ids_per_row >= self.id_rows:
+                                if more_ids:
+                                    emit(f"\t\t\t{str(more_ids)} more identifiers for code '{code_label}'...\n")
+                                break
+                        if len(pending) > code_mark:
+                            # no identifier was rendered below the code header
+                            del pending[code_mark:]
+                        else:
+                            emit(blank)
+                    del pending[type_mark:]
+
+                # codes of which no message at all was recorded
+                recorded_codes = {code for partition in test_messages.values() for code in partition}
+                for code, counts in unrecorded_codes.items():
+                    if code not in recorded_codes:
+                        emit(
+                            f"\t\t* {code_header(code)[0]}: " +
+                            f"{str(sum(counts.values()))} messages (not recorded)...\n{blank}"
+                        )
+                if len(pending) > test_mark:
+                    # headers of a test without any messages
+                    emit("")
+            if len(pending) > target_mark:
+                emit("")
+        return None
+
+    def _render_identified_messages(
+            self,
+            emit,
+            target: str,
+            test: str,
+            code: str,
+            identifier: str,
+            parameters_list: List[MESSAGE_PARAMETERS],
+            unrecorded: int
+    ):
+        """
+        Render the (parameterized) messages of a given identifier.
+        :param emit: function writing the rendered text
+        :param target: str, target of the messages
+        :param test: str, test of the messages
+        :param code: str, validation code of the messages
+        :param identifier: str, identifier of the messages
+        :param parameters_list: List[MESSAGE_PARAMETERS], parameters of each message
+        :param unrecorded: int, number of messages of the identifier not recorded (see ReportingPolicy)
+        """
+        msg_rows: int = self.msg_rows
+        num_messages: int = len(parameters_list)
+        more_msgs: int = num_messages - msg_rows if msg_rows and num_messages > msg_rows else 0
+        more_msgs += unrecorded
+        occurrences: Dict[Tuple, int] = self.reporter._occurrences[(target, test, code, identifier)] \
+            if (target, test, code, identifier) in self.reporter._occurrences else dict()
+
+        lines: List[str] = [f"\t\t\t\t# {identifier}\n"]
+        if parameters_list:
+            lines.append(f"\t\t\t\t- {' | '.join(parameters_list[0].keys())}: \n")
+        parameters: MESSAGE_PARAMETERS
+        for parameters in (parameters_list[:msg_rows] if msg_rows else parameters_list):
+            # number of occurrences of deduplicated messages
+            repeats: str = ""
+            if occurrences:
+                frozen: Tuple = self.reporter._frozen_parameters(parameters)
+                if frozen in occurrences and occurrences[frozen] > 1:
+                    repeats = f" (x{occurrences[frozen]})"
+            # the parameter values are sanitized for the report (in case non-string values sneak through)
+            lines.append(f"\t\t\t\t\t{' | '.join(map(str, parameters.values()))}{repeats}\n")
+        if more_msgs:
+            lines.append(f"\t\t\t\t{str(more_msgs)} more messages for identifier '{identifier}'...\n")
+        if not self.compact_format:
+            lines.append("\n")
+        emit("".join(lines))
@@ -1,12 +1,13 @@
 """Error and Warning Reporting Module"""
 from enum import Enum
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Set, Tuple, NamedTuple, Hashable
+from collections import Counter
 from sys import stdout
 from importlib import metadata
-from io import StringIO
-import copy
+from contextlib import contextmanager
+from copy import deepcopy
 
-from json import dumps, JSONEncoder
+import json
 
 from reasoner_validator.message import (
     MessageType,
@@ -15,28 +16,23 @@ from reasoner_validator.message import (
     IDENTIFIED_MESSAGES,
     MESSAGE_PARAMETERS,
     MESSAGES_BY_TARGET,
-    MESSAGES_BY_TEST
+    MESSAGES_BY_TEST,
+    MessagesView
 )
+from reasoner_validator import codec, serialization
+from reasoner_validator.message_store import ColumnarMessageStore
+from reasoner_validator.rendering import BufferedWriter, ReportRenderer
+from reasoner_validator.sinks import MESSAGE_RECORD, MessageSink, message_record
 from reasoner_validator.validation_codes import CodeDictionary
 
 import logging
 logger = logging.getLogger(__name__)
 
 
-class ReportJsonEncoder(JSONEncoder):
-    def default(self, o):
-        try:
-            iterable = iter(o)
-        except TypeError:
-            pass
-        else:
-            return list(iterable)
-        # Let the base class default method raise the TypeError
-        return JSONEncoder.default(self, o)
-
-
-def _output(json, flat=False):
-    return dumps(json, cls=ReportJsonEncoder, sort_keys=False, indent=None if flat else 4)
+def _output(content, flat=False):
+    # the (human-readable) text output keeps the formatting of the 'json' library
+    # (i.e. ", " and ": " separators, ASCII escaped), rather than the compact text of the codec
+    return json.dumps(content, default=codec.default, sort_keys=False, indent=None if flat else 4)
 
 
 class TRAPIGraphType(Enum):
@@ -49,6 +45,65 @@ class TRAPIGraphType(Enum):
         return self.value.lower().replace(" ", "_")
 
 
+class ReportingPolicy(NamedTuple):
+    """
+    Policies bounding the memory used by a ValidationReporter to record validation messages, e.g. for the millions
+    of (identical) warnings of a huge knowledge graph. Messages which are not recorded, as a consequence of these
+    policies, are still counted (see ValidationReporter.summary() and ValidationReporter.get_unrecorded_messages()).
+    Note that the policies apply to reported messages, not to messages added in batch (e.g. merged messages).
+    """
+    # maximum number of identifiers recorded per code (0: no limit)
+    max_identifiers: int = 0
+
+    # maximum number of parameter entries recorded per identifier (0: no limit)
+    max_messages: int = 0
+
+    # if True, identical message parameters are only recorded once for
+    # a given identifier, with their number of occurrences being counted
+    deduplicate: bool = False
+
+    # if given, messages of lower severity (in the order of declaration of
+    # MessageType, from 'info' to 'critical') are only counted, not recorded
+    min_severity: Optional[MessageType] = None
+
+    def to_dict(self) -> Dict:
+        """
+        :return: Dict, (JSON serializable) reporting policy
+        """
+        return {
+            "max_identifiers": self.max_identifiers,
+            "max_messages": self.max_messages,
+            "deduplicate": self.deduplicate,
+            "min_severity": self.min_severity.name if self.min_severity is not None else None
+        }
+
+
+# fields by which the messages of a ValidationReporter may be indexed (see ValidationReporter.find_messages()):
+# the message identifier and the values of selected message parameters
+INDEXED_FIELDS: Tuple[str, ...] = ("identifier", "edge_id", "node_id", "attribute_id")
+
+# location of an (indexed) message: its target, test, message type (name), code, identifier and parameters (if any)
+MESSAGE_LOCATION = Tuple[str, str, str, str, Hashable, Optional[MESSAGE_PARAMETERS]]
+
+
+def merge_reporters(reporters: List):
+    """
+    Merge (by pairwise tree reduction, moving rather than copying the messages) the messages of a list of
+    ValidationReporters, e.g. of parallel validation workers, into the first ValidationReporter of the list,
+    with the messages merged in the order of the list. The other ValidationReporters are left without messages.
+
+    :param reporters: List[ValidationReporter], non-empty list of ValidationReporters to be merged
+    :return: ValidationReporter, the first ValidationReporter of the list, with the messages of all of them
+    """
+    assert reporters, "merge_reporters(): empty list of reporters to be merged?"
+    level: List = list(reporters)
+    while len(level) > 1:
+        for i in range(0, len(level) - 1, 2):
+            level[i].merge(level[i + 1], move=True)
+        level = level[::2]
+    return level[0]
+
+
 class ValidationReporter:
     """
     General wrapper for managing validation status messages: information, warnings, errors and 'critical' (errors).
@@ -61,7 +116,12 @@ class ValidationReporter:
             self,
             default_test: Optional[str] = None,
             default_target: Optional[str] = None,
-            strict_validation: Optional[bool] = None
+            strict_validation: Optional[bool] = None,
+            compact_messages: bool = False,
+            reporting_policy: Optional[ReportingPolicy] = None,
+            message_sink: Optional[MessageSink] = None,
+            retain_messages: bool = True,
+            index_messages: bool = False
     ):
         """
         :param default_test: Optional[str] = None, initial default test context of the Validator messages
@@ -70,12 +130,230 @@ class ValidationReporter:
                                also used as a prefix in validation messages. Default "global" if not provided.
         :param strict_validation: Optional[bool] = None, if True, some tests validate as 'error'; False, simply issues
                                   'info' message; A value of 'None' uses the default value for specific graph contexts.
+        :param compact_messages: bool = False, if True, messages are recorded in a (much more compact) columnar
+                                 message store, with the MESSAGES_BY_TARGET 'messages' only materialized on demand,
+                                 e.g. for very large validation reports (Default: False, messages are recorded as is)
+        :param reporting_policy: Optional[ReportingPolicy] = None, if given, policies bounding the number
+                                 of messages recorded (Default: None, all reported messages are recorded)
+        :param message_sink: Optional[MessageSink] = None, if given, sink to which each message is
+                             emitted as soon as it is reported (or added), e.g. a JsonLinesFileSink
+        :param retain_messages: bool = True, if False, messages are only emitted to the
+                                'message_sink' (and counted), rather than also being recorded
+        :param index_messages: bool = False, if True, the recorded messages are indexed by their identifier and
+                               selected parameter values (see INDEXED_FIELDS), e.g. to find the messages
+                               of a given edge or node (see find_messages())
         """
         self.default_test: str = default_test if default_test else "Test"
         self.default_target: str = default_target if default_target else "Target"
         self.strict_validation: Optional[bool] = strict_validation
+        self._store: Optional[ColumnarMessageStore] = ColumnarMessageStore() if compact_messages else None
         self.messages: MESSAGES_BY_TARGET = dict()
 
+        # last materialization of the message store (if compact_messages), with the store and its extent
+        self._materialized: Optional[Tuple[ColumnarMessageStore, Tuple[int, int], MESSAGES_BY_TARGET]] = None
+
+        # running counts of the messages reported, indexed by (target, test, message type) then by code,
+        # and by code over all targets and tests (see has_message_type() and summary())
+        self._message_counts: Dict[Tuple[str, str, str], Counter] = dict()
+        self._code_counts: Counter = Counter()
+
+        # bookkeeping of the reporting policy: number of parameter entries recorded, indexed by (target, test, code)
+        # then by identifier, occurrences of (deduplicated) parameters, indexed by (target, test, code, identifier)
+        # then by parameters, and number of messages not recorded, indexed by (target, test, code) then by identifier
+        # (or None, for messages of unrecorded identifiers, or below the minimum severity)
+        self.reporting_policy: Optional[ReportingPolicy] = reporting_policy
+        self._recorded_messages: Dict[Tuple[str, str, str], Dict[Hashable, int]] = dict()
+        self._occurrences: Dict[Tuple[str, str, str, Hashable], Dict[Tuple, int]] = dict()
+        self._unrecorded: Dict[Tuple[str, str, str], Counter] = dict()
+
+        self.message_sink: Optional[MessageSink] = message_sink
+        self.retain_messages: bool = retain_messages
+
+        # (optional) inverted index of the recorded messages, indexed by field (see INDEXED_FIELDS) then by value
+        self._message_index: Optional[Dict[str, Dict[Hashable, List[MESSAGE_LOCATION]]]] = \
+            {field: dict() for field in INDEXED_FIELDS} if index_messages else None
+        # (indexed) locations of the messages solely discerned by their identifier, for constant time membership
+        self._identifier_locations: Set[MESSAGE_LOCATION] = set()
+
+        # stack of (possibly nested) active message captures (see capture_messages())
+        self._captures: List[Tuple[List, bool]] = list()
+
+    @property
+    def messages(self) -> MESSAGES_BY_TARGET:
+        """
+        :return: MESSAGES_BY_TARGET, messages of the ValidationReporter. If compact_messages, the messages are
+                 materialized from the message store, which is expensive for large reports: the materialization
+                 is reused until more messages are recorded (but does not reflect them), thus is not to be modified.
+        """
+        if self._store is not None:
+            extent: Tuple[int, int] = self._store.extent()
+            if self._materialized is None or self._materialized[0] is not self._store or \
+                    self._materialized[1] != extent:
+                self._materialized = (self._store, extent, self._store.materialize())
+            return self._materialized[2]
+        return self._messages
+
+    @messages.setter
+    def messages(self, messages: MESSAGES_BY_TARGET):
+        if self._store is not None:
+            self._store = ColumnarMessageStore.from_messages(messages)
+        else:
+            self._messages = messages
+
+    def uses_compact_messages(self) -> bool:
+        """
+        :return: bool, True if messages are recorded in a (columnar) message store
+        """
+        return self._store is not None
+
+    def uses_message_index(self) -> bool:
+        """
+        :return: bool, True if the messages are indexed (see find_messages())
+        """
+        return self._message_index is not None
+
+    def _index_message(
+            self,
+            target: str,
+            test: str,
+            message_type: str,
+            code: str,
+            identifier: Hashable,
+            parameters: Optional[MESSAGE_PARAMETERS]
+    ):
+        """
+        Index a recorded message by its identifier and (indexed) parameter values.
+        :param target: str, target of the message
+        :param test: str, test of the message
+        :param message_type: str, name of the type of the message
+        :param code: str, validation code of the message
+        :param identifier: Hashable, message identifier
+        :param parameters: Optional[MESSAGE_PARAMETERS], (recorded) additional parameters of the message
+        """
+        location: MESSAGE_LOCATION = (target, test, message_type, code, identifier, parameters)
+        if parameters is None:
+            if location in self._identifier_locations:
+                # messages solely discerned by their identifier are only recorded once
+                return
+            self._identifier_locations.add(location)
+        identifier_index: Dict[Hashable, List[MESSAGE_LOCATION]] = self._message_index["identifier"]
+        if identifier not in identifier_index:
+            identifier_index[identifier] = list()
+        identifier_index[identifier].append(location)
+        if not parameters:
+            return
+        field: str
+        for field in INDEXED_FIELDS[1:]:
+            if field in parameters and isinstance(parameters[field], Hashable):
+                value_index: Dict[Hashable, List[MESSAGE_LOCATION]] = self._message_index[field]
+                if parameters[field] not in value_index:
+                    value_index[parameters[field]] = list()
+                value_index[parameters[field]].append(location)
+
+    def _index_content(self, target: str, test: str, message_type: str, code: str, content: IDENTIFIED_MESSAGES):
+        """
+        Index the (recorded) identified messages of a given code.
+        :param target: str, target of the messages
+        :param test: str, test of the messages
+        :param message_type: str, name of the type of the messages
+        :param code: str, validation code of the messages
+        :param content: IDENTIFIED_MESSAGES, identified messages of the code
+        """
+        identifier: Hashable
+        parameters_list: Optional[List[MESSAGE_PARAMETERS]]
+        for identifier, parameters_list in content.items():
+            if parameters_list:
+                parameters: MESSAGE_PARAMETERS
+                for parameters in parameters_list:
+                    self._index_message(target, test, message_type, code, identifier, parameters)
+            else:
+                self._index_message(target, test, message_type, code, identifier, None)
+
+    def reindex_messages(self):
+        """
+        Rebuild the index of the messages (if indexed), e.g. after the messages were directly assigned.
+        """
+        if self._message_index is None:
+            return
+        self._message_index = {field: dict() for field in INDEXED_FIELDS}
+        self._identifier_locations = set()
+        target: str
+        messages_by_test: MESSAGES_BY_TEST
+        for target, messages_by_test in self.messages.items():
+            test: str
+            message_catalog: MESSAGE_CATALOG
+            for test, message_catalog in messages_by_test.items():
+                message_type: str
+                partition: MESSAGE_PARTITION
+                for message_type, partition in message_catalog.items():
+                    code: str
+                    content: Optional[IDENTIFIED_MESSAGES]
+                    for code, content in partition.items():
+                        if content:
+                            self._index_content(target, test, message_type, code, content)
+
+    def find_messages(self, value: Hashable, fields: Optional[List[str]] = None) -> List[MESSAGE_RECORD]:
+        """
+        Find the (recorded) messages of which the identifier, or the value of an indexed parameter, is a given
+        value, e.g. the messages concerning a given knowledge graph edge, in time proportional to the number
+        of messages found (rather than to the number of messages of the ValidationReporter).
+
+        :param value: Hashable, value of the identifier or indexed parameter (e.g. an edge identifier)
+        :param fields: Optional[List[str]], fields of the messages with the value, among the INDEXED_FIELDS
+                       (Default: None, the identifier and all the indexed parameters)
+        :return: List[MESSAGE_RECORD], message records (see reasoner_validator.sinks) of the messages found,
+                 in the order recorded, within the given fields (the message parameters are not to be modified)
+        """
+        assert self._message_index is not None, "find_messages(): messages are not indexed (see 'index_messages')"
+        records: List[MESSAGE_RECORD] = list()
+        found: set = set()
+        field: str
+        for field in (fields if fields else INDEXED_FIELDS):
+            assert field in self._message_index, f"find_messages(): field '{field}' is not indexed"
+            if value not in self._message_index[field]:
+                continue
+            location: MESSAGE_LOCATION
+            for location in self._message_index[field][value]:
+                # a message is only found once, even if found within several fields
+                if id(location) in found:
+                    continue
+                found.add(id(location))
+                target, test, message_type, code, identifier, parameters = location
+                records.append(
+                    message_record(
+                        target, test, MessageType[message_type], code, identifier=identifier, parameters=parameters
+                    )
+                )
+        return records
+
+    def get_edge_messages(self, edge_id: str) -> List[MESSAGE_RECORD]:
+        """
+        :param edge_id: str, (knowledge graph) edge identifier
+        :return: List[MESSAGE_RECORD], messages identified by, or with the 'edge_id' of, the edge (see find_messages())
+        """
+        return self.find_messages(edge_id, fields=["identifier", "edge_id"])
+
+    def get_node_messages(self, node_id: str) -> List[MESSAGE_RECORD]:
+        """
+        :param node_id: str, (knowledge graph) node identifier
+        :return: List[MESSAGE_RECORD], messages identified by, or with the 'node_id' of, the node (see find_messages())
+        """
+        return self.find_messages(node_id, fields=["identifier", "node_id"])
+
+    def clear_messages(self):
+        """
+        Discards all messages (and message counts) of the ValidationReporter.
+        """
+        self.messages = dict()
+        self._message_counts = dict()
+        self._code_counts = Counter()
+        self._recorded_messages = dict()
+        self._occurrences = dict()
+        self._unrecorded = dict()
+        if self._message_index is not None:
+            self._message_index = {field: dict() for field in INDEXED_FIELDS}
+            self._identifier_locations = set()
+
     def reset_default_test(self, name: str):
         """
         Resets the default test identifier of the ValidationReporter to a new string.
@@ -132,6 +410,9 @@ class ValidationReporter:
         :return: MESSAGES_BY_TEST corresponding to a resolved target
         """
         current_target = target if target else self.get_default_target()
+        if self._store is not None:
+            messages: MESSAGES_BY_TARGET = self.messages
+            return messages[current_target] if current_target in messages else dict()
         if current_target not in self.messages:
             self.messages[current_target] = dict()
         return self.messages[current_target]
@@ -140,11 +421,17 @@ class ValidationReporter:
         """
         Returns MESSAGE_CATALOG corresponding to a given or default target.
         Note that the dictionary returned is not a copy of the original
-         thus caution should be taken not to mutate it!
+         thus caution should be taken not to mutate it! (also if compact_messages,
+         in which case the dictionary is materialized from the message store)
         :param test: str, specified test (gets current 'default' test if not given)
         :param target: str, specified target (gets current 'default' test if not given)
         :return: MESSAGES_BY_TEST corresponding to a resolved target
         """
+        if self._store is not None:
+            current_target: str = target if target else self.get_default_target()
+            current_test: str = test if test else self.get_default_test()
+            self._store.add_context(current_target, current_test)
+            return self.messages[current_target][current_test]
         messages_by_test: MESSAGES_BY_TEST = self.get_messages_by_target(target=target)
         current_test = test if test else self.get_default_test()
         if current_test not in messages_by_test:
@@ -157,14 +444,17 @@ class ValidationReporter:
         :param target: str, specified target (gets current 'default' test if not given)
         :return: bool, True if ValidationReporter has any non-empty messages.
         """
-        return (
-                self.has_information(test, target) or
-                self.has_skipped(test, target) or
-                self.has_warnings(test, target) or
-                self.has_errors(test, target) or
-                self.has_critical(test, target)
+        return any(
+            self.has_message_type(message_type, test=test, target=target)
+            for message_type in MessageType
         )
 
+    def is_empty(self) -> bool:
+        """Predicate to detect that no validation messages at all were recorded, in any target or test context.
+        :return: bool, True if ValidationReporter has no messages.
+        """
+        return not self._code_counts
+
     def has_message_type(
             self,
             message_type: MessageType,
@@ -177,8 +467,117 @@ class ValidationReporter:
         :param target: str, specified target (gets current 'default' test if not given)
         :return: bool, true only if ValidationReporter has any non-empty messages of type 'message_type'.
         """
-        message_catalog: MESSAGE_CATALOG = self.get_messages_by_test(test=test, target=target)
-        return bool(message_catalog[message_type.name])
+        key: Tuple[str, str, str] = (
+            target if target else self.get_default_target(),
+            test if test else self.get_default_test(),
+            message_type.name
+        )
+        return key in self._message_counts
+
+    def _count_messages(
+            self,
+            code: str,
+            message_type: MessageType,
+            test: Optional[str] = None,
+            target: Optional[str] = None,
+            count: int = 1
+    ):
+        """
+        Update the running counts of reported messages.
+        :param code: str, code of the messages
+        :param message_type: MessageType, type of the messages
+        :param test: str, specified test (gets current 'default' test if not given)
+        :param target: str, specified target (gets current 'default' test if not given)
+        :param count: int, number of messages reported (Default: 1)
+        """
+        key: Tuple[str, str, str] = (
+            target if target else self.get_default_target(),
+            test if test else self.get_default_test(),
+            message_type.name
+        )
+        if key not in self._message_counts:
+            self._message_counts[key] = Counter()
+        self._message_counts[key][code] += count
+        self._code_counts[code] += count
+
+    @staticmethod
+    def _number_of_messages(content: Optional[IDENTIFIED_MESSAGES]) -> int:
+        """
+        :param content: Optional[IDENTIFIED_MESSAGES], messages recorded for a given code
+        :return: int, number of messages recorded (at least one, for the code itself)
+        """
+        return sum(len(parameters) if parameters else 1 for parameters in content.values()) if content else 1
+
+    def get_message_counts(self) -> Dict:
+        """
+        Running counts of the messages reported (as in summary(), but by target and test), e.g. to be stored
+        with the messages of a validation report, then restored by add_message_counts() (or add_messages()).
+        :return: Dict, indexed by target, test and code, of the number of messages reported
+        """
+        message_counts: Dict = dict()
+        key: Tuple[str, str, str]
+        counts: Counter
+        for key, counts in self._message_counts.items():
+            target, test, _ = key
+            message_counts.setdefault(target, dict()).setdefault(test, dict()).update(counts)
+        return message_counts
+
+    def add_message_counts(self, message_counts: Dict):
+        """
+        Add the running counts of messages of a validation report, e.g. of messages directly assigned.
+        :param message_counts: Dict, number of messages reported, as returned by get_message_counts()
+        """
+        target: str
+        counts_by_test: Dict
+        for target, counts_by_test in message_counts.items():
+            test: str
+            counts_by_code: Dict
+            for test, counts_by_code in counts_by_test.items():
+                code: str
+                count: int
+                for code, count in counts_by_code.items():
+                    self._count_messages(code, self.get_message_type(code), test=test, target=target, count=count)
+
+    def recount_messages(self):
+        """
+        Recompute the running counts of messages, e.g. after the messages were directly assigned. Note that
+        messages without parameters, reported more than once, are recounted only once (since only recorded once):
+        the counts of a validation report are rather restored, as reported, by add_message_counts().
+        """
+        self._message_counts = dict()
+        self._code_counts = Counter()
+        target: str
+        messages_by_test: MESSAGES_BY_TEST
+        for target, messages_by_test in self.messages.items():
+            test: str
+            message_catalog: MESSAGE_CATALOG
+            for test, message_catalog in messages_by_test.items():
+                for message_type in MessageType:
+                    if message_type.name not in message_catalog:
+                        continue
+                    code: str
+                    content: Optional[IDENTIFIED_MESSAGES]
+                    for code, content in message_catalog[message_type.name].items():
+                        self._count_messages(
+                            code, message_type, test=test, target=target, count=self._number_of_messages(content)
+                        )
+
+    def summary(self, message_type: Optional[MessageType] = None) -> Dict[str, int]:
+        """
+        Summary of the number of messages reported, by code, harvested from all target and test contexts
+        (without walking the messages: the counts are kept up to date as the messages are reported).
+        Note that messages without parameters, reported more than once, are only recorded once in the
+        messages but are counted as often as they are reported.
+
+        :param message_type: Optional[MessageType], type of the messages to be counted (Default: all messages)
+        :return: Dict[str, int], number of messages reported, indexed by code.
+        """
+        if message_type is None:
+            return dict(self._code_counts)
+        return {
+            code: count for code, count in self._code_counts.items()
+            if self.get_message_type(code) == message_type
+        }
 
     def has_information(self, test: Optional[str] = None, target: Optional[str] = None) -> bool:
         """Predicate to detect any recorded information messages.
@@ -326,12 +725,71 @@ class ValidationReporter:
         :return: None (internally record the validation message)
         """
         # Sanity check: that the given code has been registered in the codes.yaml file
-        assert CodeDictionary.get_code_entry(code) is not None, f"ValidationReporter.report: unknown code '{code}'"
+        assert CodeDictionary.get_code(code) is not None, f"ValidationReporter.report: unknown code '{code}'"
 
         # Rarely, get_message_type_label() can raise a
         # "KeyError" if the message_type_id is unknown?
         message_type: MessageType = self.get_message_type(code)
 
+        tag: str
+        for tag, value in message.items():
+            if isinstance(value, (set, frozenset)):
+                # sets are recorded as (sorted) lists, as natively serialized as JSON
+                message[tag] = sorted(value, key=str)
+
+        for capture, with_parameters in self._captures:
+            # message parameters are copied before the 'identifier' is popped below
+            capture.append((code, dict(message)) if with_parameters else code)
+
+        self._count_messages(code, message_type, test=test, target=target)
+
+        if self.message_sink is not None:
+            self.message_sink.emit(
+                message_record(
+                    target if target else self.get_default_target(),
+                    test if test else self.get_default_test(),
+                    message_type,
+                    code,
+                    identifier=message["identifier"] if "identifier" in message else None,
+                    parameters={tag: value for tag, value in message.items() if tag != "identifier"}
+                )
+            )
+        if not self.retain_messages:
+            return
+
+        if self.reporting_policy is not None and \
+                not self._apply_reporting_policy(code, message_type, test=test, target=target, message=message):
+            # the (empty) message context is nonetheless created
+            if self._store is not None:
+                self._store.add_context(
+                    target if target else self.get_default_target(),
+                    test if test else self.get_default_test()
+                )
+            else:
+                self.get_messages_by_test(test=test, target=target)
+            return
+
+        if self._store is not None:
+            identifier: Optional[Hashable] = message.pop("identifier") if "identifier" in message else None
+            self._store.append(
+                target if target else self.get_default_target(),
+                test if test else self.get_default_test(),
+                message_type,
+                code,
+                identifier=identifier,
+                parameters=message
+            )
+            if self._message_index is not None and identifier is not None:
+                self._index_message(
+                    target if target else self.get_default_target(),
+                    test if test else self.get_default_test(),
+                    message_type.name,
+                    code,
+                    identifier,
+                    message if message else None
+                )
+            return
+
         message_catalog: MESSAGE_CATALOG = self.get_messages_by_test(test=test, target=target)
         messages: message_catalog[message_type.name]
 
@@ -356,14 +814,199 @@ class ValidationReporter:
 
                     partition[message_identifier].append(message)
 
+                if self._message_index is not None:
+                    self._index_message(
+                        target if target else self.get_default_target(),
+                        test if test else self.get_default_test(),
+                        message_type.name,
+                        code,
+                        message_identifier,
+                        message if message else None
+                    )
+
         # else: additional parameters are None
 
-    def add_messages(self, new_messages: MESSAGES_BY_TARGET):
+    def _apply_reporting_policy(
+            self,
+            code: str,
+            message_type: MessageType,
+            test: Optional[str],
+            target: Optional[str],
+            message: Dict
+    ) -> bool:
+        """
+        Apply the reporting policy of the ValidationReporter to a reported message.
+        :param code: str, code of the message
+        :param message_type: MessageType, type of the message
+        :param test: str, specified test (gets current 'default' test if not given)
+        :param target: str, specified target (gets current 'default' test if not given)
+        :param message: Dict, message parameters (including any 'identifier')
+        :return: bool, True if the message is to be recorded; False if it is only counted
+        """
+        policy: ReportingPolicy = self.reporting_policy
+        context: Tuple[str, str, str] = (
+            target if target else self.get_default_target(),
+            test if test else self.get_default_test(),
+            code
+        )
+        message_types: List[MessageType] = list(MessageType)
+        if policy.min_severity is not None and \
+                message_types.index(message_type) < message_types.index(policy.min_severity):
+            self._count_unrecorded(context)
+            return False
+        if "identifier" not in message:
+            return True
+
+        identifier: Hashable = message["identifier"]
+        if context not in self._recorded_messages:
+            self._recorded_messages[context] = dict()
+        recorded: Dict[Hashable, int] = self._recorded_messages[context]
+        if identifier not in recorded:
+            if policy.max_identifiers and len(recorded) >= policy.max_identifiers:
+                self._count_unrecorded(context)
+                return False
+            recorded[identifier] = 0
+        if len(message) == 1:
+            # the identifier is the only parameter of the message
+            return True
+
+        if policy.deduplicate:
+            key: Tuple[str, str, str, Hashable] = context + (identifier,)
+            if key not in self._occurrences:
+                self._occurrences[key] = dict()
+            occurrences: Dict[Tuple, int] = self._occurrences[key]
+            parameters: Tuple = self._frozen_parameters(message)
+            if parameters in occurrences:
+                occurrences[parameters] += 1
+                return False
+            if policy.max_messages and recorded[identifier] >= policy.max_messages:
+                self._count_unrecorded(context, identifier)
+                return False
+            occurrences[parameters] = 1
+        elif policy.max_messages and recorded[identifier] >= policy.max_messages:
+            self._count_unrecorded(context, identifier)
+            return False
+
+        recorded[identifier] += 1
+        return True
+
+    @staticmethod
+    def _frozen_parameters(message: MESSAGE_PARAMETERS) -> Tuple:
+        """
+        :param message: MESSAGE_PARAMETERS, message parameters (any 'identifier' is ignored)
+        :return: Tuple, hashable representation of the message parameters
+        """
+        return tuple(
+            (tag, value if isinstance(value, (str, int, float, bool, type(None))) else str(value))
+            for tag, value in message.items() if tag != "identifier"
+        )
+
+    def _count_unrecorded(self, context: Tuple[str, str, str], identifier: Optional[Hashable] = None):
+        """
+        :param context: Tuple[str, str, str], (target, test, code) of a message which is not recorded
+        :param identifier: Optional[Hashable], identifier of the message, if recorded (Default: None)
+        """
+        if context not in self._unrecorded:
+            self._unrecorded[context] = Counter()
+        self._unrecorded[context][identifier] += 1
+
+    def get_unrecorded_messages(self) -> Dict:
+        """
+        Summary of the messages counted, but not recorded, as a consequence of the reporting policy.
+        :return: Dict, indexed by target, test and code, of the number of messages of unrecorded identifiers
+                 (or below the minimum severity), as 'messages', and the number of unrecorded messages
+                 of recorded identifiers, indexed by identifier, as 'identifiers'.
+        """
+        unrecorded: Dict = dict()
+        context: Tuple[str, str, str]
+        counts: Counter
+        for context, counts in self._unrecorded.items():
+            target, test, code = context
+            entry: Dict = {"messages": counts[None]}
+            identifiers: Dict = {identifier: count for identifier, count in counts.items() if identifier is not None}
+            if identifiers:
+                entry["identifiers"] = identifiers
+            unrecorded.setdefault(target, dict()).setdefault(test, dict())[code] = entry
+        return unrecorded
+
+    def add_unrecorded_messages(self, unrecorded: Dict, count: bool = True):
+        """
+        Add (and count) the messages of a summary of unrecorded messages, e.g. of a cached validation report.
+        :param unrecorded: Dict, unrecorded messages, as returned by get_unrecorded_messages()
+        :param count: bool, if False, the unrecorded messages are not counted, e.g. since already counted
+                      by add_message_counts() (Default: True)
+        """
+        target: str
+        messages_by_test: Dict
+        for target, messages_by_test in unrecorded.items():
+            test: str
+            messages_by_code: Dict
+            for test, messages_by_code in messages_by_test.items():
+                code: str
+                entry: Dict
+                for code, entry in messages_by_code.items():
+                    counts: Counter = Counter(entry["identifiers"] if "identifiers" in entry else dict())
+                    if "messages" in entry and entry["messages"]:
+                        counts[None] = entry["messages"]
+                    context: Tuple[str, str, str] = (target, test, code)
+                    if context not in self._unrecorded:
+                        self._unrecorded[context] = Counter()
+                    self._unrecorded[context].update(counts)
+                    if count:
+                        self._count_messages(
+                            code, self.get_message_type(code), test=test, target=target, count=sum(counts.values())
+                        )
+
+    def get_occurrences(self) -> Dict:
+        """
+        Number of occurrences of the (deduplicated) parameters recorded for each message identifier.
+        :return: Dict, indexed by target, test, code and identifier, of the lists of numbers of occurrences,
+                 in the order of the parameters recorded for the identifier (only including parameters
+                 reported more than once).
+        """
+        occurrences: Dict = dict()
+        key: Tuple[str, str, str, Hashable]
+        counts: Dict[Tuple, int]
+        for key, counts in self._occurrences.items():
+            if not any(count > 1 for count in counts.values()):
+                continue
+            target, test, code, identifier = key
+            occurrences.setdefault(target, dict()).setdefault(test, dict()).setdefault(code, dict())[identifier] = \
+                list(counts.values())
+        return occurrences
+
+    @contextmanager
+    def capture_messages(self, with_parameters: bool = False):
+        """
+        Context manager capturing the codes of all validation messages reported within its scope,
+        for example, to attribute validation messages to a specific TRAPI element being validated.
+        Captures may be nested, in which case reported codes are seen by all enclosing captures::
+
+            with validator.capture_messages() as codes:
+                validator.validate_graph_edge(edge, graph_type=TRAPIGraphType.Knowledge_Graph)
+
+        :param with_parameters: bool, if True, capture (code, message parameters) tuples
+                                which may later be replayed by 'report(code, **parameters)'
+                                (Default: False, only capture the message codes)
+        :return: List, list of codes (or tuples) reported within the scope of the context manager (in order reported)
+        """
+        capture: List = list()
+        self._captures.append((capture, with_parameters))
+        try:
+            yield capture
+        finally:
+            # nested captures are necessarily released in 'last in, first out' order
+            self._captures.pop()
+
+    def add_messages(self, new_messages: MESSAGES_BY_TARGET, message_counts: Optional[Dict] = None):
         """
         Batch addition of MESSAGES_BY_TARGET messages to a ValidationReporter instance.
         :param new_messages: MESSAGES_BY_TARGET, messages indexed by target, test and categories:
                              one of "information", "skipped tests", "warnings", "errors" or "critical",
                              with code-keyed dictionaries of (structured) message parameters.
+        :param message_counts: Optional[Dict], number of messages reported, as returned by get_message_counts()
+                               for the reporter of the messages (Default: None, the messages are counted as
+                               recorded, i.e. messages without parameters are counted once, see recount_messages())
         """
         target: str
         target_messages: MESSAGES_BY_TEST
@@ -371,14 +1014,36 @@ class ValidationReporter:
             test: str
             new_message_catalog: MESSAGE_CATALOG
             for test, new_message_catalog in target_messages.items():
-                this_message_catalog: MESSAGE_CATALOG = self.get_messages_by_test(test=test, target=target)
+                this_message_catalog: Optional[MESSAGE_CATALOG] = None
+                if self._store is not None:
+                    self._store.add_context(target, test)
+                else:
+                    this_message_catalog = self.get_messages_by_test(test=test, target=target)
                 for message_type in [name for name in MessageType.__members__]:
                     if message_type in new_message_catalog.keys():
                         new_message_type_entry: Dict = new_message_catalog[message_type]
-                        this_message_type_entry: Dict = this_message_catalog[message_type]
+                        this_message_type_entry: Optional[Dict] = \
+                            this_message_catalog[message_type] if this_message_catalog is not None else None
                         code: str
                         content: Optional[IDENTIFIED_MESSAGES]
                         for code, content in new_message_type_entry.items():
+                            if message_counts is None:
+                                self._count_messages(
+                                    code,
+                                    MessageType[message_type],
+                                    test=test,
+                                    target=target,
+                                    count=self._number_of_messages(content)
+                                )
+                            if self.message_sink is not None:
+                                self._emit_messages(target, test, MessageType[message_type], code, content)
+                            if not self.retain_messages:
+                                continue
+                            if self._message_index is not None and content:
+                                self._index_content(target, test, message_type, code, content)
+                            if self._store is not None:
+                                self._store.add_messages(target, test, MessageType[message_type], code, content)
+                                continue
                             if code not in this_message_type_entry:
                                 this_message_type_entry[code] = dict() if content else None
                             partition = this_message_type_entry[code]
@@ -392,29 +1057,83 @@ class ValidationReporter:
                                     if parameters:
                                         # additional parameters seen, then capture
                                         if partition is None:
-                                            partition = this_message_type_entry[code][code] = dict()
+                                            partition = this_message_type_entry[code] = dict()
                                         if identifier not in partition or partition[identifier] is None:
                                             partition[identifier] = list()
                                         partition[identifier].extend(parameters)
                                     else:
                                         # the message 'identifier' is the only parameter
                                         partition[identifier] = None
+        if message_counts is not None:
+            self.add_message_counts(message_counts)
 
-    def get_all_messages(self) -> MESSAGES_BY_TARGET:
+    def _emit_messages(
+            self,
+            target: str,
+            test: str,
+            message_type: MessageType,
+            code: str,
+            content: Optional[IDENTIFIED_MESSAGES]
+    ):
         """
-        Get copy of all MESSAGES_BY_TARGET as a Python data structure.
-        :return: Dict (copy) of all validation messages in the ValidationReporter.
+        Emit a batch of messages of a given code to the message sink of the ValidationReporter.
+        :param target: str, target of the messages
+        :param test: str, test of the messages
+        :param message_type: MessageType, type of the messages
+        :param code: str, validation code of the messages
+        :param content: Optional[IDENTIFIED_MESSAGES], identified messages of the code
         """
-        # TODO: is it necessary to copy these messages -
-        #       may be a large data structure,
-        #       costly to replicate (just for 'safety')
-        return copy.deepcopy(self.messages)
+        if not content:
+            self.message_sink.emit(message_record(target, test, message_type, code))
+            return
+        identifier: str
+        parameters_list: Optional[List[MESSAGE_PARAMETERS]]
+        for identifier, parameters_list in content.items():
+            if parameters_list:
+                for parameters in parameters_list:
+                    self.message_sink.emit(
+                        message_record(target, test, message_type, code, identifier=identifier, parameters=parameters)
+                    )
+            else:
+                self.message_sink.emit(message_record(target, test, message_type, code, identifier=identifier))
+
+    def emit_all_messages(self):
+        """
+        Emit all the messages recorded by the ValidationReporter to its message sink, e.g. messages
+        recorded before the message sink was configured (or retrieved from a validation report cache).
+        """
+        assert self.message_sink is not None, "emit_all_messages(): the ValidationReporter has no message sink!"
+        target: str
+        messages_by_test: MESSAGES_BY_TEST
+        for target, messages_by_test in self.messages.items():
+            test: str
+            message_catalog: MESSAGE_CATALOG
+            for test, message_catalog in messages_by_test.items():
+                message_type: MessageType
+                for message_type in MessageType:
+                    if message_type.name not in message_catalog:
+                        continue
+                    code: str
+                    content: Optional[IDENTIFIED_MESSAGES]
+                    for code, content in message_catalog[message_type.name].items():
+                        self._emit_messages(target, test, message_type, code, content)
+
+    def get_all_messages(self, copy: bool = False) -> MESSAGES_BY_TARGET:
+        """
+        Get all MESSAGES_BY_TARGET as a Python data structure.
+        :param copy: bool, if True, return an independent (deep) copy of the messages
+                     (Default: False, return a read-only view of the messages, which is much cheaper for large reports)
+        :return: MESSAGES_BY_TARGET, read-only view (or copy) of all validation messages in the ValidationReporter
+                 (if compact_messages, the view is of messages materialized from the message store).
+        """
+        return deepcopy(self.messages) if copy else MessagesView(self.messages)
 
     def get_messages_of_type(
             self,
             message_type: MessageType,
             test: Optional[str] = None,
-            target: Optional[str] = None
+            target: Optional[str] = None,
+            copy: bool = False
     ) -> MESSAGE_PARTITION:
         """
         Get Python data dictionary of the 'message_type' ValidationReporter
@@ -422,18 +1141,27 @@ class ValidationReporter:
         :param message_type: MessageType type of message whose presence is to be detected.
         :param test: String name of the specified test (gets current 'default' test if not given)
         :param target: String name of the specified target (gets current 'default' test if not given)
+        :param copy: bool, if True, return an independent (deep) copy of the messages
+                     (Default: False, return a read-only view of the messages)
         :return: Messages of type 'message_type'.
         """
         message_catalog: MESSAGE_CATALOG = self.get_messages_by_test(test=test, target=target)
-        # TODO: the deepcopy may be desirable for message data
-        #       integrity, but it may be computationally expensive?
-        return copy.deepcopy(message_catalog[message_type.name])
+        messages: MESSAGE_PARTITION = message_catalog[message_type.name]
+        return deepcopy(messages) if copy else MessagesView(messages)
 
     @staticmethod
     def merge_identified_messages(
         aggregated: IDENTIFIED_MESSAGES,
-        additions: IDENTIFIED_MESSAGES
+        additions: IDENTIFIED_MESSAGES,
+        copy: bool = False
     ):
+        """
+        Merge the parameterized messages of 'additions' into 'aggregated'.
+        :param aggregated: IDENTIFIED_MESSAGES, messages being aggregated
+        :param additions: IDENTIFIED_MESSAGES, messages to be added to the aggregated messages
+        :param copy: bool, if True, the message parameters added are (deep) copies; otherwise, they are
+                     shared with 'additions' (Default: False, since message parameters are never modified once reported)
+        """
         identifier: str
         message_parameters_list: Optional[List[MESSAGE_PARAMETERS]]
         for identifier, message_parameters_list in additions.items():
@@ -442,12 +1170,15 @@ class ValidationReporter:
             if message_parameters_list is not None:
                 if aggregated[identifier] is None:
                     aggregated[identifier] = list()
-                aggregated[identifier].extend(copy.deepcopy(message_parameters_list))
+                aggregated[identifier].extend(
+                    deepcopy(message_parameters_list) if copy else message_parameters_list
+                )
 
     def merge_coded_messages(
             self,
             aggregated: MESSAGE_PARTITION,
-            additions: MESSAGE_PARTITION
+            additions: MESSAGE_PARTITION,
+            copy: bool = False
     ):
         source: str
         identified_messages: Optional[IDENTIFIED_MESSAGES]
@@ -457,31 +1188,28 @@ class ValidationReporter:
             if identified_messages is not None:
                 if aggregated[source] is None:
                     aggregated[source] = dict()
-                self.merge_identified_messages(aggregated[source], identified_messages)
+                self.merge_identified_messages(aggregated[source], identified_messages, copy=copy)
 
-    def get_all_messages_of_type(self, message_type: MessageType) -> MESSAGE_PARTITION:
+    def get_all_messages_of_type(self, message_type: MessageType, copy: bool = False) -> MESSAGE_PARTITION:
         """
         Get the MESSAGE_PARTITION dictionary a given 'message_type',
         harvested from all target and test contexts.
         :param message_type: The MessageType whose presence is to be detected.
+        :param copy: bool, if True, return an independent (deep) copy of the messages
+                     (Default: False, return a read-only view of the messages)
         :return: MESSAGE_PARTITION of the specified MessageType.
         """
         all_messages_of_type: MESSAGE_PARTITION = dict()
-        target: str
-        messages_by_target: MESSAGES_BY_TARGET = self.get_all_messages()
-        test: str
         messages_by_test: MESSAGES_BY_TEST
         message_catalog: MESSAGE_CATALOG
-        for target, messages_by_test in messages_by_target.items():
-            for test in messages_by_test.keys():
-                additional_messages: MESSAGE_PARTITION = \
-                    self.get_messages_of_type(message_type=message_type, test=test, target=target)
-                self.merge_coded_messages(all_messages_of_type, additional_messages)
-        return all_messages_of_type
+        for messages_by_test in self.messages.values():
+            for message_catalog in messages_by_test.values():
+                self.merge_coded_messages(all_messages_of_type, message_catalog[message_type.name], copy=copy)
+        return all_messages_of_type if copy else MessagesView(all_messages_of_type)
 
     def get_info(self, test: Optional[str] = None, target: Optional[str] = None) -> MESSAGE_PARTITION:
         """
-        Get a copy of all recorded 'information' messages for a given test from a given target.
+        Get a read-only view of all recorded 'information' messages for a given test from a given target.
         :param test: str, specified test (gets current 'default' test if not given)
         :param target: str, specified target (gets current 'default' test if not given)
         :return: Dict of all 'information' messages.
@@ -490,7 +1218,7 @@ class ValidationReporter:
 
     def get_skipped(self, test: Optional[str] = None, target: Optional[str] = None) -> MESSAGE_PARTITION:
         """
-        Get copy of all recorded 'skipped test' messages for a given test from a given target.
+        Get a read-only view of all recorded 'skipped test' messages for a given test from a given target.
         :param test: str, specified test (gets current 'default' test if not given)
         :param target: str, specified target (gets current 'default' test if not given)
         :return: Dict of all 'skipped test' messages.
@@ -499,7 +1227,7 @@ class ValidationReporter:
 
     def get_warnings(self, test: Optional[str] = None, target: Optional[str] = None) -> MESSAGE_PARTITION:
         """
-        Get copy of all recorded 'warning' messages for a given test from a given target.
+        Get a read-only view of all recorded 'warning' messages for a given test from a given target.
         :param test: str, specified test (gets current 'default' test if not given)
         :param target: str, specified target (gets current 'default' test if not given)
         :return: Dict of all 'warning' messages.
@@ -508,7 +1236,7 @@ class ValidationReporter:
 
     def get_errors(self, test: Optional[str] = None, target: Optional[str] = None) -> MESSAGE_PARTITION:
         """
-        Get copy of all recorded 'error' messages, for a given test from a given target.
+        Get a read-only view of all recorded 'error' messages, for a given test from a given target.
         :param test: str, specified test (gets current 'default' test if not given)
         :param target: str, specified target (gets current 'default' test if not given)
         :return: Dict of all 'error' messages.
@@ -517,7 +1245,7 @@ class ValidationReporter:
 
     def get_critical(self, test: Optional[str] = None, target: Optional[str] = None) -> MESSAGE_PARTITION:
         """
-        Get copy of all recorded 'critical' error messages, for a given test from a given target.
+        Get a read-only view of all recorded 'critical' error messages, for a given test from a given target.
         :param test: str, specified test (gets current 'default' test if not given)
         :param target: str, specified target (gets current 'default' test if not given)
         :return: Dict of all 'critical error' messages.
@@ -527,24 +1255,208 @@ class ValidationReporter:
     ############################
     # General Instance methods #
     ############################
-    def merge(self, reporter):
+    def merge(self, reporter, move: bool = False):
         """
         Merge all messages and metadata from a second reporter
         into the calling ValidationReporter instance.
 
         :param reporter: second ValidationReporter
+        :param move: bool, if True, the (message) data structures of the second reporter are moved, without
+                     copying, into the calling ValidationReporter, leaving the second reporter without messages
+                     (Default: False, the messages of the second reporter are added, but left untouched)
         """
         assert isinstance(reporter, ValidationReporter)
 
-        # new coded messages also need to be merged!
-        self.add_messages(reporter.get_all_messages())
+        # whether copied or moved, the messages of the second reporter are counted as it counted them
+        # (including its unrecorded messages), rather than recounted as recorded (see recount_messages())
+        message_counts: Dict = reporter.get_message_counts()
+        if self._store is not None and reporter._store is not None and \
+                self._message_index is None and self.message_sink is None and self.retain_messages:
+            # the (columnar) messages of the second reporter are directly appended, without being materialized
+            self._store.extend(reporter._store)
+            self.add_message_counts(message_counts)
+        elif not move or self._store is not None or reporter._store is not None or \
+                self._message_index is not None or self.message_sink is not None or not self.retain_messages:
+            # the messages need to be (re-)recorded or emitted, one by one. The (never modified) message
+            # parameters are simply shared with the other reporter, rather than copied
+            self.add_messages(reporter.messages, message_counts=message_counts)
+        else:
+            self._move_messages(reporter._messages)
+            self.add_message_counts(message_counts)
+        context: Tuple[str, str, str]
+        counts: Counter
+        for context, counts in reporter._unrecorded.items():
+            if context not in self._unrecorded:
+                self._unrecorded[context] = Counter()
+            self._unrecorded[context].update(counts)
+        if move:
+            reporter.clear_messages()
+
+    def _move_messages(self, new_messages: MESSAGES_BY_TARGET):
+        """
+        Move the messages of another reporter into the ValidationReporter: the code-level dictionaries of identified
+        messages (and their lists of parameters) of codes (or identifiers) not yet recorded are simply taken over,
+        such that only the messages of identifiers already recorded by both reporters are (shallowly) merged.
+        The messages are recorded as by add_messages(), but without being counted.
+        :param new_messages: MESSAGES_BY_TARGET, messages of another reporter, not to be used by it any longer
+        """
+        target: str
+        target_messages: MESSAGES_BY_TEST
+        for target, target_messages in new_messages.items():
+            test: str
+            new_message_catalog: MESSAGE_CATALOG
+            for test, new_message_catalog in target_messages.items():
+                this_message_catalog: MESSAGE_CATALOG = self.get_messages_by_test(test=test, target=target)
+                message_type: str
+                new_partition: MESSAGE_PARTITION
+                for message_type, new_partition in new_message_catalog.items():
+                    partition: MESSAGE_PARTITION = this_message_catalog[message_type]
+                    code: str
+                    content: Optional[IDENTIFIED_MESSAGES]
+                    for code, content in new_partition.items():
+                        if code not in partition or partition[code] is None:
+                            if content or code not in partition:
+                                partition[code] = content if content else None
+                            continue
+                        if not content:
+                            continue
+                        identified_messages: IDENTIFIED_MESSAGES = partition[code]
+                        identifier: str
+                        parameters: Optional[List[MESSAGE_PARAMETERS]]
+                        for identifier, parameters in content.items():
+                            if not parameters:
+                                identified_messages[identifier] = None
+                            elif identifier not in identified_messages or identified_messages[identifier] is None:
+                                identified_messages[identifier] = parameters
+                            else:
+                                identified_messages[identifier].extend(parameters)
 
-    def to_dict(self) -> Dict:
+    def to_dict(self, copy: bool = False) -> Dict:
         """
-        Export ValidationReporter message contents as a Python dictionary.
+        Export ValidationReporter message contents as a Python dictionary (plus, with a reporting policy,
+        a summary of the 'unrecorded' messages and the 'occurrences' of any deduplicated messages).
+        :param copy: bool, if True, the messages are an independent (deep) copy
+                     (Default: False, the messages are the plain (JSON serializable) dictionaries
+                     of the ValidationReporter, which are not copied, thus are not to be modified)
         :return: Dict
         """
-        return {"messages": self.get_all_messages()}
+        dictionary: Dict = {"messages": self.get_all_messages(copy=True) if copy else self.messages}
+        if self.reporting_policy is not None:
+            dictionary["unrecorded"] = self.get_unrecorded_messages()
+            if self.reporting_policy.deduplicate:
+                dictionary["occurrences"] = self.get_occurrences()
+        return dictionary
+
+    def to_bytes(self) -> bytes:
+        """
+        Export ValidationReporter contents in a compact binary format (see reasoner_validator.serialization),
+        e.g. for transport between processes: the (columnar) messages, the message counts, any unrecorded messages
+        and the metadata of the ValidationReporter, i.e. its settings and the (non-message) contents of to_dict()
+        (the occurrences of deduplicated messages are not exported).
+        :return: bytes, binary contents of the ValidationReporter, to be restored by from_bytes()
+        """
+        header: Dict = {
+            key: value for key, value in self.to_dict().items()
+            if key not in ["messages", "unrecorded", "occurrences"]
+        }
+        try:
+            header["reasoner_validator"] = metadata.version('reasoner-validator')
+        except metadata.PackageNotFoundError:
+            header["reasoner_validator"] = None
+        header["default_test"] = self.default_test
+        header["default_target"] = self.default_target
+        header["strict_validation"] = self.strict_validation
+        header["compact_messages"] = self.uses_compact_messages()
+        header["index_messages"] = self.uses_message_index()
+        header["reporting_policy"] = \
+            self.reporting_policy.to_dict() if self.reporting_policy is not None else None
+
+        store: ColumnarMessageStore = self._store \
+            if self._store is not None else ColumnarMessageStore.from_messages(self._messages)
+        return serialization.dumps({
+            "header": header,
+            "messages": store.to_columns(),
+            "counts": [
+                [target, test, message_type, code, count]
+                for (target, test, message_type), counts in self._message_counts.items()
+                for code, count in counts.items()
+            ],
+            "unrecorded": [
+                [target, test, code, identifier, count]
+                for (target, test, code), counts in self._unrecorded.items()
+                for identifier, count in counts.items()
+            ]
+        })
+
+    @classmethod
+    def _constructor_arguments(cls, header: Dict) -> Dict:
+        """
+        :param header: Dict, metadata of a ValidationReporter, as exported by to_bytes()
+        :return: Dict, (keyword) arguments of the constructor of the class, restoring the given metadata
+        """
+        reporting_policy: Optional[ReportingPolicy] = None
+        if header["reporting_policy"] is not None:
+            policy: Dict = dict(header["reporting_policy"])
+            if policy["min_severity"] is not None:
+                policy["min_severity"] = MessageType[policy["min_severity"]]
+            reporting_policy = ReportingPolicy(**policy)
+        return {
+            "default_test": header["default_test"],
+            "default_target": header["default_target"],
+            "strict_validation": header["strict_validation"],
+            "compact_messages": header["compact_messages"],
+            "reporting_policy": reporting_policy,
+            "index_messages": header["index_messages"]
+        }
+
+    def _restore_metadata(self, header: Dict):
+        """
+        Restore any metadata, not set by the constructor, of a ValidationReporter exported by to_bytes().
+        :param header: Dict, metadata of a ValidationReporter, as exported by to_bytes()
+        """
+        pass
+
+    @classmethod
+    def from_bytes(cls, data: bytes, **kwargs):
+        """
+        Restore a ValidationReporter (of the calling class) from its binary contents, as exported by to_bytes().
+        :param data: bytes, binary contents of a ValidationReporter
+        :param kwargs: additional (or overriding) constructor arguments, e.g. a 'message_sink' (note that the
+                       restored messages are not emitted to the sink, nor are the reporting policies re-applied)
+        :return: ValidationReporter, (new) ValidationReporter with the contents of the given data
+        :raises: ValueError, if the data is not of the binary format of to_bytes()
+        """
+        contents = serialization.loads(data)
+        if not isinstance(contents, Dict) or \
+                not all(key in contents for key in ["header", "messages", "counts", "unrecorded"]):
+            raise ValueError("ValidationReporter.from_bytes(): data is not a serialized ValidationReporter")
+        header: Dict = contents["header"]
+        arguments: Dict = cls._constructor_arguments(header)
+        arguments.update(kwargs)
+        reporter = cls(**arguments)
+
+        store: ColumnarMessageStore = ColumnarMessageStore.from_columns(contents["messages"])
+        if reporter._store is not None:
+            reporter._store = store
+        else:
+            reporter._messages = store.materialize()
+
+        for target, test, message_type, code, count in contents["counts"]:
+            key: Tuple[str, str, str] = (target, test, message_type)
+            if key not in reporter._message_counts:
+                reporter._message_counts[key] = Counter()
+            reporter._message_counts[key][code] += count
+            reporter._code_counts[code] += count
+        for target, test, code, identifier, count in contents["unrecorded"]:
+            context: Tuple[str, str, str] = (target, test, code)
+            if context not in reporter._unrecorded:
+                reporter._unrecorded[context] = Counter()
+            reporter._unrecorded[context][identifier] += count
+
+        if reporter._message_index is not None:
+            reporter.reindex_messages()
+        reporter._restore_metadata(header)
+        return reporter
 
     def apply_validation(self, validation_method, *args, **kwargs) -> bool:
         """
@@ -668,11 +1580,15 @@ class ValidationReporter:
             id_rows: int = 0,
             msg_rows: int = 0,
             compact_format: bool = False,
-            file=stdout
-    ):
+            file=stdout,
+            cursor: Optional[str] = None,
+            page_by: Optional[str] = None,
+            page_size: int = 0
+    ) -> Optional[str]:
         """
         Dump all available messages captured by the ValidationReporter,
-        printed as formatted human-readable text, on a specified file device.
+        printed as formatted human-readable text, on a specified file device
+        (or, if paginated, one page of them, see reasoner_validator.rendering).
 
         :param title: Optional[str], user supplied report title (default: autogenerated if not set or empty string;
                                      suppressed if an explicit argument of None is given); default: "" -> default title
@@ -683,159 +1599,23 @@ class ValidationReporter:
         :param compact_format: bool, if True, omit blank lines inserted by default for human readability;
                                also, suppress character escapes (i.e. underlining of titles) (default: False)
         :param file: target file device for output
-        :return: n/a
+        :param cursor: Optional[str], cursor of the page to be printed, as returned by the
+                       printing of the previous page (Default: None, first page)
+        :param page_by: Optional[str], unit of pagination, one of 'target', 'test', 'code' or 'identifier'
+                        (Default: None, all messages are printed)
+        :param page_size: int, number of units of pagination per page (Default: 0, all messages are printed)
+        :return: Optional[str], cursor of the next page, if paginated (None once all messages are printed)
         """
         assert id_rows >= 0, "dump(): 'id_rows' argument must be positive or equal to zero"
         assert msg_rows >= 0, "dump(): 'pm_rows' argument must be positive or equal to zero"
 
-        print(f"{self.report_header(title, compact_format)}.", file=file)
-        if not compact_format:
-            # extra blank line spacer
-            print(file=file)
-
-        if self.has_messages():
-
-            # self.messages is now a MESSAGES_BY_TARGET
-            # where MESSAGE_CATALOG is Dict[<message type>, MESSAGE_PARTITION]
-            # <message type> is the top level partition of messages into
-            # 'critical', 'error', 'warning', 'skipped' or 'info'
-            target: str
-            test: str
-            message_type: str
-            target_messages: MESSAGES_BY_TEST
-            test_messages: MESSAGE_CATALOG
-            coded_messages: MESSAGE_PARTITION
-            for target, target_messages in self.messages.items():
-
-                # TODO: clean up 'target' subheader here?
-                if not compact_format:
-                    print(f"\033[4mTarget: {target}\033[0m", file=file)
-                    print(file=file)
-                else:
-                    # compact also ignores underlining
-                    print(f"\nTarget: {target}", file=file)
-
-                for test, test_messages in target_messages.items():
-
-                    # TODO: clean up 'test' subheader here?
-                    if not compact_format:
-                        print(f"\t\033[4mTest: {test}\033[0m", file=file)
-                        print(file=file)
-                    else:
-                        # compact also ignores underlining
-                        print(f"\tTest: {test}", file=file)
-
-                    for message_type, coded_messages in test_messages.items():
-
-                        # if there are coded validation messages for given message type:
-                        # ('critical', 'error', 'warning', 'skipped' or 'info')
-                        if coded_messages:
-
-                            # ... then iterate through them and print them out
-
-                            if not compact_format:
-                                print(f"\t\t\033[4m{message_type.capitalize()}\033[0m", file=file)
-                                print(file=file)
-                            else:
-                                # compact also ignores underlining
-                                print(f"\n\t\t{message_type.capitalize()}:", file=file)
-
-                            # 'coded_messages' is a MESSAGE_PARTITION where
-                            # MESSAGE_PARTITION is Dict[<validation code>, Optional[IDENTIFIED_MESSAGES]]
-
-                            # 'validation code' is the dot-delimited string
-                            # representation of the YAML path of the message codes.yaml
-                            code: str
-                            messages_by_code:  Optional[IDENTIFIED_MESSAGES]
-
-                            # Grouping message outputs by validation codes
-                            for code, messages_by_code in coded_messages.items():
-
-                                code_label: str = CodeDictionary.validation_code_tag(code)
-                                print(
-                                    f"\t\t* {code_label}:\n"
-                                    f"\t\t=> {CodeDictionary.get_message_template(code)}",
-                                    file=file
-                                )
-                                if not compact_format:
-                                    print(file=file)
-
-                                # 'coded_messages' are Optional[IDENTIFIED_MESSAGES]
-                                # An entry of 'coded_messages' may be None if the given message code
-                                # has no additional parameters that distinguish instances of context
-                                # (eg., edge id?) where the validation message occurs for the given identifier.
-                                if messages_by_code is None:
-                                    continue
-
-                                # Otherwise, codes with associated parameters in scope
-                                # 'IDENTIFIED_MESSAGES' are Dict[<identifier>, Optional[List[MESSAGE_PARAMETERS]]]
-                                # where a unique 'identifier' serves as the discriminator
-                                # of the (TRAPI or Biolink) context of the validation message
-
-                                ids_per_row: int = 0
-                                num_ids: int = len(messages_by_code.keys())
-                                more_ids: int = num_ids - id_rows if num_ids > id_rows else 0
-                                identifier: str
-                                messages: Optional[List[MESSAGE_PARAMETERS]]
-                                for identifier, messages in messages_by_code.items():
-                                    if messages is None:
-                                        # For codes whose context of validation is solely discerned
-                                        # with their identifier, just print out the identifier
-                                        print(f"\t\t\t\t# {identifier}", file=file)
-                                        if not compact_format:
-                                            print(file=file)
-                                    else:
-                                        # Since we have already checked if messages is None above,
-                                        # then we assume here that 'messages' is a List[MESSAGE_PARAMETERS]
-                                        # which records distinct additional context
-                                        # for a list of messages associated with a given code.
-
-                                        print(f"\t\t\t\t# {identifier}", file=file)
-                                        first_message: bool = True
-                                        messages_per_row: int = 0
-                                        num_messages: int = len(messages)
-                                        more_msgs: int = num_messages - msg_rows if num_messages > msg_rows else 0
-                                        # 'messages' is an instance List[MESSAGE_PARAMETERS] where every entry of
-                                        # 'MESSAGE_PARAMETERS' is a dictionary of additional parameters documenting
-                                        # a specific instance of the validation message related to the given identifier,
-                                        # where the keys are a validation code specific id (documented in codes.yaml)
-                                        parameters: MESSAGE_PARAMETERS
-                                        for parameters in messages:
-                                            if first_message:
-                                                tags = tuple(parameters.keys())
-                                                print(f"\t\t\t\t- {' | '.join(tags)}: ", file=file)
-                                                first_message = False
-                                            # Sanitize the parameter values for the report
-                                            # (in case non-string values sneak through)
-                                            parameters = {tag: str(value) for tag, value in parameters.items()}
-                                            print(f"\t\t\t\t\t{' | '.join(parameters.values())}", file=file)
-                                            messages_per_row += 1
-                                            if msg_rows and messages_per_row >= msg_rows:
-                                                if more_msgs:
-                                                    print(
-                                                        f"\t\t\t\t{str(more_msgs)} more messages " +
-                                                        f"for identifier '{identifier}'...",
-                                                        file=file
-                                                    )
-                                                break
-                                        if not compact_format:
-                                            print(file=file)
-                                    ids_per_row += 1
-                                    if id_rows and ids_per_row >= id_rows:
-                                        if more_ids:
-                                            print(
-                                                f"\t\t\t{str(more_ids)} more identifiers for code '{code_label}'...",
-                                                file=file
-                                            )
-                                        break
-                                if not compact_format:
-                                    print(file=file)
-                        # else: print nothing if a given message_type has no messages
-                    # end for each coded message
-                # end for each test
-            # end for each target
-        else:
-            print(f"Hurray! No validation messages reported!", file=file)
+        writer = BufferedWriter(file)
+        try:
+            return ReportRenderer(self, id_rows=id_rows, msg_rows=msg_rows, compact_format=compact_format).render(
+                writer, title=title, cursor=cursor, page_by=page_by, page_size=page_size
+            )
+        finally:
+            writer.flush()
 
     def dumps(
             self,
@@ -854,14 +1634,41 @@ class ValidationReporter:
         :param compact_format: bool, if True, omit blank lines inserted by default for human readability (default: True)
         :return: n/a
         """
-        output_buffer: StringIO = StringIO()
-        self.dump(
+        return self.dumps_page(id_rows=id_rows, msg_rows=msg_rows, compact_format=compact_format)[0]
+
+    def dumps_page(
+            self,
+            id_rows: int = 0,
+            msg_rows: int = 0,
+            compact_format: bool = True,
+            cursor: Optional[str] = None,
+            page_by: Optional[str] = None,
+            page_size: int = 0
+    ) -> Tuple[str, Optional[str]]:
+        """
+        Paginated version of dumps(): returns one page of the messages captured by the reporter, as a formatted
+        human-readable text blob, with the cursor of the next page, e.g. for paging through very large reports.
+
+        :param id_rows: int >= 0, if set, maximum number of code-related identifiers to
+                             print per code (value of 0 means print all; default: 0)
+        :param msg_rows: int >= 0, if set, maximum number of parameterized code-related messages to
+                                  print, per identifier row (value of 0 means print all; default: 0)
+        :param compact_format: bool, if True, omit blank lines inserted by default for human readability (default: True)
+        :param cursor: Optional[str], cursor of the page, as returned with the previous page (Default: None, first page)
+        :param page_by: Optional[str], unit of pagination, one of 'target', 'test', 'code' or 'identifier'
+                        (Default: None, all messages are returned)
+        :param page_size: int, number of units of pagination per page (Default: 0, all messages are returned)
+        :return: Tuple[str, Optional[str]], text of the page and cursor of the next page (None after the last page)
+        :raises: ValueError, if the cursor is invalid
+        """
+        writer = BufferedWriter()
+        next_cursor: Optional[str] = ReportRenderer(
+            self, id_rows=id_rows, msg_rows=msg_rows, compact_format=compact_format
+        ).render(
+            writer,
             title=None,  # title suppressed in dumps() string output
-            id_rows=id_rows,
-            msg_rows=msg_rows,
-            compact_format=compact_format,
-            file=output_buffer
+            cursor=cursor,
+            page_by=page_by,
+            page_size=page_size
         )
-        text_output: str = output_buffer.getvalue()
-        output_buffer.close()
-        return text_output.strip()
+        return writer.getvalue().strip(), next_cursor
@@ -0,0 +1,236 @@
+"""
+Seeded, stratified sampling of TRAPI Response Message knowledge graph edges and results.
+
+Simply taking the first 'N' edges or results of a TRAPI Response biases validation towards
+whatever a resource happens to emit first. Here, edges are instead partitioned into 'strata'
+by predicate, primary knowledge source and (subject, object) node category pair, and results
+by the reasoners reporting their analyses. Every stratum is then represented in a sample
+(as sample size permits), with remaining sample slots allocated proportionally to stratum size.
+"""
+from typing import Optional, Dict, List, Tuple, Hashable
+from random import Random
+
+import logging
+logger = logging.getLogger(__name__)
+
+# Knowledge Graph edges are stratified by the 4-tuple of
+# predicate, primary knowledge source and the categories
+# of the subject and object nodes of the edge
+EDGE_STRATUM = Tuple[Optional[str], Optional[str], Tuple[str, ...], Tuple[str, ...]]
+
+# Knowledge Graph nodes are stratified by their (sorted) categories
+NODE_STRATUM = Tuple[str, ...]
+
+# Results are stratified by the (sorted) identifiers of
+# the resources which reported analyses for the Result
+RESULT_STRATUM = Tuple[str, ...]
+
+
+def get_primary_knowledge_source(edge: Dict) -> Optional[str]:
+    """
+    :param edge: Dict, TRAPI knowledge graph edge
+    :return: Optional[str], 'resource_id' of the (first) primary knowledge source of the edge; None if not available
+    """
+    if "sources" in edge and isinstance(edge["sources"], List):
+        for source in edge["sources"]:
+            if isinstance(source, Dict) and \
+                    "resource_role" in source and source["resource_role"] == "primary_knowledge_source":
+                return str(source["resource_id"]) if "resource_id" in source else None
+    return None
+
+
+def get_node_categories(nodes: Dict, node_id: Optional[str]) -> Tuple[str, ...]:
+    """
+    :param nodes: Dict, TRAPI knowledge graph nodes catalog
+    :param node_id: Optional[str], identifier of the node whose categories are to be retrieved
+    :return: Tuple[str, ...], (sorted) categories of the node; empty if node (or its categories) is missing
+    """
+    if isinstance(node_id, str) and node_id in nodes and isinstance(nodes[node_id], Dict):
+        node: Dict = nodes[node_id]
+        if "categories" in node and isinstance(node["categories"], List):
+            return tuple(sorted(str(category) for category in node["categories"]))
+    return tuple()
+
+
+class StratifiedSampler:
+    """
+    Seeded sampler of TRAPI knowledge graph edges and results. Samples
+    drawn by two samplers created with the same (non-None) seed are identical.
+    """
+    def __init__(self, seed: Optional[int] = None):
+        """
+        :param seed: Optional[int], seed of the pseudo-random number generator
+                     used to draw samples (default: None, seeded from system entropy)
+        """
+        self.seed: Optional[int] = seed
+        self.rng: Random = Random(seed)
+
+    @staticmethod
+    def node_stratum(node: Dict) -> NODE_STRATUM:
+        """
+        :param node: Dict, TRAPI knowledge graph node
+        :return: NODE_STRATUM, stratum of the node
+        """
+        if "categories" in node and isinstance(node["categories"], List):
+            return tuple(sorted(str(category) for category in node["categories"]))
+        return tuple()
+
+    @staticmethod
+    def edge_stratum(edge: Dict, nodes: Dict) -> EDGE_STRATUM:
+        """
+        :param edge: Dict, TRAPI knowledge graph edge
+        :param nodes: Dict, TRAPI knowledge graph nodes catalog (to resolve subject and object node categories)
+        :return: EDGE_STRATUM, stratum of the edge
+        """
+        return (
+            str(edge["predicate"]) if "predicate" in edge else None,
+            get_primary_knowledge_source(edge),
+            get_node_categories(nodes, edge["subject"] if "subject" in edge else None),
+            get_node_categories(nodes, edge["object"] if "object" in edge else None)
+        )
+
+    @staticmethod
+    def result_stratum(result: Dict) -> RESULT_STRATUM:
+        """
+        :param result: Dict, TRAPI Result
+        :return: RESULT_STRATUM, stratum of the Result
+        """
+        resource_ids: List[str] = list()
+        if "analyses" in result and isinstance(result["analyses"], List):
+            for analysis in result["analyses"]:
+                if isinstance(analysis, Dict) and "resource_id" in analysis:
+                    resource_ids.append(str(analysis["resource_id"]))
+        return tuple(sorted(set(resource_ids)))
+
+    def stratify_nodes(self, graph: Dict) -> Dict[NODE_STRATUM, List[str]]:
+        """
+        Partition the nodes of a knowledge graph into strata.
+
+        :param graph: Dict, TRAPI knowledge graph with 'nodes'
+        :return: Dict[NODE_STRATUM, List[str]], node identifiers indexed by node stratum
+        """
+        strata: Dict[NODE_STRATUM, List[str]] = dict()
+        for node_id, node in graph["nodes"].items():
+            stratum: NODE_STRATUM = self.node_stratum(node) if isinstance(node, Dict) else tuple()
+            strata.setdefault(stratum, []).append(node_id)
+        return strata
+
+    def stratify_edges(self, graph: Dict) -> Dict[EDGE_STRATUM, List[str]]:
+        """
+        Partition the edges of a knowledge graph into strata.
+
+        :param graph: Dict, TRAPI knowledge graph with 'nodes' and 'edges'
+        :return: Dict[EDGE_STRATUM, List[str]], edge identifiers indexed by edge stratum
+        """
+        nodes: Dict = graph["nodes"]
+        strata: Dict[EDGE_STRATUM, List[str]] = dict()
+        for edge_id, edge in graph["edges"].items():
+            stratum: EDGE_STRATUM = self.edge_stratum(edge, nodes) if isinstance(edge, Dict) else (None, None, (), ())
+            strata.setdefault(stratum, []).append(edge_id)
+        return strata
+
+    def stratify_results(self, results: List[Dict]) -> Dict[RESULT_STRATUM, List[int]]:
+        """
+        Partition a list of Results into strata.
+
+        :param results: List[Dict], TRAPI Results
+        :return: Dict[RESULT_STRATUM, List[int]], (zero-based) Result list indices indexed by result stratum
+        """
+        strata: Dict[RESULT_STRATUM, List[int]] = dict()
+        for index, result in enumerate(results):
+            stratum: RESULT_STRATUM = self.result_stratum(result) if isinstance(result, Dict) else tuple()
+            strata.setdefault(stratum, []).append(index)
+        return strata
+
+    def allocate(self, strata: Dict[Hashable, List], sample_size: int) -> Dict[Hashable, int]:
+        """
+        Allocate a given sample size across strata. Every stratum gets at least one sample slot,
+        if the sample size permits (otherwise, a random subset of the strata gets one slot each);
+        any remaining slots are allocated proportionally to the number of members of each stratum.
+
+        :param strata: Dict[Hashable, List], members of each stratum
+        :param sample_size: int, total sample size to be allocated
+        :return: Dict[Hashable, int], number of members to be drawn from each stratum
+        """
+        population: int = sum(len(members) for members in strata.values())
+        if sample_size >= population:
+            return {stratum: len(members) for stratum, members in strata.items()}
+
+        if sample_size < len(strata):
+            return {stratum: 1 for stratum in self.rng.sample(list(strata.keys()), sample_size)}
+
+        quotas: Dict[Hashable, int] = {stratum: 1 for stratum in strata}
+        remaining: int = sample_size - len(strata)
+        spare: Dict[Hashable, int] = {stratum: len(members) - 1 for stratum, members in strata.items()}
+        total_spare: int = sum(spare.values())
+        if remaining > 0 and total_spare > 0:
+            shares: Dict[Hashable, float] = {
+                stratum: remaining * count / total_spare for stratum, count in spare.items()
+            }
+            for stratum, share in shares.items():
+                quotas[stratum] += int(share)
+            leftover: int = remaining - sum(int(share) for share in shares.values())
+            # Largest remainder allocation of any leftover sample slots
+            for stratum in sorted(shares, key=lambda s: shares[s] - int(shares[s]), reverse=True)[:leftover]:
+                quotas[stratum] += 1
+            for stratum in quotas:
+                quotas[stratum] = min(quotas[stratum], len(strata[stratum]))
+
+        return quotas
+
+    def draw(self, strata: Dict[Hashable, List], sample_size: int) -> set:
+        """
+        :param strata: Dict[Hashable, List], members of each stratum
+        :param sample_size: int, total sample size to be drawn
+        :return: set of members drawn from the strata
+        """
+        drawn: set = set()
+        for stratum, quota in self.allocate(strata, sample_size).items():
+            members: List = strata[stratum]
+            drawn.update(members if quota >= len(members) else self.rng.sample(members, quota))
+        return drawn
+
+    def sample_graph(self, graph: Dict, edges_limit: int) -> Dict:
+        """
+        Draw a stratified subsample of a knowledge graph. Only nodes
+        referenced by the sampled edges are drawn into the sample.
+
+        :param graph: Dict, TRAPI knowledge graph with 'nodes' and 'edges'
+        :param edges_limit: int, maximum number (> 0) of edges to be drawn
+        :return: Dict, 'edges_limit' sized subset of knowledge graph (original edge order is preserved)
+        """
+        assert edges_limit > 0, "StratifiedSampler.sample_graph(): 'edges_limit' must be a positive integer!"
+        nodes: Dict = graph["nodes"]
+        drawn: set = self.draw(self.stratify_edges(graph), edges_limit)
+
+        kg_sample: Dict = {
+            "nodes": dict(),
+            "edges": dict()
+        }
+        for edge_id, edge in graph["edges"].items():
+            if edge_id not in drawn:
+                continue
+            kg_sample["edges"][edge_id] = edge
+            if isinstance(edge, Dict):
+                for tag in ["subject", "object"]:
+                    node_id = edge[tag] if tag in edge else None
+                    if isinstance(node_id, str) and node_id in nodes and node_id not in kg_sample["nodes"]:
+                        kg_sample["nodes"][node_id] = nodes[node_id]
+
+        logger.debug(
+            f"StratifiedSampler(seed={self.seed}) drew {len(kg_sample['edges'])} " +
+            f"of {len(graph['edges'])} knowledge graph edges"
+        )
+        return kg_sample
+
+    def sample_results(self, results: List, sample_size: int) -> List:
+        """
+        Draw a stratified subsample of a list of Results.
+
+        :param results: List, original list of Results
+        :param sample_size: int, maximum number (> 0) of Results to be drawn
+        :return: List, 'sample_size' sized subset of Results (original Result order is preserved)
+        """
+        assert sample_size > 0, "StratifiedSampler.sample_results(): 'sample_size' must be a positive integer!"
+        drawn: set = self.draw(self.stratify_results(results), sample_size)
+        return [results[index] for index in sorted(drawn)]
@@ -0,0 +1,206 @@
+"""
+Compact binary serialization of (JSON-like) validation data, e.g. of the validation messages of ValidationReporters,
+for transport between processes (see ValidationReporter.to_bytes() and ValidationReporter.from_bytes()).
+
+Values are encoded much as by MessagePack, i.e. as type-tagged, variable length binary records, except that each
+distinct string is only encoded once: strings are added to a string table, as they are first encountered, such
+that repeated strings (e.g. validation codes, targets, tests and message identifiers) are simply encoded as
+(small) indices into the string table. Note that tuples and sets are decoded as lists.
+"""
+from typing import Optional, Any, Dict, List
+from collections.abc import Mapping
+from struct import Struct
+
+from reasoner_validator.message import MessagesView
+
+# format (version) marker of the serialized data
+MAGIC: bytes = b"RVB\x01"
+
+# type tags of the encoded values
+_NONE: int = 0
+_FALSE: int = 1
+_TRUE: int = 2
+_INTEGER: int = 3
+_BIG_INTEGER: int = 4
+_FLOAT: int = 5
+_STRING: int = 6
+_STRING_REFERENCE: int = 7
+_BYTES: int = 8
+_LIST: int = 9
+_DICT: int = 10
+
+_DOUBLE: Struct = Struct("<d")
+
+
+class BinaryEncoder:
+    """
+    Encoder of (JSON-like) values, plus bytes, into the compact binary format.
+    """
+    def __init__(self):
+        self.buffer: bytearray = bytearray(MAGIC)
+        self.strings: Dict[str, int] = dict()
+
+    def _unsigned(self, value: int):
+        """
+        :param value: int, non-negative integer, encoded as a variable length (7 bits per byte) integer
+        """
+        buffer: bytearray = self.buffer
+        while value >= 0x80:
+            buffer.append((value & 0x7F) | 0x80)
+            value >>= 7
+        buffer.append(value)
+
+    def encode(self, value: Any):
+        """
+        :param value: Any, value to be encoded (appended to the buffer of the encoder)
+        :raises: TypeError, if the value (or a value nested within it) cannot be encoded
+        """
+        buffer: bytearray = self.buffer
+        if value is None:
+            buffer.append(_NONE)
+        elif value is True:
+            buffer.append(_TRUE)
+        elif value is False:
+            buffer.append(_FALSE)
+        elif isinstance(value, str):
+            index: Optional[int] = self.strings.get(value)
+            if index is not None:
+                buffer.append(_STRING_REFERENCE)
+                self._unsigned(index)
+            else:
+                self.strings[value] = len(self.strings)
+                data: bytes = value.encode("utf-8")
+                buffer.append(_STRING)
+                self._unsigned(len(data))
+                buffer += data
+        elif isinstance(value, int):
+            if -2**63 <= value < 2**63:
+                buffer.append(_INTEGER)
+                # 'zigzag' encoding of signed integers
+                self._unsigned((value << 1) ^ (value >> 63))
+            else:
+                data: bytes = str(value).encode("ascii")
+                buffer.append(_BIG_INTEGER)
+                self._unsigned(len(data))
+                buffer += data
+        elif isinstance(value, float):
+            buffer.append(_FLOAT)
+            buffer += _DOUBLE.pack(value)
+        elif isinstance(value, (bytes, bytearray, memoryview)):
+            buffer.append(_BYTES)
+            self._unsigned(len(value))
+            buffer += value
+        elif isinstance(value, MessagesView):
+            self.encode(value.unwrap())
+        elif isinstance(value, Mapping):
+            buffer.append(_DICT)
+            self._unsigned(len(value))
+            for key, item in value.items():
+                self.encode(key)
+                self.encode(item)
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            buffer.append(_LIST)
+            self._unsigned(len(value))
+            for item in value:
+                self.encode(item)
+        else:
+            raise TypeError(f"Object of type {type(value).__name__} cannot be serialized")
+
+
+class BinaryDecoder:
+    """
+    Decoder of values encoded in the compact binary format.
+    """
+    def __init__(self, data: bytes):
+        """
+        :param data: bytes, encoded data
+        :raises: ValueError, if the data is not of the compact binary format
+        """
+        if bytes(data[:len(MAGIC)]) != MAGIC:
+            raise ValueError("BinaryDecoder(): data is not of the (expected version of the) binary format")
+        self.data: bytes = bytes(data)
+        self.position: int = len(MAGIC)
+        self.strings: List[str] = list()
+
+    def _unsigned(self) -> int:
+        data: bytes = self.data
+        value: int = 0
+        shift: int = 0
+        while True:
+            byte: int = data[self.position]
+            self.position += 1
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return value
+            shift += 7
+
+    def _bytes(self) -> bytes:
+        size: int = self._unsigned()
+        start: int = self.position
+        self.position += size
+        if self.position > len(self.data):
+            raise ValueError("BinaryDecoder(): truncated data")
+        return self.data[start:self.position]
+
+    def decode(self) -> Any:
+        """
+        :return: Any, next decoded value
+        :raises: ValueError, if the data is invalid
+        """
+        try:
+            tag: int = self.data[self.position]
+        except IndexError:
+            raise ValueError("BinaryDecoder(): truncated data")
+        self.position += 1
+        if tag == _STRING_REFERENCE:
+            return self.strings[self._unsigned()]
+        elif tag == _STRING:
+            value: str = self._bytes().decode("utf-8")
+            self.strings.append(value)
+            return value
+        elif tag == _DICT:
+            return {self.decode(): self.decode() for _ in range(self._unsigned())}
+        elif tag == _LIST:
+            return [self.decode() for _ in range(self._unsigned())]
+        elif tag == _INTEGER:
+            value: int = self._unsigned()
+            return (value >> 1) ^ -(value & 1)
+        elif tag == _NONE:
+            return None
+        elif tag == _TRUE:
+            return True
+        elif tag == _FALSE:
+            return False
+        elif tag == _FLOAT:
+            value: float = _DOUBLE.unpack_from(self.data, self.position)[0]
+            self.position += _DOUBLE.size
+            return value
+        elif tag == _BYTES:
+            return self._bytes()
+        elif tag == _BIG_INTEGER:
+            return int(self._bytes().decode("ascii"))
+        raise ValueError(f"BinaryDecoder(): unknown type tag '{tag}'")
+
+
+def dumps(value: Any) -> bytes:
+    """
+    :param value: Any, (JSON-like) value to be serialized
+    :return: bytes, serialized value
+    :raises: TypeError, if the value cannot be serialized
+    """
+    encoder = BinaryEncoder()
+    encoder.encode(value)
+    return bytes(encoder.buffer)
+
+
+def loads(data: bytes) -> Any:
+    """
+    :param data: bytes, serialized value
+    :return: Any, deserialized value
+    :raises: ValueError, if the data is invalid
+    """
+    decoder = BinaryDecoder(data)
+    value: Any = decoder.decode()
+    if decoder.position != len(decoder.data):
+        raise ValueError("BinaryDecoder(): unexpected trailing data")
+    return value
@@ -0,0 +1,148 @@
+"""
+Message sinks of a ValidationReporter, to which each validation message is emitted as soon as it is reported,
+e.g. for rendering partial results of (long) validations or, if the ValidationReporter does not also retain its
+messages, for validating huge TRAPI Responses with a flat memory footprint. Each message is emitted as a
+(JSON serializable) message record, of the form:
+
+    {
+        "target": <target>,
+        "test": <test>,
+        "type": <message type, one of 'info', 'skipped', 'warning', 'error' or 'critical'>,
+        "code": <validation code>,
+        "identifier": <message identifier, if any>,
+        "parameters": <dictionary of any additional message parameters>
+    }
+"""
+from typing import Optional, Dict, Callable, Any, IO
+from asyncio import Queue, AbstractEventLoop
+
+from reasoner_validator import codec
+from reasoner_validator.message import MessageType, MESSAGE_PARAMETERS
+
+MESSAGE_RECORD = Dict[str, Any]
+
+
+def message_record(
+        target: str,
+        test: str,
+        message_type: MessageType,
+        code: str,
+        identifier: Optional[str] = None,
+        parameters: Optional[MESSAGE_PARAMETERS] = None
+) -> MESSAGE_RECORD:
+    """
+    :param target: str, target of the message
+    :param test: str, test of the message
+    :param message_type: MessageType, type of the message
+    :param code: str, validation code of the message
+    :param identifier: Optional[str], message identifier (Default: None, message without an identifier)
+    :param parameters: Optional[MESSAGE_PARAMETERS], additional parameters of an identified message
+    :return: MESSAGE_RECORD, record of the message, as emitted to message sinks
+    """
+    record: MESSAGE_RECORD = {"target": target, "test": test, "type": message_type.name, "code": code}
+    if identifier is not None:
+        record["identifier"] = identifier
+    if parameters:
+        record["parameters"] = parameters
+    return record
+
+
+def _json_default(o):
+    # message parameter values which are not JSON serializable, e.g. sets, are
+    # serialized as lists (as by the codec) or, failing that, as strings
+    try:
+        return list(iter(o))
+    except TypeError:
+        return str(o)
+
+
+class MessageSink:
+    """
+    Abstract sink of the messages emitted by a ValidationReporter.
+    """
+    def emit(self, record: MESSAGE_RECORD):
+        """
+        :param record: MESSAGE_RECORD, record of a reported message (not to be modified by the sink)
+        """
+        raise NotImplementedError("Abstract method - implement in child subclass!")
+
+    def close(self):
+        """
+        Signals the end of the messages emitted to the sink (Default: does nothing).
+        """
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class CallbackSink(MessageSink):
+    """
+    Message sink calling a given function with each message record.
+    """
+    def __init__(self, callback: Callable[[MESSAGE_RECORD], Any]):
+        """
+        :param callback: Callable[[MESSAGE_RECORD], Any], function called with each message record
+        """
+        self.callback: Callable[[MESSAGE_RECORD], Any] = callback
+
+    def emit(self, record: MESSAGE_RECORD):
+        self.callback(record)
+
+
+class JsonLinesFileSink(MessageSink):
+    """
+    Message sink writing each message record as one line of JSON (i.e. 'JSON Lines') to a file.
+    """
+    def __init__(self, file: Optional[IO] = None, path: Optional[str] = None, flush: bool = False):
+        """
+        :param file: Optional[IO], (text) file to which the message records are written
+        :param path: Optional[str], path of the file to which the message records are
+                     written, if no 'file' is given (the file is then closed by close())
+        :param flush: bool, if True, the file is flushed after each message record (Default: False)
+        """
+        assert file is not None or path, "JsonLinesFileSink(): either a 'file' or a 'path' must be given!"
+        self._owns_file: bool = file is None
+        self.file: IO = file if file is not None else open(path, "w", encoding="utf-8")
+        self.flush: bool = flush
+
+    def emit(self, record: MESSAGE_RECORD):
+        self.file.write(codec.dumps(record, default_function=_json_default) + "\n")
+        if self.flush:
+            self.file.flush()
+
+    def close(self):
+        if self._owns_file:
+            self.file.close()
+        else:
+            self.file.flush()
+
+
+class AsyncQueueSink(MessageSink):
+    """
+    Message sink putting each message record onto an asyncio Queue, e.g. consumed by a (web service) coroutine
+    rendering partial results of a validation. The end of the messages, i.e. close(), is signalled by a None.
+    """
+    def __init__(self, queue: Queue, loop: Optional[AbstractEventLoop] = None):
+        """
+        :param queue: asyncio.Queue, (unbounded) queue of the message records
+        :param loop: Optional[AbstractEventLoop], event loop of the queue, if the messages are reported by
+                     another thread, e.g. validation run in an executor (Default: None, same thread as the loop)
+        """
+        self.queue: Queue = queue
+        self.loop: Optional[AbstractEventLoop] = loop
+
+    def _put(self, record: Optional[MESSAGE_RECORD]):
+        if self.loop is not None:
+            self.loop.call_soon_threadsafe(self.queue.put_nowait, record)
+        else:
+            self.queue.put_nowait(record)
+
+    def emit(self, record: MESSAGE_RECORD):
+        self._put(record)
+
+    def close(self):
+        self._put(None)
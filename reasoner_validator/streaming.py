@@ -0,0 +1,514 @@
+"""
+Streaming validation of (possibly huge) TRAPI Responses, parsed incrementally, from files, sockets or web requests.
+
+The Response JSON is parsed as a stream of (ijson) events, from which only one Message element at a time (i.e. the
+query graph, then each knowledge graph node, each knowledge graph edge and each result) is built and validated, as it
+arrives. Apart from the (small) non-Message components of the Response, the only data retained during validation
+are the index of knowledge graph node categories needed to validate the edges and the indexes of knowledge graph
+identifiers (and edge statements) and result bindings needed to cross-check them, so that memory use is bounded by
+the size of those indexes, rather than by the size of the Response document.
+
+The (optional) 'ijson' package is needed for streaming validation (i.e. the 'streaming' extra of the package).
+"""
+from typing import Optional, Dict, List, Set, Tuple, Hashable, Any, Callable, AsyncIterator, BinaryIO
+
+from reasoner_validator.report import TRAPIGraphType
+from reasoner_validator.trapi.mapping import MappingValidator
+from reasoner_validator.validator import TRAPIResponseValidator
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+class AsyncByteStream:
+    """
+    Adapter of an asynchronous iterator of byte chunks (e.g. the body of a web request)
+    to the asynchronous file-like 'read()' interface expected by the ijson parser.
+    """
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        """
+        :param chunks: AsyncIterator[bytes], asynchronous iterator of byte chunks
+        """
+        self.chunks: AsyncIterator[bytes] = chunks.__aiter__()
+        self.buffer: bytes = b""
+
+    async def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self.buffer) < size:
+            try:
+                self.buffer += await self.chunks.__anext__()
+            except StopAsyncIteration:
+                break
+        if size < 0:
+            data, self.buffer = self.buffer, b""
+        else:
+            data, self.buffer = self.buffer[:size], self.buffer[size:]
+        return data
+
+
+class _ValueBuilder:
+    """
+    Builds one JSON value from the stream of ijson events of the value
+    (or, if not 'building', simply skips over the events of the value).
+    """
+    def __init__(self, callback: Optional[Callable[[Any], None]]):
+        """
+        :param callback: Optional[Callable[[Any], None]], called with the completed value (None: value is skipped)
+        """
+        self.callback: Optional[Callable[[Any], None]] = callback
+        self.builder = ijson.ObjectBuilder() if callback is not None else None
+        self.depth: int = 0
+
+    def event(self, event: str, value: Any) -> bool:
+        """
+        :param event: str, ijson event
+        :param value: Any, ijson event value
+        :return: bool, True if the value is complete
+        """
+        if self.builder is not None:
+            self.builder.event(event, value)
+        if event in ("start_map", "start_array"):
+            self.depth += 1
+        elif event in ("end_map", "end_array"):
+            self.depth -= 1
+        if self.depth > 0:
+            return False
+        if self.callback is not None:
+            self.callback(self.builder.value)
+        return True
+
+
+class StreamingTRAPIResponseValidator(TRAPIResponseValidator):
+    """
+    TRAPIResponseValidator which validates a TRAPI Response JSON document, element by
+    element, as it is (incrementally) parsed from a byte stream, instead of a parsed Response.
+
+    As for a parsed Response, the Message is only validated if the non-Message components of the Response are valid
+    (with a known 'status'), the knowledge graph only if the query graph is valid, and the results only if the
+    knowledge graph is valid. Elements arriving before the validity of such preceding components is known (e.g.
+    results preceding the knowledge graph in the stream) are validated into a scratch copy of the validator, whose
+    messages are only kept once (and if) those components are found to be valid. The knowledge graph node and
+    edge mappings and the bindings of the results are cross-checked as for a parsed Response, from indexes of
+    the knowledge graph identifiers and of the result bindings (but not of the elements themselves).
+
+    If the stream is seekable, a preliminary pass over the stream reads the non-Message components of the Response
+    (i.e. its 'schema_version', 'biolink_version', 'status', etc.) and indexes the knowledge graph nodes, so that
+    the validation of the Response does not depend upon the order of its components. Otherwise:
+
+    - the TRAPI and Biolink Model versions given by the Response only select the validation versions
+      (of validators without explicit versions) if they precede the Message in the stream;
+    - the non-Message components of the Response only gate the validation of the Message if they precede it
+      in the stream: any components following the Message are only validated after the Message;
+    - knowledge graph edges preceding the knowledge graph nodes in the stream are validated against the TRAPI
+      schema as they arrive, but retained for their Biolink Model validation until the nodes are indexed, up to
+      'max_pending_edges' edges: the Biolink Model validation of any further such edges is skipped (and reported).
+
+    Knowledge graph nodes, edges and results are validated against the TRAPI schema one at a time (i.e. as 'Node',
+    'Edge' and 'Result' components, rather than within the whole 'KnowledgeGraph'), in stream order: 'max_kg_edges'
+    and 'max_results' select the first edges and results of the stream (seeded random sampling of elements is not
+    available with streaming validation) and all the knowledge graph nodes, rather than only the nodes of the
+    selected edges, are validated.
+    """
+    DEFAULT_MAX_PENDING_EDGES: int = 10000
+
+    # Message components, in the order in which (the validity of) each gates the validation of the next
+    COMPONENTS: List[str] = ["response", "query_graph", "knowledge_graph", "results"]
+
+    def __init__(self, max_pending_edges: int = DEFAULT_MAX_PENDING_EDGES, **kwargs):
+        """
+        :param max_pending_edges: int, maximum number of knowledge graph edges, preceding the knowledge graph nodes
+                                  in a (non-seekable) stream, retained until they may be validated against the
+                                  Biolink Model (Default: 10000)
+        :param kwargs: keyword arguments of the TRAPIResponseValidator
+        """
+        assert ijson is not None, "StreamingTRAPIResponseValidator(): the 'ijson' package needs to be installed!"
+        TRAPIResponseValidator.__init__(self, **kwargs)
+        self.max_pending_edges: int = max_pending_edges
+        self._reset_stream()
+
+    def _reset_stream(self, prefix: str = "", max_kg_edges: int = 0, max_results: int = 0):
+        self._prefix: str = prefix
+        self._max_kg_edges: int = max_kg_edges
+        self._max_results: int = max_results
+        self._value: Optional[_ValueBuilder] = None
+        self._envelope: Dict = dict()
+        self._envelope_checked: Set[str] = set()
+        self._versions_checked: bool = False
+        self._message: Optional[Dict[str, bool]] = None  # Message components seen, once the Message starts
+
+        # validity of each Message component (None: not yet known) and scratch
+        # validators of the elements of components whose validation is pending
+        self._valid: Dict[str, Optional[bool]] = {component: None for component in self.COMPONENTS}
+        self._pending: Dict[str, TRAPIResponseValidator] = dict()
+
+        self._nodes_indexed: bool = False
+        self._knowledge_graph_complete: bool = False
+        self._pending_edges: List[Dict] = list()
+        self._unvalidated_edges: int = 0
+        self._number_of_edges: int = 0
+        self._number_of_results: int = 0
+
+        # indexes of the cross-checks of the knowledge graph node and edge mappings and of the result bindings
+        self._mapping: MappingValidator = MappingValidator()
+        self._kg_nodes: Dict[str, None] = dict()
+        self._used_nodes: Set[str] = set()
+        self._statements: Dict[Hashable, str] = dict()
+        self._edge_references: List[Tuple[str, Dict]] = list()
+        self._edge_ids: Set[str] = set()
+        self._query_nodes: Set[str] = set()
+        self._query_edges: Set[str] = set()
+        self._binding_references: Dict[str, Dict[str, None]] = dict()
+
+    def _preview(self, stream: BinaryIO):
+        # preliminary pass over a seekable stream, for the non-Message
+        # components of the Response and the index of the knowledge graph nodes
+        for path, event, value in ijson.parse(stream, use_float=True):
+            self._preview_event(path, event, value)
+        self._value = None
+
+    def _preview_event(self, path: str, event: str, value: Any):
+        if self._value is not None:
+            if self._value.event(event, value):
+                self._value = None
+            return
+        path = self._path(path)
+        if path is None:
+            return
+        if event == "map_key":
+            if path == "" and value != "message":
+                self._build(lambda envelope_value: self._envelope.__setitem__(value, envelope_value))
+            elif path == "message.knowledge_graph.nodes":
+                self._build(lambda node: self._index_node(value, node))
+        elif path == "message.knowledge_graph.nodes" and event in ["end_map", "null"]:
+            self._nodes_indexed = True
+
+    def check_compliance_of_trapi_response_stream(
+            self,
+            stream: BinaryIO,
+            prefix: str = "",
+            max_kg_edges: int = 0,
+            max_results: int = 0
+    ):
+        """
+        Streaming version of 'check_compliance_of_trapi_response()'.
+
+        :param stream: BinaryIO, binary file-like object (e.g. open file or socket) from which the
+                       TRAPI Response (JSON) is read. If seekable, the stream is read twice.
+        :param prefix: str, ijson (dot delimited) path to the TRAPI Response within the
+                       JSON document, e.g. "fields.data" for ARS responses (Default: "", the whole document)
+        :param max_kg_edges: int, maximum number of (the first) knowledge graph edges to be validated (0: all edges)
+        :param max_results: int, maximum number of (the first) results to be validated (0: all results)
+        """
+        self._reset_stream(prefix=prefix, max_kg_edges=max_kg_edges, max_results=max_results)
+        if stream.seekable():
+            start: int = stream.tell()
+            self._preview(stream)
+            stream.seek(start)
+        for path, event, value in ijson.parse(stream, use_float=True):
+            self._event(path, event, value)
+        self._end_of_stream()
+
+    async def check_compliance_of_trapi_response_async_stream(
+            self,
+            stream,
+            prefix: str = "",
+            max_kg_edges: int = 0,
+            max_results: int = 0
+    ):
+        """
+        Asynchronous streaming version of 'check_compliance_of_trapi_response()'.
+
+        :param stream: asynchronous file-like object, with an 'async read()' method
+                       (see AsyncByteStream), from which the TRAPI Response (JSON) is read
+        :param prefix: str, ijson (dot delimited) path to the TRAPI Response within the JSON document
+        :param max_kg_edges: int, maximum number of (the first) knowledge graph edges to be validated (0: all edges)
+        :param max_results: int, maximum number of (the first) results to be validated (0: all results)
+        """
+        self._reset_stream(prefix=prefix, max_kg_edges=max_kg_edges, max_results=max_results)
+        async for path, event, value in ijson.parse_async(stream, use_float=True):
+            self._event(path, event, value)
+        self._end_of_stream()
+
+    def _path(self, path: str) -> Optional[str]:
+        # path relative to the Response (None if outside of the Response)
+        if not self._prefix:
+            return path
+        if path == self._prefix:
+            return ""
+        if path.startswith(f"{self._prefix}."):
+            return path[len(self._prefix) + 1:]
+        return None
+
+    def _build(self, callback: Optional[Callable[[Any], None]], event: Optional[str] = None, value: Any = None):
+        self._value = _ValueBuilder(callback)
+        if event is not None and self._value.event(event, value):
+            self._value = None
+
+    def _event(self, path: str, event: str, value: Any):
+        if self._value is not None:
+            if self._value.event(event, value):
+                self._value = None
+            return
+
+        path = self._path(path)
+        if path is None:
+            return
+
+        if event == "map_key":
+            if path == "":
+                if value == "message":
+                    self._start_message()
+                else:
+                    self._build(lambda envelope_value: self._envelope.__setitem__(value, envelope_value))
+            elif path == "message":
+                if "present" not in self._message:
+                    # the Message is not empty: it is only validated if the rest of the Response is valid
+                    self._message["present"] = True
+                    self._check_envelope()
+                self._message[value] = True
+                if value == "query_graph":
+                    self._build(self._query_graph)
+                elif value not in ["knowledge_graph", "results"]:
+                    # other Message components (e.g. auxiliary graphs) are not validated
+                    self._build(None)
+            elif path == "message.knowledge_graph":
+                if value not in ["nodes", "edges"]:
+                    self._build(None)
+            elif path == "message.knowledge_graph.nodes":
+                self._build(lambda node: self._node(value, node))
+            elif path == "message.knowledge_graph.edges":
+                self._build(lambda edge: self._edge(value, edge))
+
+        elif path == "message.results.item":
+            self._build(self._result, event, value)
+
+        elif path == "message.knowledge_graph.nodes" and event in ["end_map", "null"]:
+            self._end_of_nodes()
+
+        elif path == "message.knowledge_graph" and event in ["end_map", "null"]:
+            self._end_of_knowledge_graph()
+
+        elif path == "message.results" and event not in ["end_array", "end_map"]:
+            # 'null' results are empty, other (non-array) values are invalid
+            self._message["results_array"] = event in ["start_array", "null"]
+
+    def _start_message(self):
+        self._message = dict()
+        if "schema_version" in self._envelope or "biolink_version" in self._envelope:
+            self._check_versions()
+
+    def _check_versions(self):
+        if not self._versions_checked:
+            self._versions_checked = True
+            self.check_response_versions(self._envelope)
+
+    def _check_envelope(self):
+        self._check_versions()
+        self._envelope_checked = set(self._envelope.keys())
+        self._valid["response"] = self._is_valid_envelope(self._envelope)
+
+    def _is_valid_envelope(self, components: Dict) -> bool:
+        # the non-Message components of the Response are validated with a stub Message
+        envelope: Dict = self.sanitize_workflow(dict(components))
+        envelope['message'] = {}
+        with self.capture_messages() as codes:
+            self.is_valid_trapi_query(instance=envelope, component="Response")
+        if any(code.startswith("critical.") for code in codes):
+            return False
+        status: Optional[str] = envelope['status'] if 'status' in envelope else None
+        if status and status not in ["OK", "Success", "QueryNotTraversable", "KPsNotAvailable"]:
+            self.report("warning.trapi.response.status.unknown", identifier=status)
+            return False
+        return True
+
+    def _preceding_validity(self, component: str) -> List[Optional[bool]]:
+        return [self._valid[name] for name in self.COMPONENTS[:self.COMPONENTS.index(component)]]
+
+    def _validator(self, component: str) -> Optional[TRAPIResponseValidator]:
+        # validator of the elements of a Message component: this validator, if all the preceding components
+        # are valid, None if any of them is invalid, otherwise, a scratch (pending) validator of the component
+        preceding: List[Optional[bool]] = self._preceding_validity(component)
+        if False in preceding:
+            return None
+        if None not in preceding:
+            return self
+        if component not in self._pending:
+            self._pending[component] = self.scratch_copy()
+        return self._pending[component]
+
+    def _settle(self):
+        # the messages of pending validators are merged into this validator once all the preceding
+        # components of their Message component are known to be valid, or discarded if any is invalid
+        for component in ["knowledge_graph", "results"]:
+            preceding: List[Optional[bool]] = self._preceding_validity(component)
+            if None in preceding and False not in preceding:
+                return
+            if component in self._pending:
+                pending: TRAPIResponseValidator = self._pending.pop(component)
+                if False not in preceding:
+                    self.merge(pending, move=True)
+            if component == "knowledge_graph" and self._knowledge_graph_complete and self._valid[component] is None:
+                # as for a parsed Response, the results are only validated if the knowledge graph is valid
+                self._valid[component] = False not in preceding and not self.has_errors()
+
+    def _query_graph(self, query_graph: Any):
+        if isinstance(query_graph, Dict):
+            for tag, keys in [("nodes", self._query_nodes), ("edges", self._query_edges)]:
+                if tag in query_graph and isinstance(query_graph[tag], Dict):
+                    keys.update(query_graph[tag].keys())
+        if self._valid["response"]:
+            # as for a parsed Response, the query graph is validated before (thus, without the
+            # index of) the knowledge graph nodes, which is (in place) put aside in the meantime
+            kg_nodes: Dict = dict(self.nodes)
+            self.nodes.clear()
+            self._valid["query_graph"] = self.has_valid_query_graph({"query_graph": query_graph})
+            self.nodes.update(kg_nodes)
+        else:
+            self._valid["query_graph"] = False
+        self._settle()
+
+    def _validate_schema(self, content: List, instance: Any, component: str):
+        if self.validation_cache is not None:
+            self.cached_validation(content, self.is_valid_trapi_query, instance=instance, component=component)
+        else:
+            self.is_valid_trapi_query(instance=instance, component=component)
+
+    def _index_node(self, node_id: str, node: Any):
+        # the node (categories) index needed to validate the edges
+        if node_id not in self._kg_nodes:
+            self._kg_nodes[node_id] = None
+            self.set_nodes({node_id: node if isinstance(node, Dict) else dict()})
+
+    def _node(self, node_id: str, node: Any):
+        self._index_node(node_id, node)
+        validator: Optional[TRAPIResponseValidator] = self._validator("knowledge_graph")
+        if validator is not None:
+            validator._validate_schema(["Node", node_id, node], instance=node, component="Node")
+            if validator.validate_biolink() and isinstance(node, Dict):
+                validator.validate_graph_node(node_id, node, graph_type=TRAPIGraphType.Knowledge_Graph)
+
+    def _end_of_nodes(self):
+        self._nodes_indexed = True
+        for edge_id, edge in self._edge_references:
+            self._mapping.check_edge_nodes(edge_id, edge, self._kg_nodes, self._used_nodes)
+        self._edge_references = list()
+        validator: Optional[TRAPIResponseValidator] = self._validator("knowledge_graph")
+        if validator is not None:
+            for edge in self._pending_edges:
+                validator.validate_graph_edge(edge, graph_type=TRAPIGraphType.Knowledge_Graph)
+        self._pending_edges = list()
+
+    def _edge(self, edge_id: str, edge: Any):
+        self._number_of_edges += 1
+
+        # the mappings of all the edges are cross-checked, as for a parsed Response
+        self._edge_ids.add(edge_id)
+        self._mapping.check_duplicated_edge(edge_id, edge, self._statements)
+        if self._nodes_indexed:
+            self._mapping.check_edge_nodes(edge_id, edge, self._kg_nodes, self._used_nodes)
+        elif isinstance(edge, Dict):
+            self._edge_references.append(
+                (edge_id, {tag: edge[tag] for tag in ["subject", "object"] if tag in edge})
+            )
+
+        if 0 < self._max_kg_edges < self._number_of_edges:
+            return
+        validator: Optional[TRAPIResponseValidator] = self._validator("knowledge_graph")
+        if validator is None:
+            return
+        validator._validate_schema(["Edge", edge], instance=edge, component="Edge")
+        if not (validator.validate_biolink() and isinstance(edge, Dict)):
+            return
+        if self._nodes_indexed:
+            validator.validate_graph_edge(edge, graph_type=TRAPIGraphType.Knowledge_Graph)
+        elif len(self._pending_edges) < self.max_pending_edges:
+            self._pending_edges.append(edge)
+        else:
+            self._unvalidated_edges += 1
+
+    def _end_of_knowledge_graph(self):
+        if self._knowledge_graph_complete:
+            return
+        self._end_of_nodes()
+        self._knowledge_graph_complete = True
+        validator: Optional[TRAPIResponseValidator] = self._validator("knowledge_graph")
+        if validator is not None:
+            if not (self._kg_nodes and self._number_of_edges):
+                if not self.suppress_empty_data_warnings:
+                    validator.report(code="warning.trapi.response.message.knowledge_graph.empty")
+            else:
+                self._mapping.check_dangling_nodes(self._kg_nodes, self._used_nodes)
+                if self._mapping.has_messages():
+                    validator.merge(self._mapping, move=True)
+                if self._unvalidated_edges:
+                    validator.report(
+                        code="warning.trapi.response.message.knowledge_graph.edges.unvalidated",
+                        identifier=str(self._unvalidated_edges)
+                    )
+        self._settle()
+
+    def _result(self, result: Any):
+        self._number_of_results += 1
+        # the bindings of all the results are cross-checked, as for a parsed Response
+        self.collect_result_binding_references(result, self._binding_references)
+        if 0 < self._max_results < self._number_of_results:
+            return
+        validator: Optional[TRAPIResponseValidator] = self._validator("results")
+        if validator is not None:
+            validator._validate_schema(["Result", result], instance=result, component="Result")
+
+    def _end_of_stream(self):
+        message: Optional[Dict[str, bool]] = self._message
+        if message is None:
+            if not self.suppress_empty_data_warnings:
+                self.report("error.trapi.response.empty")
+            return
+        self._check_versions()
+        if not ("present" in message and message["present"]):
+            if not self.suppress_empty_data_warnings:
+                self.report("error.trapi.response.message.empty")
+            return
+
+        # non-Message components of the Response only following the Message in the stream
+        late_components: Dict = {
+            tag: value for tag, value in self._envelope.items() if tag not in self._envelope_checked
+        }
+        if late_components:
+            self._is_valid_envelope(late_components)
+
+        if "query_graph" not in message:
+            self._valid["query_graph"] = \
+                self.has_valid_query_graph(dict()) if self._valid["response"] else False
+            self._settle()
+
+        if "knowledge_graph" not in message:
+            if self._validator("knowledge_graph") is self and not self.suppress_empty_data_warnings:
+                self.report(code="error.trapi.response.message.knowledge_graph.missing")
+            self._knowledge_graph_complete = True
+            self._settle()
+        else:
+            # e.g. a (non-object) knowledge graph without any nodes or edges
+            self._end_of_knowledge_graph()
+
+        if self._validator("results") is not self:
+            return
+        if "results" not in message:
+            if not self.suppress_empty_data_warnings:
+                self.report(code="error.trapi.response.message.results.missing")
+        elif not self._number_of_results:
+            if "results_array" not in message:
+                self.report(code="error.trapi.response.message.results.not_array")
+            elif not self.suppress_empty_data_warnings:
+                self.report(code="warning.trapi.response.message.results.empty")
+        else:
+            self.report_dangling_result_bindings(
+                self._binding_references,
+                query_nodes=self._query_nodes,
+                query_edges=self._query_edges,
+                kg_nodes=set(self._kg_nodes.keys()),
+                kg_edges=self._edge_ids
+            )
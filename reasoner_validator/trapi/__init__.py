@@ -15,7 +15,9 @@ try:
 except ImportError:
     from yaml import load, Loader
 
-from reasoner_validator.report import ValidationReporter
+from reasoner_validator import codec
+from reasoner_validator.report import ValidationReporter, ReportingPolicy
+from reasoner_validator.sinks import MessageSink
 from reasoner_validator.trapi.mapping import check_node_edge_mappings
 from reasoner_validator.github import GIT_ORG, GIT_REPO
 from reasoner_validator.versioning import SemVer, SemVerError, get_latest_version
@@ -160,7 +162,7 @@ async def call_trapi(url: str, trapi_message):
     response_json = None
     if response.status_code == 200:
         try:
-            response_json = response.json()
+            response_json = codec.loads(response.content)
         except Exception as exc:
             logger.error(f"call_trapi({query_url}) JSON access error: {str(exc)}")
 
@@ -231,7 +233,13 @@ class TRAPISchemaValidator(ValidationReporter):
             default_test: Optional[str] = None,
             default_target: Optional[str] = None,
             trapi_version: Optional[str] = None,
-            strict_validation: Optional[bool] = None
+            strict_validation: Optional[bool] = None,
+            compact_messages: bool = False,
+            reporting_policy: Optional[ReportingPolicy] = None,
+            message_sink: Optional[MessageSink] = None,
+            retain_messages: bool = True,
+            index_messages: bool = False,
+            validation_metadata_checked: bool = False
     ):
         """
         TRAPI Validator constructor.
@@ -241,11 +249,23 @@ class TRAPISchemaValidator(ValidationReporter):
         :param trapi_version: Str, version of the component to validate against
         :param strict_validation: Optional[bool] = None, if True, some tests validate as 'error'; False, simply issues
                                   'info' message; A value of 'None' uses the default value for specific graph contexts.
+        :param compact_messages: bool = False, if True, messages are recorded in a (much more compact) columnar
+                                 message store (see ValidationReporter)
+        :param reporting_policy: Optional[ReportingPolicy] = None, if given, policies bounding the number
+                                 of messages recorded (see ValidationReporter)
+        :param message_sink: Optional[MessageSink] = None, if given, sink to which each message is
+                             emitted as soon as it is reported (see ValidationReporter)
+        :param retain_messages: bool = True, if False, messages are only emitted to the 'message_sink'
+        :param index_messages: bool = False, if True, messages are indexed by identifier and selected parameter
+                               values, e.g. to find the messages of a given edge (see ValidationReporter)
+        :param validation_metadata_checked: bool = False, if True, access to the validation metadata is known
+                                            to be working (e.g. as checked by a parent process), thus not checked
 
         """
         # The following class method checks whether the application
         # has working access to key validation metadata
-        self.check_validation_metadata()
+        if not validation_metadata_checked:
+            self.check_validation_metadata()
 
         self.default_trapi: bool = False
         if trapi_version is None:
@@ -259,7 +279,12 @@ class TRAPISchemaValidator(ValidationReporter):
             self,
             default_test=default_test if default_test is not None else "Standards Test",
             default_target=default_target if default_target is not None else "TRAPI Validation",
-            strict_validation=strict_validation
+            strict_validation=strict_validation,
+            compact_messages=compact_messages,
+            reporting_policy=reporting_policy,
+            message_sink=message_sink,
+            retain_messages=retain_messages,
+            index_messages=index_messages
         )
 
     def get_trapi_version(self) -> str:
@@ -365,30 +390,44 @@ class TRAPISchemaValidator(ValidationReporter):
                 )
 
 
-    def merge(self, reporter):
+    def merge(self, reporter, move: bool = False):
         """
         Merge all messages and metadata from a second TRAPISchemaValidator,
         into the calling TRAPISchemaValidator instance.
 
         :param reporter: second TRAPISchemaValidator
+        :param move: bool, if True, the messages of the second TRAPISchemaValidator
+                     are moved, rather than copied (see ValidationReporter.merge())
         """
-        ValidationReporter.merge(self, reporter)
+        ValidationReporter.merge(self, reporter, move=move)
 
         # Processed on a FIFO basis...
         # We only overwrite empty versions in the parent reporter
         if isinstance(reporter, TRAPISchemaValidator) and not self.get_trapi_version():
             self.reset_trapi_version(reporter.get_trapi_version())
 
-    def to_dict(self) -> Dict:
+    def to_dict(self, copy: bool = False) -> Dict:
         """
         Export TRAPISchemaValidator contents as a Python dictionary
         (including TRAPI version and parent class dictionary content)
+        :param copy: bool, if True, the messages are an independent (deep) copy
+                     (Default: False, the messages are shared with the validator, thus are not to be modified)
         :return: Dict
         """
-        dictionary = ValidationReporter.to_dict(self)
+        dictionary = ValidationReporter.to_dict(self, copy=copy)
         dictionary["trapi_version"] = self.get_trapi_version()
         return dictionary
 
+    @classmethod
+    def _constructor_arguments(cls, header: Dict) -> Dict:
+        """
+        :param header: Dict, metadata of a TRAPISchemaValidator, as exported by to_bytes()
+        :return: Dict, constructor arguments of the class (including the TRAPI version)
+        """
+        arguments: Dict = super()._constructor_arguments(header)
+        arguments["trapi_version"] = header["trapi_version"]
+        return arguments
+
     def report_header(self, title: Optional[str] = None, compact_format: bool = True) -> str:
         header: str = super().report_header(title, compact_format)
         header += f" validating against TRAPI version " \
@@ -0,0 +1,58 @@
+"""
+Lookup indexes of a TRAPI Response Message, built once per Response, for (near) constant time test case matching.
+"""
+from typing import Optional, Dict, List, Tuple
+
+
+class ResponseIndex:
+    """
+    Indexes of the knowledge graph edges of a TRAPI Message, by their (subject, object) node identifier pair,
+    and of the Message results, by the identifiers of the knowledge graph edges which they bind (in any analysis).
+    Both indexes preserve the original (Message) order of their edges and results.
+    """
+    def __init__(self, message: Dict):
+        """
+        :param message: Dict, TRAPI Message (assumed to be well-formed)
+        """
+        knowledge_graph: Dict = message["knowledge_graph"] \
+            if "knowledge_graph" in message and message["knowledge_graph"] else dict()
+        self.nodes: Dict = knowledge_graph["nodes"] \
+            if "nodes" in knowledge_graph and knowledge_graph["nodes"] else dict()
+        self.edges: Dict = knowledge_graph["edges"] \
+            if "edges" in knowledge_graph and knowledge_graph["edges"] else dict()
+        self.results: List = message["results"] if "results" in message and message["results"] else list()
+
+        self.edges_by_node_pair: Dict[Tuple[str, str], List[str]] = dict()
+        for edge_id, edge in self.edges.items():
+            if "subject" in edge and "object" in edge:
+                self.edges_by_node_pair.setdefault((edge["subject"], edge["object"]), list()).append(edge_id)
+
+        self.results_by_edge: Dict[str, List[int]] = dict()
+        for position, result in enumerate(self.results):
+            bound_edges: Dict[str, None] = dict()
+            for analysis in result["analyses"] if "analyses" in result and result["analyses"] else []:
+                if "edge_bindings" not in analysis or not analysis["edge_bindings"]:
+                    continue
+                for bindings in analysis["edge_bindings"].values():
+                    for binding in bindings if bindings else []:
+                        if "id" in binding:
+                            bound_edges[binding["id"]] = None
+            for edge_id in bound_edges:
+                self.results_by_edge.setdefault(edge_id, list()).append(position)
+
+    def get_edges(self, subject_id: str, object_id: str) -> List[str]:
+        """
+        :param subject_id: str, subject node identifier
+        :param object_id: str, object node identifier
+        :return: List[str], identifiers of the knowledge graph edges from the subject to the object node
+        """
+        pair: Tuple[str, str] = (subject_id, object_id)
+        return self.edges_by_node_pair[pair] if pair in self.edges_by_node_pair else list()
+
+    def get_results(self, edge_id: str) -> List[Dict]:
+        """
+        :param edge_id: str, knowledge graph edge identifier
+        :return: List[Dict], results with an analysis which binds the edge (to any query edge)
+        """
+        return [self.results[position] for position in self.results_by_edge[edge_id]] \
+            if edge_id in self.results_by_edge else list()
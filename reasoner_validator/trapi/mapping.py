@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Optional, Any, Dict, List, Set, Hashable, Container, Iterable
 
 from reasoner_validator.report import ValidationReporter
 
@@ -18,11 +18,112 @@ class MappingValidator(ValidationReporter):
             default_target="Validating Knowledge Graph Node and Edge Mappings"
         )
 
+    @staticmethod
+    def edge_key(edge: Dict) -> Hashable:
+        """
+        :param edge: Dict, knowledge graph edge
+        :return: Hashable, key of the statement of the edge: its subject, predicate, object,
+                 qualifiers and primary knowledge source (i.e. the content of a duplicated edge)
+        """
+        qualifiers: List = edge["qualifiers"] if "qualifiers" in edge and isinstance(edge["qualifiers"], List) else []
+        sources: List = edge["sources"] if "sources" in edge and isinstance(edge["sources"], List) else []
+        return (
+            edge["subject"] if "subject" in edge else None,
+            edge["predicate"] if "predicate" in edge else None,
+            edge["object"] if "object" in edge else None,
+            tuple(sorted(
+                (str(qualifier["qualifier_type_id"]), str(qualifier["qualifier_value"]))
+                for qualifier in qualifiers
+                if isinstance(qualifier, Dict) and "qualifier_type_id" in qualifier and "qualifier_value" in qualifier
+            )),
+            tuple(sorted(
+                str(source["resource_id"]) for source in sources
+                if isinstance(source, Dict) and "resource_id" in source and
+                "resource_role" in source and source["resource_role"] == "primary_knowledge_source"
+            ))
+        )
+
     def check_dangling_references(self, graph: Dict):
+        """
+        Check the referential integrity of a knowledge graph, in a single pass over its edges: edges whose
+        subject or object is missing from the graph nodes, nodes without any incident edges ('dangling' nodes)
+        and duplicated edges (with identical subject, predicate, object, qualifiers and primary knowledge source).
+
+        :param graph: Dict, knowledge graph, with 'nodes' and 'edges'
+        """
         if not ('nodes' in graph and graph['nodes'] and 'edges' in graph and graph['edges']):
             self.report(code="warning.graph.empty", identifier="MappingValidator")
+            return
+
+        nodes: Set[str] = set(graph['nodes'].keys())
+        used_nodes: Set[str] = set()
+        statements: Dict[Hashable, str] = dict()
+        edge_id: str
+        edge: Dict
+        for edge_id, edge in graph['edges'].items():
+            self.check_edge_nodes(edge_id, edge, nodes, used_nodes)
+            self.check_duplicated_edge(edge_id, edge, statements)
+        self.check_dangling_nodes(graph['nodes'], used_nodes)
+
+    def check_edge_nodes(self, edge_id: str, edge: Any, nodes: Container[str], used_nodes: Set[str]):
+        """
+        Check that the subject and object of a knowledge graph edge are knowledge graph nodes.
+
+        :param edge_id: str, identifier of the edge
+        :param edge: Any, knowledge graph edge
+        :param nodes: Container[str], identifiers of the knowledge graph nodes
+        :param used_nodes: Set[str], identifiers of the nodes with incident edges (updated in place)
+        """
+        if not isinstance(edge, Dict):
+            return
+        for tag in ["subject", "object"]:
+            node_id: Optional[str] = edge[tag] if tag in edge and isinstance(edge[tag], str) else None
+            if not node_id:
+                # missing subject and object identifiers are reported by the TRAPI schema validation
+                continue
+            if node_id in nodes:
+                used_nodes.add(node_id)
+            else:
+                self.report(
+                    code=f"error.knowledge_graph.edge.{tag}.missing_from_nodes",
+                    identifier=node_id,
+                    edge_id=edge_id
+                )
+
+    def check_duplicated_edge(self, edge_id: str, edge: Any, statements: Dict[Hashable, str]):
+        """
+        Check that a knowledge graph edge doesn't duplicate the statement of another edge.
+
+        :param edge_id: str, identifier of the edge
+        :param edge: Any, knowledge graph edge
+        :param statements: Dict[Hashable, str], identifiers of the edges seen so far, indexed
+                           by the keys of their statements (see 'edge_key()'), updated in place
+        """
+        if not isinstance(edge, Dict):
+            return
+        statement: Hashable = self.edge_key(edge)
+        if statement in statements:
+            self.report(
+                code="warning.knowledge_graph.edge.duplicated",
+                identifier=edge_id,
+                edge_id=statements[statement]
+            )
         else:
-            pass
+            statements[statement] = edge_id
+
+    def check_dangling_nodes(self, nodes: Iterable[str], used_nodes: Set[str]):
+        """
+        Report the knowledge graph nodes without any incident edges.
+
+        :param nodes: Iterable[str], identifiers of the knowledge graph nodes (in order)
+        :param used_nodes: Set[str], identifiers of the nodes with incident edges
+        """
+        dangling_nodes: List[str] = [node_id for node_id in nodes if node_id not in used_nodes]
+        if dangling_nodes:
+            self.report(
+                code="warning.knowledge_graph.nodes.dangling",
+                identifier='|'.join(dangling_nodes)
+            )
 
 
 # Detect 'dangling nodes/edges' by iterating through node <-> edge mappings)
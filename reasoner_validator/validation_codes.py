@@ -1,6 +1,7 @@
 import copy
 from os.path import join, abspath, dirname
-from typing import Optional, Any, Dict, List, Tuple
+from types import MappingProxyType
+from typing import Optional, Any, Dict, List, Tuple, Mapping, NamedTuple
 
 try:
     from yaml import load, CLoader as Loader
@@ -16,6 +17,18 @@ logger = logging.getLogger(__name__)
 DEFAULT_CODES_DOCUMENTATION_FILE = abspath(join(dirname(__file__), "..", "docs", "validation_codes_dictionary.md"))
 
 
+class CodeEntry(NamedTuple):
+    """
+    Immutable entry of a (leaf) validation code: its message type
+    (i.e. info, skipped, warning, error or critical), message template,
+    (optional) message context parameters and (optional) description.
+    """
+    message_type: str
+    message: str
+    context: Optional[Tuple[str, ...]]
+    description: Optional[str]
+
+
 class CodeDictionary:
 
     CODE_DICTIONARY_FILE: str = abspath(join(dirname(__file__), "codes.yaml"))
@@ -26,6 +39,9 @@ class CodeDictionary:
 
     code_dictionary: Optional[Dict] = None
 
+    # flat, read-only index of the leaf code entries of the code dictionary, keyed by (dot delimited) code
+    code_index: Optional[Mapping[str, CodeEntry]] = None
+
     @classmethod
     def _get_code_dictionary(cls) -> Dict:
         if not cls.code_dictionary:
@@ -34,6 +50,43 @@ class CodeDictionary:
                 cls.code_dictionary = load(f, Loader=Loader)
         return cls.code_dictionary
 
+    @classmethod
+    def _index_code_entries(cls, root: str, code_subtree: Dict, index: Dict[str, CodeEntry]):
+        for tag, value in code_subtree.items():
+            if not isinstance(value, Dict):
+                continue
+            code: str = f"{root}.{tag}" if root else tag
+            if cls.MESSAGE not in value:
+                cls._index_code_entries(code, value, index)
+            else:
+                index[code] = CodeEntry(
+                    message_type=cls.get_message_type(code),
+                    message=value[cls.MESSAGE],
+                    context=tuple(value[cls.CONTEXT]) if cls.CONTEXT in value and value[cls.CONTEXT] else None,
+                    description=value[cls.DESCRIPTION] if cls.DESCRIPTION in value else None
+                )
+
+    @classmethod
+    def _get_code_index(cls) -> Mapping[str, CodeEntry]:
+        if cls.code_index is None:
+            index: Dict[str, CodeEntry] = dict()
+            cls._index_code_entries("", cls._get_code_dictionary(), index)
+            cls.code_index = MappingProxyType(index)
+        return cls.code_index
+
+    @classmethod
+    def get_code(cls, code: Optional[str]) -> Optional[CodeEntry]:
+        """
+        Get the (immutable) code entry of a leaf validation code, by a single flat index lookup.
+
+        :param code: Optional[str], dot delimited validation message code identifier (None is ok, but returns None)
+        :return: Optional[CodeEntry], code entry; None, if the code is empty, unknown or not a leaf code
+        """
+        if not code:
+            return None
+        index: Mapping[str, CodeEntry] = cls._get_code_index()
+        return index[code] if code in index else None
+
     @classmethod
     def filter_copy_by_facet(cls, tree: Dict, facet: str) -> Dict:
         """
@@ -157,27 +210,32 @@ class CodeDictionary:
 
         :return: Dict, single terminal leaf code entry (complete with indicated or all facets); None, if not available
         """
-        value: Optional[Tuple[str, Dict[str, str]]] = cls.get_code_subtree(code, facet=facet, is_leaf=True)
-        if not value:
+        code_entry: Optional[CodeEntry] = cls.get_code(code)
+        if code_entry is None:
             return None
-        entry: Optional[Dict[str, str]]
-        message_type, entry = value
+        entry: Dict[str, Any] = {cls.MESSAGE: code_entry.message}
+        if code_entry.context is not None:
+            entry[cls.CONTEXT] = list(code_entry.context)
+        if code_entry.description is not None:
+            entry[cls.DESCRIPTION] = code_entry.description
+        if facet:
+            entry = {key: value for key, value in entry.items() if key == f"${facet.lower()}"}
         return entry
 
     @classmethod
     def get_message_template(cls, code: Optional[str]) -> Optional[str]:
-        entry: Optional[Dict[str, str]] = cls.get_code_entry(code)
-        return entry[cls.MESSAGE] if entry else None
+        entry: Optional[CodeEntry] = cls.get_code(code)
+        return entry.message if entry else None
 
     @classmethod
     def get_message_context(cls, code: Optional[str]) -> Optional[List[str]]:
-        entry: Optional[Dict[str, str]] = cls.get_code_entry(code)
-        return entry[cls.CONTEXT] if entry else None
+        entry: Optional[CodeEntry] = cls.get_code(code)
+        return list(entry.context) if entry and entry.context else None
 
     @classmethod
     def get_description(cls, code: Optional[str]) -> Optional[str]:
-        entry: Optional[Dict[str, str]] = cls.get_code_entry(code)
-        return entry[cls.DESCRIPTION] if entry else None
+        entry: Optional[CodeEntry] = cls.get_code(code)
+        return entry.description if entry else None
 
     @staticmethod
     def validation_code_tag(code: str) -> str:
@@ -206,14 +264,14 @@ class CodeDictionary:
 
         :return: Optional[List[str] of decoded messages for the given code
         """
-        value: Optional[Tuple[str, Dict[str, str]]] = cls.get_code_subtree(code, is_leaf=True)
-        assert value, f"CodeDictionary.display(): unknown message code {code}"
+        entry: Optional[CodeEntry] = cls.get_code(code)
+        assert entry, f"CodeDictionary.display(): unknown message code {code}"
 
-        message_type = cls.get_message_type(code)
+        message_type = entry.message_type
         message_type_prefix: str = f"{message_type.upper()} - " if add_prefix else ""
         context: str = cls.validation_code_tag(code) + ": " if add_prefix else ""
 
-        template: str = cls.get_message_template(code)
+        template: str = entry.message
         message_set: List = list()
 
         if not messages:
@@ -1,16 +1,26 @@
-from typing import Optional, List, Dict, Set, Tuple
-from functools import lru_cache
+from typing import Optional, List, Dict, Set, Tuple, Hashable, Any, Iterator
+from importlib import metadata
+from queue import Queue
+from threading import Thread, Lock
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+import copy
 from reasoner_validator.versioning import SemVer
 from reasoner_validator.biolink import (
     BiolinkValidator,
     get_biolink_model_toolkit
 )
 
-from reasoner_validator import post_query, NODE_NORMALIZER_SERVER
 from reasoner_validator.biolink import is_curie
-from reasoner_validator.biolink.ontology import get_parent_concepts
-from reasoner_validator.report import TRAPIGraphType
-from reasoner_validator.trapi import  check_node_edge_mappings
+from reasoner_validator.biolink.ontology import get_parent_concepts_of
+from reasoner_validator.cache import content_hash, ValidationCache, ResponseValidationCache
+from reasoner_validator.estimation import PrevalenceEstimator
+from reasoner_validator.nodenorm import get_node_normalizer
+from reasoner_validator.report import TRAPIGraphType, ReportingPolicy, merge_reporters
+from reasoner_validator.sampling import StratifiedSampler
+from reasoner_validator import serialization
+from reasoner_validator.sinks import MESSAGE_RECORD, MessageSink, CallbackSink
+from reasoner_validator.trapi import TRAPISchemaValidator, check_node_edge_mappings
+from reasoner_validator.trapi.index import ResponseIndex
 from reasoner_validator.trapi.mapping import MappingValidator
 from reasoner_validator.versioning import get_latest_version
 
@@ -21,6 +31,90 @@ logger = logging.getLogger(__name__)
 # for Biolink Model release compliance only needs to be superficial
 RESULT_TEST_DATA_SAMPLE_SIZE = 10
 
+# Release of the reasoner-validator, on which (cached) validation messages depend, see get_validation_context()
+try:
+    _RELEASE: Optional[str] = metadata.version('reasoner-validator')
+except metadata.PackageNotFoundError:
+    _RELEASE = None
+
+# TRAPI schema validator of each (process pool) results validation worker, see _init_results_worker()
+_results_worker_validator: Optional[TRAPISchemaValidator] = None
+
+
+def _init_results_worker(trapi_version: str, validation_metadata_checked: bool):
+    """
+    :param trapi_version: str, TRAPI version (or schema file) against which the worker validates results
+    :param validation_metadata_checked: bool, True if access to the validation metadata was already
+                                        checked by the parent process (thus need not be checked again)
+    """
+    global _results_worker_validator
+    _results_worker_validator = TRAPISchemaValidator(
+        trapi_version=trapi_version,
+        validation_metadata_checked=validation_metadata_checked
+    )
+
+
+def _validate_results_partition(results: List[Dict]) -> bytes:
+    """
+    Validate a partition of TRAPI Results against the TRAPI schema (in a results validation worker).
+
+    :param results: List[Dict], (contiguous) partition of TRAPI Results
+    :return: bytes, (code, parameters) of the validation messages of each result, in order, returned to the
+             parent process in the compact binary format of reasoner_validator.serialization (with the
+             codes, parameter names and other strings repeated across the messages only encoded once)
+    """
+    messages: List[List[Tuple[str, Dict]]] = list()
+    for result in results:
+        with _results_worker_validator.capture_messages(with_parameters=True) as captured:
+            _results_worker_validator.is_valid_trapi_query(instance=result, component="Result")
+        messages.append(captured)
+    # the messages are returned to the parent process, thus need not be kept in the worker
+    _results_worker_validator.clear_messages()
+    return serialization.dumps(messages)
+
+
+class ResultsWorkerPool:
+    """
+    Process pools of results validation workers (see validate_results_in_parallel()), each created on first use
+    for a given TRAPI version and number of workers, then reused until shut down. A ResultsWorkerPool is
+    shared by a TRAPIResponseValidator and its scratch copies, and may be shared by many (successive)
+    TRAPIResponseValidators, e.g. one per request of a web service (see the 'results_pool' of the validator).
+    """
+    def __init__(self):
+        self._lock = Lock()
+        self._executors: Dict[Tuple[str, int], ProcessPoolExecutor] = dict()
+
+    def get_executor(
+            self,
+            trapi_version: str,
+            workers: int,
+            validation_metadata_checked: bool
+    ) -> ProcessPoolExecutor:
+        """
+        :param trapi_version: str, TRAPI version (or schema file) against which the workers validate results
+        :param workers: int, number of worker processes
+        :param validation_metadata_checked: bool, True if access to the validation metadata was already checked
+        :return: ProcessPoolExecutor, (possibly already running) pool of results validation workers
+        """
+        with self._lock:
+            if (trapi_version, workers) not in self._executors:
+                self._executors[(trapi_version, workers)] = ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_results_worker,
+                    initargs=(trapi_version, validation_metadata_checked)
+                )
+            return self._executors[(trapi_version, workers)]
+
+    def shutdown(self):
+        """
+        Shut down all the process pools, waiting for their pending work to complete.
+        """
+        with self._lock:
+            executors: List[ProcessPoolExecutor] = list(self._executors.values())
+            self._executors.clear()
+        for executor in executors:
+            executor.shutdown()
+
 
 class TRAPIResponseValidator(BiolinkValidator):
     """
@@ -35,7 +129,17 @@ class TRAPIResponseValidator(BiolinkValidator):
             biolink_version: Optional[str] = None,
             target_provenance: Optional[Dict[str, str]] = None,
             strict_validation: Optional[bool] = None,
-            suppress_empty_data_warnings: bool = False
+            suppress_empty_data_warnings: bool = False,
+            sampling_seed: Optional[int] = None,
+            validation_cache: Optional[ValidationCache] = None,
+            response_cache: Optional[ResponseValidationCache] = None,
+            result_workers: int = 0,
+            results_pool: Optional[ResultsWorkerPool] = None,
+            compact_messages: bool = False,
+            reporting_policy: Optional[ReportingPolicy] = None,
+            message_sink: Optional[MessageSink] = None,
+            retain_messages: bool = True,
+            index_messages: bool = False
     ):
         """
         :param default_test: Optional[str] =  None, initial default test context of the TRAPIResponseValidator messages
@@ -49,6 +153,46 @@ class TRAPIResponseValidator(BiolinkValidator):
         :param suppress_empty_data_warnings: bool = False, validation normally reports empty Message query graph,
                                 knowledge graph and results as warnings. This flag suppresses the reporting
                                 of such warnings (default: False).
+        :param sampling_seed: Optional[int] = None, if given, knowledge graph edges and results are subsampled
+                              (as limited by 'max_kg_edges' and 'max_results') by seeded random sampling, stratified
+                              by edge predicate, primary knowledge source and subject/object categories (for edges)
+                              or by reporting resources (for results). If None (the default), simply the first
+                              'max_kg_edges' knowledge graph edges and first 'max_results' results are validated.
+        :param validation_cache: Optional[ValidationCache] = None, if given, validation is 'incremental': validation
+                                 messages of each knowledge graph node, edge and result are cached, keyed by a hash
+                                 of their content (plus the validation context: TRAPI and Biolink Model versions,
+                                 strictness and target provenance), so that only new or changed elements are
+                                 validated again, with messages of unchanged elements replayed from the cache.
+                                 Note that the knowledge graph is then validated against the TRAPI schema one
+                                 node and edge at a time (rather than as a whole).
+        :param response_cache: Optional[ResponseValidationCache] = None, if given, the validation reports of
+                               whole TRAPI Responses are cached, keyed by a hash of the response content plus all
+                               validation parameters, such that repeated validation of an identical response
+                               (with identical parameters) simply retrieves the messages from the cache.
+        :param result_workers: int = 0, if greater than 1, the (sampled) results of a TRAPI Response are validated
+                               against the TRAPI schema in parallel, partitioned across a pool of 'result_workers'
+                               processes, with their messages merged in the order of the results. Results are
+                               validated serially when incremental validation (a 'validation_cache') is used.
+                               The worker processes are started on first use, then reused by later validations
+                               until the validator is closed (see close()).
+        :param results_pool: Optional[ResultsWorkerPool] = None, if given, (shared) pool of the results validation
+                             workers, which is then not shut down when the validator is closed, but by its owner
+                             (Default: a pool of the validator).
+        :param compact_messages: bool = False, if True, messages are recorded in a (much more compact) columnar
+                                 message store, only materialized on demand (e.g. by to_dict()), which is
+                                 recommended for knowledge graphs with millions of validation messages.
+        :param reporting_policy: Optional[ReportingPolicy] = None, if given, policies bounding the number of
+                                 messages recorded (e.g. the number of identifiers recorded per code),
+                                 with messages beyond these bounds only counted (see ValidationReporter).
+                                 Note that messages replayed from a 'validation_cache' are recorded as is.
+        :param message_sink: Optional[MessageSink] = None, if given, sink to which each message is emitted as
+                             soon as it is reported, e.g. to render partial results of long validations
+                             (see also iter_validate())
+        :param retain_messages: bool = True, if False, messages are only emitted to the 'message_sink' (and counted),
+                                rather than also being recorded, for a flat memory footprint (validation reports
+                                are then not stored in the 'response_cache').
+        :param index_messages: bool = False, if True, messages are indexed by identifier and selected parameter
+                               values, e.g. to find the messages of a given edge (see ValidationReporter)
         """
         BiolinkValidator.__init__(
             self,
@@ -57,9 +201,26 @@ class TRAPIResponseValidator(BiolinkValidator):
             trapi_version=trapi_version,
             biolink_version=biolink_version,
             target_provenance=target_provenance,
-            strict_validation=strict_validation
+            strict_validation=strict_validation,
+            compact_messages=compact_messages,
+            reporting_policy=reporting_policy,
+            message_sink=message_sink,
+            retain_messages=retain_messages,
+            index_messages=index_messages
         )
         self.suppress_empty_data_warnings: bool = suppress_empty_data_warnings
+        self.sampling_seed: Optional[int] = sampling_seed
+        self.validation_cache: Optional[ValidationCache] = validation_cache
+        self.response_cache: Optional[ResponseValidationCache] = response_cache
+        self.result_workers: int = result_workers
+        self._results_pool: ResultsWorkerPool = results_pool if results_pool is not None else ResultsWorkerPool()
+        self._owns_results_pool: bool = results_pool is None
+
+        # prevalence estimates of validation codes, as computed by estimate_error_rates()
+        self.error_rate_estimates: Optional[Dict] = None
+
+        # lookup indexes of the TRAPI Message last matched against test cases, see get_response_index()
+        self._response_index: Optional[Tuple[Dict, ResponseIndex]] = None
 
     @staticmethod
     def sanitize_workflow(response: Dict) -> Dict:
@@ -69,20 +230,25 @@ class TRAPIResponseValidator(BiolinkValidator):
 
         :param response: Dict full TRAPI Response JSON object
         :return: Dict, response with discretionary removal of content which
-                       triggers (temporarily) unwarranted TRAPI validation failures
+                       triggers (temporarily) unwarranted TRAPI validation failures. The input
+                       response is not modified: a sanitized (shallow) wrapper of it is returned.
         """
         if 'workflow' in response and response['workflow']:
             # a 'workflow' is a list of steps, which are JSON object specifications
-            workflow_steps: List[Dict] = response['workflow']
-            for step in workflow_steps:
-                if 'runner_parameters' in step and not step['runner_parameters']:
-                    # self.report("warning.trapi.response.workflow.runner_parameters.missing")
-                    step.pop('runner_parameters')
-                if 'parameters' in step and not step['parameters']:
-                    # There are some workflow types that have mandatory need for 'parameters'
-                    # but this should be caught in a later schema validation step
-                    # self.report("warning.trapi.response.workflow.parameters.missing")
-                    step.pop('parameters')
+            workflow_steps: List[Dict] = list()
+            for step in response['workflow']:
+                # self.report("warning.trapi.response.workflow.runner_parameters.missing")
+                # There are some workflow types that have mandatory need for 'parameters'
+                # but this should be caught in a later schema validation step
+                # self.report("warning.trapi.response.workflow.parameters.missing")
+                workflow_steps.append(
+                    {
+                        tag: value for tag, value in step.items()
+                        if not (tag in ['runner_parameters', 'parameters'] and not value)
+                    }
+                )
+            response = dict(response)
+            response['workflow'] = workflow_steps
         return response
 
     def check_compliance_of_trapi_response(
@@ -111,16 +277,133 @@ class TRAPIResponseValidator(BiolinkValidator):
                                   of all edges in the knowledge graph (Default: 0 - use all edges)
         :param max_results: int, target sample number of results to validate (default: 0 for 'use all results').
 
+        If the validator has a 'response_cache' (and no messages yet recorded), the validation report
+        is retrieved from (or, after validation, stored in) the cache. The cache is bypassed if the validator
+        has error rate estimates (see estimate_error_rates()), which are not part of the cached reports.
+
         """
-        if not (response and "message" in response):
-            if not self.suppress_empty_data_warnings:
-                self.report("error.trapi.response.empty")
+        if self.response_cache is None or not response or not self.is_empty() or \
+                self.error_rate_estimates is not None:
+            self._check_compliance_of_trapi_response(response, max_kg_edges=max_kg_edges, max_results=max_results)
+            return
 
-            # nothing more to validate?
+        key: str = ResponseValidationCache.key(
+            response=response,
+            parameters=self.get_response_validation_parameters(max_kg_edges=max_kg_edges, max_results=max_results)
+        )
+        report: Optional[Dict] = self.response_cache.get(key)
+        if report is not None:
+            logger.debug(f"TRAPI Response validation report '{key}' retrieved from the response cache")
+            # the validator has no messages yet, so simply takes a copy of the cached messages (and their counts)
+            self.messages = copy.deepcopy(report["messages"])
+            if "counts" in report:
+                self.add_message_counts(report["counts"])
+            else:
+                self.recount_messages()
+            if "unrecorded" in report:
+                # unrecorded messages are already included in the (cached) counts
+                self.add_unrecorded_messages(report["unrecorded"], count="counts" not in report)
+            if self.message_sink is not None:
+                self.emit_all_messages()
+            if not self.retain_messages:
+                # the messages remain counted
+                self.messages = dict()
+            else:
+                self.reindex_messages()
+            if report["trapi_version"]:
+                self.reset_trapi_version(report["trapi_version"])
+            if report["biolink_version"] and report["biolink_version"] != self.get_biolink_version():
+                self.bmt = get_biolink_model_toolkit(biolink_version=report["biolink_version"])
+                self.reset_biolink_version(self.bmt.get_model_version())
             return
 
-        # Note the 'trapi_version' and 'biolink_version' recorded
-        # in the 'response_json' (if the tags are provided; issue warning otherwise)
+        self._check_compliance_of_trapi_response(response, max_kg_edges=max_kg_edges, max_results=max_results)
+        if self.retain_messages:
+            report = self.to_dict(copy=True)
+            report["counts"] = self.get_message_counts()
+            self.response_cache.put(key, report)
+
+    def iter_validate(
+            self,
+            response: Optional[Dict],
+            max_kg_edges: int = 0,
+            max_results: int = 0
+    ) -> Iterator[MESSAGE_RECORD]:
+        """
+        Generator-style validation of a TRAPI Response (see check_compliance_of_trapi_response()), yielding
+        the record of each validation message (see reasoner_validator.sinks) as soon as it is reported, while the
+        response is validated by a background thread. Any configured 'message_sink' also receives the messages.
+        The generator only returns (even if closed early) once the validation of the response is completed.
+
+        :param response: Optional[Dict], Query.Response to be validated.
+        :param max_kg_edges: int, maximum number of edges to be validated from the
+                                  knowledge graph of the response (Default: 0 - use all edges)
+        :param max_results: int, target sample number of results to validate (default: 0 for 'use all results').
+        :return: Iterator[MESSAGE_RECORD], records of the validation messages, in the order reported
+        """
+        records: Queue = Queue()
+        message_sink: Optional[MessageSink] = self.message_sink
+
+        def forward(record: MESSAGE_RECORD):
+            records.put(record)
+            if message_sink is not None:
+                message_sink.emit(record)
+
+        errors: List[Exception] = list()
+
+        def validate():
+            try:
+                self.check_compliance_of_trapi_response(
+                    response=response,
+                    max_kg_edges=max_kg_edges,
+                    max_results=max_results
+                )
+            except Exception as error:
+                errors.append(error)
+            finally:
+                # end of the messages
+                records.put(None)
+
+        self.message_sink = CallbackSink(forward)
+        validation = Thread(target=validate, daemon=True)
+        validation.start()
+        try:
+            record: Optional[MESSAGE_RECORD] = records.get()
+            while record is not None:
+                yield record
+                record = records.get()
+        finally:
+            validation.join()
+            self.message_sink = message_sink
+        if errors:
+            raise errors[0]
+
+    def get_response_validation_parameters(self, max_kg_edges: int = 0, max_results: int = 0) -> List:
+        """
+        :param max_kg_edges: int, maximum number of knowledge graph edges to be validated
+        :param max_results: int, target sample number of results to validate
+        :return: List, all validation parameters on which the validation report of a TRAPI Response depends
+        """
+        return self.get_validation_context() + [
+            self.default_test,
+            self.default_target,
+            self.default_trapi,
+            self.default_biolink,
+            self.suppress_empty_data_warnings,
+            self.sampling_seed,
+            self.validation_cache is not None,
+            self.reporting_policy.to_dict() if self.reporting_policy is not None else None,
+            max_kg_edges,
+            max_results
+        ]
+
+    def check_response_versions(self, response: Dict):
+        """
+        Note the 'trapi_version' and 'biolink_version' recorded in a TRAPI Response (issuing warnings if the tags
+        are missing) which, if the validator has no explicitly specified versions, override its default versions.
+
+        :param response: Dict, TRAPI Response (only the 'schema_version' and 'biolink_version' are accessed)
+        """
         if 'schema_version' not in response:
             self.report(code="warning.trapi.response.schema_version.missing")
         else:
@@ -153,22 +436,46 @@ class TRAPIResponseValidator(BiolinkValidator):
                 f"TRAPI Response reported Biolink Model version is: '{biolink_version}'"
             )
 
+    def _check_compliance_of_trapi_response(
+            self,
+            response: Optional[Dict],
+            max_kg_edges: int = 0,
+            max_results: int = 0
+    ):
+        """
+        Validation of a TRAPI Response (see 'check_compliance_of_trapi_response()').
+
+        :param response: Optional[Dict], Query.Response to be validated.
+        :param max_kg_edges: int, maximum number of edges to be validated from the knowledge graph of the response.
+        :param max_results: int, target sample number of results to validate.
+        """
+        if not (response and "message" in response):
+            if not self.suppress_empty_data_warnings:
+                self.report("error.trapi.response.empty")
+
+            # nothing more to validate?
+            return
+
+        self.check_response_versions(response)
+
         # Here, we split the TRAPI Response.Message out from the other
         # Response components, to allow for independent TRAPI Schema
         # validation of those non-Message components versus the Message
         # itself (checking along the way whether the Message is empty)
-        message: Optional[Dict] = response.pop('message')
+        message: Optional[Dict] = response['message']
 
-        # We insert a stub to enable TRAPI schema
-        # then validate the remainder of the Response
-        response['message'] = {}
+        # The non-Message components are validated in a shallow wrapper of the Response,
+        # with a stub Message: the Response itself is never modified, thus may be
+        # validated concurrently (i.e. by several validators, in several threads)
+        envelope: Dict = {tag: value for tag, value in response.items() if tag != 'message'}
+        envelope['message'] = {}
         if message:
-            response = self.sanitize_workflow(response)
+            envelope = self.sanitize_workflow(envelope)
 
-            self.is_valid_trapi_query(instance=response, component="Response")
+            self.is_valid_trapi_query(instance=envelope, component="Response")
             if not self.has_critical():
 
-                status: Optional[str] = response['status'] if 'status' in response else None
+                status: Optional[str] = envelope['status'] if 'status' in envelope else None
                 if status and status not in ["OK", "Success", "QueryNotTraversable", "KPsNotAvailable"]:
                     self.report("warning.trapi.response.status.unknown", identifier=status)
 
@@ -188,28 +495,28 @@ class TRAPIResponseValidator(BiolinkValidator):
             if not self.suppress_empty_data_warnings:
                 self.report("error.trapi.response.message.empty")
 
-        # Reconstitute the original Message
-        # to the Response before returning
-        response['message'] = message
-
     @staticmethod
-    def sample_results(results: List, sample_size: int = 0) -> List:
+    def sample_results(results: List, sample_size: int = 0, seed: Optional[int] = None) -> List:
         """
         Subsample the results to a maximum size of 'sample_size'
 
         :param results: List, original list of Results
         :param sample_size: int, target sample size (default: 0 for 'use all results').
+        :param seed: Optional[int], if given, draw a reproducible stratified random sample of results
+                     using this seed (default: None, simply take the first 'sample_size' results).
 
         :return: List, 'sample_size' sized subset of Results
         """
         if sample_size > 0:
             sample_size = min(sample_size, len(results))
+            if seed is not None:
+                return StratifiedSampler(seed=seed).sample_results(results, sample_size)
             return results[0:sample_size]
         else:
             return results
 
     @staticmethod
-    def sample_graph(graph: Dict, edges_limit: int = 0) -> Dict:
+    def sample_graph(graph: Dict, edges_limit: int = 0, seed: Optional[int] = None) -> Dict:
         """
         Only process a strict subsample of the TRAPI Response Message knowledge graph.
 
@@ -218,12 +525,19 @@ class TRAPIResponseValidator(BiolinkValidator):
         :param edges_limit: integer maximum number of edges to be validated in the knowledge graph. A value of zero
                             triggers validation of all edges in the knowledge graph (Default: 0 - use all edges)
         :type edges_limit: int
+        :param seed: if given, draw a reproducible random sample of edges using this seed, stratified by edge
+                     predicate, primary knowledge source and subject/object node categories (Default: None,
+                     simply take the first 'edges_limit' edges of the knowledge graph)
+        :type seed: Optional[int]
 
         :return: Dict, 'edges_limit' sized subset of knowledge graph
         """
         # We don't check for non-empty graphs here simply because the sole caller of this
         # method is the 'has_valid_knowledge_graph' method, which filters out empty graphs
-        if edges_limit > 0:
+        if edges_limit > 0 and seed is not None:
+            return StratifiedSampler(seed=seed).sample_graph(graph, edges_limit)
+
+        elif edges_limit > 0:
             kg_sample: Dict = {
                 "nodes": dict(),
                 "edges": dict()
@@ -262,6 +576,244 @@ class TRAPIResponseValidator(BiolinkValidator):
                 "edges": graph["edges"]
             }
 
+    def scratch_copy(self):
+        """
+        :return: TRAPIResponseValidator, scratch (shallow) copy of the validator, sharing its
+                 configuration (i.e. TRAPI and Biolink Model versions), but with empty messages.
+                 The scratch copy neither emits its messages to the 'message_sink' nor indexes them,
+                 but always retains them, such that they are only emitted (or recorded), once,
+                 when (and if) merged back into this validator.
+        """
+        validator: TRAPIResponseValidator = copy.copy(self)
+        validator.message_sink = None
+        validator.retain_messages = True
+        validator._message_index = None
+        validator.clear_messages()
+        validator._captures = list()
+        return validator
+
+    def _estimate_population_error_rates(
+            self,
+            estimator: PrevalenceEstimator,
+            validate_unit,
+            sample_size: int,
+            adaptive: bool,
+            tolerance: float,
+            max_sample_size: int
+    ) -> Dict:
+        """
+        Validate (possibly adaptively growing) samples of a single population of TRAPI elements.
+
+        :param estimator: PrevalenceEstimator, estimator of the population
+        :param validate_unit: Callable, validation of one (sampled) member of the population
+        :param sample_size: int, initial sample size
+        :param adaptive: bool, if True, keep (doubling the) sampling until the estimates are stable
+        :param tolerance: float, maximum confidence interval half-width of stable estimates
+        :param max_sample_size: int, upper limit to adaptive sampling (0: the population size)
+        :return: Dict, summary of the population, sample and prevalence estimates
+        """
+        limit: int = max_sample_size if max_sample_size > 0 else estimator.population_size
+        rounds: int = 0
+        while True:
+            drawn: List[Tuple[Hashable, object]] = estimator.extend(min(sample_size, limit))
+            rounds += 1
+            for stratum, member in drawn:
+                with self.capture_messages() as codes:
+                    validate_unit(member)
+                estimator.observe(stratum, set(codes))
+            if not (adaptive and drawn) or \
+                    estimator.sample_size >= limit or \
+                    estimator.is_stable(tolerance):
+                break
+            sample_size *= 2
+
+        summary: Dict = estimator.to_dict()
+        summary["rounds"] = rounds
+        return summary
+
+    def estimate_error_rates(
+            self,
+            response: Dict,
+            sample_size: int = 100,
+            adaptive: bool = False,
+            tolerance: float = 0.05,
+            max_sample_size: int = 0,
+            confidence: float = 0.95
+    ) -> Dict:
+        """
+        Estimate the prevalence of each validation code across all the knowledge graph nodes,
+        knowledge graph edges and results of a (possibly huge) TRAPI Response Message, with confidence
+        intervals, from the validation of (seeded by the 'sampling_seed' of the validator) stratified
+        random samples of these elements. Validation messages of the sampled elements are reported into
+        a scratch copy of this validator: the messages of the calling validator are not modified, but
+        the estimates are recorded in its 'error_rate_estimates' (thus, also, in its 'to_dict()' output).
+
+        :param response: Dict, TRAPI Response (or Response.Message) whose elements are to be sampled
+        :param sample_size: int, (initial) number of elements to be validated from each of the
+                            nodes, edges and results of the Message (Default: 100)
+        :param adaptive: bool, if True, keep doubling the sample sizes, until the confidence interval half-widths
+                         of all estimates fall within the 'tolerance' (or the sampling limit is reached)
+        :param tolerance: float, maximum confidence interval half-width of stable estimates (Default: 0.05)
+        :param max_sample_size: int, limit to adaptive sampling of each of the nodes, edges
+                                and results (Default: 0, the number of elements available)
+        :param confidence: float, confidence level of the estimated intervals (Default: 0.95)
+        :return: Dict, indexed by "knowledge_graph_nodes", "knowledge_graph_edges" and "results", of
+                 the population and sample sizes, with the prevalence estimates of each observed code
+        """
+        assert sample_size > 0, "The 'sample_size' must be a positive integer!"
+
+        message: Dict = response["message"] if "message" in response else response
+        message = message if message else dict()
+        knowledge_graph: Dict = message["knowledge_graph"] \
+            if "knowledge_graph" in message and message["knowledge_graph"] else dict()
+        nodes: Dict = knowledge_graph["nodes"] if "nodes" in knowledge_graph and knowledge_graph["nodes"] else dict()
+        edges: Dict = knowledge_graph["edges"] if "edges" in knowledge_graph and knowledge_graph["edges"] else dict()
+        results: List = message["results"] \
+            if "results" in message and isinstance(message["results"], List) else list()
+
+        validator: TRAPIResponseValidator = self.scratch_copy()
+        validator.nodes = dict()
+        validator.set_nodes(nodes)
+
+        def validate_node(node_id: str):
+            validator.is_valid_trapi_query(instance=nodes[node_id], component="Node")
+            validator.validate_graph_node(node_id, nodes[node_id], graph_type=TRAPIGraphType.Knowledge_Graph)
+
+        def validate_edge(edge_id: str):
+            validator.is_valid_trapi_query(instance=edges[edge_id], component="Edge")
+            if validator.validate_biolink():
+                validator.validate_graph_edge(edges[edge_id], graph_type=TRAPIGraphType.Knowledge_Graph)
+
+        def validate_result(index: int):
+            validator.is_valid_trapi_query(instance=results[index], component="Result")
+
+        sampler = StratifiedSampler()
+        populations = [
+            ("knowledge_graph_nodes", sampler.stratify_nodes({"nodes": nodes}), validate_node),
+            ("knowledge_graph_edges", sampler.stratify_edges({"nodes": nodes, "edges": edges}), validate_edge),
+            ("results", sampler.stratify_results(results), validate_result)
+        ]
+        estimates: Dict = {"confidence": confidence}
+        for population, strata, validate_unit in populations:
+            estimator = PrevalenceEstimator(strata, seed=self.sampling_seed, confidence=confidence)
+            estimates[population] = validator._estimate_population_error_rates(
+                estimator=estimator,
+                validate_unit=validate_unit,
+                sample_size=sample_size,
+                adaptive=adaptive,
+                tolerance=tolerance,
+                max_sample_size=max_sample_size
+            )
+            logger.debug(
+                f"estimate_error_rates(): {population} estimates from " +
+                f"{estimates[population]['sampled']} of {estimates[population]['population']} elements"
+            )
+
+        self.error_rate_estimates = estimates
+        return estimates
+
+    def to_dict(self, copy: bool = False) -> Dict:
+        """
+        Export TRAPIResponseValidator contents as a Python dictionary
+        (including any error rate estimates and parent class dictionary content).
+        :param copy: bool, if True, the messages are an independent (deep) copy
+                     (Default: False, the messages are shared with the validator, thus are not to be modified)
+        :return: Dict
+        """
+        dictionary = BiolinkValidator.to_dict(self, copy=copy)
+        if self.error_rate_estimates is not None:
+            dictionary["error_rate_estimates"] = self.error_rate_estimates
+        return dictionary
+
+    def _restore_metadata(self, header: Dict):
+        """
+        Restore any error rate estimates of a TRAPIResponseValidator exported by to_bytes().
+        :param header: Dict, metadata of a TRAPIResponseValidator, as exported by to_bytes()
+        """
+        if "error_rate_estimates" in header:
+            self.error_rate_estimates = header["error_rate_estimates"]
+
+    def get_validation_context(self) -> List:
+        """
+        :return: List, validation settings on which (cached) validation messages
+                 depend: the reasoner-validator release, TRAPI and Biolink Model versions,
+                 validation strictness and target provenance of the validator.
+        """
+        return [
+            _RELEASE,
+            self.get_trapi_version(),
+            self.get_biolink_version(),
+            self.strict_validation,
+            self.target_provenance
+        ]
+
+    def cached_validation(self, content: Any, validation, *args, **kwargs) -> bool:
+        """
+        Incremental validation: if the validation messages of given content (in the current validation
+        context) are in the 'validation_cache', the messages are simply replayed into the validator.
+        Otherwise, the validation method is applied to the content and its messages are cached.
+
+        :param content: Any, JSON-like content uniquely identifying the data being validated
+        :param validation: validation method, reporting its messages into this validator
+        :param args: positional arguments of the validation method
+        :param kwargs: keyword arguments of the validation method
+        :return: bool, True if the validation messages were replayed from the cache
+        """
+        key: str = content_hash([self.get_validation_context(), content])
+        records: Optional[List] = self.validation_cache.get(key)
+        if records is None:
+            with self.capture_messages(with_parameters=True) as records:
+                validation(*args, **kwargs)
+            self.validation_cache.put(key, records)
+            return False
+        for code, parameters in records:
+            self.report(code, **parameters)
+        return True
+
+    def validate_graph_node(self, node_id: str, slots: Dict[str, Any], graph_type: TRAPIGraphType):
+        """
+        Validate slot properties (mainly 'categories') of a node, incrementally
+        (see 'cached_validation') for knowledge graph nodes, if a 'validation_cache' is given.
+
+        :param node_id: str, identifier of a concept node
+        :param slots: Dict, properties of the node
+        :param graph_type: TRAPIGraphType, properties of the node
+        """
+        if self.validation_cache is None or graph_type is not TRAPIGraphType.Knowledge_Graph:
+            BiolinkValidator.validate_graph_node(self, node_id, slots, graph_type)
+        else:
+            self.cached_validation(
+                ["validate_graph_node", node_id, slots],
+                BiolinkValidator.validate_graph_node, self, node_id, slots, graph_type
+            )
+
+    def validate_graph_edge(self, edge: Dict, graph_type: TRAPIGraphType):
+        """
+        Validate slot properties of a relationship ('biolink:Association') edge, incrementally
+        (see 'cached_validation') for knowledge graph edges, if a 'validation_cache' is given.
+
+        :param edge: Dict[str, str], dictionary of the edge slot properties.
+        :param graph_type: TRAPIGraphType, component type of TRAPI being validated
+        """
+        if self.validation_cache is None or graph_type is not TRAPIGraphType.Knowledge_Graph:
+            BiolinkValidator.validate_graph_edge(self, edge, graph_type)
+            return
+
+        # Edge validation also depends on the presence and categories of its subject and object nodes
+        node_ids: List[Optional[str]] = [
+            edge[tag] if tag in edge and isinstance(edge[tag], str) and edge[tag] in self.nodes else None
+            for tag in ["subject", "object"]
+        ]
+        if self.cached_validation(
+            ["validate_graph_edge", edge, node_ids, [self.get_node_categories(node_id) for node_id in node_ids]],
+            BiolinkValidator.validate_graph_edge, self, edge, graph_type
+        ):
+            # replayed edge validation messages don't track
+            # node usage, needed to detect dangling nodes
+            for node_id in node_ids:
+                if node_id is not None:
+                    self.count_node(node_id)
+
     def has_valid_query_graph(self, message: Dict) -> bool:
         """
         Validate a TRAPI Query Graph.
@@ -333,23 +885,55 @@ class TRAPIResponseValidator(BiolinkValidator):
                 if not self.suppress_empty_data_warnings:
                     self.report(code="warning.trapi.response.message.knowledge_graph.empty")
             else:
+                # Referential integrity of the whole Knowledge Graph is checked in a single (cheap) pass,
+                # including dangling nodes, which are not detected in the (possibly sampled) graph below
                 mapping_validator: MappingValidator = check_node_edge_mappings(knowledge_graph)
                 if mapping_validator.has_messages():
-                    self.merge(mapping_validator)
+                    self.merge(mapping_validator, move=True)
 
                 # ...then if not empty, validate a subgraph sample of the associated
                 # Knowledge Graph (since some TRAPI response kg's may be huge!)
-                kg_sample = self.sample_graph(graph=knowledge_graph, edges_limit=edges_limit)
+                kg_sample = self.sample_graph(
+                    graph=knowledge_graph,
+                    edges_limit=edges_limit,
+                    seed=self.sampling_seed
+                )
 
                 # Verify that the sample of the knowledge graph is TRAPI compliant
-                self.is_valid_trapi_query(instance=kg_sample, component="KnowledgeGraph")
+                if self.validation_cache is not None:
+                    # incremental validation is done one (cacheable) node and edge at a time, after
+                    # a single validation of the Knowledge Graph 'shell' (without its nodes and edges),
+                    # such that any errors of the graph (rather than of its elements) are still reported
+                    nodes = kg_sample["nodes"]
+                    edges = kg_sample["edges"]
+                    shell: Dict = dict(kg_sample)
+                    if isinstance(nodes, Dict):
+                        shell["nodes"] = dict()
+                    if isinstance(edges, Dict):
+                        shell["edges"] = dict()
+                    self.is_valid_trapi_query(instance=shell, component="KnowledgeGraph")
+                    if isinstance(nodes, Dict):
+                        for node_id, node in nodes.items():
+                            self.cached_validation(
+                                ["Node", node_id, node],
+                                self.is_valid_trapi_query, instance=node, component="Node"
+                            )
+                    if isinstance(edges, Dict):
+                        for edge in edges.values():
+                            self.cached_validation(
+                                ["Edge", edge],
+                                self.is_valid_trapi_query, instance=edge, component="Edge"
+                            )
+                else:
+                    self.is_valid_trapi_query(instance=kg_sample, component="KnowledgeGraph")
 
                 if self.validate_biolink():
                     # Conduct validation of Biolink Model compliance of the
                     # Knowledge Graph, if Biolink validation not suppressed...
                     self.check_biolink_model_compliance(
                         graph=kg_sample,
-                        graph_type=TRAPIGraphType.Knowledge_Graph
+                        graph_type=TRAPIGraphType.Knowledge_Graph,
+                        check_dangling_nodes=False
                     )
 
         # Only 'error' but not 'info' nor 'warning'
@@ -390,19 +974,23 @@ class TRAPIResponseValidator(BiolinkValidator):
 
             else:
                 # Validate a subsample of a non-empty Message.results component.
-                results_sample = self.sample_results(results, sample_size=sample_size)
+                results_sample = self.sample_results(results, sample_size=sample_size, seed=self.sampling_seed)
+                if self.validation_cache is None and 1 < self.result_workers < len(results_sample):
+                    self.validate_results_in_parallel(results_sample)
+                    results_sample = list()
                 for result in results_sample:
 
                     # generally validate against the pertinent schema
-                    self.is_valid_trapi_query(instance=result, component="Result")
+                    if self.validation_cache is not None:
+                        self.cached_validation(
+                            ["Result", result],
+                            self.is_valid_trapi_query, instance=result, component="Result"
+                        )
+                    else:
+                        self.is_valid_trapi_query(instance=result, component="Result")
 
                     # TODO: implement me! Maybe some additional TRAPI-release specific non-schematic validation here?
 
-                    # TODO: here, we could try to compare the Results against the contents of the KnowledgeGraph,
-                    #       with respect to node input values from the QueryGraph, but this is tricky to do solely
-                    #       with the subsamples, which may not completely overlap,
-                    #       and may also be somewhat computationally intensive?
-
                     # ...Finally, check that the sample Results contained the object of the Query
 
                     # The 'output_element' is 'subject' or 'object' target (unknown) of retrieval
@@ -426,9 +1014,143 @@ class TRAPIResponseValidator(BiolinkValidator):
                     # # data_dump=f"Resolved aliases:\n{','.join(output_aliases)}\n" +
                     #         #   f"Result object IDs:\n{_output(object_ids,flat=True)}"
 
+                # The Results are cross-referenced against the Query Graph and Knowledge Graph in a
+                # single (hash indexed) pass over all their bindings, thus are not (need not be) sampled
+                self.check_result_bindings(message, results)
+
         # Only 'error' but not 'info' nor 'warning' messages invalidate the overall Message
         return False if self.has_errors() else True
 
+    def validate_results_in_parallel(self, results: List[Dict]):
+        """
+        Validate TRAPI Results against the TRAPI schema, partitioned across a pool of 'result_workers'
+        processes (started on first use, then reused until close()). The messages of the results are
+        reported in (deterministic) order of the results.
+
+        :param results: List[Dict], TRAPI Results to validate
+        """
+        # a few contiguous partitions per worker, to balance the load
+        partition_size: int = -(-len(results) // (4 * self.result_workers))
+        partitions: List[List[Dict]] = [
+            results[start:start + partition_size] for start in range(0, len(results), partition_size)
+        ]
+        executor: ProcessPoolExecutor = self._results_pool.get_executor(
+            trapi_version=self.trapi_version,
+            workers=self.result_workers,
+            validation_metadata_checked=self._validation_metadata_checked
+        )
+        for partition_data in executor.map(_validate_results_partition, partitions):
+            for result_messages in serialization.loads(partition_data):
+                for code, parameters in result_messages:
+                    self.report(code, **parameters)
+
+    def close(self):
+        """
+        Shut down the results validation worker processes (if any were started) of the TRAPIResponseValidator,
+        shared with its scratch copies, unless the pool of the workers was given to the validator (which are
+        then shut down by the owner of the pool). The validator remains usable: the workers are restarted if needed.
+        """
+        if self._owns_results_pool:
+            self._results_pool.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def check_result_bindings(self, message: Dict, results: List):
+        """
+        Cross-reference the bindings of TRAPI Results against the Query Graph and Knowledge Graph of the
+        Message: the keys of every node (and analysis edge) binding should be Query Graph node (edge) keys
+        and the bound identifiers should be Knowledge Graph node (edge) identifiers. Each dangling key
+        or identifier is reported once. This check runs in time linear in the total number of bindings.
+
+        :param message: Dict, TRAPI Message with the Query Graph and Knowledge Graph to be cross-referenced
+        :param results: List, TRAPI Results whose bindings are to be checked
+        """
+        query_graph: Dict = message["query_graph"] \
+            if "query_graph" in message and isinstance(message["query_graph"], Dict) else dict()
+        knowledge_graph: Dict = message["knowledge_graph"] \
+            if "knowledge_graph" in message and isinstance(message["knowledge_graph"], Dict) else dict()
+
+        def keys_of(graph: Dict, tag: str) -> Set[str]:
+            return set(graph[tag].keys()) if tag in graph and isinstance(graph[tag], Dict) else set()
+
+        references: Dict[str, Dict[str, None]] = dict()
+        for result in results:
+            self.collect_result_binding_references(result, references)
+        self.report_dangling_result_bindings(
+            references,
+            query_nodes=keys_of(query_graph, "nodes"),
+            query_edges=keys_of(query_graph, "edges"),
+            kg_nodes=keys_of(knowledge_graph, "nodes"),
+            kg_edges=keys_of(knowledge_graph, "edges")
+        )
+
+    @staticmethod
+    def collect_result_binding_references(result: Any, references: Dict[str, Dict[str, None]]):
+        """
+        Collect the Query Graph keys and Knowledge Graph identifiers referenced by the bindings of a TRAPI Result
+        (see 'check_result_bindings()'), such that the references of successive results may be checked at once.
+
+        :param result: Any, TRAPI Result
+        :param references: Dict[str, Dict[str, None]], references collected so far (updated in place), i.e. the
+                           "node_binding.key", "node_binding.id", "edge_binding.key" and "edge_binding.id"
+                           values bound by the results, in order of first occurrence
+        """
+        def collect(bindings: Dict, binding_type: str):
+            keys: Dict[str, None] = references.setdefault(f"{binding_type}.key", dict())
+            ids: Dict[str, None] = references.setdefault(f"{binding_type}.id", dict())
+            for key, key_bindings in bindings.items():
+                keys[key] = None
+                if not isinstance(key_bindings, List):
+                    continue
+                for binding in key_bindings:
+                    if isinstance(binding, Dict) and "id" in binding:
+                        ids[binding["id"]] = None
+
+        if not isinstance(result, Dict):
+            return
+        if "node_bindings" in result and isinstance(result["node_bindings"], Dict):
+            collect(result["node_bindings"], "node_binding")
+        analyses: List = result["analyses"] \
+            if "analyses" in result and isinstance(result["analyses"], List) else list()
+        for analysis in analyses:
+            if isinstance(analysis, Dict) and \
+                    "edge_bindings" in analysis and isinstance(analysis["edge_bindings"], Dict):
+                collect(analysis["edge_bindings"], "edge_binding")
+
+    def report_dangling_result_bindings(
+            self,
+            references: Dict[str, Dict[str, None]],
+            query_nodes: Set[str],
+            query_edges: Set[str],
+            kg_nodes: Set[str],
+            kg_edges: Set[str]
+    ):
+        """
+        Report each Query Graph key and Knowledge Graph identifier referenced by result bindings (as collected by
+        'collect_result_binding_references()') which is missing from the Query Graph (Knowledge Graph), once.
+
+        :param references: Dict[str, Dict[str, None]], references of the result bindings
+        :param query_nodes: Set[str], Query Graph node keys
+        :param query_edges: Set[str], Query Graph edge keys
+        :param kg_nodes: Set[str], Knowledge Graph node identifiers
+        :param kg_edges: Set[str], Knowledge Graph edge identifiers
+        """
+        for binding_type, query_keys, kg_ids in [
+            ("node_binding", query_nodes, kg_nodes),
+            ("edge_binding", query_edges, kg_edges)
+        ]:
+            for tag, suffix, known in [("key", "key.missing", query_keys), ("id", "dangling", kg_ids)]:
+                values: Dict[str, None] = references[f"{binding_type}.{tag}"] \
+                    if f"{binding_type}.{tag}" in references else dict()
+                code: str = f"error.trapi.response.message.result.{binding_type}.{suffix}"
+                for value in values:
+                    if value not in known:
+                        self.report(code=code, identifier=value)
+
     def category_matched(self, source_categories: List[str], target_categories: List[str]) -> Optional[str]:
         """
         For each 'source' Biolink Model category given (list of CURIEs as strings?),
@@ -549,29 +1271,42 @@ class TRAPIResponseValidator(BiolinkValidator):
         #
         # Sanity check
         assert target in ["subject", "object"]
-        for node_id in nodes.keys():
-            node_details = nodes[node_id]
-            category: Optional[str]
-            if node_id in target_id_aliases:
+
+        category: Optional[str]
+
+        # Direct matches of the target node identifier are looked up in the
+        # (node identifier indexed) catalog, hence are preferred to parent matches
+        for node_id in target_id_aliases:
+            if node_id in nodes:
                 # Directly found the target node identifier, but is the expected category present?
-                category = self.testcase_node_category_found(target, node_id, testcase, node_details)
+                category = self.testcase_node_category_found(target, node_id, testcase, nodes[node_id])
                 if category:
                     return node_id, category, None  # no 'parent of node' is given, since the node is directly matched.
-            else:
+
+        aliases: Set[str] = set(target_id_aliases)
+
+        # Parent concepts of all the KG nodes not directly matched, resolved
+        # in one batch, but only if (and when) they are needed, below
+        parent_concepts: Optional[Dict[str, Optional[List[str]]]] = None
+
+        for node_id in nodes.keys():
+            if node_id not in aliases:
                 # The currently viewed node identifier is NOT equal to one of the target aliases, but
                 # we check whether the node identifier is within an ontology DAG hierarchy which
                 # includes an aliases of the target identifier as a child term. For this search, we assume
                 # that the matching terms have the same category as the term of the specified testcase 'target'.
                 category = testcase[f"{target}_category"]
-                parents_of_node_id: Optional[List[str]] = get_parent_concepts(
-                    curie=node_id,
-                    category=category,
-                    biolink_version=self.get_biolink_version()
-                )
+                if parent_concepts is None:
+                    parent_concepts = get_parent_concepts_of(
+                        curies=[other_node_id for other_node_id in nodes.keys() if other_node_id not in aliases],
+                        category=category,
+                        biolink_version=self.get_biolink_version()
+                    )
+                parents_of_node_id: Optional[List[str]] = parent_concepts[node_id]
                 if parents_of_node_id:
                     match: Optional[str] = None
                     for identifier in parents_of_node_id:
-                        if identifier in target_id_aliases:
+                        if identifier in aliases:
                             match = identifier
                     if match is not None:
                         self.report(
@@ -667,7 +1402,8 @@ class TRAPIResponseValidator(BiolinkValidator):
             subject_query_id: Optional[str],
             object_id: str,
             object_query_id: Optional[str],
-            data: Dict
+            data: Dict,
+            bindings_checked: bool = False
     ) -> bool:
         """
         Check if the specified subject and object identifier
@@ -680,6 +1416,9 @@ class TRAPIResponseValidator(BiolinkValidator):
         :param object_id: expected node identifier of the knowledge graph object
         :param object_query_id: expected bound 'query_id' if not the 'object_id' (see TRAPI spec)
         :param data: the result object
+        :param bindings_checked: bool, if True, the node binding keys were already checked against the query
+                                 nodes (e.g. by 'check_result_bindings()'), thus keys which don't match any
+                                 query node are not reported again (Default: False, such keys are reported)
         :return: bool, True if node_bindings found for specified subject and object
         """
         # node_bindings:
@@ -700,10 +1439,11 @@ class TRAPIResponseValidator(BiolinkValidator):
             # A basic expectation is for the node_binding keys
             # to match one of the input query node keys
             if q_node_id not in query_nodes.keys():
-                self.report(
-                    code="error.trapi.response.message.result.node_binding.key.missing",
-                    identifier=q_node_id
-                )
+                if not bindings_checked:
+                    self.report(
+                        code="error.trapi.response.message.result.node_binding.key.missing",
+                        identifier=q_node_id
+                    )
                 continue
 
             q_node_entry: Dict = query_nodes[q_node_id]
@@ -760,7 +1500,9 @@ class TRAPIResponseValidator(BiolinkValidator):
             object_id: str,
             object_query_id: Optional[str],
             edge_id: str,
-            results: List
+            results: List,
+            index: Optional[ResponseIndex] = None,
+            bindings_checked: bool = False
     ) -> bool:
         """
         Validate that test testcase S--P->O edge is found bound to the Results?
@@ -771,11 +1513,33 @@ class TRAPIResponseValidator(BiolinkValidator):
         :param object_query_id:  Optional[str], object node (CURIE) query node identifier (if applicable)
         :param edge_id:  str, edge identifier
         :param results: List of (TRAPI-version specific) Result objects
+        :param index: Optional[ResponseIndex], lookup indexes of the TRAPI Message of the results. If given,
+                      only the results binding the edge (rather than all the results) are searched.
+        :param bindings_checked: bool, if True, the result bindings were already checked (i.e. by
+                                 'check_result_bindings()'), otherwise node binding keys missing from the
+                                 query graph nodes are reported here, once (Default: False)
         :return: bool, True if testcase S-P-O edge was found in the results
         """
         # TODO: need to implement some kind of validation of 'subject_query_id' and 'object_query_id'
         assert query_graph, "testcase_result_found() encountered an empty query graph"
 
+        if index is not None:
+            results = index.get_results(edge_id)
+
+        if not bindings_checked:
+            # node binding keys of the searched results are checked once here,
+            # rather than once per result (in 'testcase_node_bindings()')
+            references: Dict[str, Dict[str, None]] = dict()
+            for result in results:
+                self.collect_result_binding_references(result, references)
+            self.report_dangling_result_bindings(
+                {"node_binding.key": references["node_binding.key"]} if "node_binding.key" in references else dict(),
+                query_nodes=set(query_graph["nodes"].keys()),
+                query_edges=set(),
+                kg_nodes=set(),
+                kg_edges=set()
+            )
+
         result_found: bool = False
         result: Dict
 
@@ -792,7 +1556,8 @@ class TRAPIResponseValidator(BiolinkValidator):
                     subject_query_id,
                     object_id,
                     object_query_id,
-                    result
+                    result,
+                    bindings_checked=True
                 )
 
             edge_binding_found: bool = False
@@ -867,10 +1632,51 @@ class TRAPIResponseValidator(BiolinkValidator):
         # If nothing matches, this result could still be False
         return result_found
 
-    @lru_cache(maxsize=1024)
+    @staticmethod
+    def prefetch_testcase_aliases(testcases: List[Dict]):
+        """
+        Resolve, as a single (chunked, concurrent) batch of Node Normalizer requests, the identifier cliques
+        of the subject and object nodes of a set of test cases, such that the subsequent 'get_aliases()' of
+        the test case node identifiers (i.e. by 'testcase_input_found_in_response()') hit the shared cache.
+
+        :param testcases: List[Dict], test cases (with 'subject_id' and 'object_id' identifiers)
+        """
+        curies: List[str] = list()
+        for testcase in testcases:
+            for target in ["subject", "object"]:
+                curie = testcase[f"{target}_id"] if f"{target}_id" in testcase else \
+                    testcase[target] if target in testcase else None
+                if isinstance(curie, str) and is_curie(curie):
+                    curies.append(curie)
+        get_node_normalizer().resolve(curies)
+
+    def prefetch_testcase_ancestors(self, testcases: List[Dict], nodes: Dict):
+        """
+        Resolve, in bulk, the parent concepts of the knowledge graph nodes, for each of the subject and object
+        categories of a set of test cases, such that the subsequent searches for parent concept matches (i.e. by
+        'testcase_node_found()') of the test case node identifiers hit the (shared) memoized parent concepts.
+
+        :param testcases: List[Dict], test cases (with 'subject_category' and 'object_category')
+        :param nodes: Dict, knowledge graph nodes, indexed by node identifiers
+        """
+        if not self.validate_biolink():
+            # the ontology namespaces of categories are only known from the Biolink Model
+            return
+        categories: Set[str] = {
+            testcase[f"{target}_category"]
+            for testcase in testcases for target in ["subject", "object"]
+            if f"{target}_category" in testcase and testcase[f"{target}_category"]
+        }
+        for category in sorted(categories):
+            try:
+                get_parent_concepts_of(list(nodes.keys()), category, biolink_version=self.get_biolink_version())
+            except AssertionError as error:
+                # test cases with invalid categories are reported when evaluated
+                logger.warning(f"prefetch_testcase_ancestors(): {str(error)}")
+
     def get_aliases(self, curie: str) -> Optional[List[str]]:
         """
-        Get clique of related identifiers from the Node Normalizer. Note that
+        Get clique of related identifiers from the Node Normalizer (cached by the shared NodeNormalizer). Note that
         except for the cases of a missing or invalid CURIE input, this method
         is guaranteed to succeed in returning at least the input CURIE as one
         of the aliases; however, the method reports various validation warnings
@@ -896,8 +1702,7 @@ class TRAPIResponseValidator(BiolinkValidator):
         else:
             # Use the Translator Node Normalizer service to resolve
             # the identifier clique associated with the CURIE
-            query = {'curies': [curie]}
-            result = post_query(url=NODE_NORMALIZER_SERVER, query=query, server="Node Normalizer")
+            result: Dict[str, Optional[Dict]] = get_node_normalizer().resolve([curie])
             if result:
                 if curie not in result.keys():
                     self.report(
@@ -1005,10 +1810,21 @@ class TRAPIResponseValidator(BiolinkValidator):
         )
         return None
 
+    def get_response_index(self, message: Dict) -> ResponseIndex:
+        """
+        :param message: Dict, TRAPI Message
+        :return: ResponseIndex, lookup indexes of the Message, built once, then reused
+                 while successive test cases are matched against the same Message
+        """
+        if self._response_index is None or self._response_index[0] is not message:
+            self._response_index = (message, ResponseIndex(message))
+        return self._response_index[1]
+
     def testcase_input_found_in_response(
             self,
             testcase: Dict,
-            response: Dict
+            response: Dict,
+            bindings_checked: bool = False
     ) -> bool:
         """
         Predicate to validate if test data test case specified edge is returned
@@ -1017,6 +1833,9 @@ class TRAPIResponseValidator(BiolinkValidator):
 
         :param testcase: Dict, input data test case
         :param response: Dict, TRAPI Response whose message ought to contain the test case edge
+        :param bindings_checked: bool, if True, the result bindings of the TRAPI Response were already checked,
+                                 e.g. by 'check_compliance_of_trapi_response()', thus result node binding keys
+                                 missing from the query graph are not reported again (Default: False)
         :return: True if test case edge found; False otherwise
         """
         # sanity checks
@@ -1165,32 +1984,33 @@ class TRAPIResponseValidator(BiolinkValidator):
             # ignoring deep Biolink Model validation
             predicate_descendants = [predicate]
 
+        # Only the edges between the matched subject and object nodes,
+        # looked up in the (subject, object) edge index, need to be checked
+        index: ResponseIndex = self.get_response_index(message)
+
         edge_id_match: Optional[str] = None
         edge_subject_match: Optional[str] = None
         edge_subject_query_id_match: Optional[str] = None
         edge_object_match: Optional[str] = None
         edge_object_query_id_match: Optional[str] = None
-        for edge_id, edge in edges.items():
-            # Note: this edge search could be arduous on a big knowledge graph?
-            if edge["subject"] == subject_match and \
-                    edge["predicate"] in predicate_descendants and \
-                    edge["object"] == object_match:
+        for edge_id in index.get_edges(subject_match, object_match):
+            if edges[edge_id]["predicate"] in predicate_descendants:
                 edge_id_match = edge_id
                 edge_subject_query_id_match = subject_query_id
                 edge_subject_match = subject_match
                 edge_object_query_id_match = object_query_id
                 edge_object_match = object_match
                 break
-            elif edge["subject"] == object_match and \
-                    edge["predicate"] in inverse_predicate_descendants and \
-                    edge["object"] == subject_match:
-                # observation of the inverse edge is also counted as a match?
-                edge_subject_match = object_match
-                edge_subject_query_id_match = object_query_id
-                edge_object_match = subject_match
-                edge_object_query_id_match = subject_query_id
-                edge_id_match = edge_id
-                break
+        if edge_id_match is None:
+            for edge_id in index.get_edges(object_match, subject_match):
+                if edges[edge_id]["predicate"] in inverse_predicate_descendants:
+                    # observation of the inverse edge is also counted as a match?
+                    edge_subject_match = object_match
+                    edge_subject_query_id_match = object_query_id
+                    edge_object_match = subject_match
+                    edge_object_query_id_match = subject_query_id
+                    edge_id_match = edge_id
+                    break
 
         testcase_edge_id: str = \
             f"{testcase['idx']}|" +\
@@ -1216,7 +2036,9 @@ class TRAPIResponseValidator(BiolinkValidator):
                 edge_object_match,
                 edge_object_query_id_match,
                 edge_id_match,
-                results
+                results,
+                index=index,
+                bindings_checked=bindings_checked
             )
         if not results_found:
             self.report(
@@ -1228,3 +2050,55 @@ class TRAPIResponseValidator(BiolinkValidator):
         # By this point, the testcase data assumed to be
         # successfully validated in the TRAPI Response?
         return True
+
+    def testcases_found_in_response(
+            self,
+            testcases: List[Dict],
+            response: Dict,
+            max_workers: int = 4,
+            bindings_checked: bool = False
+    ) -> List[bool]:
+        """
+        Batch version of 'testcase_input_found_in_response()', evaluating a list of test cases against
+        a single TRAPI Response: the lookup indexes of the Response Message are built once, the aliases of the
+        test case nodes and the parent concepts of the knowledge graph nodes are resolved in bulk, then the test
+        cases are evaluated concurrently, each into a scratch copy of this validator. The validation messages of
+        all test cases are finally merged (in test case order) into the messages of this validator.
+
+        :param testcases: List[Dict], input data test cases
+        :param response: Dict, TRAPI Response whose message ought to contain the test case edges
+        :param max_workers: int, maximum number of test cases evaluated concurrently (Default: 4)
+        :param bindings_checked: bool, if True, the result bindings of the TRAPI Response were already checked
+                                 (see 'testcase_input_found_in_response()')
+        :return: List[bool], verdict of each test case (in the order given): True if the test case edge is found
+        """
+        assert response, "testcases_found_in_response(): Empty or missing TRAPI Response!"
+        assert "message" in response, "testcases_found_in_response(): TRAPI Response missing Message component!"
+        message: Dict = response["message"] if response["message"] else dict()
+        knowledge_graph: Dict = message["knowledge_graph"] \
+            if "knowledge_graph" in message and message["knowledge_graph"] else dict()
+        nodes: Dict = knowledge_graph["nodes"] if "nodes" in knowledge_graph and knowledge_graph["nodes"] else dict()
+
+        if message:
+            # built here, then shared (read only) by the scratch validators of all test cases
+            self.get_response_index(message)
+        self.prefetch_testcase_aliases(testcases)
+        self.prefetch_testcase_ancestors(testcases, nodes)
+
+        def evaluate(testcase: Dict) -> Tuple[bool, TRAPIResponseValidator]:
+            validator: TRAPIResponseValidator = self.scratch_copy()
+            return validator.testcase_input_found_in_response(
+                testcase, response, bindings_checked=bindings_checked
+            ), validator
+
+        outcomes: List[Tuple[bool, TRAPIResponseValidator]]
+        if max_workers > 1 and len(testcases) > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(testcases))) as executor:
+                outcomes = list(executor.map(evaluate, testcases))
+        else:
+            outcomes = [evaluate(testcase) for testcase in testcases]
+
+        # the messages of the (scratch) validators of the test cases are moved, rather than copied
+        if outcomes:
+            self.merge(merge_reporters([validator for _, validator in outcomes]), move=True)
+        return [verdict for verdict, _ in outcomes]
@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+"""
+Benchmarks the JSON codec of the reasoner-validator (i.e. 'orjson', if installed) against the Python standard library
+'json' module, loading and serializing a large (synthetic) TRAPI Response and serializing a large validation report.
+
+Usage:
+    ./benchmark_codec.py -s 100 -n 1000000
+"""
+import argparse
+import json
+from time import perf_counter
+from typing import Callable, Dict, Any
+
+from reasoner_validator import codec
+from reasoner_validator.report import ValidationReporter
+
+
+def synthetic_response(size: int) -> Dict:
+    """
+    :param size: int, approximate size (in MB) of the JSON text of the TRAPI Response
+    :return: Dict, TRAPI Response with a knowledge graph of (about) 1000 edges per 0.5 MB
+    """
+    number_of_edges: int = size * 2000
+    nodes: Dict = {
+        f"NCBIGene:{i}": {"categories": ["biolink:Gene"], "name": f"gene {i}", "attributes": []}
+        for i in range(number_of_edges // 10 + 1)
+    }
+    edges: Dict = {
+        f"edge_{i}": {
+            "subject": f"NCBIGene:{i // 10}",
+            "predicate": "biolink:physically_interacts_with",
+            "object": f"NCBIGene:{(i + 1) // 10}",
+            "sources": [{"resource_id": "infores:molepro", "resource_role": "primary_knowledge_source"}],
+            "attributes": [
+                {"attribute_type_id": "biolink:knowledge_level", "value": "knowledge_assertion"},
+                {"attribute_type_id": "biolink:agent_type", "value": "manual_agent"},
+                {"attribute_type_id": "biolink:publications", "value": [f"PMID:{i}", f"PMID:{i + 1}"]},
+                {"attribute_type_id": "biolink:p_value", "value": 1.0 / (i + 1)}
+            ]
+        }
+        for i in range(number_of_edges)
+    }
+    results = [
+        {
+            "node_bindings": {"n0": [{"id": f"NCBIGene:{i // 10}", "attributes": []}]},
+            "analyses": [{"resource_id": "infores:molepro", "edge_bindings": {"e0": [{"id": f"edge_{i}"}]}}]
+        }
+        for i in range(0, number_of_edges, 10)
+    ]
+    return {
+        "message": {
+            "query_graph": {"nodes": {}, "edges": {}},
+            "knowledge_graph": {"nodes": nodes, "edges": edges},
+            "results": results
+        }
+    }
+
+
+def synthetic_report(number_of_messages: int) -> Dict:
+    """
+    :param number_of_messages: int, number of (warning) messages of the validation report
+    :return: Dict, validation report (i.e. 'to_dict()' of the ValidationReporter)
+    """
+    reporter = ValidationReporter(default_test="benchmark", default_target="Benchmark Report")
+    for i in range(number_of_messages):
+        reporter.report(
+            code="warning.knowledge_graph.edge.duplicated",
+            identifier=f"edge_{i % 1000}",
+            edge_id=f"edge_{1000 + i}"
+        )
+    return reporter.to_dict()
+
+
+def measure(name: str, operation: Callable[[], Any]) -> Any:
+    start: float = perf_counter()
+    result: Any = operation()
+    print(f"{name:<40}: {perf_counter() - start:8.3f} seconds")
+    return result
+
+
+def get_cli_arguments():
+    arg_parser = argparse.ArgumentParser(
+        description='Benchmark the JSON codec of the reasoner-validator against the standard library json module.'
+    )
+    arg_parser.add_argument(
+        '-s', '--response_size', type=int, default=100,
+        help='Approximate size (in MB) of the (synthetic) TRAPI Response (Default: 100).'
+    )
+    arg_parser.add_argument(
+        '-n', '--number_of_messages', type=int, default=1000000,
+        help='Number of (warning) messages of the validation report (Default: 1000000).'
+    )
+    return arg_parser.parse_args()
+
+
+def main():
+    args = get_cli_arguments()
+    print(f"Codec library: {'orjson' if codec.uses_orjson() else 'json'}")
+
+    response: Dict = synthetic_response(args.response_size)
+    text: bytes = measure("json.dumps() of the response", lambda: json.dumps(response).encode("utf-8"))
+    print(f"Response size: {len(text) / 2**20:.1f} MiB")
+    measure("codec.dumps_bytes() of the response", lambda: codec.dumps_bytes(response))
+    measure("json.loads() of the response", lambda: json.loads(text))
+    measure("codec.loads() of the response", lambda: codec.loads(text))
+    del response, text
+
+    report: Dict = synthetic_report(args.number_of_messages)
+    measure(
+        f"json.dumps() of {args.number_of_messages} messages",
+        lambda: json.dumps(report, default=codec.default).encode("utf-8")
+    )
+    measure(f"codec.dumps_bytes() of {args.number_of_messages} messages", lambda: codec.dumps_bytes(report))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+"""
+Benchmarks the merging of the messages of many ValidationReporters (e.g. of parallel validation workers):
+sequential merging, with the messages copied, versus tree-reduced merging, with the messages moved.
+
+Usage:
+    ./benchmark_merge.py -r 64 -n 100000
+"""
+import argparse
+from time import perf_counter
+from typing import List
+
+from reasoner_validator.report import ValidationReporter, merge_reporters
+
+
+def build_reporters(number_of_reporters: int, number_of_messages: int) -> List[ValidationReporter]:
+    """
+    :param number_of_reporters: int, number of ValidationReporters
+    :param number_of_messages: int, number of (warning) messages of each ValidationReporter, of which
+                               half share their identifiers with the messages of all the other reporters
+    :return: List[ValidationReporter]
+    """
+    reporters: List[ValidationReporter] = list()
+    for r in range(number_of_reporters):
+        reporter = ValidationReporter(default_test="benchmark", default_target="Benchmark Report")
+        for i in range(number_of_messages):
+            reporter.report(
+                code="warning.knowledge_graph.edge.duplicated",
+                identifier=f"edge_{i % 1000}" if i % 2 else f"edge_{r}_{i}",
+                edge_id=f"edge_{r}_{i}_duplicate"
+            )
+        reporters.append(reporter)
+    return reporters
+
+
+def get_cli_arguments():
+    arg_parser = argparse.ArgumentParser(description='Benchmark the merging of many ValidationReporters.')
+    arg_parser.add_argument(
+        '-r', '--number_of_reporters', type=int, default=64,
+        help='Number of ValidationReporters merged (Default: 64).'
+    )
+    arg_parser.add_argument(
+        '-n', '--number_of_messages', type=int, default=100000,
+        help='Number of (warning) messages of each ValidationReporter (Default: 100000).'
+    )
+    return arg_parser.parse_args()
+
+
+def main():
+    args = get_cli_arguments()
+
+    reporters: List[ValidationReporter] = build_reporters(args.number_of_reporters, args.number_of_messages)
+    start: float = perf_counter()
+    merged = ValidationReporter(default_test="benchmark", default_target="Benchmark Report")
+    for reporter in reporters:
+        merged.merge(reporter)
+    print(f"{'Sequential merge (copied)':<30}: {perf_counter() - start:8.3f} seconds")
+    del merged, reporters
+
+    reporters = build_reporters(args.number_of_reporters, args.number_of_messages)
+    start = perf_counter()
+    merged = merge_reporters(reporters)
+    print(f"{'Tree-reduced merge (moved)':<30}: {perf_counter() - start:8.3f} seconds")
+    print(f"Merged {sum(merged.summary().values())} messages of {args.number_of_reporters} reporters")
+
+
+if __name__ == "__main__":
+    main()
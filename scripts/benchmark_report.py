@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+"""
+Benchmarks the memory usage and latency of the ValidationReporter message accessors
+on a large (synthetic) validation report, i.e. with millions of knowledge graph edge warnings.
+
+Usage:
+    ./benchmark_report.py -n 1000000 [--compact_messages]
+"""
+import argparse
+import tracemalloc
+from time import perf_counter
+from typing import Callable, Tuple, List, Any
+
+from reasoner_validator.message import MessageType
+from reasoner_validator.report import ValidationReporter
+
+
+def build_report(identifiers: List[str], edge_ids: List[str], compact_messages: bool) -> ValidationReporter:
+    reporter = ValidationReporter(
+        default_test="benchmark",
+        default_target="Benchmark Report",
+        compact_messages=compact_messages
+    )
+    for i, edge_id in enumerate(edge_ids):
+        reporter.report(
+            code="warning.knowledge_graph.edge.duplicated",
+            identifier=identifiers[i % len(identifiers)],
+            edge_id=edge_id
+        )
+    return reporter
+
+
+def measure(operation: Callable[[], Any]) -> Tuple[float, int]:
+    """
+    :param operation: Callable, operation to be benchmarked
+    :return: Tuple[float, int], latency (in seconds, without memory tracing) and peak memory allocated (in bytes)
+    """
+    start: float = perf_counter()
+    operation()
+    latency: float = perf_counter() - start
+
+    tracemalloc.start()
+    operation()
+    peak: int = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return latency, peak
+
+
+def get_cli_arguments():
+    arg_parser = argparse.ArgumentParser(
+        description='Benchmark the memory usage and latency of ValidationReporter message accessors.'
+    )
+    arg_parser.add_argument(
+        '-n', '--number_of_messages', type=int, default=1000000,
+        help='Number of (warning) messages reported (Default: 1000000).'
+    )
+    arg_parser.add_argument(
+        '-i', '--number_of_identifiers', type=int, default=1000,
+        help='Number of distinct message identifiers (Default: 1000).'
+    )
+    arg_parser.add_argument(
+        '-c', '--compact_messages', action='store_true',
+        help='Record the messages in the (columnar) compact message store of the ValidationReporter.'
+    )
+    return arg_parser.parse_args()
+
+
+def main():
+    args = get_cli_arguments()
+
+    # the identifiers and edge identifiers of the messages, as would be found in the
+    # validated knowledge graph, are not accounted for in the size of the report
+    identifiers: List[str] = [f"edge_{i}" for i in range(args.number_of_identifiers)]
+    edge_ids: List[str] = [f"edge_{args.number_of_identifiers + i}" for i in range(args.number_of_messages)]
+
+    start: float = perf_counter()
+    tracemalloc.start()
+    reporter: ValidationReporter = build_report(identifiers, edge_ids, args.compact_messages)
+    report_size: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(
+        f"Reported {args.number_of_messages} messages in {perf_counter() - start:.2f} seconds " +
+        f"({report_size / 2**20:.1f} MiB)"
+    )
+
+    other = ValidationReporter()
+    for copy in [False, True]:
+        operations = {
+            "get_all_messages()": lambda: reporter.get_all_messages(copy=copy),
+            "get_warnings()": lambda: reporter.get_messages_of_type(MessageType.warning, copy=copy),
+            "get_all_messages_of_type()": lambda: reporter.get_all_messages_of_type(MessageType.warning, copy=copy),
+            "to_dict()": lambda: reporter.to_dict(copy=copy)
+        }
+        for name, operation in operations.items():
+            latency, peak = measure(operation)
+            print(f"{name:<28} copy={str(copy):<5}: {latency:8.4f} seconds, {peak / 2**20:8.1f} MiB")
+
+    latency, peak = measure(lambda: other.merge(reporter))
+    print(f"{'merge()':<39}: {latency:8.4f} seconds, {peak / 2**20:8.1f} MiB")
+
+    for name, operation in {"summary()": reporter.summary, "has_warnings()": reporter.has_warnings}.items():
+        latency, peak = measure(operation)
+        print(f"{name:<39}: {latency:8.4f} seconds, {peak / 2**20:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
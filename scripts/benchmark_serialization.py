@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+"""
+Benchmarks the serialization of the messages of a ValidationReporter (e.g. for transport between processes):
+pickle (of the messages) and JSON (of the validation report) versus the compact binary format of to_bytes().
+
+Usage:
+    ./benchmark_serialization.py -n 100000
+"""
+import argparse
+import pickle
+from time import perf_counter
+from typing import Callable, Any
+
+from reasoner_validator import codec
+from reasoner_validator.report import ValidationReporter
+
+
+def build_reporter(number_of_messages: int) -> ValidationReporter:
+    """
+    :param number_of_messages: int, number of (warning) messages of the ValidationReporter
+    :return: ValidationReporter
+    """
+    reporter = ValidationReporter(default_test="benchmark", default_target="Benchmark Report")
+    for i in range(number_of_messages):
+        reporter.report(
+            code="warning.knowledge_graph.edge.duplicated",
+            identifier=f"edge_{i % 1000}",
+            edge_id=f"edge_{i}_duplicate"
+        )
+    return reporter
+
+
+def benchmark(label: str, dump: Callable[[], bytes], load: Callable[[bytes], Any]):
+    start: float = perf_counter()
+    data: bytes = dump()
+    dumped: float = perf_counter() - start
+    start = perf_counter()
+    load(data)
+    loaded: float = perf_counter() - start
+    print(f"{label:<20}: {len(data) / 2**20:8.2f} MB, dumps {dumped:8.3f} seconds, loads {loaded:8.3f} seconds")
+
+
+def get_cli_arguments():
+    arg_parser = argparse.ArgumentParser(description='Benchmark the serialization of a ValidationReporter.')
+    arg_parser.add_argument(
+        '-n', '--number_of_messages', type=int, default=100000,
+        help='Number of (warning) messages of the ValidationReporter (Default: 100000).'
+    )
+    return arg_parser.parse_args()
+
+
+def main():
+    args = get_cli_arguments()
+    reporter: ValidationReporter = build_reporter(args.number_of_messages)
+    benchmark(
+        "pickle",
+        lambda: pickle.dumps(reporter.get_all_messages(copy=True), protocol=pickle.HIGHEST_PROTOCOL),
+        pickle.loads
+    )
+    benchmark(
+        f"JSON ({'orjson' if codec.uses_orjson() else 'json'})",
+        lambda: codec.dumps_bytes(reporter.to_dict()),
+        codec.loads
+    )
+    benchmark("to_bytes()", reporter.to_bytes, ValidationReporter.from_bytes)
+
+    compact_reporter = ValidationReporter(compact_messages=True)
+    compact_reporter.merge(reporter)
+    benchmark("to_bytes() (compact)", compact_reporter.to_bytes, ValidationReporter.from_bytes)
+
+
+if __name__ == "__main__":
+    main()
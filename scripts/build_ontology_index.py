@@ -0,0 +1,37 @@
+#!/usr/bin/env python
+"""
+Builds the offline ontology closure index, consulted (when the ONTOLOGY_INDEX_PATH environment variable is set
+to the index file path) for ontology subclass matching, before falling back to (network) Ontology KP queries.
+
+Usage:
+    ./build_ontology_index.py -o ontology.index mondo.obo hp.json uberon.obo.gz
+"""
+import argparse
+
+from reasoner_validator.biolink.ontology_index import OntologyIndex
+
+
+def get_cli_arguments():
+    arg_parser = argparse.ArgumentParser(
+        description='Build an offline (memory-mappable) ontology closure index from local ontology files.'
+    )
+    arg_parser.add_argument(
+        '-o', '--output', type=str, required=True,
+        help='Path of the ontology index file to be written.'
+    )
+    arg_parser.add_argument(
+        'ontologies', type=str, nargs='+',
+        help='Paths of (optionally gzip compressed) OBO or OBO Graphs JSON (.json) ontology files.'
+    )
+    return arg_parser.parse_args()
+
+
+def main():
+    args = get_cli_arguments()
+    index = OntologyIndex.build(args.ontologies)
+    index.save(args.output)
+    print(f"Ontology index of {len(index)} terms written to '{args.output}'")
+
+
+if __name__ == "__main__":
+    main()
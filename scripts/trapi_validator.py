@@ -23,11 +23,13 @@ from json.decoder import JSONDecodeError
 
 import requests
 from requests.exceptions import JSONDecodeError
-import json
 import argparse
 
 from bmt import Toolkit
 from reasoner_validator.validator import TRAPIResponseValidator
+from reasoner_validator import codec
+from reasoner_validator.rendering import PAGE_UNITS
+from reasoner_validator.streaming import StreamingTRAPIResponseValidator
 from reasoner_validator.trapi import call_trapi
 from reasoner_validator.versioning import get_latest_version
 from reasoner_validator.biolink import get_biolink_model_toolkit
@@ -84,6 +86,12 @@ def get_cli_arguments():
         help='Local JSON input text file source of the TRAPI Request. ' +
              'Mandatory when --endpoint CLI argument is given.'
     )
+    arg_parser.add_argument(
+        '-s', '--stream', action='store_true',
+        help='If given, a local JSON file given as the --ars_response_id is validated as a stream, parsed ' +
+             'incrementally, rather than being loaded into memory as a whole (recommended for huge TRAPI ' +
+             'Responses; needs the "ijson" package to be installed).'
+    )
     arg_parser.add_argument(
         '-j', '--json', action='store_true',
         help='If given, dump validation messages in JSON format '
@@ -111,6 +119,17 @@ def get_cli_arguments():
         help='If given, compress human readable text output by suppressing blank lines '
              '(default: False; ignored when "--json" flag is given).'
     )
+    arg_parser.add_argument(
+        '-p', '--page_by', type=str, nargs='?', default=None, choices=list(PAGE_UNITS.keys()),
+        help='If given, the human readable report is paged through, by the given unit of pagination, with the ' +
+             'next page only shown when requested (default: None, display all messages; ' +
+             'ignored when "--json" flag is given).'
+    )
+    arg_parser.add_argument(
+        '--page_size',
+        metavar='N', type=int, nargs='?', default=10,
+        help='Number N of units of pagination (see "--page_by") per page (default: 10).'
+    )
 
     return arg_parser.parse_args()
 
@@ -134,8 +153,8 @@ async def direct_trapi_request(
     if isfile(trapi_request_filepath):
         trapi_request: Optional[Dict] = None
         try:
-            with open(trapi_request_filepath) as infile:
-                trapi_request = json.load(infile)
+            with open(trapi_request_filepath, "rb") as infile:
+                trapi_request = codec.load(infile)
         except IOError as e:
             print(e, file=stderr)
         except (JSONDecodeError, TypeError) as e:
@@ -215,7 +234,7 @@ def retrieve_ars_result(response_id: str, verbose: bool):
 
     # Unpack the response content into a dict
     try:
-        response_dict = response_content.json()
+        response_dict = codec.loads(response_content.content)
     except Exception as e:
         print(f"Cannot decode ARS PK '{response_id}' to a Translator Response, exception: {e}")
         return
@@ -243,7 +262,7 @@ def retrieve_arax_result(response_id: str):
     if status_code == 200:
         # Unpack the response content into a dict
         try:
-            trapi_response = response_content.json()
+            trapi_response = codec.loads(response_content.content)
         except Exception as e:
             print(f"Cannot decode ARAX Response ID '{response_id}' to a Translator Response, exception: {e}")
     else:
@@ -268,14 +287,25 @@ def validation_report(validator: TRAPIResponseValidator, args):
 
     if show_messages or args.verbose:
         if args.json:
-            print(json.dumps(validator.get_all_messages(), sort_keys=True, indent=2))
+            print(codec.dumps(validator.get_all_messages(), sort_keys=True, indent=2))
         else:
-            validator.dump(
+            cursor: Optional[str] = validator.dump(
                 title=args.title,
                 id_rows=args.number_of_identifiers,
                 msg_rows=args.number_of_messages,
-                compact_format=args.compact_format
+                compact_format=args.compact_format,
+                page_by=args.page_by,
+                page_size=args.page_size if args.page_by else 0
             )
+            while cursor is not None and prompt_user("More validation messages were reported"):
+                cursor = validator.dump(
+                    id_rows=args.number_of_identifiers,
+                    msg_rows=args.number_of_messages,
+                    compact_format=args.compact_format,
+                    cursor=cursor,
+                    page_by=args.page_by,
+                    page_size=args.page_size
+                )
 
 
 def main():
@@ -296,7 +326,8 @@ def main():
         resolved_biolink_version: str = bmt.get_model_version()
 
     # Perform a validation on it
-    validator = TRAPIResponseValidator(
+    validator_class = StreamingTRAPIResponseValidator if args.stream else TRAPIResponseValidator
+    validator = validator_class(
         trapi_version=resolved_trapi_version,
         biolink_version=resolved_biolink_version
     )
@@ -333,8 +364,15 @@ def main():
     elif args.ars_response_id:
         if isfile(args.ars_response_id):
             # The response identifier can just be a local file...
-            with open(args.ars_response_id) as infile:
-                trapi_response = json.load(infile)
+            if args.stream:
+                # ...which may be validated as a stream, without loading it into memory
+                with open(args.ars_response_id, "rb") as infile:
+                    validator.check_compliance_of_trapi_response_stream(infile)
+                validation_report(validator, args)
+                return
+
+            with open(args.ars_response_id, "rb") as infile:
+                trapi_response = codec.load(infile)
         else:
             # ... unless it is an ARS PK
             retrieve_ars_result(response_id=args.ars_response_id, verbose=args.verbose)
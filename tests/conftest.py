@@ -0,0 +1,47 @@
+"""
+Shared pytest fixtures
+"""
+from typing import Callable, Dict, List
+from json import loads, dumps
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from threading import Thread
+
+import pytest
+
+
+@pytest.fixture
+def local_server():
+    """
+    Factory of local stand-in JSON web services (e.g. of the Node Normalizer or an Ontology KP): each
+    service answers HTTP POSTs of JSON queries with the JSON returned by a given 'answer' function.
+    Returns the URL of the service and the list of the JSON queries which it received.
+    """
+    servers: List[ThreadingHTTPServer] = list()
+
+    def start(answer: Callable[[Dict], Dict]):
+        queries: List[Dict] = list()
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                query: Dict = loads(self.rfile.read(int(self.headers["Content-Length"])))
+                queries.append(query)
+                body: bytes = dumps(answer(query)).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return f"http://127.0.0.1:{server.server_port}/", queries
+
+    yield start
+
+    for server in servers:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,87 @@
+"""
+Unit tests of validation caching
+"""
+from os import listdir
+from os.path import join
+
+from reasoner_validator import codec
+from reasoner_validator.cache import content_hash, ValidationCache, ResponseValidationCache
+
+
+def test_content_hash():
+    edge = {"subject": "NCBIGene:29974", "predicate": "biolink:related_to", "object": "PUBCHEM.COMPOUND:597"}
+    reordered_edge = {"object": "PUBCHEM.COMPOUND:597", "predicate": "biolink:related_to", "subject": "NCBIGene:29974"}
+    assert content_hash(edge) == content_hash(reordered_edge)
+    assert content_hash(edge) != content_hash({**edge, "predicate": "biolink:interacts_with"})
+    assert content_hash(["1.5.0", edge]) != content_hash(["1.4.2", edge])
+
+
+def test_validation_cache_is_bounded():
+    cache = ValidationCache(max_size=2)
+    cache.put("a", [])
+    cache.put("b", [["info.compliant", {}]])
+    assert cache.get("a") == []  # 'a' is now more recently used than 'b'...
+    cache.put("c", [])
+    assert len(cache) == 2
+    assert "b" not in cache  # ...so 'b' is evicted
+    assert "a" in cache and "c" in cache
+    assert cache.get("b") is None
+
+
+def test_validation_cache_entries_expire(monkeypatch):
+    now: float = 1000.0
+    monkeypatch.setattr("reasoner_validator.cache.monotonic", lambda: now)
+    cache = ValidationCache(ttl=10)
+    cache.put("a", [])
+    assert "a" in cache and cache.get("a") == []
+    now += 10
+    # expired entries are neither contained in, nor retrieved from, the cache
+    assert "a" not in cache
+    assert cache.get("a") is None and len(cache) == 0
+
+
+def test_validation_cache_persistence(tmp_path):
+    path: str = join(tmp_path, "validation_cache.json")
+    cache = ValidationCache(path=path)
+    cache.put("a", [["warning.knowledge_graph.node.name.missing", {"identifier": "NCBIGene:29974"}]])
+    cache.save()
+    reloaded = ValidationCache(path=path)
+    assert len(reloaded) == 1
+    assert reloaded.get("a") == [["warning.knowledge_graph.node.name.missing", {"identifier": "NCBIGene:29974"}]]
+
+
+def test_response_validation_cache(tmp_path):
+    response = {"message": {"query_graph": {}, "knowledge_graph": {}, "results": []}}
+    key: str = ResponseValidationCache.key(response, parameters=["1.5.0", "4.2.2", None])
+    assert key != ResponseValidationCache.key(response, parameters=["1.5.0", "4.2.2", True])
+    report = {"messages": {}, "trapi_version": "1.5.0", "biolink_version": "4.2.2"}
+
+    cache = ResponseValidationCache(max_size=1, directory=str(tmp_path))
+    assert cache.get(key) is None
+    cache.put(key, report)
+    assert cache.get(key) == report
+
+    # the on-disk tier still has reports evicted from memory...
+    cache.put("another", report)
+    assert key not in cache.memory
+    assert cache.get(key) == report
+
+    # ...including those of other cache instances
+    assert ResponseValidationCache(directory=str(tmp_path)).get(key) == report
+
+
+def test_response_validation_cache_disk_tier_is_bounded(tmp_path):
+    report = {"messages": {}, "trapi_version": "1.5.0", "biolink_version": "4.2.2"}
+    size: int = len(codec.dumps_bytes(report))
+    cache = ResponseValidationCache(max_size=1, directory=str(tmp_path), max_bytes=2 * size)
+    cache.put("a", report)
+    cache.put("b", report)
+    assert cache.get("a") == report  # 'a' is now more recently used than 'b'...
+    cache.put("c", report)
+    # ...so 'b' is deleted from disk, and no temporary files are left behind
+    assert sorted(listdir(tmp_path)) == ["a.json", "c.json"]
+    assert cache.get("b") is None
+
+    # the bound also applies to reports already on disk
+    ResponseValidationCache(directory=str(tmp_path), max_bytes=size)
+    assert len(listdir(tmp_path)) == 1
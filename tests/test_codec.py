@@ -0,0 +1,74 @@
+"""
+Unit tests of the JSON codec of the reasoner-validator
+"""
+from typing import Dict
+import io
+import json
+
+import pytest
+
+from reasoner_validator import codec
+from reasoner_validator.cache import content_hash
+from reasoner_validator.report import ValidationReporter
+
+_CONTENT: Dict = {
+    "message": {
+        "knowledge_graph": {
+            "nodes": {"NCBIGene:29974": {"categories": ["biolink:Gene"], "name": "A1CF – APOBEC1"}},
+            "edges": {}
+        },
+        "results": [{"score": 0.5, "rank": 1}]
+    }
+}
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "json"])
+def library(request, monkeypatch):
+    # both the 'orjson' library (a dev dependency) and the 'json' fallback of the codec are tested
+    if not request.param:
+        monkeypatch.setattr(codec, "orjson", None)
+    return request.param
+
+
+def test_codec_round_trip(library: bool):
+    assert codec.uses_orjson() == library
+    text: str = codec.dumps(_CONTENT)
+    assert codec.loads(text) == _CONTENT
+    assert codec.loads(codec.dumps_bytes(_CONTENT)) == _CONTENT
+    assert codec.load(io.BytesIO(text.encode("utf-8"))) == _CONTENT
+    assert codec.load(io.StringIO(text)) == _CONTENT
+    # compact, unescaped JSON text, by either library
+    assert text == json.dumps(_CONTENT, separators=(",", ":"), ensure_ascii=False)
+    assert json.loads(codec.dumps(_CONTENT, indent=2, sort_keys=True)) == _CONTENT
+    assert json.loads(codec.dumps(_CONTENT, indent=4)) == _CONTENT
+
+    with pytest.raises(json.JSONDecodeError):
+        codec.loads("{not JSON")
+
+
+def test_codec_of_validation_reports(library: bool):
+    reporter = ValidationReporter()
+    reporter.report(
+        code="info.compliant",
+        identifier="test edge",
+        qualifier_value={"activity"}
+    )
+    # sets are recorded as lists, thus reports are natively serialized (without any default function)
+    assert reporter.get_all_messages(copy=True)["Target"]["Test"]["info"]["info.compliant"] == {
+        "test edge": [{"qualifier_value": ["activity"]}]
+    }
+    report: Dict = codec.loads(codec.dumps(reporter.to_dict(), default_function=None))
+    assert report["messages"]["Target"]["Test"]["info"]["info.compliant"] == {
+        "test edge": [{"qualifier_value": ["activity"]}]
+    }
+    # read-only message views and (other) sets are serialized by the default function
+    assert codec.loads(codec.dumps(reporter.get_all_messages())) == report["messages"]
+    assert codec.dumps({"values": {"b", "a"}}) == '{"values":["a","b"]}'
+    with pytest.raises(TypeError):
+        codec.dumps({"not JSON": object()})
+
+
+def test_content_hash(library: bool):
+    # key order independent hash, identical for both libraries (of content without floating point numbers)
+    assert content_hash({"b": [1, 2], "a": "–"}) == content_hash({"a": "–", "b": [1, 2]}) == \
+        "89db9d70ed9748ebf94fd3ed44bb054206ebf778e1a3430fc6ff92cdcffe968b"
@@ -0,0 +1,128 @@
+"""
+Unit tests of the statistical estimation of validation code prevalence from samples
+"""
+from typing import Dict, List
+
+import pytest
+
+from reasoner_validator.estimation import wilson_interval, PrevalenceEstimator
+from reasoner_validator.validator import TRAPIResponseValidator
+from tests import LATEST_TRAPI_RELEASE
+
+
+def test_wilson_interval():
+    lower, upper = wilson_interval(0.0, 100, 1.96)
+    assert lower == 0.0
+    assert 0.03 < upper < 0.04
+    lower, upper = wilson_interval(0.5, 100, 1.96)
+    assert lower < 0.5 < upper
+    assert upper - 0.5 == pytest.approx(0.5 - lower)
+
+
+def _population() -> Dict[str, List[int]]:
+    # stratum 'a': 900 units, one in ten exhibiting the code;
+    # stratum 'b': 100 units, all exhibiting the code
+    return {"a": list(range(900)), "b": list(range(900, 1000))}
+
+
+def _has_code(member: int) -> bool:
+    return member >= 900 or member % 10 == 0
+
+
+def _observe(estimator: PrevalenceEstimator, sample_size: int):
+    for stratum, member in estimator.extend(sample_size):
+        estimator.observe(stratum, {"error.test.code"} if _has_code(member) else set())
+
+
+def test_prevalence_estimator():
+    estimator = PrevalenceEstimator(_population(), seed=42)
+    _observe(estimator, 200)
+    assert estimator.population_size == 1000
+    assert estimator.sample_size == 200
+    estimate = estimator.estimate("error.test.code")
+    # true prevalence: (90 + 100) / 1000
+    assert estimate["lower"] <= 0.19 <= estimate["upper"]
+    assert estimate["observed"] > 0
+    assert estimator.estimate("error.unseen.code")["prevalence"] == 0.0
+
+    # growing a sample only draws new units
+    assert not estimator.extend(200)
+    width = estimator.max_half_width()
+    _observe(estimator, 400)
+    assert estimator.sample_size == 400
+    assert estimator.max_half_width() < width
+
+    # a census has no sampling error
+    _observe(estimator, 1000)
+    assert estimator.is_exhaustive()
+    assert estimator.estimate("error.test.code") == {
+        "prevalence": pytest.approx(0.19), "lower": pytest.approx(0.19), "upper": pytest.approx(0.19), "observed": 190
+    }
+
+
+def test_prevalence_estimator_is_reproducible():
+    first = PrevalenceEstimator(_population(), seed=7)
+    second = PrevalenceEstimator(_population(), seed=7)
+    _observe(first, 50)
+    _observe(second, 50)
+    assert first.estimates() == second.estimates()
+
+
+def test_prevalence_estimator_samples_every_stratum():
+    # a sample size smaller than the number of strata is raised, so that no stratum is left unestimated
+    strata: Dict[str, List[int]] = {f"s{n}": list(range(100 * n, 100 * n + 100)) for n in range(10)}
+    strata["empty"] = list()
+    estimator = PrevalenceEstimator(strata, seed=3)
+    for stratum, member in estimator.extend(2):
+        estimator.observe(stratum, {"error.test.code"} if member < 500 else set())
+    assert estimator.sample_size == 10
+    assert all(estimator.observations[f"s{n}"] for n in range(10))
+    assert estimator.estimate("error.test.code")["prevalence"] == pytest.approx(0.5)
+
+
+def _sample_response(number_of_edges: int) -> Dict:
+    nodes: Dict = {
+        "NCBIGene:29974": {"categories": ["biolink:Gene"], "name": "APOBEC1 complementation factor"},
+        "PUBCHEM.COMPOUND:597": {"categories": ["biolink:SmallMolecule"], "name": "cytosine"}
+    }
+    edges: Dict = dict()
+    for n in range(number_of_edges):
+        edge: Dict = {
+            "subject": "NCBIGene:29974",
+            "predicate": "biolink:physically_interacts_with",
+            "object": "PUBCHEM.COMPOUND:597",
+            "sources": [{"resource_id": "infores:molepro", "resource_role": "primary_knowledge_source"}]
+        }
+        if n % 4 == 0:
+            # one in four edges is missing its (schema mandatory) subject
+            edge.pop("subject")
+        edges[f"e{n}"] = edge
+    return {"message": {"knowledge_graph": {"nodes": nodes, "edges": edges}, "results": []}}
+
+
+def test_estimate_error_rates():
+    validator = TRAPIResponseValidator(
+        trapi_version=LATEST_TRAPI_RELEASE,
+        biolink_version="suppress",
+        sampling_seed=1
+    )
+    estimates: Dict = validator.estimate_error_rates(_sample_response(400), sample_size=40)
+    edges: Dict = estimates["knowledge_graph_edges"]
+    assert edges["population"] == 400
+    assert edges["sampled"] == 40
+    assert edges["rounds"] == 1
+    estimate: Dict = edges["estimates"]["critical.trapi.validation"]
+    assert estimate["lower"] <= 0.25 <= estimate["upper"]
+    assert estimates["knowledge_graph_nodes"]["estimates"] == {}
+    assert estimates["results"]["population"] == 0
+
+    # validation messages of sampled elements don't pollute the validator
+    assert not validator.has_messages()
+    assert validator.to_dict()["error_rate_estimates"] == estimates
+
+    # adaptive sampling grows the sample until stable (or the population is exhausted)
+    estimates = validator.estimate_error_rates(_sample_response(400), sample_size=10, adaptive=True, tolerance=0.1)
+    edges = estimates["knowledge_graph_edges"]
+    assert edges["rounds"] > 1
+    estimate = edges["estimates"]["critical.trapi.validation"]
+    assert (estimate["upper"] - estimate["lower"]) / 2.0 <= 0.1
@@ -0,0 +1,88 @@
+"""
+Unit tests of the referential integrity checks of the MappingValidator
+"""
+from typing import Dict
+from copy import deepcopy
+
+import pytest
+
+from reasoner_validator.trapi.mapping import MappingValidator, check_node_edge_mappings
+from tests.test_validation_report import check_messages
+
+_SAMPLE_KG: Dict = {
+    "nodes": {
+        "NCBIGene:29974": {"categories": ["biolink:Gene"]},
+        "PUBCHEM.COMPOUND:597": {"categories": ["biolink:SmallMolecule"]}
+    },
+    "edges": {
+        "edge_1": {
+            "subject": "NCBIGene:29974",
+            "predicate": "biolink:physically_interacts_with",
+            "object": "PUBCHEM.COMPOUND:597",
+            "sources": [{"resource_id": "infores:molepro", "resource_role": "primary_knowledge_source"}]
+        }
+    }
+}
+
+
+def _sample_kg(**edges) -> Dict:
+    graph: Dict = deepcopy(_SAMPLE_KG)
+    graph["edges"].update(deepcopy(edges))
+    return graph
+
+
+_EDGE_1: Dict = _SAMPLE_KG["edges"]["edge_1"]
+
+
+@pytest.mark.parametrize(
+    "graph,code",
+    [
+        (_SAMPLE_KG, ""),
+        ({"nodes": {}, "edges": {}}, "warning.graph.empty"),
+        (
+            _sample_kg(edge_2=dict(_EDGE_1, subject="NCBIGene:0")),
+            "error.knowledge_graph.edge.subject.missing_from_nodes"
+        ),
+        (
+            _sample_kg(edge_2=dict(_EDGE_1, object="PUBCHEM.COMPOUND:0")),
+            "error.knowledge_graph.edge.object.missing_from_nodes"
+        ),
+        (
+            dict(_SAMPLE_KG, nodes=dict(_SAMPLE_KG["nodes"], **{"MONDO:0005148": {}})),
+            "warning.knowledge_graph.nodes.dangling"
+        ),
+        (_sample_kg(edge_2=_EDGE_1), "warning.knowledge_graph.edge.duplicated"),
+        # edges of distinct primary knowledge sources, or with distinct qualifiers, are not duplicates
+        (
+            _sample_kg(
+                edge_2=dict(
+                    _EDGE_1,
+                    sources=[{"resource_id": "infores:chebi", "resource_role": "primary_knowledge_source"}]
+                )
+            ),
+            ""
+        ),
+        (
+            _sample_kg(
+                edge_2=dict(
+                    _EDGE_1,
+                    qualifiers=[{"qualifier_type_id": "biolink:object_aspect_qualifier", "qualifier_value": "activity"}]
+                )
+            ),
+            ""
+        )
+    ]
+)
+def test_check_dangling_references(graph: Dict, code: str):
+    validator: MappingValidator = check_node_edge_mappings(graph)
+    check_messages(validator, code)
+
+
+def test_duplicated_edge_identifiers():
+    graph: Dict = _sample_kg(edge_2=_EDGE_1, edge_3=_EDGE_1)
+    validator: MappingValidator = check_node_edge_mappings(graph)
+    # each duplicate is reported against the first edge with the same statement
+    assert validator.get_warnings()["warning.knowledge_graph.edge.duplicated"] == {
+        "edge_2": [{"edge_id": "edge_1"}],
+        "edge_3": [{"edge_id": "edge_1"}]
+    }
@@ -0,0 +1,160 @@
+"""
+Unit tests of the columnar (compact) message store of the ValidationReporter
+"""
+import tracemalloc
+from typing import Dict, List
+
+from reasoner_validator.message import MessageType, MESSAGES_BY_TARGET
+from reasoner_validator.message_store import ColumnarMessageStore
+from reasoner_validator.report import ValidationReporter
+from tests.test_validation_report import full_test_messages_by_target
+
+
+def _report_messages(reporter: ValidationReporter):
+    reporter.report(code="info.compliant")
+    reporter.report(code="info.compliant")
+    reporter.report(code="warning.graph.empty", identifier="first graph")
+    reporter.report(code="warning.graph.empty", identifier="second graph", test="another test")
+    reporter.report(
+        code="warning.knowledge_graph.edge.duplicated",
+        identifier="edge_2",
+        edge_id="edge_1"
+    )
+    reporter.report(
+        code="warning.knowledge_graph.edge.duplicated",
+        identifier="edge_3",
+        edge_id="edge_1"
+    )
+    reporter.report(
+        code="error.knowledge_graph.edge.predicate.abstract",
+        identifier="biolink:contributor",
+        target="another target",
+        edge_id="Richard->biolink:contributor->Translator"
+    )
+    reporter.report(
+        code="info.compliant",
+        identifier="test edge",
+        qualifier_type_id='biolink:subject_aspect_qualifier',
+        qualifier_value=['degradation', 'activity'],
+    )
+    # an empty message catalog is also created for a queried test
+    reporter.get_messages_by_test(test="empty test")
+
+
+def test_compact_messages():
+    reporter = ValidationReporter()
+    compact_reporter = ValidationReporter(compact_messages=True)
+    assert not reporter.uses_compact_messages() and compact_reporter.uses_compact_messages()
+    _report_messages(reporter)
+    _report_messages(compact_reporter)
+    assert compact_reporter.get_all_messages() == reporter.get_all_messages()
+    assert compact_reporter.get_warnings() == reporter.get_warnings()
+    assert compact_reporter.get_errors(target="another target") == reporter.get_errors(target="another target")
+    assert compact_reporter.get_all_messages_of_type(MessageType.info) == \
+        reporter.get_all_messages_of_type(MessageType.info)
+    assert compact_reporter.summary() == reporter.summary()
+    assert compact_reporter.dumps() == reporter.dumps()
+
+
+def test_compact_add_messages():
+    reporter = ValidationReporter()
+    compact_reporter = ValidationReporter(compact_messages=True)
+    reporter.add_messages(full_test_messages_by_target)
+    compact_reporter.add_messages(full_test_messages_by_target)
+    assert compact_reporter.get_all_messages() == reporter.get_all_messages()
+
+    # merged into, and from, compact reporters
+    other = ValidationReporter(compact_messages=True)
+    other.merge(reporter)
+    assert other.get_all_messages() == reporter.get_all_messages()
+    another = ValidationReporter()
+    another.merge(other)
+    assert another.get_all_messages() == reporter.get_all_messages()
+
+
+def test_extend_message_store():
+    reporter = ValidationReporter(compact_messages=True)
+    _report_messages(reporter)
+    other = ValidationReporter(compact_messages=True, default_target="another target")
+    other.add_messages(full_test_messages_by_target)
+
+    store = ColumnarMessageStore()
+    store.extend(reporter._store)
+    store.extend(other._store)
+    reporter.add_messages(other.messages)
+    assert len(store) == len(reporter._store)
+    assert store.materialize() == reporter.messages
+
+    # compact reporters are merged without materializing their messages
+    merged = ValidationReporter(compact_messages=True)
+    merged.merge(reporter)
+    assert merged.messages == reporter.messages
+    assert merged.summary() == reporter.summary()
+
+
+def test_compact_messages_materialized_once():
+    reporter = ValidationReporter(compact_messages=True)
+    _report_messages(reporter)
+    messages: MESSAGES_BY_TARGET = reporter.messages
+    assert reporter.messages is messages
+    assert reporter.get_messages_by_target() is messages[reporter.get_default_target()]
+
+    # ... until more messages are recorded
+    reporter.report(code="warning.graph.empty", identifier="third graph")
+    assert reporter.messages is not messages
+    assert "third graph" in reporter.messages[reporter.get_default_target()]["Test"]["warning"]["warning.graph.empty"]
+    reporter.clear_messages()
+    assert not reporter.has_messages()
+
+
+def test_materialize_messages_as_is():
+    messages: MESSAGES_BY_TARGET = {
+        "target": {
+            "test": {
+                "info": {"info.compliant": None},
+                "skipped": {},
+                "warning": {"warning.graph.empty": {}},
+                "error": {
+                    "error.knowledge_graph.edge.predicate.abstract": {
+                        "biolink:contributor": [
+                            {"edge_id": "Richard->biolink:contributor->Translator"},
+                            {"edge_id": "Tim->biolink:contributor->Translator"}
+                        ],
+                        "biolink:contributes_to": None
+                    }
+                },
+                "critical": {}
+            },
+            "empty test": {"info": {}, "skipped": {}, "warning": {}, "error": {}, "critical": {}}
+        }
+    }
+    store: ColumnarMessageStore = ColumnarMessageStore.from_messages(messages)
+    assert len(store) == 5
+    assert store.materialize() == messages
+    assert store.materialize(test="empty test") == {"target": {"empty test": messages["target"]["empty test"]}}
+    assert store.materialize(target="another target") == {}
+
+    # messages directly assigned to a compact reporter are stored
+    reporter = ValidationReporter(compact_messages=True)
+    reporter.messages = messages
+    reporter.recount_messages()
+    assert reporter.messages == messages
+    assert reporter.has_errors(test="test", target="target")
+
+
+def test_compact_message_store_size():
+    # the parameter values (e.g. knowledge graph edge identifiers) are referenced, not copied, by both reporters
+    edge_ids: List[str] = [f"edge_{i}" for i in range(20000)]
+    sizes: Dict[bool, int] = dict()
+    for compact_messages in [False, True]:
+        tracemalloc.start()
+        reporter = ValidationReporter(compact_messages=compact_messages)
+        for i, edge_id in enumerate(edge_ids):
+            reporter.report(
+                code="warning.knowledge_graph.edge.duplicated",
+                identifier=edge_ids[i % 100],
+                edge_id=edge_id
+            )
+        sizes[compact_messages] = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+    assert sizes[True] * 5 < sizes[False]
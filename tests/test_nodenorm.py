@@ -0,0 +1,69 @@
+"""
+Unit tests of batched, cached Node Normalizer resolution, against a local stand-in Node Normalizer
+"""
+from typing import Dict, List
+from time import sleep
+
+from reasoner_validator.nodenorm import NodeNormalizer
+from reasoner_validator.biolink.ontology import convert_to_preferred
+
+CLIQUES: Dict[str, List[str]] = {
+    "MONDO:0005148": ["MONDO:0005148", "DOID:9352", "HP:0005978"],
+    "DOID:9352": ["MONDO:0005148", "DOID:9352", "HP:0005978"],
+    "CHEBI:6801": ["CHEBI:6801", "PUBCHEM.COMPOUND:4091"],
+    "orphanet:33110": ["MONDO:0011096", "orphanet:33110"]
+}
+
+
+def stand_in_node_normalizer(query: Dict) -> Dict:
+    return {
+        curie: {
+            "id": {"identifier": CLIQUES[curie][0]},
+            "equivalent_identifiers": [{"identifier": identifier} for identifier in CLIQUES[curie]]
+        } if curie in CLIQUES else None
+        for curie in query["curies"]
+    }
+
+
+def test_batched_resolution(local_server):
+    url, queries = local_server(stand_in_node_normalizer)
+    node_normalizer = NodeNormalizer(url=url, chunk_size=2)
+    curies = ["MONDO:0005148", "DOID:9352", "CHEBI:6801", "orphanet:33110", "FOO:1", "MONDO:0005148"]
+    resolved = node_normalizer.resolve(curies)
+    # five distinct CURIEs, in chunks of two
+    assert len(queries) == 3
+    assert sorted(curie for query in queries for curie in query["curies"]) == sorted(set(curies))
+    assert NodeNormalizer.get_equivalent_identifiers(resolved["CHEBI:6801"]) == CLIQUES["CHEBI:6801"]
+    assert resolved["FOO:1"] is None
+
+    # resolved cliques (including unknown CURIEs) are cached
+    assert node_normalizer.resolve(curies) == resolved
+    assert node_normalizer.get_clique("FOO:1") is None
+    assert len(queries) == 3
+
+
+def test_resolution_failures_are_not_cached(local_server):
+    url, queries = local_server(lambda query: {})
+    node_normalizer = NodeNormalizer(url=url)
+    assert node_normalizer.resolve(["MONDO:0005148"]) == {}
+    assert node_normalizer.resolve(["MONDO:0005148"]) == {}
+    assert len(queries) == 2
+
+
+def test_cache_ttl(local_server):
+    url, queries = local_server(stand_in_node_normalizer)
+    node_normalizer = NodeNormalizer(url=url, ttl=0.1)
+    node_normalizer.get_clique("MONDO:0005148")
+    node_normalizer.get_clique("MONDO:0005148")
+    assert len(queries) == 1
+    sleep(0.2)
+    node_normalizer.get_clique("MONDO:0005148")
+    assert len(queries) == 2
+
+
+def test_convert_to_preferred(local_server):
+    url, queries = local_server(stand_in_node_normalizer)
+    node_normalizer = NodeNormalizer(url=url)
+    assert convert_to_preferred("DOID:9352", ["HP"], node_normalizer=node_normalizer) == "HP:0005978"
+    assert convert_to_preferred("DOID:9352", ["UBERON"], node_normalizer=node_normalizer) is None
+    assert convert_to_preferred("FOO:1", ["HP"], node_normalizer=node_normalizer) is None
@@ -1,14 +1,18 @@
 """
 Unit tests of the low level ontology and node normalization calling subsystem.
 """
-from typing import Optional
+from typing import Optional, Dict, List
 import pytest
 
 from reasoner_validator import post_query, NODE_NORMALIZER_SERVER
 from reasoner_validator.biolink.ontology import (
     ONTOLOGY_KP_TRAPI_SERVER,
-    get_parent_concepts
+    get_parent_concepts,
+    get_ontology_ancestors_of,
+    resolve_parent_concepts
 )
+from reasoner_validator.nodenorm import NodeNormalizer
+from tests.test_nodenorm import stand_in_node_normalizer
 
 pytest_plugins = ('pytest_asyncio',)
 
@@ -103,3 +107,71 @@ def test_get_parent_concept(curie: str, category: str, result: Optional[str]):
     # Just use default Biolink Model release for this test
     parent_concepts = get_parent_concepts(curie=curie, category=category, biolink_version=None)
     assert (result is None and parent_concepts is None) or result in parent_concepts
+
+
+# Stand-in Ontology KP subclass hierarchy
+SUPERCLASSES: Dict[str, List[str]] = {
+    "MONDO:0005148": ["MONDO:0005015", "MONDO:0000001", "UPHENO:0000001"],  # type 2 diabetes
+    "MONDO:0005015": ["MONDO:0000001"],  # diabetes mellitus
+    "HP:0005978": ["HP:0000118"]
+}
+
+
+def stand_in_ontology_kp(query: Dict) -> Dict:
+    return {
+        "message": {
+            "results": [
+                {
+                    "node_bindings": {
+                        "a": [{"id": curie}],
+                        "b": [{"id": parent}]
+                    }
+                }
+                for curie in query["message"]["query_graph"]["nodes"]["a"]["ids"]
+                for parent in [curie] + (SUPERCLASSES[curie] if curie in SUPERCLASSES else [])
+            ]
+        }
+    }
+
+
+def test_get_ontology_ancestors_of(local_server):
+    url, queries = local_server(stand_in_ontology_kp)
+    ancestors = get_ontology_ancestors_of(["MONDO:0005148", "MONDO:0005015", "CHEBI:6801"], "biolink:Disease", url=url)
+    assert len(queries) == 1
+    assert ancestors == {
+        "MONDO:0005148": ["MONDO:0005015", "MONDO:0000001"],  # UPHENO term is filtered out
+        "MONDO:0005015": ["MONDO:0000001"],
+        "CHEBI:6801": []
+    }
+
+
+def test_resolve_parent_concepts(local_server):
+    kp_url, kp_queries = local_server(stand_in_ontology_kp)
+    nn_url, nn_queries = local_server(stand_in_node_normalizer)
+    parents = resolve_parent_concepts(
+        curies=["MONDO:0005148", "DOID:9352", "CHEBI:6801", "MONDO:0005148"],
+        category="biolink:Disease",
+        preferred_prefixes=["MONDO"],
+        url=kp_url,
+        node_normalizer=NodeNormalizer(url=nn_url)
+    )
+    # one Ontology KP query for all the CURIEs...
+    assert len(kp_queries) == 1
+    # ...plus one Node Normalizer query each for the non-preferred CURIEs and the ancestors
+    assert len(nn_queries) == 2
+    assert parents["MONDO:0005148"] == ["MONDO:0005015", "MONDO:0000001"]
+    # DOID:9352 is a MONDO:0005148 alias, but its MONDO ancestors are not in the DOID namespace
+    assert parents["DOID:9352"] is None
+    assert parents["CHEBI:6801"] is None
+
+
+def test_resolve_parent_concepts_with_ontology_kp_offline(local_server):
+    kp_url, _ = local_server(lambda query: {})
+    nn_url, _ = local_server(stand_in_node_normalizer)
+    assert resolve_parent_concepts(
+        curies=["MONDO:0005148"],
+        category="biolink:Disease",
+        preferred_prefixes=["MONDO"],
+        url=kp_url,
+        node_normalizer=NodeNormalizer(url=nn_url)
+    ) is None
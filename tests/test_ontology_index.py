@@ -0,0 +1,120 @@
+"""
+Unit tests of the offline ontology closure index
+"""
+from typing import Dict
+import json
+
+from reasoner_validator.biolink.ontology import get_parent_concepts_of
+from reasoner_validator.biolink.ontology_index import (
+    iri_to_curie,
+    OntologyIndex,
+    get_ontology_index,
+    set_ontology_index
+)
+
+SAMPLE_OBO = """format-version: 1.2
+ontology: mondo
+
+[Term]
+id: MONDO:0000001
+name: disease
+
+[Term]
+id: MONDO:0700096
+name: human disease
+is_a: MONDO:0000001 ! disease
+
+[Term]
+id: MONDO:0005015
+name: diabetes mellitus
+is_a: MONDO:0700096 ! human disease {source="MONDO:equivalentTo"}
+
+[Term]
+id: MONDO:0005148
+name: type 2 diabetes mellitus
+is_a: MONDO:0005015 ! diabetes mellitus
+
+[Term]
+id: MONDO:9999999
+name: obsolete disease
+is_obsolete: true
+is_a: MONDO:0000001
+
+[Typedef]
+id: part_of
+is_a: MONDO:0000001
+"""
+
+
+def _sample_obographs() -> Dict:
+    obo: str = "http://purl.obolibrary.org/obo/"
+    return {
+        "graphs": [
+            {
+                "nodes": [
+                    {"id": f"{obo}HP_0000118", "type": "CLASS"},
+                    {"id": f"{obo}HP_0000478", "type": "CLASS"},
+                    {"id": f"{obo}HP_0000479", "type": "CLASS"},
+                    {"id": f"{obo}HP_0000480", "type": "CLASS", "meta": {"deprecated": True}}
+                ],
+                "edges": [
+                    {"sub": f"{obo}HP_0000478", "pred": "is_a", "obj": f"{obo}HP_0000118"},
+                    {"sub": f"{obo}HP_0000479", "pred": "is_a", "obj": f"{obo}HP_0000478"},
+                    {"sub": f"{obo}HP_0000480", "pred": "is_a", "obj": f"{obo}HP_0000478"},
+                    {"sub": f"{obo}HP_0000479", "pred": f"{obo}BFO_0000050", "obj": f"{obo}HP_0000118"}
+                ]
+            }
+        ]
+    }
+
+
+def test_iri_to_curie():
+    assert iri_to_curie("http://purl.obolibrary.org/obo/MONDO_0005148") == "MONDO:0005148"
+    assert iri_to_curie("MONDO:0005148") == "MONDO:0005148"
+
+
+def test_ontology_index_closure():
+    # diamond shaped hierarchy, with a (spurious) cycle
+    index = OntologyIndex.from_hierarchy({"A": ["B", "C"], "B": ["D"], "C": ["D"], "D": ["A"]})
+    assert index.get_ancestors("A") == ["B", "C", "D"]
+    assert index.is_subclass_of("B", "D")
+    assert not index.is_subclass_of("B", "C")
+    assert index.get_ancestors("unknown") is None
+
+
+def test_ontology_index_build_save_and_load(tmp_path):
+    obo_path = tmp_path / "mondo.obo"
+    obo_path.write_text(SAMPLE_OBO)
+    json_path = tmp_path / "hp.json"
+    json_path.write_text(json.dumps(_sample_obographs()))
+
+    index = OntologyIndex.build([str(obo_path), str(json_path)])
+    assert index.get_ancestors("MONDO:0005148") == ["MONDO:0000001", "MONDO:0005015", "MONDO:0700096"]
+    assert "MONDO:9999999" not in index
+    assert "part_of" not in index
+    assert index.get_ancestors("HP:0000479") == ["HP:0000118", "HP:0000478"]
+    assert "HP:0000480" not in index
+
+    index_path = str(tmp_path / "ontology.index")
+    index.save(index_path)
+    loaded = OntologyIndex.load(index_path)
+    assert len(loaded) == len(index)
+    for curie in index.ids:
+        assert loaded.get_ancestors(curie) == index.get_ancestors(curie)
+    assert loaded.is_subclass_of("MONDO:0005148", "MONDO:0000001")
+    assert not loaded.is_subclass_of("MONDO:0000001", "MONDO:0005148")
+
+
+def test_get_parent_concepts_of_consults_the_ontology_index():
+    default_index = get_ontology_index()
+    set_ontology_index(
+        OntologyIndex.from_hierarchy({"MONDO:0005148": ["MONDO:0005015", "EFO:0000400"], "MONDO:0005015": []})
+    )
+    try:
+        # indexed terms are resolved offline, without any Biolink Model or Ontology KP lookup
+        parents = get_parent_concepts_of(
+            ["MONDO:0005148", "MONDO:0005015"], "biolink:Disease", biolink_version="not-a-version"
+        )
+        assert parents == {"MONDO:0005148": ["MONDO:0005015"], "MONDO:0005015": None}
+    finally:
+        set_ontology_index(default_index)
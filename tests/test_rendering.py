@@ -0,0 +1,103 @@
+"""
+Unit tests of the (buffered, paginated) rendering of text validation reports
+"""
+from typing import List, Optional
+import io
+
+import pytest
+
+from reasoner_validator.rendering import BufferedWriter, code_header, parse_cursor
+from reasoner_validator.report import ValidationReporter
+from tests.test_validation_report import full_test_messages_by_target
+
+
+def _message_lines(text: str) -> List[str]:
+    # identifier and message parameter lines of a text report
+    return sorted(
+        line for line in text.splitlines()
+        if line.startswith("\t\t\t\t# ") or line.startswith("\t\t\t\t\t")
+    )
+
+
+def _reporter() -> ValidationReporter:
+    reporter = ValidationReporter()
+    reporter.add_messages(full_test_messages_by_target)
+    for i in range(5):
+        for j in range(3):
+            reporter.report(code="warning.knowledge_graph.edge.duplicated", identifier=f"e{i}", edge_id=f"e{i}{j}")
+    return reporter
+
+
+def test_buffered_writer():
+    file = io.StringIO()
+    writer = BufferedWriter(file, buffer_size=10)
+    writer.write("12345")
+    assert file.getvalue() == ""
+    writer.write("67890")
+    assert file.getvalue() == "1234567890"
+    writer.write("abc")
+    writer.flush()
+    assert file.getvalue() == "1234567890abc"
+
+    writer = BufferedWriter()
+    writer.write("12345")
+    writer.write("67890")
+    assert writer.getvalue() == "1234567890"
+
+
+def test_code_header():
+    assert code_header("info.compliant") == ("Compliant", "Biolink Model-compliant TRAPI Message")
+    assert code_header("info.compliant") is code_header("info.compliant")
+
+
+@pytest.mark.parametrize(
+    "page_by,page_size,number_of_pages",
+    [
+        ("target", 1, 3),
+        ("test", 2, 2),
+        ("code", 1, 11),
+        ("code", 3, 4),
+        ("identifier", 1, 19),
+        ("identifier", 2, 10)
+    ]
+)
+def test_paginated_report(page_by: str, page_size: int, number_of_pages: int):
+    reporter = _reporter()
+    whole: str = reporter.dumps()
+    pages: List[str] = list()
+    cursor: Optional[str] = None
+    while True:
+        page, cursor = reporter.dumps_page(cursor=cursor, page_by=page_by, page_size=page_size)
+        pages.append(page)
+        if cursor is None:
+            break
+    assert len(pages) == number_of_pages
+
+    # the report header is only rendered on the first page, and each message on exactly one page
+    assert pages[0].startswith("Reasoner Validator")
+    assert not any(page.startswith("Reasoner Validator") for page in pages[1:])
+    assert _message_lines("\n".join(pages)) == _message_lines(whole)
+
+    # the pages of dump() are those of dumps_page()
+    file = io.StringIO()
+    cursor = reporter.dump(title=None, compact_format=True, file=file, page_by=page_by, page_size=page_size)
+    assert file.getvalue().strip() == pages[0]
+    if cursor is not None:
+        file = io.StringIO()
+        reporter.dump(compact_format=True, file=file, cursor=cursor, page_by=page_by, page_size=page_size)
+        assert file.getvalue().strip() == pages[1]
+
+
+def test_unpaginated_report():
+    reporter = _reporter()
+    assert reporter.dumps_page() == (reporter.dumps(), None)
+    assert reporter.dumps_page(page_by="code") == (reporter.dumps(), None)
+
+
+def test_invalid_cursor():
+    assert parse_cursor(None) == [0, 0, 0, 0, 0]
+    assert parse_cursor("1:0:2:3:4") == [1, 0, 2, 3, 4]
+    reporter = _reporter()
+    for cursor in ["", "1:2", "a:0:0:0:0", "-1:0:0:0:0"]:
+        with pytest.raises(ValueError):
+            reporter.dumps_page(cursor=cursor, page_by="code", page_size=1)
@@ -0,0 +1,51 @@
+"""
+Unit tests of the lookup indexes of TRAPI Response Messages
+"""
+from typing import Dict
+
+from reasoner_validator.trapi.index import ResponseIndex
+
+
+def _sample_message() -> Dict:
+    return {
+        "knowledge_graph": {
+            "nodes": {
+                "MONDO:0005148": {"categories": ["biolink:Disease"]},
+                "CHEBI:6801": {"categories": ["biolink:Drug"]}
+            },
+            "edges": {
+                "e0": {"subject": "CHEBI:6801", "predicate": "biolink:treats", "object": "MONDO:0005148"},
+                "e1": {"subject": "MONDO:0005148", "predicate": "biolink:treated_by", "object": "CHEBI:6801"},
+                "e2": {"subject": "CHEBI:6801", "predicate": "biolink:related_to", "object": "MONDO:0005148"}
+            }
+        },
+        "results": [
+            {"node_bindings": {}, "analyses": [{"edge_bindings": {"q0": [{"id": "e1"}]}}]},
+            {
+                "node_bindings": {},
+                "analyses": [
+                    {"edge_bindings": {"q0": [{"id": "e0"}, {"id": "e2"}]}},
+                    {"edge_bindings": {"q1": [{"id": "e0"}]}}
+                ]
+            },
+            {"node_bindings": {}, "analyses": []}
+        ]
+    }
+
+
+def test_response_index():
+    message: Dict = _sample_message()
+    index = ResponseIndex(message)
+    assert index.get_edges("CHEBI:6801", "MONDO:0005148") == ["e0", "e2"]
+    assert index.get_edges("MONDO:0005148", "CHEBI:6801") == ["e1"]
+    assert index.get_edges("CHEBI:6801", "CHEBI:6801") == []
+    # a result binding an edge in several analyses is only indexed once
+    assert index.get_results("e0") == [message["results"][1]]
+    assert index.get_results("e1") == [message["results"][0]]
+    assert index.get_results("e3") == []
+
+
+def test_response_index_of_empty_message():
+    index = ResponseIndex({"knowledge_graph": None, "results": None})
+    assert index.get_edges("CHEBI:6801", "MONDO:0005148") == []
+    assert index.get_results("e0") == []
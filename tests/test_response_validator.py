@@ -3,16 +3,22 @@ Unit tests for the generic (shared) components of the SRI Testing Framework
 """
 from typing import Optional, Tuple, List, Dict
 from sys import stderr
+from collections import Counter
 
 import logging
 
 from copy import deepcopy
+from threading import Barrier
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
 from dictdiffer import diff
 
-from reasoner_validator.validator import TRAPIResponseValidator
+from reasoner_validator.cache import ValidationCache, ResponseValidationCache
+from reasoner_validator.message import MessageType
+from reasoner_validator.sinks import CallbackSink
+from reasoner_validator.validator import TRAPIResponseValidator, ResultsWorkerPool
 
 from tests import (
     LATEST_TRAPI_RELEASE,
@@ -185,11 +191,39 @@ _SHARED_TEST_EDGES = {
         }
     }
 
+# Knowledge Graph nodes and edge bound by the node_bindings and _TEST_ANALYSES of _TEST_RESULTS_1
+_TEST_RESULT_NODES = {
+    TYPE_2_DIABETES_CURIE: {
+        "name": "type-2 diabetes",
+        "categories": ["biolink:Disease"],
+        "attributes": []
+    },
+    METFORMIN_CURIE: {
+        "name": "metformin",
+        "categories": ["biolink:Drug"],
+        "attributes": []
+    }
+}
+
+_TEST_RESULT_EDGES = {
+    "df87ff82": {
+        "subject": METFORMIN_CURIE,
+        "predicate": "biolink:ameliorates_condition",
+        "object": TYPE_2_DIABETES_CURIE,
+        "attributes": DEFAULT_KL_AND_AT_ATTRIBUTES,
+        "sources": _TEST_KG_EDGE_SOURCES
+    }
+}
+
+_TEST_NODES_1 = deepcopy(SAMPLE_NODES_WITH_ATTRIBUTES)
+_TEST_NODES_1.update(_TEST_RESULT_NODES)
+
 _TEST_EDGES_1 = deepcopy(_SHARED_TEST_EDGES)
 _TEST_EDGES_1["edge_1"]["sources"] = _TEST_KG_EDGE_SOURCES
+_TEST_EDGES_1.update(_TEST_RESULT_EDGES)
 
 _TEST_KG_1 = {
-    "nodes": SAMPLE_NODES_WITH_ATTRIBUTES,
+    "nodes": _TEST_NODES_1,
     "edges": _TEST_EDGES_1
 }
 
@@ -239,8 +273,10 @@ _TEST_EDGES_SOURCES_MISSING_PRIMARY = {
         }
     }
 
+_TEST_EDGES_SOURCES_MISSING_PRIMARY.update(_TEST_RESULT_EDGES)
+
 _TEST_KG_WITH_EDGE_SOURCES_MISSING_PRIMARY = {
-    "nodes": SAMPLE_NODES_WITH_ATTRIBUTES,
+    "nodes": _TEST_NODES_1,
     "edges": _TEST_EDGES_SOURCES_MISSING_PRIMARY
 }
 
@@ -428,9 +464,10 @@ _TEST_KG_MISSING_PRIMARY_SOURCE = {
 
 _TEST_EDGES_MULTIPLE_PRIMARY_SOURCE = deepcopy(_SHARED_TEST_EDGES)
 _TEST_EDGES_MULTIPLE_PRIMARY_SOURCE["edge_1"]["sources"] = _TEST_KG_EDGE_SOURCES_MULTIPLE_PRIMARY
+_TEST_EDGES_MULTIPLE_PRIMARY_SOURCE.update(_TEST_RESULT_EDGES)
 
 _TEST_KG_MULTIPLE_PRIMARY_SOURCE = {
-    "nodes": SAMPLE_NODES_WITH_ATTRIBUTES,
+    "nodes": _TEST_NODES_1,
     "edges": _TEST_EDGES_MULTIPLE_PRIMARY_SOURCE
 }
 
@@ -556,6 +593,236 @@ def test_conservation_of_response_object():
     assert not list(diff(input_response, reference_response))
 
 
+def test_concurrent_validation_of_shared_response():
+    # validators of different strictness validate one (shared) response object concurrently
+    shared_response: Dict = deepcopy(_TEST_LATEST_TRAPI_RELEASE_FULL_SAMPLE)
+    references: Dict[bool, Dict] = dict()
+    for strict_validation in [False, True]:
+        validator = TRAPIResponseValidator(strict_validation=strict_validation)
+        validator.check_compliance_of_trapi_response(response=deepcopy(_TEST_LATEST_TRAPI_RELEASE_FULL_SAMPLE))
+        references[strict_validation] = validator.get_all_messages()
+
+    number_of_threads: int = 16
+    barrier = Barrier(number_of_threads)
+
+    def validate(thread: int) -> Tuple[bool, Dict]:
+        strict_validation: bool = thread % 2 == 1
+        validator = TRAPIResponseValidator(strict_validation=strict_validation)
+        barrier.wait()
+        validator.check_compliance_of_trapi_response(response=shared_response)
+        return strict_validation, validator.get_all_messages()
+
+    with ThreadPoolExecutor(max_workers=number_of_threads) as executor:
+        outcomes: List[Tuple[bool, Dict]] = list(executor.map(validate, range(number_of_threads)))
+
+    for strict_validation, messages in outcomes:
+        assert messages == references[strict_validation]
+    assert not list(diff(shared_response, _TEST_LATEST_TRAPI_RELEASE_FULL_SAMPLE))
+
+
+def test_parallel_validation_of_results():
+    response: Dict = deepcopy(_TEST_LATEST_TRAPI_RELEASE_FULL_SAMPLE)
+    result: Dict = response["message"]["results"][0]
+    response["message"]["results"] = [deepcopy(result) for _ in range(20)]
+    # a few schema-invalid results, whose messages should be merged in the order of the results
+    for position in [3, 11, 17]:
+        response["message"]["results"][position].pop("analyses")
+        response["message"]["results"][position]["node_bindings"][f"invalid-{position}"] = "not-a-list"
+
+    serial: TRAPIResponseValidator = TRAPIResponseValidator()
+    serial.check_compliance_of_trapi_response(response=response)
+    parallel: TRAPIResponseValidator = TRAPIResponseValidator(result_workers=3)
+    parallel.check_compliance_of_trapi_response(response=response)
+
+    assert "critical.trapi.validation" in parallel.get_critical()
+    assert parallel.get_all_messages() == serial.get_all_messages()
+
+
+def test_results_worker_pool_is_reused_until_closed():
+    response: Dict = deepcopy(_TEST_LATEST_TRAPI_RELEASE_FULL_SAMPLE)
+    result: Dict = response["message"]["results"][0]
+    response["message"]["results"] = [deepcopy(result) for _ in range(20)]
+    response["message"]["results"][7].pop("analyses")
+
+    with TRAPIResponseValidator(result_workers=3) as validator:
+        validator.check_compliance_of_trapi_response(response=response)
+        messages: Dict = validator.get_all_messages(copy=True)
+        validator.clear_messages()
+        validator.check_compliance_of_trapi_response(response=response)
+        assert validator.get_all_messages() == messages
+        # both validations ran on the same pool of workers
+        assert len(validator._results_pool._executors) == 1
+    assert not validator._results_pool._executors
+
+    # a shared pool of workers outlives the validators to which it is given, until shut down by its owner
+    pool: ResultsWorkerPool = ResultsWorkerPool()
+    for _ in range(2):
+        with TRAPIResponseValidator(result_workers=3, results_pool=pool) as validator:
+            validator.check_compliance_of_trapi_response(response=response)
+            assert validator.get_all_messages() == messages
+        assert len(pool._executors) == 1
+    pool.shutdown()
+    assert not pool._executors
+
+
+def test_iter_validate():
+    reference: TRAPIResponseValidator = TRAPIResponseValidator()
+    reference.check_compliance_of_trapi_response(response=deepcopy(_TEST_LATEST_TRAPI_RELEASE_FULL_SAMPLE))
+
+    records: List[Dict] = list()
+    validator: TRAPIResponseValidator = TRAPIResponseValidator(
+        message_sink=CallbackSink(records.append),
+        retain_messages=False
+    )
+    streamed: List[Dict] = list(validator.iter_validate(deepcopy(_TEST_LATEST_TRAPI_RELEASE_FULL_SAMPLE)))
+    assert streamed and streamed == records
+    assert validator.summary() == reference.summary()
+    assert not validator.get_all_messages_of_type(MessageType.warning)
+
+    # the streamed messages are those recorded by a (retaining) validator
+    assert Counter(record["code"] for record in streamed) == Counter(reference.summary())
+
+
+def _dangling_result(node_key: str, node_id: str, edge_key: str, edge_id: str) -> Dict:
+    result: Dict = deepcopy(_TEST_RESULTS_1[0])
+    result["node_bindings"][node_key] = [{"id": node_id, "attributes": []}]
+    result["analyses"][0]["edge_bindings"][edge_key] = [{"id": edge_id, "attributes": []}]
+    return result
+
+
+@pytest.mark.parametrize(
+    "result,code",
+    [
+        (_TEST_RESULTS_1[0], ""),
+        (
+            _dangling_result("not-a-qnode", METFORMIN_CURIE, "treats", "df87ff82"),
+            "error.trapi.response.message.result.node_binding.key.missing"
+        ),
+        (
+            _dangling_result("drug", "RXCUI:0", "treats", "df87ff82"),
+            "error.trapi.response.message.result.node_binding.dangling"
+        ),
+        (
+            _dangling_result("drug", METFORMIN_CURIE, "not-a-qedge", "df87ff82"),
+            "error.trapi.response.message.result.edge_binding.key.missing"
+        ),
+        (
+            _dangling_result("drug", METFORMIN_CURIE, "treats", "not-an-edge"),
+            "error.trapi.response.message.result.edge_binding.dangling"
+        )
+    ]
+)
+def test_check_result_bindings(result: Dict, code: str):
+    validator: TRAPIResponseValidator = TRAPIResponseValidator()
+    message: Dict = {"query_graph": _TEST_QG_1, "knowledge_graph": _TEST_KG_1, "results": [result]}
+    validator.check_result_bindings(message, message["results"])
+    check_messages(validator, code)
+
+
+def test_incremental_validation():
+    cache = ValidationCache()
+    first: TRAPIResponseValidator = TRAPIResponseValidator(validation_cache=cache)
+    first.check_compliance_of_trapi_response(response=deepcopy(_TEST_LATEST_TRAPI_RELEASE_FULL_SAMPLE))
+    cached_entries: int = len(cache)
+    assert cached_entries > 0
+
+    # an identical response is fully validated from the cache, replaying the same messages
+    second: TRAPIResponseValidator = TRAPIResponseValidator(validation_cache=cache)
+    second.check_compliance_of_trapi_response(response=deepcopy(_TEST_LATEST_TRAPI_RELEASE_FULL_SAMPLE))
+    assert len(cache) == cached_entries
+    assert second.get_all_messages() == first.get_all_messages()
+
+    # a changed element is validated again...
+    changed_response: Dict = deepcopy(_TEST_LATEST_TRAPI_RELEASE_FULL_SAMPLE)
+    edge: Dict = next(iter(changed_response["message"]["knowledge_graph"]["edges"].values()))
+    edge["predicate"] = "biolink:related_to"
+    TRAPIResponseValidator(validation_cache=cache).check_compliance_of_trapi_response(response=changed_response)
+    assert len(cache) > cached_entries
+
+    # ...as are all elements validated in a different validation context
+    cached_entries = len(cache)
+    TRAPIResponseValidator(validation_cache=cache, strict_validation=True).check_compliance_of_trapi_response(
+        response=deepcopy(_TEST_LATEST_TRAPI_RELEASE_FULL_SAMPLE)
+    )
+    assert len(cache) > cached_entries
+
+
+def test_incremental_validation_of_knowledge_graph_schema():
+    # one (schema) invalid edge, missing its subject
+    knowledge_graph: Dict = deepcopy(_TEST_LATEST_TRAPI_RELEASE_FULL_SAMPLE["message"]["knowledge_graph"])
+    next(iter(knowledge_graph["edges"].values())).pop("subject")
+    message: Dict = {"knowledge_graph": knowledge_graph}
+
+    uncached: TRAPIResponseValidator = TRAPIResponseValidator()
+    uncached.has_valid_knowledge_graph(message=deepcopy(message))
+
+    # the same codes are reported when the knowledge graph is validated incrementally, without or with cache hits
+    cache = ValidationCache()
+    for _ in range(2):
+        cached: TRAPIResponseValidator = TRAPIResponseValidator(validation_cache=cache)
+        cached.has_valid_knowledge_graph(message=deepcopy(message))
+        assert "critical.trapi.validation" in cached.summary()
+        assert set(cached.summary()) == set(uncached.summary())
+
+
+def test_response_validation_cache():
+    cache = ResponseValidationCache()
+    first: TRAPIResponseValidator = TRAPIResponseValidator(response_cache=cache)
+    first.check_compliance_of_trapi_response(response=deepcopy(_TEST_LATEST_TRAPI_RELEASE_FULL_SAMPLE))
+    assert len(cache.memory) == 1
+
+    second: TRAPIResponseValidator = TRAPIResponseValidator(response_cache=cache)
+    second.check_compliance_of_trapi_response(response=deepcopy(_TEST_LATEST_TRAPI_RELEASE_FULL_SAMPLE))
+    assert len(cache.memory) == 1
+    assert second.to_dict() == first.to_dict()
+
+    # different validation parameters are cached separately
+    TRAPIResponseValidator(response_cache=cache).check_compliance_of_trapi_response(
+        response=deepcopy(_TEST_LATEST_TRAPI_RELEASE_FULL_SAMPLE), max_kg_edges=1
+    )
+    assert len(cache.memory) == 2
+
+
+def test_response_validation_cache_bypassed_with_error_rate_estimates():
+    response: Dict = deepcopy(_TEST_LATEST_TRAPI_RELEASE_FULL_SAMPLE)
+    cache = ResponseValidationCache()
+    first: TRAPIResponseValidator = TRAPIResponseValidator(response_cache=cache, sampling_seed=1)
+    estimates: Dict = first.estimate_error_rates(response, sample_size=1)
+    first.check_compliance_of_trapi_response(response=deepcopy(response))
+    # the report (with the error rate estimates) of the validator is not cached...
+    assert len(cache.memory) == 0
+    assert first.to_dict()["error_rate_estimates"] == estimates
+
+    second: TRAPIResponseValidator = TRAPIResponseValidator(response_cache=cache, sampling_seed=1)
+    second.check_compliance_of_trapi_response(response=deepcopy(response))
+    assert len(cache.memory) == 1 and "error_rate_estimates" not in second.to_dict()
+
+    # ...nor retrieved from the cache, thus the same with or without a cached report of the response
+    third: TRAPIResponseValidator = TRAPIResponseValidator(response_cache=cache, sampling_seed=1)
+    third.estimate_error_rates(response, sample_size=1)
+    third.check_compliance_of_trapi_response(response=deepcopy(response))
+    assert third.to_dict() == first.to_dict()
+
+
+@pytest.mark.parametrize("compact_messages", [False, True], ids=["dict", "compact"])
+def test_response_validation_cache_preserves_summary(compact_messages: bool):
+    # both (empty) attribute types of the edge are reported, with the same identifier (thus only recorded once)
+    response: Dict = deepcopy(_TEST_LATEST_TRAPI_RELEASE_FULL_SAMPLE)
+    response["message"]["knowledge_graph"]["edges"]["df87ff82"]["attributes"] = [
+        {"attribute_type_id": "", "value": 1},
+        {"attribute_type_id": "", "value": 2}
+    ]
+    cache = ResponseValidationCache()
+    first: TRAPIResponseValidator = TRAPIResponseValidator(response_cache=cache, compact_messages=compact_messages)
+    first.check_compliance_of_trapi_response(response=response)
+    assert first.summary()["error.knowledge_graph.edge.attribute.type_id.empty"] == 2
+
+    second: TRAPIResponseValidator = TRAPIResponseValidator(response_cache=cache, compact_messages=compact_messages)
+    second.check_compliance_of_trapi_response(response=deepcopy(response))
+    assert second.summary() == first.summary()
+    assert second.to_dict() == first.to_dict()
+
+
 @pytest.mark.parametrize(
     "edges_limit,number_of_nodes_returned,number_of_edges_returned",
     [
@@ -584,6 +851,67 @@ def test_sample_graph(edges_limit: int, number_of_nodes_returned: int, number_of
     assert len(kg_sample["edges"]) == number_of_edges_returned
 
 
+def _stratified_test_graph() -> Dict:
+    # 90 edges from one primary knowledge source listed ahead of
+    # 10 edges from another, with a different predicate
+    nodes: Dict = {
+        "CHEBI:6801": {"categories": ["biolink:SmallMolecule"]},
+        "MONDO:0005148": {"categories": ["biolink:Disease"]},
+        "HGNC:12791": {"categories": ["biolink:Gene"]}
+    }
+    edges: Dict = dict()
+    for n in range(90):
+        edges[f"ea{n}"] = {
+            "subject": "CHEBI:6801",
+            "predicate": "biolink:treats",
+            "object": "MONDO:0005148",
+            "sources": [{"resource_id": "infores:kp-a", "resource_role": "primary_knowledge_source"}]
+        }
+    for n in range(10):
+        edges[f"eb{n}"] = {
+            "subject": "HGNC:12791",
+            "predicate": "biolink:gene_associated_with_condition",
+            "object": "MONDO:0005148",
+            "sources": [{"resource_id": "infores:kp-b", "resource_role": "primary_knowledge_source"}]
+        }
+    return {"nodes": nodes, "edges": edges}
+
+
+def test_stratified_sample_graph():
+    graph: Dict = _stratified_test_graph()
+
+    # first-N sampling only ever sees the first primary knowledge source...
+    kg_sample: Dict = TRAPIResponseValidator.sample_graph(graph=graph, edges_limit=10)
+    assert all(edge_id.startswith("ea") for edge_id in kg_sample["edges"])
+
+    # ...whereas stratified sampling covers both, in
+    # approximate proportion to their share of the graph
+    kg_sample = TRAPIResponseValidator.sample_graph(graph=graph, edges_limit=10, seed=42)
+    assert len(kg_sample["edges"]) == 10
+    assert any(edge_id.startswith("eb") for edge_id in kg_sample["edges"])
+    assert sum(edge_id.startswith("ea") for edge_id in kg_sample["edges"]) > 5
+    assert "HGNC:12791" in kg_sample["nodes"]
+
+    # only nodes of the sampled edges are drawn
+    assert all(
+        node_id in [edge["subject"] for edge in kg_sample["edges"].values()] or
+        node_id in [edge["object"] for edge in kg_sample["edges"].values()]
+        for node_id in kg_sample["nodes"]
+    )
+
+    # seeded samples are reproducible
+    assert TRAPIResponseValidator.sample_graph(graph=graph, edges_limit=10, seed=42) == kg_sample
+
+
+def test_stratified_sample_results():
+    results: List[Dict] = [{"analyses": [{"resource_id": "infores:ara-a"}]} for _ in range(20)]
+    results.append({"analyses": [{"resource_id": "infores:ara-b"}]})
+    results_sample: List = TRAPIResponseValidator.sample_results(results, sample_size=5, seed=1)
+    assert len(results_sample) == 5
+    assert results[-1] in results_sample
+    assert TRAPIResponseValidator.sample_results(results, sample_size=5, seed=1) == results_sample
+
+
 @pytest.mark.parametrize(
     "response,trapi_version,biolink_version,target_provenance,strict_validation,code",
     [
@@ -1902,3 +2230,71 @@ def test_case_input_found_in_response(testcase, response, code):
     outcome: bool = validator.testcase_input_found_in_response(testcase=testcase, response=response)
     assert not outcome if code.startswith("error") else True
     check_messages(validator, code)
+
+
+@pytest.mark.parametrize("bindings_checked", [False, True])
+def test_case_input_node_binding_key_missing(bindings_checked: bool):
+    results: List = [deepcopy(SAMPLE_TEST_RESULTS[0]) for _ in range(2)]
+    for result in results:
+        result["node_bindings"]["not a query node"] = [{"id": METFORMIN_CURIE, "attributes": []}]
+    response: Dict = {
+        "message": {
+            "query_graph": SAMPLE_QUERY_GRAPH,
+            "knowledge_graph": SAMPLE_TEST_GRAPH,
+            "results": results
+        }
+    }
+    validator = TRAPIResponseValidator(
+        trapi_version=LATEST_TRAPI_RELEASE,
+        biolink_version=LATEST_BIOLINK_MODEL_VERSION
+    )
+    assert validator.testcase_input_found_in_response(SAMPLE_TEST_CASE, response, bindings_checked=bindings_checked)
+    # reported once (unless the result bindings were already checked), rather than once per result
+    code: str = "error.trapi.response.message.result.node_binding.key.missing"
+    assert validator.summary().get(code, 0) == (0 if bindings_checked else 1)
+
+
+def test_testcases_found_in_response():
+    validator = TRAPIResponseValidator(
+        trapi_version=LATEST_TRAPI_RELEASE,
+        biolink_version=LATEST_BIOLINK_MODEL_VERSION
+    )
+    response: Dict = {
+        "message": {
+            "query_graph": SAMPLE_QUERY_GRAPH,
+            "knowledge_graph": SAMPLE_TEST_GRAPH,
+            "results": SAMPLE_TEST_INCOMPLETE_RESULTS
+        }
+    }
+    missing_edge_case: Dict = deepcopy(SAMPLE_TEST_CASE)
+    missing_edge_case["idx"] = 1
+    missing_edge_case["predicate_id"] = "biolink:causes"
+    verdicts: List[bool] = validator.testcases_found_in_response(
+        [SAMPLE_TEST_CASE, missing_edge_case], response, max_workers=2
+    )
+    assert verdicts == [False, False]
+    # the messages of all the test cases are merged into the validator
+    errors = validator.get_errors()
+    assert "error.trapi.response.message.result.missing" in errors
+    assert "error.trapi.response.message.knowledge_graph.edge.missing" in errors
+
+
+@pytest.mark.parametrize("retain_messages", [True, False])
+def test_scratch_copy_messages_are_only_emitted_when_merged(retain_messages: bool):
+    records: List = list()
+    validator = TRAPIResponseValidator(
+        trapi_version=LATEST_TRAPI_RELEASE,
+        biolink_version="suppress",
+        message_sink=CallbackSink(records.append),
+        retain_messages=retain_messages
+    )
+    scratch: TRAPIResponseValidator = validator.scratch_copy()
+    for n in range(3):
+        scratch.report(code="warning.knowledge_graph.node.name.missing", identifier=f"NCBIGene:{n}")
+    assert not records
+    assert not validator.has_messages()
+
+    validator.merge(scratch, move=True)
+    assert len(records) == 3
+    assert validator.summary() == {"warning.knowledge_graph.node.name.missing": 3}
+    assert bool(validator.get_messages_by_test()["warning"]) == retain_messages
@@ -0,0 +1,123 @@
+"""
+Unit tests of the compact binary serialization of validation data (and of ValidationReporters)
+"""
+from typing import Dict, List
+import json
+import pickle
+
+import pytest
+
+from reasoner_validator import codec, serialization
+from reasoner_validator.message import MessageType
+from reasoner_validator.report import ValidationReporter, ReportingPolicy
+from reasoner_validator.trapi import TRAPISchemaValidator
+from tests.test_validation_report import full_test_messages_by_target
+
+
+def test_serialization_round_trip():
+    content: Dict = {
+        "none": None,
+        "booleans": [True, False],
+        "integers": [0, 1, -1, 127, 128, -129, 2**62, -2**63, 2**64, -2**100],
+        "floats": [0.5, -1.25e-300, float("inf")],
+        "bytes": b"\x00\x01\xff",
+        "strings": ["", "edge_1", "edge_1", "A1CF – APOBEC1", "edge_1"],
+        "nested": {"edge_1": [{"edge_1": None}, []], "": {}},
+        "tuple": ("edge_1", 1)
+    }
+    expected: Dict = dict(content)
+    expected["tuple"] = ["edge_1", 1]
+    assert serialization.loads(serialization.dumps(content)) == expected
+
+    # repeated strings are only encoded once
+    strings: List[str] = ["warning.knowledge_graph.edge.duplicated"] * 100
+    assert len(serialization.dumps(strings)) < len(strings[0]) + 3 * len(strings)
+
+
+def test_serialization_errors():
+    with pytest.raises(TypeError):
+        serialization.dumps({"object": object()})
+    with pytest.raises(ValueError):
+        serialization.loads(json.dumps([1, 2]).encode("utf-8"))
+    with pytest.raises(ValueError):
+        serialization.loads(serialization.dumps(["edge_1", "edge_2"])[:-2])
+    with pytest.raises(ValueError):
+        serialization.loads(serialization.dumps(1) + b"\x00")
+    with pytest.raises(ValueError):
+        ValidationReporter.from_bytes(serialization.dumps([1, 2]))
+
+
+def _report_messages(reporter: ValidationReporter):
+    reporter.add_messages(full_test_messages_by_target)
+    reporter.report(code="info.compliant")
+    for i in range(3):
+        reporter.report(
+            code="warning.knowledge_graph.edge.duplicated",
+            identifier=f"edge_{i % 2}",
+            edge_id=f"edge_{i}"
+        )
+    reporter.report(code="error.knowledge_graph.node.category.missing", identifier="n0", target="another target")
+    reporter.get_messages_by_test(test="empty test")
+
+
+@pytest.mark.parametrize("compact_messages", [False, True], ids=["dict", "compact"])
+def test_reporter_round_trip(compact_messages: bool):
+    reporter = ValidationReporter(
+        default_test="some test",
+        default_target="some target",
+        strict_validation=True,
+        compact_messages=compact_messages
+    )
+    _report_messages(reporter)
+    data: bytes = reporter.to_bytes()
+    restored = ValidationReporter.from_bytes(data)
+    assert restored.get_default_test() == "some test"
+    assert restored.get_default_target() == "some target"
+    assert restored.strict_validation
+    assert restored.uses_compact_messages() == compact_messages
+    assert restored.get_all_messages() == reporter.get_all_messages()
+    assert restored.summary() == reporter.summary()
+    assert restored.has_errors(target="another target", test="some test")
+    assert restored.dumps() == reporter.dumps()
+
+    # constructor arguments may be overridden
+    other = ValidationReporter.from_bytes(data, compact_messages=not compact_messages)
+    assert other.uses_compact_messages() != compact_messages
+    assert other.get_all_messages() == reporter.get_all_messages()
+
+
+def test_reporter_serialization_size():
+    reporter = ValidationReporter()
+    for i in range(1000):
+        reporter.report(
+            code="warning.knowledge_graph.edge.duplicated",
+            identifier=f"edge_{i % 10}",
+            edge_id=f"edge_{i}"
+        )
+    data: bytes = reporter.to_bytes()
+    assert ValidationReporter.from_bytes(data).get_all_messages() == reporter.get_all_messages()
+
+    # the binary format is more compact than both JSON and pickle serializations of the messages
+    assert len(data) < len(codec.dumps_bytes(reporter.to_dict()))
+    assert len(data) < len(pickle.dumps(reporter.get_all_messages(copy=True)))
+
+
+def test_reporter_round_trip_of_unrecorded_messages():
+    reporter = ValidationReporter(reporting_policy=ReportingPolicy(max_messages=1, min_severity=MessageType.warning))
+    reporter.report(code="info.compliant")
+    for i in range(3):
+        reporter.report(code="warning.knowledge_graph.edge.duplicated", identifier="edge_0", edge_id=f"edge_{i}")
+    restored = ValidationReporter.from_bytes(reporter.to_bytes())
+    assert restored.reporting_policy == reporter.reporting_policy
+    assert restored.summary() == {"info.compliant": 1, "warning.knowledge_graph.edge.duplicated": 3}
+    assert restored.get_unrecorded_messages() == reporter.get_unrecorded_messages()
+    assert restored.to_dict() == reporter.to_dict()
+
+
+def test_trapi_validator_round_trip():
+    validator = TRAPISchemaValidator(trapi_version="1.5.0")
+    validator.report(code="critical.trapi.validation", identifier="1.5.0", component="Result", reason="no nodes")
+    restored = TRAPISchemaValidator.from_bytes(validator.to_bytes())
+    assert isinstance(restored, TRAPISchemaValidator)
+    assert restored.get_trapi_version() == validator.get_trapi_version()
+    assert restored.to_dict() == validator.to_dict()
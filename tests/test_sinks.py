@@ -0,0 +1,121 @@
+"""
+Unit tests of the message sinks of the ValidationReporter
+"""
+from typing import List, Dict
+import asyncio
+import io
+import json
+
+from reasoner_validator.message import MessageType
+from reasoner_validator.report import ValidationReporter
+from reasoner_validator.sinks import CallbackSink, JsonLinesFileSink, AsyncQueueSink, message_record
+
+
+def _report_messages(reporter: ValidationReporter):
+    reporter.report(code="info.compliant")
+    reporter.report(code="warning.graph.empty", identifier="first graph")
+    reporter.report(
+        code="warning.knowledge_graph.edge.duplicated",
+        identifier="edge_2",
+        edge_id="edge_1",
+        test="another test"
+    )
+
+
+_MESSAGE_RECORDS: List[Dict] = [
+    {"target": "Target", "test": "Test", "type": "info", "code": "info.compliant"},
+    {
+        "target": "Target", "test": "Test", "type": "warning",
+        "code": "warning.graph.empty", "identifier": "first graph"
+    },
+    {
+        "target": "Target", "test": "another test", "type": "warning",
+        "code": "warning.knowledge_graph.edge.duplicated", "identifier": "edge_2",
+        "parameters": {"edge_id": "edge_1"}
+    }
+]
+
+
+def test_callback_sink():
+    records: List[Dict] = list()
+    reporter = ValidationReporter(message_sink=CallbackSink(records.append))
+    _report_messages(reporter)
+    assert records == _MESSAGE_RECORDS
+    # the messages are also retained, by default
+    assert reporter.get_warnings(test="another test") == {
+        "warning.knowledge_graph.edge.duplicated": {"edge_2": [{"edge_id": "edge_1"}]}
+    }
+
+    # messages merged from other reporters are also emitted
+    records.clear()
+    other = ValidationReporter()
+    _report_messages(other)
+    reporter.merge(other)
+    assert sorted(records, key=json.dumps) == sorted(_MESSAGE_RECORDS, key=json.dumps)
+
+    # ... as are (all) the recorded messages, on demand
+    records.clear()
+    other.message_sink = reporter.message_sink
+    other.emit_all_messages()
+    assert sorted(records, key=json.dumps) == sorted(_MESSAGE_RECORDS, key=json.dumps)
+
+
+def test_message_sink_without_retention():
+    records: List[Dict] = list()
+    reporter = ValidationReporter(message_sink=CallbackSink(records.append), retain_messages=False)
+    _report_messages(reporter)
+    other = ValidationReporter()
+    _report_messages(other)
+    reporter.merge(other)
+    assert len(records) == 6
+    # the messages are only counted
+    assert reporter.summary() == {
+        "info.compliant": 2,
+        "warning.graph.empty": 2,
+        "warning.knowledge_graph.edge.duplicated": 2
+    }
+    assert reporter.has_warnings() and not reporter.get_warnings()
+
+
+def test_json_lines_file_sink():
+    output = io.StringIO()
+    with JsonLinesFileSink(file=output) as sink:
+        reporter = ValidationReporter(message_sink=sink)
+        _report_messages(reporter)
+        # non-JSON parameter values are serialized as lists
+        reporter.report(
+            code="info.compliant",
+            identifier="test edge",
+            qualifier_value={"activity"}
+        )
+    records: List[Dict] = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert records[:3] == _MESSAGE_RECORDS
+    assert records[3]["parameters"] == {"qualifier_value": ["activity"]}
+
+
+def test_async_queue_sink():
+    async def consume() -> List[Dict]:
+        queue: asyncio.Queue = asyncio.Queue()
+        sink = AsyncQueueSink(queue, loop=asyncio.get_running_loop())
+
+        def validate():
+            reporter = ValidationReporter(message_sink=sink, retain_messages=False)
+            _report_messages(reporter)
+            sink.close()
+
+        validation = asyncio.get_running_loop().run_in_executor(None, validate)
+        records: List[Dict] = list()
+        record = await queue.get()
+        while record is not None:
+            records.append(record)
+            record = await queue.get()
+        await validation
+        return records
+
+    assert asyncio.run(consume()) == _MESSAGE_RECORDS
+
+
+def test_message_record():
+    assert message_record("Target", "Test", MessageType.error, "error.trapi.validation", parameters={}) == {
+        "target": "Target", "test": "Test", "type": "error", "code": "error.trapi.validation"
+    }
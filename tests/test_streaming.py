@@ -0,0 +1,175 @@
+"""
+Unit tests of the streaming validation of TRAPI Responses
+"""
+from typing import Dict, List
+from copy import deepcopy
+import asyncio
+import io
+import json
+
+import pytest
+
+from reasoner_validator.validator import TRAPIResponseValidator
+from reasoner_validator.streaming import AsyncByteStream, StreamingTRAPIResponseValidator
+
+from tests import LATEST_TRAPI_RELEASE, LATEST_BIOLINK_MODEL_VERSION
+from tests.test_response_validator import _TEST_LATEST_TRAPI_RELEASE_FULL_SAMPLE
+
+
+def _validate(response: Dict, **kwargs) -> TRAPIResponseValidator:
+    validator = TRAPIResponseValidator(
+        trapi_version=LATEST_TRAPI_RELEASE,
+        biolink_version=LATEST_BIOLINK_MODEL_VERSION
+    )
+    validator.check_compliance_of_trapi_response(response=deepcopy(response), **kwargs)
+    return validator
+
+
+class _UnseekableStream(io.BytesIO):
+    # e.g. a socket, which can only be read once
+    def seekable(self) -> bool:
+        return False
+
+
+def _validate_stream(
+        response: Dict,
+        seekable: bool = True,
+        max_pending_edges: int = StreamingTRAPIResponseValidator.DEFAULT_MAX_PENDING_EDGES,
+        **kwargs
+) -> StreamingTRAPIResponseValidator:
+    validator = StreamingTRAPIResponseValidator(
+        trapi_version=LATEST_TRAPI_RELEASE,
+        biolink_version=LATEST_BIOLINK_MODEL_VERSION,
+        max_pending_edges=max_pending_edges
+    )
+    data: bytes = json.dumps(response).encode("utf-8")
+    validator.check_compliance_of_trapi_response_stream(
+        io.BytesIO(data) if seekable else _UnseekableStream(data), **kwargs
+    )
+    return validator
+
+
+def _sample_with_bad_edge() -> Dict:
+    response: Dict = deepcopy(_TEST_LATEST_TRAPI_RELEASE_FULL_SAMPLE)
+    edge: Dict = next(iter(response["message"]["knowledge_graph"]["edges"].values()))
+    edge.pop("subject")
+    return response
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        _TEST_LATEST_TRAPI_RELEASE_FULL_SAMPLE,
+        {"message": None},
+        {"message": {"query_graph": None, "knowledge_graph": None, "results": None}}
+    ]
+)
+def test_streaming_validation(response: Dict):
+    assert _validate_stream(response).get_all_messages() == _validate(response).get_all_messages()
+
+
+def test_streaming_validation_of_bad_edge():
+    # knowledge graph edges are schema validated one at a time, rather than within the whole knowledge graph
+    validator = _validate_stream(_sample_with_bad_edge())
+    assert "critical.trapi.validation" in validator.get_critical()
+    assert "critical.trapi.validation" in _validate(_sample_with_bad_edge()).get_critical()
+
+
+def test_streaming_validation_of_reordered_response():
+    # the knowledge graph edges precede their nodes and the message precedes the version metadata
+    message: Dict = deepcopy(_TEST_LATEST_TRAPI_RELEASE_FULL_SAMPLE["message"])
+    message["knowledge_graph"] = {
+        "edges": message["knowledge_graph"]["edges"],
+        "nodes": message["knowledge_graph"]["nodes"]
+    }
+    response: Dict = {"message": message}
+    response.update({key: value for key, value in _TEST_LATEST_TRAPI_RELEASE_FULL_SAMPLE.items() if key != "message"})
+    assert _validate_stream(response).get_all_messages() == _validate(response).get_all_messages()
+
+
+def _reordered(response: Dict, components: List[str], message_first: bool = True) -> Dict:
+    # the Message, with its components in the given order, preceding (or following) the rest of the Response
+    message: Dict = {component: response["message"][component] for component in components}
+    envelope: Dict = {key: value for key, value in response.items() if key != "message"}
+    return {"message": message, **envelope} if message_first else {**envelope, "message": message}
+
+
+@pytest.mark.parametrize("seekable", [True, False])
+def test_streaming_validation_is_gated_by_response_status(seekable: bool):
+    response: Dict = deepcopy(_TEST_LATEST_TRAPI_RELEASE_FULL_SAMPLE)
+    response["status"] = "Unknown"
+    response["message"]["results"][0].pop("node_bindings")
+    # as for a parsed Response, the Message isn't validated if the status of the Response is unknown...
+    envelope_first: Dict = _reordered(response, ["query_graph", "knowledge_graph", "results"], message_first=False)
+    assert _validate_stream(envelope_first, seekable=seekable).get_all_messages() == \
+        _validate(envelope_first).get_all_messages()
+
+    # ...unless the status only follows the Message in a stream which can't be read twice
+    message_first: Dict = _reordered(response, ["query_graph", "knowledge_graph", "results"])
+    if seekable:
+        assert _validate_stream(message_first).get_all_messages() == _validate(message_first).get_all_messages()
+    else:
+        validator = _validate_stream(message_first, seekable=False)
+        assert "warning.trapi.response.status.unknown" in validator.get_warnings()
+        assert "critical.trapi.validation" in validator.get_critical()
+
+
+@pytest.mark.parametrize("seekable", [True, False])
+def test_streaming_validation_of_results_preceding_knowledge_graph(seekable: bool):
+    response: Dict = _sample_with_bad_edge()
+    response["message"]["results"][0].pop("node_bindings")
+    response = _reordered(response, ["query_graph", "results", "knowledge_graph"], message_first=False)
+    # as for a parsed Response, the (invalid) results aren't validated if the knowledge graph is invalid
+    validator = _validate_stream(response, seekable=seekable)
+    assert validator.summary() == _validate(response).summary()
+    assert sum(len(parameters) for parameters in validator.get_critical()["critical.trapi.validation"].values()) == 1
+
+
+def test_streaming_validation_of_result_bindings():
+    response: Dict = deepcopy(_TEST_LATEST_TRAPI_RELEASE_FULL_SAMPLE)
+    response["message"]["results"][0]["node_bindings"]["not-a-qnode"] = [{"id": "NCBIGene:0", "attributes": []}]
+    validator = _validate_stream(response)
+    assert "error.trapi.response.message.result.node_binding.key.missing" in validator.get_errors()
+    assert "error.trapi.response.message.result.node_binding.dangling" in validator.get_errors()
+    assert validator.get_all_messages() == _validate(response).get_all_messages()
+
+
+def test_streaming_validation_of_edges_preceding_nodes():
+    response: Dict = deepcopy(_TEST_LATEST_TRAPI_RELEASE_FULL_SAMPLE)
+    knowledge_graph: Dict = response["message"]["knowledge_graph"]
+    response["message"]["knowledge_graph"] = {"edges": knowledge_graph["edges"], "nodes": knowledge_graph["nodes"]}
+    # edges preceding the nodes of a stream which can't be read twice are retained until the nodes are indexed...
+    assert _validate_stream(response, seekable=False).get_all_messages() == _validate(response).get_all_messages()
+
+    # ...up to a limit, beyond which they are only validated against the TRAPI schema
+    validator = _validate_stream(response, seekable=False, max_pending_edges=0)
+    assert "warning.trapi.response.message.knowledge_graph.edges.unvalidated" in validator.get_warnings()
+
+
+def test_streaming_validation_with_prefix():
+    response: Dict = _sample_with_bad_edge()
+    validator = StreamingTRAPIResponseValidator(
+        trapi_version=LATEST_TRAPI_RELEASE,
+        biolink_version=LATEST_BIOLINK_MODEL_VERSION
+    )
+    validator.check_compliance_of_trapi_response_stream(
+        io.BytesIO(json.dumps({"fields": {"data": response}}).encode("utf-8")),
+        prefix="fields.data"
+    )
+    assert validator.get_all_messages() == _validate_stream(response).get_all_messages()
+
+
+def test_async_streaming_validation():
+    response: Dict = _sample_with_bad_edge()
+    data: bytes = json.dumps(response).encode("utf-8")
+
+    async def chunks():
+        for i in range(0, len(data), 100):
+            yield data[i:i + 100]
+
+    validator = StreamingTRAPIResponseValidator(
+        trapi_version=LATEST_TRAPI_RELEASE,
+        biolink_version=LATEST_BIOLINK_MODEL_VERSION
+    )
+    asyncio.run(validator.check_compliance_of_trapi_response_async_stream(AsyncByteStream(chunks())))
+    assert validator.get_all_messages() == _validate_stream(response).get_all_messages()
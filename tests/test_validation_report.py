@@ -3,6 +3,7 @@ import copy
 import sys
 from typing import Optional, Dict, List
 from sys import stderr
+from json import dumps
 
 import pytest
 
@@ -12,10 +13,17 @@ from reasoner_validator.message import (
     MESSAGE_PARTITION,
     MESSAGE_CATALOG,
     MESSAGES_BY_TEST,
-    MESSAGES_BY_TARGET
+    MESSAGES_BY_TARGET,
+    MessagesView
 )
-from reasoner_validator.report import ValidationReporter, TRAPIGraphType
-from reasoner_validator.validation_codes import CodeDictionary
+from reasoner_validator.report import (
+    ValidationReporter,
+    TRAPIGraphType,
+    ReportingPolicy,
+    merge_reporters
+)
+from reasoner_validator import codec
+from reasoner_validator.validation_codes import CodeDictionary, CodeEntry
 from reasoner_validator.versioning import get_latest_version
 
 TEST_TRAPI_VERSION = get_latest_version(ValidationReporter.DEFAULT_TRAPI_VERSION)
@@ -151,6 +159,35 @@ def test_get_entry():
     assert CodeDictionary.get_code_entry("foo.bar") is None
 
 
+def test_get_code():
+    assert CodeDictionary.get_code("") is None
+    assert CodeDictionary.get_code("info") is None
+    assert CodeDictionary.get_code("info.query_graph") is None
+    assert CodeDictionary.get_code("foo.bar") is None
+
+    entry: Optional[CodeEntry] = CodeDictionary.get_code("info.compliant")
+    assert entry is not None
+    assert entry.message_type == "info"
+    assert entry.message == "Biolink Model-compliant TRAPI Message"
+    assert entry.context is None
+    assert entry.description.startswith("Specified TRAPI message completely satisfies")
+
+    entry = CodeDictionary.get_code("critical.trapi.validation")
+    assert entry.context == ("identifier", "component", "json_path", "reason")
+    assert CodeDictionary.get_message_context("critical.trapi.validation") == list(entry.context)
+
+    # the same (immutable) entry is returned by every lookup
+    assert CodeDictionary.get_code("critical.trapi.validation") is entry
+    with pytest.raises(TypeError):
+        CodeDictionary.code_index["info.compliant"] = entry
+
+    # every leaf entry of the code dictionary is indexed
+    assert all(
+        CodeDictionary.get_code_entry(code) == CodeDictionary.get_code_subtree(code, is_leaf=True)[1]
+        for code in CodeDictionary.code_index
+    )
+
+
 def test_get_message_template():
     assert CodeDictionary.get_message_template("") is None
     assert CodeDictionary.get_message_template("info.compliant") == "Biolink Model-compliant TRAPI Message"
@@ -464,6 +501,76 @@ def test_get_all_messages_of_type():
     _check_humpty_dumpty(messages[code_for_testing])
 
 
+def _merge_test_reporter(number: int) -> ValidationReporter:
+    reporter = ValidationReporter()
+    reporter.add_messages(copy.deepcopy(full_test_messages_by_target))
+    reporter.report(code="info.compliant")
+    reporter.report(code="warning.graph.empty", identifier=f"graph {number % 2}")
+    reporter.report(code="warning.knowledge_graph.edge.duplicated", identifier="edge_2", edge_id=f"edge_{number}")
+    reporter.report(code="error.knowledge_graph.node.category.missing", identifier=f"n{number}", test=f"test {number}")
+    return reporter
+
+
+def test_merge_move():
+    # messages moved from other reporters are merged as if they were copied
+    copied = ValidationReporter()
+    copied.report(code="info.compliant", identifier="test edge", qualifier_value="activity")
+    moved = ValidationReporter()
+    moved.report(code="info.compliant", identifier="test edge", qualifier_value="activity")
+    for number in range(3):
+        copied.merge(_merge_test_reporter(number))
+        donor: ValidationReporter = _merge_test_reporter(number)
+        moved.merge(donor, move=True)
+        assert donor.is_empty() and not donor.get_all_messages()
+    assert moved.get_all_messages() == copied.get_all_messages()
+    assert moved.get_warnings()["warning.knowledge_graph.edge.duplicated"] == {
+        "edge_2": [{"edge_id": "edge_0"}, {"edge_id": "edge_1"}, {"edge_id": "edge_2"}]
+    }
+    assert moved.get_info()["info.compliant"] == {"test edge": [{"qualifier_value": "activity"}]}
+    # the counts of the reported messages are moved as well
+    assert moved.summary()["warning.graph.empty"] == 3
+
+    # tree reduction of many reporters, merged in their order
+    reporters: List[ValidationReporter] = [_merge_test_reporter(number) for number in range(7)]
+    reference: ValidationReporter = _merge_test_reporter(0)
+    for number in range(1, 7):
+        reference.merge(_merge_test_reporter(number))
+    merged: ValidationReporter = merge_reporters(reporters)
+    assert merged is reporters[0]
+    assert all(reporter.is_empty() for reporter in reporters[1:])
+    assert merged.get_all_messages() == reference.get_all_messages()
+    assert merged.summary() == reference.summary()
+
+
+@pytest.mark.parametrize(
+    "move,kwargs",
+    [
+        (False, dict()),
+        (True, dict()),
+        (True, {"compact_messages": True}),
+        (True, {"index_messages": True})
+    ],
+    ids=["copy", "move", "move-compact", "move-indexed"]
+)
+def test_merge_carries_counts_of_unrecorded_messages(move: bool, kwargs: Dict):
+    # whether copied, moved or (re-)recorded, the counts of the merged reporter are carried over
+    donor = ValidationReporter(reporting_policy=ReportingPolicy(max_identifiers=1))
+    for i in range(5):
+        donor.report(code="error.knowledge_graph.node.category.missing", identifier=f"n{i}")
+    donor.report(code="info.compliant")
+    donor.report(code="info.compliant")
+    summary: Dict[str, int] = donor.summary()
+    unrecorded: Dict = donor.get_unrecorded_messages()
+    assert summary == {"error.knowledge_graph.node.category.missing": 5, "info.compliant": 2}
+    assert unrecorded == {"Target": {"Test": {"error.knowledge_graph.node.category.missing": {"messages": 4}}}}
+
+    merged = ValidationReporter(**kwargs)
+    merged.merge(donor, move=move)
+    assert merged.summary() == summary
+    assert merged.get_unrecorded_messages() == unrecorded
+    assert donor.is_empty() == move
+
+
 def test_prefix_accessors():
     reporter = ValidationReporter()
     assert reporter.report_header().startswith("Validation Report\n")
@@ -506,6 +613,243 @@ def test_validation_message_report1():
     assert "INFO - Input Edge Predicate: Edge has an 'abstract' predicate" in displayed
 
 
+def test_is_empty():
+    reporter = ValidationReporter()
+    assert reporter.is_empty()
+    assert not reporter.has_messages()  # does not create an empty message catalog...
+    assert reporter.is_empty()  # ...thus, is still empty
+    reporter.report(code="info.compliant", test="another test")
+    assert not reporter.is_empty()
+
+
+
+def test_message_summary():
+    reporter = ValidationReporter()
+    assert not reporter.has_errors(test="some test", target="some target")
+    # predicates do not create empty message catalogs
+    assert "some target" not in reporter.get_all_messages()
+    assert reporter.summary() == {}
+
+    reporter.report(code="info.compliant")
+    reporter.report(code="error.knowledge_graph.node.category.missing", identifier="n0")
+    reporter.report(code="error.knowledge_graph.node.category.missing", identifier="n1", test="another test")
+    reporter.report(
+        code="warning.knowledge_graph.edge.duplicated",
+        identifier="e1",
+        edge_id="e0",
+        target="another target"
+    )
+    assert reporter.has_errors() and reporter.has_errors(test="another test")
+    assert not reporter.has_warnings() and reporter.has_warnings(target="another target")
+    assert reporter.summary() == {
+        "info.compliant": 1,
+        "error.knowledge_graph.node.category.missing": 2,
+        "warning.knowledge_graph.edge.duplicated": 1
+    }
+    assert reporter.summary(MessageType.error) == {"error.knowledge_graph.node.category.missing": 2}
+
+    # messages added in a batch are also counted
+    other = ValidationReporter()
+    other.merge(reporter)
+    assert other.summary() == reporter.summary()
+    assert other.has_warnings(target="another target")
+
+    # directly assigned messages are recounted
+    other.messages = reporter.get_all_messages(copy=True)
+    other.recount_messages()
+    assert other.summary() == reporter.summary()
+
+    # messages without parameters, reported more than once, are recorded once, but counted as reported...
+    reporter.report(code="info.compliant")
+    reporter.report(code="error.knowledge_graph.node.category.missing", identifier="n0")
+    assert reporter.summary()["info.compliant"] == 2
+    assert reporter.summary()["error.knowledge_graph.node.category.missing"] == 3
+
+    # ...thus only recounted once, unless their counts are restored
+    other = ValidationReporter()
+    other.messages = reporter.get_all_messages(copy=True)
+    other.recount_messages()
+    assert other.summary()["info.compliant"] == 1
+    other.clear_messages()
+    other.messages = reporter.get_all_messages(copy=True)
+    other.add_message_counts(reporter.get_message_counts())
+    assert other.summary() == reporter.summary()
+    other = ValidationReporter()
+    other.add_messages(reporter.get_all_messages(), message_counts=reporter.get_message_counts())
+    assert other.summary() == reporter.summary()
+    other = ValidationReporter()
+    other.merge(reporter)
+    assert other.summary() == reporter.summary()
+
+    reporter.clear_messages()
+    assert reporter.is_empty() and not reporter.has_errors()
+
+
+@pytest.mark.parametrize("compact_messages", [False, True])
+def test_reporting_policy(compact_messages: bool):
+    reporter = ValidationReporter(
+        reporting_policy=ReportingPolicy(
+            max_identifiers=2, max_messages=2, deduplicate=True, min_severity=MessageType.warning
+        ),
+        compact_messages=compact_messages
+    )
+    reporter.report(code="info.compliant")
+    for i in range(4):
+        for j in range(3):
+            reporter.report(code="warning.knowledge_graph.edge.duplicated", identifier=f"e{i}", edge_id=f"e{i}{j}")
+    for _ in range(3):
+        reporter.report(code="warning.knowledge_graph.edge.duplicated", identifier="e0", edge_id="e00")
+    reporter.report(code="error.knowledge_graph.node.category.missing", identifier="n0")
+
+    # all messages are counted...
+    assert reporter.summary() == {
+        "info.compliant": 1,
+        "warning.knowledge_graph.edge.duplicated": 15,
+        "error.knowledge_graph.node.category.missing": 1
+    }
+    assert reporter.has_information()
+
+    # ... but only recorded within the bounds of the reporting policy
+    assert "info.compliant" not in reporter.get_info()
+    assert reporter.get_warnings() == {
+        "warning.knowledge_graph.edge.duplicated": {
+            "e0": [{"edge_id": "e00"}, {"edge_id": "e01"}],
+            "e1": [{"edge_id": "e10"}, {"edge_id": "e11"}]
+        }
+    }
+    assert reporter.get_errors() == {"error.knowledge_graph.node.category.missing": {"n0": None}}
+    assert reporter.get_unrecorded_messages() == {
+        "Target": {
+            "Test": {
+                "info.compliant": {"messages": 1},
+                "warning.knowledge_graph.edge.duplicated": {"messages": 6, "identifiers": {"e0": 1, "e1": 1}}
+            }
+        }
+    }
+    assert reporter.get_occurrences() == {
+        "Target": {"Test": {"warning.knowledge_graph.edge.duplicated": {"e0": [4, 1]}}}
+    }
+    dictionary: Dict = reporter.to_dict()
+    assert dictionary["unrecorded"] == reporter.get_unrecorded_messages()
+    assert dictionary["occurrences"] == reporter.get_occurrences()
+
+    text: str = reporter.dumps()
+    assert "e00 (x4)" in text
+    assert "1 more messages for identifier 'e0'" in text
+    assert "6 more messages for code" in text
+    assert "Compliant: 1 messages (not recorded)" in text
+
+    # the summary of unrecorded messages is restored by other reporters
+    other = ValidationReporter()
+    other.messages = reporter.get_all_messages(copy=True)
+    other.recount_messages()
+    other.add_unrecorded_messages(dictionary["unrecorded"])
+    assert other.get_unrecorded_messages() == reporter.get_unrecorded_messages()
+    assert other.summary() == {
+        "info.compliant": 1,
+        "warning.knowledge_graph.edge.duplicated": 12,
+        "error.knowledge_graph.node.category.missing": 1
+    }
+
+    reporter.clear_messages()
+    assert reporter.is_empty() and not reporter.get_unrecorded_messages() and not reporter.get_occurrences()
+
+
+@pytest.mark.parametrize("compact_messages", [False, True])
+def test_message_index(compact_messages: bool):
+    reporter = ValidationReporter(index_messages=True, compact_messages=compact_messages)
+    assert reporter.uses_message_index()
+    reporter.report(code="info.compliant")
+    reporter.report(code="warning.knowledge_graph.edge.duplicated", identifier="e1", edge_id="e0")
+    reporter.report(code="warning.knowledge_graph.edge.duplicated", identifier="e2", edge_id="e0")
+    reporter.report(code="error.knowledge_graph.edge.subject.missing", identifier="e0")
+    reporter.report(code="error.knowledge_graph.edge.subject.missing", identifier="e0")
+    reporter.report(code="error.knowledge_graph.node.category.missing", identifier="n0", test="another test")
+    reporter.add_messages(
+        {
+            "another target": {
+                "some test": {
+                    "info": {},
+                    "skipped": {},
+                    "warning": {
+                        "warning.knowledge_graph.node.id.unmapped_prefix": {
+                            "NCBIGene": [{"node_id": "n0"}, {"node_id": "n1"}]
+                        }
+                    },
+                    "error": {},
+                    "critical": {}
+                }
+            }
+        }
+    )
+
+    assert reporter.get_edge_messages("e0") == [
+        {
+            "target": "Target",
+            "test": "Test",
+            "type": "error",
+            "code": "error.knowledge_graph.edge.subject.missing",
+            "identifier": "e0"
+        },
+        {
+            "target": "Target",
+            "test": "Test",
+            "type": "warning",
+            "code": "warning.knowledge_graph.edge.duplicated",
+            "identifier": "e1",
+            "parameters": {"edge_id": "e0"}
+        },
+        {
+            "target": "Target",
+            "test": "Test",
+            "type": "warning",
+            "code": "warning.knowledge_graph.edge.duplicated",
+            "identifier": "e2",
+            "parameters": {"edge_id": "e0"}
+        }
+    ]
+    assert [record["code"] for record in reporter.find_messages("e0", fields=["edge_id"])] == \
+        ["warning.knowledge_graph.edge.duplicated"] * 2
+    assert [(record["test"], record["code"]) for record in reporter.get_node_messages("n0")] == [
+        ("another test", "error.knowledge_graph.node.category.missing"),
+        ("some test", "warning.knowledge_graph.node.id.unmapped_prefix")
+    ]
+    assert len(reporter.find_messages("NCBIGene")) == 2
+    assert reporter.find_messages("unknown") == []
+
+    # the index of merged messages (as of messages restored from binary data) is rebuilt
+    edge_messages = reporter.get_edge_messages("e0")
+    merged = ValidationReporter(index_messages=True)
+    merged.merge(reporter, move=True)
+    assert merged.get_edge_messages("e0") == edge_messages
+    restored = ValidationReporter.from_bytes(merged.to_bytes())
+    assert restored.uses_message_index()
+    assert len(restored.get_node_messages("n1")) == 1
+
+    merged.clear_messages()
+    assert merged.get_edge_messages("e0") == []
+    merged.report(code="error.knowledge_graph.edge.subject.missing", identifier="e0")
+    merged.report(code="error.knowledge_graph.edge.subject.missing", identifier="e0")
+    assert len(merged.get_edge_messages("e0")) == 1
+
+
+def test_capture_messages():
+    reporter = ValidationReporter()
+    reporter.report(code="info.compliant")
+    with reporter.capture_messages() as outer:
+        reporter.report(code="warning.knowledge_graph.node.name.missing", identifier="n0")
+        with reporter.capture_messages() as inner:
+            reporter.report(code="error.knowledge_graph.node.category.missing", identifier="n1")
+    reporter.report(code="info.compliant")
+    assert outer == [
+        "warning.knowledge_graph.node.name.missing",
+        "error.knowledge_graph.node.category.missing"
+    ]
+    assert inner == ["error.knowledge_graph.node.category.missing"]
+    # captured messages are still reported as usual
+    assert reporter.has_warnings() and reporter.has_errors()
+
+
 # this test may be redundant, but it does a test and passes, so...
 def test_validation_message_report2():
     reporter2 = ValidationReporter(
@@ -528,6 +872,61 @@ def test_validation_message_report2():
     assert "biolink:contributor" in messages_by_code['error.knowledge_graph.edge.predicate.abstract']
 
 
+
+def test_read_only_message_views():
+    reporter = ValidationReporter(default_test="test_read_only_message_views", default_target="Views")
+    reporter.report(
+        code="error.knowledge_graph.edge.predicate.abstract",
+        identifier="biolink:contributor",
+        edge_id="Richard->biolink:contributor->Translator"
+    )
+    messages: MESSAGES_BY_TARGET = reporter.get_all_messages()
+    errors: MESSAGE_PARTITION = reporter.get_errors()
+    assert isinstance(messages, MessagesView) and isinstance(errors, MessagesView)
+    assert errors == {
+        "error.knowledge_graph.edge.predicate.abstract": {
+            "biolink:contributor": [{"edge_id": "Richard->biolink:contributor->Translator"}]
+        }
+    }
+    with pytest.raises(TypeError):
+        errors["error.knowledge_graph.edge.predicate.abstract"]["biolink:contributor"][0]["edge_id"] = "foo"
+    with pytest.raises(AttributeError):
+        errors["error.knowledge_graph.edge.predicate.abstract"]["biolink:contributor"].append({"edge_id": "foo"})
+
+    # an explicit copy is independent of the reporter, whereas views reflect later messages
+    copied: MESSAGES_BY_TARGET = reporter.get_all_messages(copy=True)
+    assert isinstance(copied, Dict) and copied == messages
+    reporter.report(code="warning.graph.empty", identifier="test_read_only_message_views")
+    assert messages != copied
+    assert "warning.graph.empty" in messages["Views"]["test_read_only_message_views"]["warning"]
+    assert "warning.graph.empty" not in copied["Views"]["test_read_only_message_views"]["warning"]
+
+    # the flat text output keeps the formatting of the 'json' library
+    assert reporter.dump_errors(test="test_read_only_message_views", target="Views", flat=True) == \
+        dumps(copied["Views"]["test_read_only_message_views"]["error"])
+
+    # views are JSON serializable by the codec, whereas to_dict() exports plain dictionaries
+    assert dumps(messages, default=codec.default) == dumps(reporter.get_all_messages(copy=True))
+    assert not isinstance(reporter.to_dict()["messages"], MessagesView)
+    assert dumps(reporter.to_dict()) == dumps(reporter.to_dict(copy=True))
+
+    # merging (a view of) a report shares, but does not modify, the merged messages
+    other = ValidationReporter()
+    other.merge(reporter)
+    other.report(
+        code="error.knowledge_graph.edge.predicate.abstract",
+        identifier="biolink:contributor",
+        test="test_read_only_message_views",
+        target="Views",
+        edge_id="Tim->biolink:contributor->Translator"
+    )
+    assert len(errors["error.knowledge_graph.edge.predicate.abstract"]["biolink:contributor"]) == 1
+    assert len(other.get_errors(
+        test="test_read_only_message_views",
+        target="Views"
+    )["error.knowledge_graph.edge.predicate.abstract"]["biolink:contributor"]) == 2
+
+
 def _validate_full_messages(
         reporter: ValidationReporter,
         message_type: MessageType,